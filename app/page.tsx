@@ -1,5 +1,5 @@
 import Button from '@/components/Button';
-import Image from 'next/image';
+import ResponsiveImage from '@/components/ResponsiveImage';
 import type { Metadata } from 'next';
 
 export const metadata: Metadata = {
@@ -14,12 +14,10 @@ export default function Home() {
       {/* 모바일: 세로 끝단(위/아래)을 맞추기 위해 높이 기준으로 확대, 가로는 잘림 */}
       {/* 웹: 기존처럼 중앙 정렬 */}
       <div className="absolute inset-0 z-0">
-        <Image
+        <ResponsiveImage
           src="/images/mainbackground.png"
           alt="PEIT 배경"
-          fill
-          className="object-cover bg-image-left md:bg-image-center"
-          quality={90}
+          className="absolute inset-0 w-full h-full object-cover bg-image-left md:bg-image-center"
           sizes="100vw"
           priority
         />
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+콘텐츠 파이프라인 벤치마크 스크립트
+- 원본 유형 수의 ×1, ×16, ×256 합성 코퍼스로 단계별 경과 시간, 실행 중 늘어난 최대 RSS, 처리량 측정
+  (--modes fields면 유형 수 대신 섹션 본문 길이를 늘린 코퍼스도 측정)
+- benchmarks/baseline.json과 비교해 느려진 단계가 있으면 종료 코드 1
+  (비율 --tolerance와 절대 시간 --min-delta를 모두 넘어야 느려짐 - 1ms 미만 단계의 흔들림 무시)
+- --save-baseline으로 현재 결과를 기준값으로 저장
+"""
+
+import argparse
+import sys
+
+from peit_content.bench import (BASELINE_PATH, DEFAULT_MIN_DELTA, DEFAULT_REPEAT, DEFAULT_SCALES, DEFAULT_TOLERANCE,
+                                SCALE_MODES, STAGES, compare, load_baseline, run_benchmarks, save_baseline)
+
+def main():
+    parser = argparse.ArgumentParser(description='콘텐츠 파이프라인 벤치마크')
+    parser.add_argument('--scales', type=int, nargs='+', default=DEFAULT_SCALES, metavar='N',
+                        help='원본 유형 수의 배수 (기본 1 16 256)')
+    parser.add_argument('--modes', nargs='+', default=['types'], choices=SCALE_MODES,
+                        help='types: 유형 블록 복제, fields: 섹션 본문 길이 확대 (기본 types)')
+    parser.add_argument('--stages', nargs='+', default=STAGES, choices=STAGES, metavar='STAGE')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help=f'단계별 반복 횟수 (최소 시간 사용, 기본 {DEFAULT_REPEAT})')
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help=f'기준값 대비 허용하는 느려짐 비율 (기본 {DEFAULT_TOLERANCE})')
+    parser.add_argument('--min-delta', type=float, default=DEFAULT_MIN_DELTA, metavar='SEC',
+                        help=f'느려짐으로 보는 최소 절대 시간 차이 (기본 {DEFAULT_MIN_DELTA}초)')
+    parser.add_argument('--save-baseline', action='store_true', help='결과를 기준값으로 저장')
+    args = parser.parse_args()
+
+    report = run_benchmarks(args.scales, args.stages, args.repeat, args.modes)
+
+    if args.save_baseline:
+        save_baseline(report, args.baseline)
+        print(f"기준값 저장 완료: {args.baseline}")
+        return
+
+    regressions = compare(report, load_baseline(args.baseline), args.tolerance, args.min_delta)
+    for key, stage, base, current in regressions:
+        print(f"느려짐: 코퍼스 {key} {stage} {base:.3f}s → {current:.3f}s")
+    if regressions:
+        sys.exit(1)
+    print("기준값 대비 느려진 단계 없음")
+
+if __name__ == '__main__':
+    main()
@@ -1,40 +1,17 @@
 'use client';
 
 import { useEffect } from 'react';
+import { fieldHtml } from '@/lib/html';
 
 interface DetailModalProps {
   isOpen: boolean;
   onClose: () => void;
   title: string;
-  content: string;
+  data: any; // 유형 항목 (html 맵 포함)
+  field: string;
 }
 
-// 마크다운 스타일 텍스트를 HTML로 변환하는 함수
-function renderMarkdownText(text: string) {
-  // **텍스트** -> <strong>텍스트</strong>
-  let html = text.replace(/\*\*(.*?)\*\*/g, '<strong class="font-semibold text-gray-900">$1</strong>');
-  
-  // '텍스트' -> <span class="text-accent">텍스트</span>
-  html = html.replace(/'([^']+)'/g, '<span class="text-accent font-medium">\'$1\'</span>');
-  
-  // 줄바꿈 처리 - ### 제목 처리 포함
-  html = html.split('\n').map(paragraph => {
-    const trimmed = paragraph.trim();
-    if (!trimmed) return '';
-    
-    // ### 제목 처리
-    if (trimmed.startsWith('### ')) {
-      const titleText = trimmed.substring(4).trim();
-      return `<h3 class="text-xl font-bold mb-3 mt-6 text-gray-900">${titleText}</h3>`;
-    }
-    
-    return `<p class="mb-4 last:mb-0">${paragraph}</p>`;
-  }).join('');
-  
-  return html;
-}
-
-export default function DetailModal({ isOpen, onClose, title, content }: DetailModalProps) {
+export default function DetailModal({ isOpen, onClose, title, data, field }: DetailModalProps) {
   useEffect(() => {
     if (isOpen) {
       document.body.style.overflow = 'hidden';
@@ -72,7 +49,7 @@ export default function DetailModal({ isOpen, onClose, title, content }: DetailM
         <div className="p-6">
           <div 
             className="text-gray-700 leading-relaxed"
-            dangerouslySetInnerHTML={{ __html: renderMarkdownText(content) }}
+            dangerouslySetInnerHTML={{ __html: fieldHtml(data, field) }}
           />
         </div>
       </div>
@@ -104,7 +104,6 @@ export default function FlipCard({ type, data, category, title }: FlipCardProps)
               name={data.name}
               image={imagePath}
               scores={data.scores}
-              description={data.description}
               isCompact={true}
               category={category}
               hideDetailButton={true}
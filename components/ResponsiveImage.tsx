@@ -0,0 +1,53 @@
+import type { CSSProperties } from 'react';
+import { images } from '@/lib/generated/images';
+
+const MIME_TYPES: Record<string, string> = {
+  avif: 'image/avif',
+  webp: 'image/webp',
+};
+
+interface ResponsiveImageProps {
+  src: string;
+  alt: string;
+  sizes: string;
+  className?: string;
+  style?: CSSProperties;
+  priority?: boolean;
+}
+
+// 빌드 때 만든 너비별 변형(peit-content images → lib/generated/images.ts)을 <picture>로 내려보냄
+// GitHub Pages 정적 export에서는 next/image가 최적화하지 않아 원본이 그대로 내려가기 때문
+// 매니페스트에 없는 이미지는 원본 그대로 표시
+export default function ResponsiveImage({ src, alt, sizes, className, style, priority = false }: ResponsiveImageProps) {
+  const variants = images[src];
+  const loading = priority ? 'eager' : 'lazy';
+  const fetchPriority = priority ? 'high' : undefined;
+
+  if (!variants) {
+    return <img src={src} alt={alt} className={className} style={style} loading={loading} fetchPriority={fetchPriority} />;
+  }
+
+  // srcSet은 AVIF, WebP, 마지막이 JPEG/PNG 대체 형식 순서
+  const formats = Object.keys(variants.srcSet);
+  const fallback = formats[formats.length - 1];
+  return (
+    <picture>
+      {formats.slice(0, -1).map((format) => (
+        <source key={format} type={MIME_TYPES[format] ?? `image/${format}`} srcSet={variants.srcSet[format]} sizes={sizes} />
+      ))}
+      <img
+        src={variants.src}
+        srcSet={variants.srcSet[fallback]}
+        sizes={sizes}
+        width={variants.width}
+        height={variants.height}
+        alt={alt}
+        className={className}
+        style={style}
+        loading={loading}
+        fetchPriority={fetchPriority}
+        decoding="async"
+      />
+    </picture>
+  );
+}
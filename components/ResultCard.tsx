@@ -1,35 +1,14 @@
-import Image from 'next/image';
 import SpectrumChart from './SpectrumChart';
 import Button from './Button';
+import ResponsiveImage from './ResponsiveImage';
 import { results } from '@/lib/results';
-
-// 마크다운 스타일 텍스트를 HTML로 변환하는 함수
-function renderMarkdownText(text: string) {
-  // **텍스트** -> <strong>텍스트</strong>
-  let html = text.replace(/\*\*(.*?)\*\*/g, '<strong class="font-semibold text-gray-900">$1</strong>');
-  
-  // ### 제목 처리
-  html = html.split('\n').map(paragraph => {
-    const trimmed = paragraph.trim();
-    if (!trimmed) return '';
-    
-    if (trimmed.startsWith('### ')) {
-      const titleText = trimmed.substring(4).trim();
-      return `<h3 class="text-xl font-bold mb-3 mt-6 text-gray-900">${titleText}</h3>`;
-    }
-    
-    return paragraph;
-  }).join('\n');
-  
-  return html;
-}
+import { fieldHtml } from '@/lib/html';
 
 interface ResultCardProps {
   type: string;
   name: string;
   image: string;
   scores: { [key: string]: number };
-  description: string;
   isCompact?: boolean;
   category?: 'political' | 'economic';
   hideDetailButton?: boolean;
@@ -41,7 +20,6 @@ export default function ResultCard({
   name, 
   image, 
   scores, 
-  description,
   isCompact = false,
   category = 'political',
   hideDetailButton = false,
@@ -51,14 +29,11 @@ export default function ResultCard({
     <div className={`bg-white rounded-3xl border-4 border-accent shadow-xl ${isCompact ? 'p-4' : 'p-8'}`}>
       <div className={`text-center ${isCompact ? 'mb-4' : 'mb-8'}`}>
         <div className={`relative mx-auto mb-4 ${isCompact ? 'w-48 h-32' : 'w-full'} overflow-hidden isolation-isolate`}>
-          <Image
+          <ResponsiveImage
             src={image}
             alt={type}
-            width={isCompact ? 192 : 800}
-            height={isCompact ? 128 : 533}
             className="w-full h-auto object-cover"
             style={{ maxHeight: isCompact ? '128px' : '400px' }}
-            quality={95}
             sizes={isCompact ? '192px' : '(max-width: 768px) 100vw, (max-width: 1200px) 800px, 800px'}
             priority={!isCompact}
           />
@@ -75,13 +50,14 @@ export default function ResultCard({
         </div>
       )}
       
-      <p 
+      {/* 설명 HTML은 요약 모듈(results)에 함께 들어 있어 상세 모듈 없이 바로 표시 */}
+      <div 
         className="text-lg leading-relaxed text-gray-700"
-        dangerouslySetInnerHTML={{ __html: renderMarkdownText(
+        dangerouslySetInnerHTML={{ __html: 
           category === 'economic' && results[type]?.spectrum_analysis 
-            ? results[type].spectrum_analysis 
-            : description
-        ) }}
+            ? fieldHtml(results[type], 'spectrum_analysis') 
+            : fieldHtml(results[type], 'description')
+        }}
       />
       
       {/* 자세히보기 버튼 (옵션) */}
@@ -1,6 +1,7 @@
 'use client';
 
 import ExpandableSection from '@/components/ExpandableSection';
+import { fieldHtml } from '@/lib/html';
 
 interface ResultDetailSectionsProps {
   type: string;
@@ -8,34 +9,6 @@ interface ResultDetailSectionsProps {
   defaultExpanded?: boolean;
 }
 
-// Remove emoji characters for clean UI
-function stripEmojis(s: string) {
-  return s.replace(/[\u{1F300}-\u{1FAFF}\u{1F900}-\u{1F9FF}\u{2600}-\u{27BF}\u{FE0F}]/gu, '');
-}
-
-// Simple markdown-ish to HTML used in detail sections
-function renderMarkdownText(text: string) {
-  const cleaned = stripEmojis(text || '');
-  let html = cleaned.replace(/\*\*(.*?)\*\*/g, '<strong class="font-semibold text-gray-900">$1</strong>');
-  html = html.replace(/'([^']+)'/g, '<span class="text-accent font-medium">\'$1\'</span>');
-  html = html
-    .split('\n')
-    .map((p) => {
-      const trimmed = p.trim();
-      if (!trimmed) return '';
-      
-      // ### 제목 처리
-      if (trimmed.startsWith('### ')) {
-        const titleText = trimmed.substring(4).trim();
-        return `<h3 class="text-xl font-bold mb-3 mt-6 text-gray-900">${titleText}</h3>`;
-      }
-      
-      return `<p class="mb-4 last:mb-0">${p}</p>`;
-    })
-    .join('');
-  return html;
-}
-
 export default function ResultDetailSections({ type, data, defaultExpanded = false }: ResultDetailSectionsProps) {
   if (!data) return null;
 
@@ -101,19 +74,19 @@ export default function ResultDetailSections({ type, data, defaultExpanded = fal
 
         {data.summary && (
           <ExpandableSection title="한 줄 요약" borderColor="border-purple-gradient-200" defaultExpanded={defaultExpanded}>
-            <div className="text-gray-700 leading-relaxed" dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.summary) }} />
+            <div className="text-gray-700 leading-relaxed" dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'summary') }} />
           </ExpandableSection>
         )}
 
         {data.political_spectrum && data.political_spectrum_detail && (
           <ExpandableSection title={`종합 정치 스펙트럼: ${data.political_spectrum}`} borderColor="border-purple-gradient-300" defaultExpanded={defaultExpanded}>
-            <div className="text-gray-700 leading-relaxed" dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.political_spectrum_detail) }} />
+            <div className="text-gray-700 leading-relaxed" dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'political_spectrum_detail') }} />
           </ExpandableSection>
         )}
 
         {data.detailed_description && (
           <ExpandableSection title="당신은 이런 사람입니다" borderColor="border-purple-gradient-400" defaultExpanded={defaultExpanded}>
-            <div className="text-gray-700 leading-relaxed" dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.detailed_description) }} />
+            <div className="text-gray-700 leading-relaxed" dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'detailed_description') }} />
           </ExpandableSection>
         )}
 
@@ -121,22 +94,22 @@ export default function ResultDetailSections({ type, data, defaultExpanded = fal
           <ExpandableSection title="당신의 화법" borderColor="border-purple-gradient-500" defaultExpanded={defaultExpanded}>
             <div className="space-y-6 text-gray-700 leading-relaxed">
               {data.speech_style && (
-                <div dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.speech_style) }} />
+                <div dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'speech_style') }} />
               )}
               {data.stress_moment && (
-                <div dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.stress_moment) }} />
+                <div dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'stress_moment') }} />
               )}
               {data.solution && (
-                <div dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.solution) }} />
+                <div dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'solution') }} />
               )}
               {data.love_value && (
-                <div dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.love_value) }} />
+                <div dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'love_value') }} />
               )}
               {data.best_partner && (
-                <div dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.best_partner) }} />
+                <div dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'best_partner') }} />
               )}
               {data.worst_partner && (
-                <div dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.worst_partner) }} />
+                <div dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'worst_partner') }} />
               )}
             </div>
           </ExpandableSection>
@@ -144,7 +117,7 @@ export default function ResultDetailSections({ type, data, defaultExpanded = fal
 
         {data.communication_barrier && (
           <ExpandableSection title="소통의 벽: 당신이 보수주의자와 대화할 때 답답함을 느끼는 이유" borderColor="border-purple-gradient-600" defaultExpanded={defaultExpanded}>
-            <div className="text-gray-700 leading-relaxed" dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.communication_barrier) }} />
+            <div className="text-gray-700 leading-relaxed" dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'communication_barrier') }} />
           </ExpandableSection>
         )}
 
@@ -152,10 +125,10 @@ export default function ResultDetailSections({ type, data, defaultExpanded = fal
           <ExpandableSection title="돈과 일에 대한 태도" borderColor="border-purple-gradient-700" defaultExpanded={defaultExpanded}>
             <div className="space-y-6">
               {data.career_value && (
-                <div className="text-gray-700 leading-relaxed" dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.career_value) }} />
+                <div className="text-gray-700 leading-relaxed" dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'career_value') }} />
               )}
               {data.financial_style && (
-                <div className="text-gray-700 leading-relaxed" dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.financial_style) }} />
+                <div className="text-gray-700 leading-relaxed" dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'financial_style') }} />
               )}
             </div>
           </ExpandableSection>
@@ -165,10 +138,10 @@ export default function ResultDetailSections({ type, data, defaultExpanded = fal
           <ExpandableSection title="역사와 현실 속 당신의 아바타" borderColor="border-purple-gradient-800" defaultExpanded={defaultExpanded}>
             <div className="space-y-6">
               {data.historical_avatar && (
-                <div className="text-gray-700 leading-relaxed" dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.historical_avatar) }} />
+                <div className="text-gray-700 leading-relaxed" dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'historical_avatar') }} />
               )}
               {data.real_avatar && (
-                <div className="text-gray-700 leading-relaxed" dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.real_avatar) }} />
+                <div className="text-gray-700 leading-relaxed" dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'real_avatar') }} />
               )}
             </div>
           </ExpandableSection>
@@ -178,10 +151,10 @@ export default function ResultDetailSections({ type, data, defaultExpanded = fal
           <ExpandableSection title="개인적 성장과 자기계발" borderColor="border-purple-gradient-900" defaultExpanded={defaultExpanded}>
             <div className="space-y-6">
               {data.growth_direction && (
-                <div className="text-gray-700 leading-relaxed" dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.growth_direction) }} />
+                <div className="text-gray-700 leading-relaxed" dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'growth_direction') }} />
               )}
               {data.final_goal && (
-                <div className="text-gray-700 leading-relaxed" dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.final_goal) }} />
+                <div className="text-gray-700 leading-relaxed" dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'final_goal') }} />
               )}
             </div>
           </ExpandableSection>
@@ -196,7 +169,7 @@ export default function ResultDetailSections({ type, data, defaultExpanded = fal
           >
             <div 
               className="text-gray-700 leading-relaxed"
-              dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.recommended_content) }}
+              dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'recommended_content') }}
             />
           </ExpandableSection>
         )}
@@ -267,43 +240,43 @@ export default function ResultDetailSections({ type, data, defaultExpanded = fal
 
       {data.spectrum_analysis && (
         <ExpandableSection title="종합 경제 스펙트럼 분석" borderColor="border-purple-gradient-200" defaultExpanded={defaultExpanded}>
-          <div className="text-gray-700 leading-relaxed" dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.spectrum_analysis) }} />
+          <div className="text-gray-700 leading-relaxed" dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'spectrum_analysis') }} />
         </ExpandableSection>
       )}
 
       {data.detailed_analysis && (
         <ExpandableSection title="당신은 이런 사람입니다" borderColor="border-purple-gradient-300" defaultExpanded={defaultExpanded}>
-          <div className="text-gray-700 leading-relaxed" dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.detailed_analysis) }} />
+          <div className="text-gray-700 leading-relaxed" dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'detailed_analysis') }} />
         </ExpandableSection>
       )}
 
       {data.coaching && (
         <ExpandableSection title="종합 코칭 제언" borderColor="border-purple-gradient-400" defaultExpanded={defaultExpanded}>
-          <div className="text-gray-700 leading-relaxed" dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.coaching) }} />
+          <div className="text-gray-700 leading-relaxed" dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'coaching') }} />
         </ExpandableSection>
       )}
 
       {data.synergy_partner && (
         <ExpandableSection title="시너지 파트너" borderColor="border-purple-gradient-500" defaultExpanded={defaultExpanded}>
-          <div className="text-gray-700 leading-relaxed" dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.synergy_partner) }} />
+          <div className="text-gray-700 leading-relaxed" dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'synergy_partner') }} />
         </ExpandableSection>
       )}
 
       {data.risk_partner && (
         <ExpandableSection title="리스크 파트너" borderColor="border-purple-gradient-600" defaultExpanded={defaultExpanded}>
-          <div className="text-gray-700 leading-relaxed" dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.risk_partner) }} />
+          <div className="text-gray-700 leading-relaxed" dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'risk_partner') }} />
         </ExpandableSection>
       )}
 
       {data.success_formula && (
         <ExpandableSection title="성공 공식" borderColor="border-purple-gradient-700" defaultExpanded={defaultExpanded}>
-          <div className="text-gray-700 leading-relaxed" dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.success_formula) }} />
+          <div className="text-gray-700 leading-relaxed" dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'success_formula') }} />
         </ExpandableSection>
       )}
 
       {data.failure_formula && (
         <ExpandableSection title="실패 공식" borderColor="border-purple-gradient-800" defaultExpanded={defaultExpanded}>
-          <div className="text-gray-700 leading-relaxed" dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.failure_formula) }} />
+          <div className="text-gray-700 leading-relaxed" dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'failure_formula') }} />
         </ExpandableSection>
       )}
     </div>
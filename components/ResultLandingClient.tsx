@@ -3,7 +3,7 @@
 import { useEffect, useState } from 'react';
 import { useSearchParams } from 'next/navigation';
 import { calculateResult, calculateRelativeScores } from '@/lib/calculate';
-import { results } from '@/lib/results';
+import { loadResultDetails, results } from '@/lib/results';
 import FlipCard from '@/components/FlipCard';
 import Button from '@/components/Button';
 import ShareButton from '@/components/ShareButton';
@@ -112,6 +112,25 @@ export default function ResultLandingClient() {
 
     setResultData(resultData);
     setLoading(false);
+
+    // 카드 뒷면의 상세(ResultDetailSections)는 계산된 유형의 모듈만 불러와 합침
+    const summary = resultData;
+    if (!summary) return;
+    let cancelled = false;
+    Promise.all([
+      summary.political ? loadResultDetails(summary.political) : null,
+      summary.economic ? loadResultDetails(summary.economic) : null,
+    ]).then(([politicalDetails, economicDetails]) => {
+      if (cancelled) return;
+      setResultData({
+        ...summary,
+        politicalData: summary.politicalData && { ...summary.politicalData, ...politicalDetails },
+        economicData: summary.economicData && { ...summary.economicData, ...economicDetails },
+      });
+    });
+    return () => {
+      cancelled = true;
+    };
   }, [forcedType]);
 
   if (loading) {
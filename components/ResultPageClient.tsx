@@ -2,68 +2,21 @@
 
 import { useEffect, useState, Suspense } from 'react';
 import { useSearchParams } from 'next/navigation';
-import { results } from '@/lib/results';
+import { loadResultDetails, results } from '@/lib/results';
+import { ResultData } from '@/lib/types';
 import ResultCard from '@/components/ResultCard';
 import Button from '@/components/Button';
 import ShareButton from '@/components/ShareButton';
 import { calculateResult, calculateRelativeScores } from '@/lib/calculate';
 import ExpandableSection from '@/components/ExpandableSection';
 import SimpleResultCard from '@/components/SimpleResultCard';
+import { fieldHtml } from '@/lib/html';
 
 interface ResultPageClientProps {
   type: string;
   showExpanded?: boolean;
 }
 
-// 마크다운 스타일 텍스트를 HTML로 변환하는 함수
-function renderMarkdownText(text: string) {
-  // HTML 링크가 이미 포함된 경우를 처리하기 위해 먼저 링크를 보호
-  const linkPlaceholders: string[] = [];
-  let html = text.replace(new RegExp('<a[^>]*>.*?</a>', 'g'), (match) => {
-    const placeholder = `__LINK_${linkPlaceholders.length}__`;
-    linkPlaceholders.push(match);
-    return placeholder;
-  });
-  
-  // ### **제목** 형태의 소제목에서 ** 제거 (경제테스트 결과 최종 텍스트용)
-  html = html.replace(new RegExp('### \\*\\*([^*]+?)\\*\\*', 'g'), '### $1');
-  
-  // **텍스트** -> <strong>텍스트</strong>
-  html = html.replace(new RegExp('\\*\\*(.*?)\\*\\*', 'g'), '<strong class="font-semibold text-gray-900">$1</strong>');
-  
-  // '텍스트' -> <span class="text-accent">텍스트</span>
-  html = html.replace(new RegExp("'([^']+)'", 'g'), '<span class="text-accent font-medium">\'$1\'</span>');
-  
-  // 줄바꿈 처리 - ### 제목 처리 포함
-  html = html.split('\n').map(paragraph => {
-    const trimmed = paragraph.trim();
-    if (!trimmed) return '';
-    
-    // ### 제목 처리
-    if (trimmed.startsWith('### ')) {
-      const titleText = trimmed.substring(4).trim();
-      return `<h3 class="text-xl font-bold mb-3 mt-6 text-gray-900">${titleText}</h3>`;
-    }
-    
-    // 링크가 포함된 줄도 <p> 태그로 감싸서 줄바꿈 처리 (경제테스트 결과 추천도서 줄바꿈용)
-    if (trimmed.includes('__LINK_')) {
-      return `<p class="mb-4 last:mb-0">${trimmed}</p>`;
-    }
-    
-    return `<p class="mb-4 last:mb-0">${paragraph}</p>`;
-  }).join('');
-  
-  // 링크 플레이스홀더를 원래 HTML로 복원
-  linkPlaceholders.forEach((link, index) => {
-    html = html.replace(`__LINK_${index}__`, link);
-  });
-  
-  // 최종 HTML에서 남아있는 ** 제거 (경제테스트 결과 최종 텍스트용)
-  html = html.replace(new RegExp('\\*\\*', 'g'), '');
-  
-  return html;
-}
-
 // useSearchParams를 사용하는 내부 컴포넌트
 function ResultPageContent({ type, showExpanded = false }: ResultPageClientProps) {
   const searchParams = useSearchParams();
@@ -71,14 +24,23 @@ function ResultPageContent({ type, showExpanded = false }: ResultPageClientProps
   const detailed = searchParams.get('detailed');
   const from = searchParams.get('from');
   
-  const [data, setData] = useState(results[type]);
-  
-  // explore=true 파라미터가 있으면 간단한 버전 표시
-  if (explore === 'true') {
-    return <SimpleResultCard type={type} />;
-  }
-  
+  const [summary, setData] = useState(results[type]);
   const [hasTestResult, setHasTestResult] = useState(false);
+  const [details, setDetails] = useState<Partial<ResultData> | null>(null);
+
+  // 본문 상세 필드는 이 유형의 모듈만 불러옴 (이름, 점수 등 요약 필드는 results에서 바로 표시)
+  // 훅은 explore 분기보다 앞에 있어야 렌더마다 같은 순서로 호출됨
+  useEffect(() => {
+    if (explore === 'true') return;
+    let cancelled = false;
+    setDetails(null);
+    loadResultDetails(type).then((loaded) => {
+      if (!cancelled) setDetails(loaded);
+    });
+    return () => {
+      cancelled = true;
+    };
+  }, [type, explore]);
 
   useEffect(() => {
     if (!results[type]) return;
@@ -157,6 +119,13 @@ function ResultPageContent({ type, showExpanded = false }: ResultPageClientProps
     setData(originalData);
   }, [type, from]);
 
+  // explore=true 파라미터가 있으면 간단한 버전 표시
+  if (explore === 'true') {
+    return <SimpleResultCard type={type} />;
+  }
+
+  const data = summary && details ? { ...summary, ...details } : summary;
+
   if (!data) {
     return <div>결과를 찾을 수 없습니다.</div>;
   }
@@ -205,7 +174,6 @@ function ResultPageContent({ type, showExpanded = false }: ResultPageClientProps
               name={data.name}
               image={imagePath}
               scores={data.scores}
-              description={data.description}
               category={data.category}
               hideDetailButton={true}
               showChart={hasTestResult}
@@ -284,7 +252,9 @@ function ResultPageContent({ type, showExpanded = false }: ResultPageClientProps
                 <div 
                   className="text-gray-700 leading-relaxed"
                   dangerouslySetInnerHTML={{ 
-                    __html: renderMarkdownText(data.political_spectrum_detail || data.summary || '') 
+                    __html: data.political_spectrum_detail
+                      ? fieldHtml(data, 'political_spectrum_detail')
+                      : fieldHtml(data, 'summary')
                   }}
                 />
               </ExpandableSection>
@@ -300,7 +270,7 @@ function ResultPageContent({ type, showExpanded = false }: ResultPageClientProps
               >
                 <div 
                   className="text-gray-700 leading-relaxed"
-                  dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.detailed_description) }}
+                  dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'detailed_description') }}
                 />
               </ExpandableSection>
             )}
@@ -314,13 +284,13 @@ function ResultPageContent({ type, showExpanded = false }: ResultPageClientProps
               >
                 <div className="space-y-6 text-gray-700 leading-relaxed">
                   {data.speech_style && (
-                    <div dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.speech_style) }} />
+                    <div dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'speech_style') }} />
                   )}
                   {data.stress_moment && (
-                    <div dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.stress_moment) }} />
+                    <div dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'stress_moment') }} />
                   )}
                   {data.solution && (
-                    <div dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.solution) }} />
+                    <div dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'solution') }} />
                   )}
                 </div>
               </ExpandableSection>
@@ -335,13 +305,13 @@ function ResultPageContent({ type, showExpanded = false }: ResultPageClientProps
               >
                 <div className="space-y-6 text-gray-700 leading-relaxed">
                   {data.love_value && (
-                    <div dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.love_value) }} />
+                    <div dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'love_value') }} />
                   )}
                   {data.best_partner && (
-                    <div dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.best_partner) }} />
+                    <div dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'best_partner') }} />
                   )}
                   {data.worst_partner && (
-                    <div dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.worst_partner) }} />
+                    <div dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'worst_partner') }} />
                   )}
                 </div>
               </ExpandableSection>
@@ -356,7 +326,7 @@ function ResultPageContent({ type, showExpanded = false }: ResultPageClientProps
               >
                 <div 
                   className="text-gray-700 leading-relaxed"
-                  dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.communication_barrier) }}
+                  dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'communication_barrier') }}
                 />
               </ExpandableSection>
             )}
@@ -370,10 +340,10 @@ function ResultPageContent({ type, showExpanded = false }: ResultPageClientProps
               >
                 <div className="space-y-6 text-gray-700 leading-relaxed">
                   {data.career_value && (
-                    <div dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.career_value) }} />
+                    <div dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'career_value') }} />
                   )}
                   {data.financial_style && (
-                    <div dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.financial_style) }} />
+                    <div dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'financial_style') }} />
                   )}
                 </div>
               </ExpandableSection>
@@ -388,10 +358,10 @@ function ResultPageContent({ type, showExpanded = false }: ResultPageClientProps
               >
                 <div className="space-y-6 text-gray-700 leading-relaxed">
                   {data.historical_avatar && (
-                    <div dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.historical_avatar) }} />
+                    <div dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'historical_avatar') }} />
                   )}
                   {data.real_avatar && (
-                    <div dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.real_avatar) }} />
+                    <div dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'real_avatar') }} />
                   )}
                 </div>
               </ExpandableSection>
@@ -406,10 +376,10 @@ function ResultPageContent({ type, showExpanded = false }: ResultPageClientProps
               >
                 <div className="space-y-6 text-gray-700 leading-relaxed">
                   {data.growth_direction && (
-                    <div dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.growth_direction) }} />
+                    <div dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'growth_direction') }} />
                   )}
                   {data.final_goal && (
-                    <div dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.final_goal) }} />
+                    <div dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'final_goal') }} />
                   )}
                 </div>
               </ExpandableSection>
@@ -424,7 +394,7 @@ function ResultPageContent({ type, showExpanded = false }: ResultPageClientProps
               >
                 <div 
                   className="text-gray-700"
-                  dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.recommended_content) }}
+                  dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'recommended_content') }}
                 />
               </ExpandableSection>
             )}
@@ -503,7 +473,7 @@ function ResultPageContent({ type, showExpanded = false }: ResultPageClientProps
                 >
                   <div 
                     className="text-gray-700 leading-relaxed"
-                    dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.spectrum_analysis) }}
+                    dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'spectrum_analysis') }}
                   />
                 </ExpandableSection>
               )}
@@ -516,7 +486,7 @@ function ResultPageContent({ type, showExpanded = false }: ResultPageClientProps
                 >
                   <div 
                     className="text-gray-700 leading-relaxed"
-                    dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.detailed_analysis) }}
+                    dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'detailed_analysis') }}
                   />
                 </ExpandableSection>
               )}
@@ -531,12 +501,12 @@ function ResultPageContent({ type, showExpanded = false }: ResultPageClientProps
                   <div className="space-y-6 text-gray-700 leading-relaxed">
                     {data.synergy_partner && (
                       <div 
-                        dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.synergy_partner) }}
+                        dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'synergy_partner') }}
                       />
                     )}
                     {data.risk_partner && (
                       <div 
-                        dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.risk_partner) }}
+                        dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'risk_partner') }}
                       />
                     )}
                   </div>
@@ -553,12 +523,12 @@ function ResultPageContent({ type, showExpanded = false }: ResultPageClientProps
                   <div className="space-y-6 text-gray-700 leading-relaxed">
                     {data.success_formula && (
                       <div 
-                        dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.success_formula) }}
+                        dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'success_formula') }}
                       />
                     )}
                     {data.failure_formula && (
                       <div 
-                        dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.failure_formula) }}
+                        dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'failure_formula') }}
                       />
                     )}
                   </div>
@@ -573,7 +543,7 @@ function ResultPageContent({ type, showExpanded = false }: ResultPageClientProps
                 >
                   <div 
                     className="text-gray-700 leading-relaxed"
-                    dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.benchmarking) }}
+                    dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'benchmarking') }}
                   />
                 </ExpandableSection>
               )}
@@ -586,7 +556,7 @@ function ResultPageContent({ type, showExpanded = false }: ResultPageClientProps
                 >
                   <div 
                     className="text-gray-700 leading-relaxed"
-                    dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.career_navigation) }}
+                    dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'career_navigation') }}
                   />
                 </ExpandableSection>
               )}
@@ -621,7 +591,7 @@ function ResultPageContent({ type, showExpanded = false }: ResultPageClientProps
                           <h4 className="font-semibold mb-2 text-lg">
                             역사적 아바타{personName ? `: ${personName}` : ''}
                           </h4>
-                          <div dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.historical_avatar) }} />
+                          <div dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'historical_avatar') }} />
                         </div>
                       );
                     })()}
@@ -658,7 +628,7 @@ function ResultPageContent({ type, showExpanded = false }: ResultPageClientProps
                           <h4 className="font-semibold mb-2 text-lg">
                             현실 속 아바타{avatarName ? `: ${avatarName}` : ''}
                           </h4>
-                          <div dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.real_avatar) }} />
+                          <div dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'real_avatar') }} />
                         </div>
                       );
                     })()}
@@ -675,7 +645,7 @@ function ResultPageContent({ type, showExpanded = false }: ResultPageClientProps
                 >
                   <div 
                     className="text-gray-700"
-                    dangerouslySetInnerHTML={{ __html: renderMarkdownText(data.recommended_content) }}
+                    dangerouslySetInnerHTML={{ __html: fieldHtml(data, 'recommended_content') }}
                   />
                 </ExpandableSection>
               )}
@@ -1,27 +1,7 @@
-import Image from 'next/image';
 import Button from './Button';
+import ResponsiveImage from './ResponsiveImage';
 import { results } from '@/lib/results';
-
-// 마크다운 스타일 텍스트를 HTML로 변환하는 함수
-function renderMarkdownText(text: string) {
-  // **텍스트** -> <strong>텍스트</strong>
-  let html = text.replace(/\*\*(.*?)\*\*/g, '<strong class="font-semibold text-gray-900">$1</strong>');
-  
-  // ### 제목 처리
-  html = html.split('\n').map(paragraph => {
-    const trimmed = paragraph.trim();
-    if (!trimmed) return '';
-    
-    if (trimmed.startsWith('### ')) {
-      const titleText = trimmed.substring(4).trim();
-      return `<h3 class="text-xl font-bold mb-3 mt-6 text-gray-900">${titleText}</h3>`;
-    }
-    
-    return paragraph;
-  }).join('\n');
-  
-  return html;
-}
+import { fieldHtml } from '@/lib/html';
 
 interface SimpleResultCardProps {
   type: string;
@@ -72,12 +52,10 @@ export default function SimpleResultCard({ type }: SimpleResultCardProps) {
         {/* 심플한 카드 - 심볼, 이름, 간단 설명만 */}
         <div className="bg-white rounded-3xl border-4 border-accent shadow-xl p-8 text-center">
           <div className="relative mx-auto mb-8 w-full h-80 overflow-hidden isolation-isolate">
-            <Image
+            <ResponsiveImage
               src={imagePath}
               alt={type}
-              fill
-              className="object-contain"
-              quality={95}
+              className="absolute inset-0 w-full h-full object-contain"
               sizes="(max-width: 768px) 100vw, (max-width: 1200px) 80vw, 1200px"
               priority
             />
@@ -86,13 +64,13 @@ export default function SimpleResultCard({ type }: SimpleResultCardProps) {
           <h2 className="text-4xl font-bold text-accent mb-4">{type}</h2>
           <h3 className="text-2xl font-medium mb-6">{data.name}</h3>
           
-          <p 
+          <div 
             className="text-lg leading-relaxed text-gray-700 max-w-2xl mx-auto"
-            dangerouslySetInnerHTML={{ __html: renderMarkdownText(
+            dangerouslySetInnerHTML={{ __html: 
               data.category === 'economic' && data.spectrum_analysis 
-                ? data.spectrum_analysis 
-                : data.description
-            ) }}
+                ? fieldHtml(data, 'spectrum_analysis') 
+                : fieldHtml(data, 'description')
+            }}
           />
         </div>
 
@@ -1,9 +1,8 @@
 'use client';
 
-import { useState, useRef } from 'react';
-import Image from 'next/image';
-import html2canvas from 'html2canvas';
 import Button from './Button';
+import ResponsiveImage from './ResponsiveImage';
+import { cards } from '@/lib/generated/cards';
 
 interface SimpleResultViewProps {
   type: string;
@@ -12,35 +11,14 @@ interface SimpleResultViewProps {
 }
 
 export default function SimpleResultView({ type, name, category }: SimpleResultViewProps) {
-  const [isCapturing, setIsCapturing] = useState(false);
-  const cardRef = useRef<HTMLDivElement>(null);
-
   // IPUE는 PNG 파일이므로 특별 처리
   const imageExtension = type === 'IPUE' ? 'png' : 'jpg';
   const imagePath = category === 'political' 
     ? `/images/political/${type}.${imageExtension}`
     : `/images/economic/${type}.jpg`;
 
-  const handleSaveCard = async () => {
-    if (!cardRef.current) return;
-    
-    setIsCapturing(true);
-    
-    try {
-      const canvas = await html2canvas(cardRef.current);
-      
-      // 캔버스를 이미지로 변환하여 다운로드
-      const link = document.createElement('a');
-      link.download = `PEIT-${type}-결과.png`;
-      link.href = canvas.toDataURL();
-      link.click();
-    } catch (error) {
-      console.error('카드 저장 중 오류:', error);
-      alert('카드 저장에 실패했습니다. 다시 시도해 주세요.');
-    } finally {
-      setIsCapturing(false);
-    }
-  };
+  // 빌드 때 미리 그린 카드 (peit-content cards → public/cards/<코드>-square.<다이제스트>.png)
+  const cardUrl = cards[type]?.square?.png;
 
   return (
     <div className="min-h-screen bg-bg-light-purple py-12 flex flex-col items-center justify-center">
@@ -49,18 +27,15 @@ export default function SimpleResultView({ type, name, category }: SimpleResultV
           당신의 {category === 'political' ? '정치' : '경제'} 성향은
         </h1>
 
-        {/* 캡처될 카드 영역 */}
+        {/* 카드 미리보기 (저장 이미지는 같은 레이아웃으로 빌드 때 생성) */}
         <div 
-          ref={cardRef}
           className="bg-white rounded-3xl border-4 border-accent shadow-xl p-8 text-center mb-8"
         >
           <div className="relative mx-auto mb-6 w-full h-64 overflow-hidden isolation-isolate">
-            <Image
+            <ResponsiveImage
               src={imagePath}
               alt={type}
-              fill
-              className="object-contain"
-              quality={95}
+              className="absolute inset-0 w-full h-full object-contain"
               sizes="(max-width: 768px) 100vw, 512px"
               priority
             />
@@ -77,13 +52,15 @@ export default function SimpleResultView({ type, name, category }: SimpleResultV
 
         {/* 액션 버튼들 */}
         <div className="flex flex-col gap-4">
-          <button
-            onClick={handleSaveCard}
-            disabled={isCapturing}
-            className="w-full glass-purple text-white hover:bg-accent/30 hover:border-accent/50 font-semibold py-3 px-6 rounded-xl transition-all disabled:opacity-50"
-          >
-            {isCapturing ? '저장 중...' : '카드 저장하기'}
-          </button>
+          {cardUrl && (
+            <a
+              href={cardUrl}
+              download={`PEIT-${type}-결과.png`}
+              className="w-full glass-purple text-white hover:bg-accent/30 hover:border-accent/50 font-semibold py-3 px-6 rounded-xl transition-all text-center"
+            >
+              카드 저장하기
+            </a>
+          )}
           
           <Button 
             href={`/result/${type}?detailed=true`}
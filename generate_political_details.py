@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+data/political_details.txt → lib/political_details.ts 생성 스크립트
+- 추출, 정리, 값 보정, 검증, 직렬화를 한 번에 수행하고 결과 파일은 마지막에 한 번만 씀
+- --split DIR: 생성 결과를 유형별 JSON + index.ts로도 분할 (--split-only면 기존 출력만 분할)
+- --results: lib/generated/results.ts와 유형별 상세 lib/generated/details/도 다시 병합
+- 예전의 generate_political_details.js → cleanup_political_data.py → cleanup_all_fields.py
+  → final_cleanup.py → fix_format.py 순서를 대체
+- `python -m peit_content emit` 과 같음
+"""
+
+import sys
+
+from peit_content.cli import main
+
+if __name__ == '__main__':
+    sys.exit(main(['emit'] + sys.argv[1:]))
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+병합된 결과 데이터 생성 스크립트
+- lib/results_base.ts + lib/political_details.ts → lib/generated/results.ts (요약 필드)
+  + lib/generated/details/<유형 코드>.json (상세 필드와 html) + lib/generated/recommended_content.ts
+- 두 파일 중 하나를 고친 뒤(정리 스크립트 실행 포함) 다시 실행
+"""
+
+import argparse
+
+from peit_content.paths import DETAILS_PATH, RESULTS_BASE_PATH, RESULTS_OUTPUT_PATH
+from peit_content.results import build_results
+
+def main():
+    parser = argparse.ArgumentParser(description='결과 데이터 빌드 시 병합')
+    parser.add_argument('--base', default=RESULTS_BASE_PATH)
+    parser.add_argument('--details', default=DETAILS_PATH)
+    parser.add_argument('--output', default=RESULTS_OUTPUT_PATH)
+    args = parser.parse_args()
+
+    if build_results(args.base, args.details, args.output):
+        print(f"파일 저장 완료: {args.output}")
+    else:
+        print(f"변경 사항 없음: {args.output}")
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,4 @@
-import { politicalDetails } from './political_details';
+import { recommendedContent } from './generated/recommended_content';
 import { results } from './results';
 
 export interface Book {
@@ -102,49 +102,27 @@ function parseRecommendedContent(content: string): Book[] {
 
 /**
  * 모든 유형의 도서 정보를 수집하고 중복을 제거합니다.
+ * (정치 유형 다음 경제 유형 순서, generate_results.py가 recommended_content만 따로 생성)
  */
 export function getAllBooks(): Book[] {
   const bookMap = new Map<string, Book>();
   
-  // 정치 유형 도서 수집
-  Object.entries(politicalDetails).forEach(([typeCode, details]) => {
-    if (details.recommended_content) {
-      const books = parseRecommendedContent(details.recommended_content);
-      
-      books.forEach(book => {
-        // 같은 도서(제목+저자)가 이미 있으면 유형만 추가
-        const key = `${book.title}|${book.author}`;
-        if (bookMap.has(key)) {
-          const existingBook = bookMap.get(key)!;
-          if (!existingBook.relatedTypes.includes(typeCode)) {
-            existingBook.relatedTypes.push(typeCode);
-          }
-        } else {
-          book.relatedTypes = [typeCode];
-          bookMap.set(key, book);
-        }
-      });
-    }
-  });
-  
-  // 경제 유형 도서 수집
-  Object.entries(results).forEach(([typeCode, data]) => {
-    if (data.category === 'economic' && data.recommended_content) {
-      const books = parseRecommendedContent(data.recommended_content);
-      
-      books.forEach(book => {
-        const key = `${book.title}|${book.author}`;
-        if (bookMap.has(key)) {
-          const existingBook = bookMap.get(key)!;
-          if (!existingBook.relatedTypes.includes(typeCode)) {
-            existingBook.relatedTypes.push(typeCode);
-          }
-        } else {
-          book.relatedTypes = [typeCode];
-          bookMap.set(key, book);
+  Object.entries(recommendedContent).forEach(([typeCode, content]) => {
+    const books = parseRecommendedContent(content);
+    
+    books.forEach(book => {
+      // 같은 도서(제목+저자)가 이미 있으면 유형만 추가
+      const key = `${book.title}|${book.author}`;
+      if (bookMap.has(key)) {
+        const existingBook = bookMap.get(key)!;
+        if (!existingBook.relatedTypes.includes(typeCode)) {
+          existingBook.relatedTypes.push(typeCode);
         }
-      });
-    }
+      } else {
+        book.relatedTypes = [typeCode];
+        bookMap.set(key, book);
+      }
+    });
   });
   
   return Array.from(bookMap.values());
@@ -162,8 +140,8 @@ export function getBooksByType(typeCode: string): Book[] {
  * 모든 정치 유형 코드를 반환합니다.
  */
 export function getAllPoliticalTypes(): string[] {
-  return Object.keys(politicalDetails).filter(code => 
-    politicalDetails[code].category === 'political'
+  return Object.keys(results).filter(code => 
+    results[code].category === 'political'
   ).sort();
 }
 
@@ -0,0 +1,65 @@
+// 자동 생성 파일 - 직접 수정하지 마세요 (lib/generated/results.ts 에서 분할)
+
+export const typeCodes = ['IPAE', 'IPAS', 'IPUE', 'IPUS', 'ITAE', 'ITAS', 'ITUE', 'ITUS', 'CPAE', 'CPAS', 'CPUE', 'CPUS', 'CTAE', 'CTAS', 'CTUE', 'CTUS', 'GVE', 'GVW', 'GAE', 'GAW', 'SVE', 'SVW', 'SAE', 'SAW'] as const;
+
+export const typeNames: Record<string, string> = {
+  IPAE: "진보적 자유주의자 (Progressive Liberal)",
+  IPAS: "급진적 자유주의자 (Radical Liberal)",
+  IPUE: "합리적 개인주의자 (Rational Individualist)",
+  IPUS: "고전적 자유주의자 (Classical Liberal)",
+  ITAE: "실용주의적 보수주의자 (Pragmatic Conservative)",
+  ITAS: "보수적 자유주의자 (Conservative Liberal)",
+  ITUE: "원칙주의적 보수주의자 (Principled Conservative)",
+  ITUS: "고립주의적 자유주의자 (Isolationist Liberal)",
+  CPAE: "진보적 공동체주의자 (Progressive Communitarian)",
+  CPAS: "개혁적 국가주의자 (Reformist Nationalist)",
+  CPUE: "사회민주주의자 (Social Democrat)",
+  CPUS: "기술주의적 국가주의자 (Technocratic Nationalist)",
+  CTAE: "실용주의적 공동체주의자 (Pragmatic Communitarian)",
+  CTAS: "애국주의적 보수주의자 (Patriotic Conservative)",
+  CTUE: "중도 보수주의자 (Center-Right Conservative)",
+  CTUS: "국가주의적 보수주의자 (Nationalist Conservative)",
+  GVE: "비전을 현실로 만드는 혁신가",
+  GVW: "미래를 예측하는 조직의 탐험가",
+  GAE: "계산된 성장을 추구하는 전략 창업가",
+  GAW: "데이터를 통해 조직을 혁신하는 전문가",
+  SVE: "사회적 가치와 비전으로 변화를 만드는 지속가능한 리더",
+  SVW: "신념을 지키는 조직의 이상가",
+  SAE: "데이터를 기반으로 도전하는 현실적 사업가",
+  SAW: "리스크를 관리하는 조직의 파수꾼",
+};
+
+const loaders: Record<string, () => Promise<{ default: Record<string, any> }>> = {
+  IPAE: () => import('./IPAE.json'),
+  IPAS: () => import('./IPAS.json'),
+  IPUE: () => import('./IPUE.json'),
+  IPUS: () => import('./IPUS.json'),
+  ITAE: () => import('./ITAE.json'),
+  ITAS: () => import('./ITAS.json'),
+  ITUE: () => import('./ITUE.json'),
+  ITUS: () => import('./ITUS.json'),
+  CPAE: () => import('./CPAE.json'),
+  CPAS: () => import('./CPAS.json'),
+  CPUE: () => import('./CPUE.json'),
+  CPUS: () => import('./CPUS.json'),
+  CTAE: () => import('./CTAE.json'),
+  CTAS: () => import('./CTAS.json'),
+  CTUE: () => import('./CTUE.json'),
+  CTUS: () => import('./CTUS.json'),
+  GVE: () => import('./GVE.json'),
+  GVW: () => import('./GVW.json'),
+  GAE: () => import('./GAE.json'),
+  GAW: () => import('./GAW.json'),
+  SVE: () => import('./SVE.json'),
+  SVW: () => import('./SVW.json'),
+  SAE: () => import('./SAE.json'),
+  SAW: () => import('./SAW.json'),
+};
+
+/**
+ * 유형 하나의 상세 데이터만 불러옵니다. 없는 코드면 null을 반환합니다.
+ */
+export async function loadTypeDetails(code: string): Promise<Record<string, any> | null> {
+  const loader = loaders[code];
+  return loader ? (await loader()).default : null;
+}
@@ -0,0 +1,29 @@
+// 자동 생성 파일 - 직접 수정하지 마세요 (generate_results.py 로 생성)
+// 유형 코드 → recommended_content 원문 (lib/books.ts가 도서 목록을 뽑음)
+
+export const recommendedContent: Readonly<Record<string, string>> = {
+  "IPAS": "**📚 추천 도서:** **『권력의 법칙』 (로버트 그린):** <a href=\"https://link.coupang.com/a/c4m40N\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a><br>\n\n**📚 추천 도서:** **『어떻게 원하는 것을 얻는가』 (스튜어트 다이아몬드):** <a href=\"https://link.coupang.com/a/c4m54a\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:** 유튜브에서 **'설득의 심리학'**이나 **'협상 전략'** 관련 강의를 찾아보세요. 당신의 강력한 주장에 설득의 기술이 더해지면, 적을 만들지 않고도 승리할 수 있습니다.\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*",
+  "IPAE": "**📚 추천 도서:** **『린 스타트업』 (에릭 리스):** <a href=\"https://link.coupang.com/a/c4mXIL\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a><br>\n\n**📚 추천 도서:** **『팩트풀니스』 (한스 로슬링):** <a href=\"https://link.coupang.com/a/c4m3jT\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:** 유튜브나 온라인 클래스에서 **'사회적 기업 재무제표 읽는 법'**이나 **'데이터 기반 정책 분석'** 관련 콘텐츠를 찾아보세요. 숫자는 당신의 이상을 현실로 만드는 가장 강력한 언어입니다.\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*",
+  "IPUE": "**📚 추천 도서:** **『인간관계론』 (데일 카네기):** <a href=\"https://link.coupang.com/a/c4m5yh\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a><br>\n\n**📚 추천 도서:** **『생각에 관한 생각』 (대니얼 카너먼):** <a href=\"https://link.coupang.com/a/c4m65M\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:** 유튜브에서 **'비폭력 대화법'** 관련 영상을 찾아보세요. 이는 당신의 합리적인 메시지를 상대방이 상처 없이 받아들이게 하는 최고의 기술입니다.\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*",
+  "IPUS": "**📚 추천 도서:** **『나 홀로 볼링』 (로버트 퍼트넘):** <a href=\"https://link.coupang.com/a/c4m75Q\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a><br>\n\n**📚 추천 도서:** **『총, 균, 쇠』 (재레드 다이아몬드):** <a href=\"https://link.coupang.com/a/c4m8BG\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:** 유튜브에서 **'성공적인 팀워크'**나 **'협업의 기술'**에 대한 TED 강연을 찾아보세요. 혼자서는 이룰 수 없는 더 위대한 성과를 위해 어떻게 협력해야 하는지에 대한 통찰을 얻을 수 있습니다.\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*",
+  "ITAE": "**📚 추천 도서:** **『리더십 불변의 법칙』 (존 C. 맥스웰):** <a href=\"https://link.coupang.com/a/c5SLmg\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a><br>\n\n**📚 추천 도서:** **『블랙 스완』 (나심 니콜라스 탈레브):** <a href=\"https://link.coupang.com/a/c4m9Zt\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:** 유튜브에서 **'성공한 CEO들의 위기 극복 스토리'**를 다룬 다큐멘터리를 시청해보세요. 그들이 어떤 정보와 직관을 바탕으로 과감한 결정을 내렸는지 배울 수 있습니다.\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*",
+  "ITAS": "**📚 추천 도서:** **『정의란 무엇인가』 (마이클 샌델):** <a href=\"https://link.coupang.com/a/c4naqO\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a><br>\n\n**📚 추천 도서:** **『돈의 심리학』 (모건 하우절):** <a href=\"https://link.coupang.com/a/c4na2F\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:** 유튜브에서 **'사회적 기업가'**들의 창업 스토리를 담은 다큐멘터리를 시청해보세요. '돈 버는 것' 이상의 가치를 추구하는 사람들의 이야기를 통해, 당신이 놓치고 있던 새로운 관점을 발견할 수 있습니다.\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*",
+  "ITUE": "**📚 추천 도서:** **『성공하는 사람들의 7가지 습관』 (스티븐 코비):** <a href=\"https://link.coupang.com/a/c4nbn4\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a><br>\n\n**📚 추천 도서:** **『안티프래질』 (나심 니콜라스 탈레브):** <a href=\"https://link.coupang.com/a/c4nbQX\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:** 역사 속에서 위대한 리더들이 **'원칙을 깨고 예외를 허용하여'** 더 큰 성공을 이룬 사례(예: 링컨의 노예 해방 선언)를 다룬 역사 다큐멘터리를 찾아보세요.\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*",
+  "ITUS": "**📚 추천 도서:** **『사피엔스』 (유발 하라리):** <a href=\"https://link.coupang.com/a/c4nceA\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a><br>\n\n**📚 추천 도서:** **『지리의 힘』 (팀 마샬):** <a href=\"https://link.coupang.com/a/c4ncNp\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:** 유튜브에서 **'성공적인 글로벌 파트너십'** 사례에 대한 다큐멘터리나, 서로 다른 문화권의 사람들이 만나 교류하는 여행 콘텐츠를 시청해보세요. 당신이 몰랐던 '연결'의 긍정적인 측면을 발견할 수 있습니다.\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*",
+  "CPAE": "**📚 추천 도서:** **『바른 마음』 (조너선 하이트):** <a href=\"https://link.coupang.com/a/c4ndre\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a><br>\n\n**📚 추천 도서:** **『설득의 심리학』 (로버트 치알디니):** <a href=\"https://link.coupang.com/a/c4neEQ\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:** 당신이 가장 비판적으로 생각하는 **보수 논객의 토론 영상** 중, 가장 논리적이라고 생각되는 영상을 하나 찾아 '그 사람이 왜 저렇게 생각할까?'를 이해하려는 목적으로 시청해보세요.\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*",
+  "CPAS": "**📚 추천 도서:** **『아주 작은 습관의 힘』 (제임스 클리어):** <a href=\"https://link.coupang.com/a/c4nfHy\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a><br>\n\n**📚 추천 도서:** **『군주론』 (니콜로 마키아벨리):** <a href=\"https://link.coupang.com/a/c4ngi7\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:** 유튜브에서 **'대한민국 헌법의 가치'**나 **'민주적 의사결정 과정'**에 대한 교양 강의를 시청해보세요. 당신이 때로 답답하게 느끼는 '절차'가 왜 공동체를 지키기 위해 필수적인지 이해할 수 있습니다.\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*",
+  "CPUE": "**📚 추천 도서:** **『국가는 왜 실패하는가』 (대런 아세모글루):** <a href=\"https://link.coupang.com/a/c4ngW3\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a><br>\n\n**📚 추천 도서:** **『정치와 비전』 (셸던 월린):** <a href=\"https://link.coupang.com/a/c4njP6\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:** 유튜브에서 **'북유럽 복지국가의 그림자'**나 **'베네수엘라 경제 위기의 원인'**을 다룬 다큐멘터리를 시청해보세요. 복지 정책의 성공 조건과 실패 원인을 객관적으로 학습할 수 있습니다.\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*",
+  "CPUS": "**📚 추천 도서:** **『생각에 관한 생각』 (대니얼 카너먼):** <a href=\"https://link.coupang.com/a/c4nkmM\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a><br>\n\n**📚 추천 도서:** **『감시와 처벌』 (미셸 푸코):** <a href=\"https://link.coupang.com/a/c4nkVA\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:** 인문학이나 심리학 관련 교양 강의, 특히 **'인간의 감정'**이나 **'비이성적 행동'**을 주제로 한 TED 강연을 찾아보세요. 당신이 '버그'라고 생각했던 인간의 행동에 대한 깊은 이해를 얻을 수 있습니다.\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*",
+  "CTAE": "**📚 추천 도서:** **『좋은 기업을 넘어 위대한 기업으로』 (짐 콜린스):** <a href=\"https://link.coupang.com/a/c4nlnX\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a><br>\n\n**📚 추천 도서:** **『원칙』 (레이 달리오):** <a href=\"https://link.coupang.com/a/c4nlKF\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:** 존경받는 리더들의 '인생 철학'이나 '핵심 가치'에 대한 인터뷰 영상을 시청해보세요. 그들이 어떻게 단기적인 유혹을 뿌리치고, 장기적인 비전을 지켜나갔는지 배울 수 있습니다.\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*",
+  "CTAS": "**📚 추천 도서:** **『지리의 힘』 (팀 마샬):** <a href=\"https://link.coupang.com/a/c4nmiu\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a><br>\n\n**📚 추천 도서:** **『코스모스』 (칼 세이건):** <a href=\"https://link.coupang.com/a/c4nmDa\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:** 당신이 가장 비판적으로 생각하는 **내부 비판가** (예: 보수 진영을 비판하는 보수 논객)의 토론 영상을 찾아, 그의 주장에서 '우리 공동체를 더 좋게 만들고 싶은 애정'이 느껴지는 부분이 있는지 찾아보세요.\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*",
+  "CTUE": "**📚 추천 도서:** **『딥워크』 (칼 뉴포트):** <a href=\"https://link.coupang.com/a/c4nmWS\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a><br>\n\n**📚 추천 도서:** **『정리하는 뇌』 (대니얼 J. 레비틴):** <a href=\"https://link.coupang.com/a/c4nnhH\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:** 역사 속에서, **'모두의 반대를 무릅쓴 리더의 결단'**이 어떻게 조직이나 국가의 운명을 바꾸었는지에 대한 다큐멘터리를 시청해보세요. (예: 미국의 달 착륙 결정)\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*",
+  "CTUS": "**📚 추천 도서:** **『원칙』 (레이 달리오):** <a href=\"https://link.coupang.com/a/c4nnLZ\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a><br>\n\n**📚 추천 도서:** **『사피엔스』 (유발 하라리):** <a href=\"https://link.coupang.com/a/c4nv6c\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:** 유튜브에서 당신과 **반대되는 정치 성향을 가진 지식인**의 '가장 논리적인 인터뷰 영상'을 찾아 편견 없이 끝까지 시청해보세요. 당신이 동의하지 않더라도, 그들의 논리 구조를 이해하는 것만으로도 당신의 사고는 확장될 것입니다.\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*",
+  "GVE": "**📚 추천 도서:** **『제로 투 원』 (피터 틸):** <a href=\"https://link.coupang.com/a/c4nwtT\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a>\n\n**📚 추천 도서:** **『그릿』 (앤젤라 더크워스):** <a href=\"https://link.coupang.com/a/c4nwQU\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:** 유튜브에서 **'스타트업 성공 전략', '혁신 리더십', '실행력 강화'** 관련 강의나 영상을 찾아보세요. 당신의 비전을 더욱 빠르고 효과적으로 현실화하는 데 필요한 실질적인 지식과 영감을 얻을 수 있습니다.\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*",
+  "GVW": "**📚 추천 도서:** **『변화의 시작 5초의 법칙』 (멜 로빈스):** <a href=\"https://link.coupang.com/a/c4nxt5\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a>\n\n**📚 추천 도서:** **『생각의 탄생』 (로버트 루트번스타인, 미셸 루트번스타인):** <a href=\"https://link.coupang.com/a/c4nx4z\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:** 유튜브에서 **'미래학 트렌드', '거시 경제 분석', '선행 지표 분석'** 관련 강의나 영상을 찾아보세요. 당신의 예측 능력을 데이터 기반의 통찰과 결합하여, 조직에 더욱 명확한 방향성을 제시하는 데 필요한 지식을 얻을 수 있습니다.\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*",
+  "GAE": "**📚 추천 도서:** **『스타트업 바이블』 (빌 올렛):** <a href=\"https://link.coupang.com/a/c4nyOa\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a>\n\n**📚 추천 도서:** **『경영의 모험』 (존 브룩스):** <a href=\"https://link.coupang.com/a/c4nzc5\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:** 유튜브에서 **'린 스타트업', '비즈니스 모델 캔버스', '데이터 기반 의사결정'** 관련 강의나 영상을 찾아보세요. 당신의 전략적인 창업 역량에 실행력을 더하고, 성장을 가속화하는 데 필요한 실질적인 지식과 노하우를 얻을 수 있습니다.\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*",
+  "GAW": "**📚 추천 도서:** **『데이터는 어떻게 세상을 지배하는가』 (강성호):** <a href=\"https://link.coupang.com/a/c4nzLo\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a>\n\n**📚 추천 도서:** **『인간관계론』 (데일 카네기):** <a href=\"https://link.coupang.com/a/c4nAUH\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:** 유튜브에서 **'데이터 시각화', '비즈니스 프레젠테이션', '설득의 기술'** 관련 강의나 영상을 찾아보세요. 당신의 강력한 데이터 분석 역량을 조직 내 변화를 이끄는 실질적인 동력으로 전환하는 데 필요한 노하우를 얻을 수 있습니다.\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*",
+  "SVE": "**📚 추천 도서:** **『부자의 그릇』 (이즈미 마사토):** <a href=\"https://link.coupang.com/a/c4nBlc\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a>\n\n**📚 추천 도서:** **『나쁜 사마리아인들』 (장하준):** <a href=\"https://link.coupang.com/a/c4nBHo\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:** 유튜브에서 **'사회적 기업가 정신', '임팩트 투자', '비영리 조직의 수익 모델'** 관련 강의나 영상을 찾아보세요. 당신의 따뜻한 비전이 현실에서 단단하고 지속 가능한 힘을 가질 수 있도록 돕는 실용적인 지식을 얻을 수 있습니다.\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*",
+  "SVW": "**📚 추천 도서:** **『어떻게 원하는 것을 얻는가』 (스튜어트 다이아몬드):** <a href=\"https://link.coupang.com/a/c4nB5n\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a>\n\n**📚 추천 도서:** **『기브 앤 테이크』 (애덤 그랜트):** <a href=\"https://link.coupang.com/a/c4nCox\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:** 유튜브에서 **'조직 문화 혁신', '변화 관리 리더십', '내부 브랜딩'** 관련 강의나 영상을 찾아보세요. 당신의 확고한 신념이 조직 전체의 동력으로 작용하도록 만드는 효과적인 소통 및 실행 전략을 배울 수 있습니다.\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*",
+  "SAE": "**📚 추천 도서:** **『한국형 장사의 신』 (김유진):** <a href=\"https://link.coupang.com/a/c4nCQe\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a>\n\n**📚 추천 도서:** **『아이디어 불패의 법칙』 (알베르토 사보이아):** <a href=\"https://link.coupang.com/a/c4nDkm\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:** 유튜브에서 **'고객 관계 관리 (CRM)', '네트워킹 전략', '사업 제휴 노하우'** 관련 강의나 영상을 찾아보세요. 당신의 데이터 기반 사업 역량에 사람을 얻는 기술을 더하여, 사업의 지속적인 성공을 위한 기반을 다질 수 있습니다.\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*",
+  "SAW": "**📚 추천 도서:** **『블랙 스완』 (나심 니콜라스 탈레브):** <a href=\"https://link.coupang.com/a/c4nDIP\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a>\n\n**📚 추천 도서:** **『더 골』 (엘리 골드렛):** <a href=\"https://link.coupang.com/a/c4nD4E\" target=\"_blank\" rel=\"noopener noreferrer\" class=\"text-blue-600 underline\">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:** 유튜브에서 **'위기 관리 전략', '준법 경영', '사업 연속성 계획(BCP)'** 관련 강의나 영상을 찾아보세요. 당신의 탁월한 리스크 관리 능력을 조직의 지속 가능한 성장을 위한 강력한 방패이자, 때로는 새로운 기회를 모색하는 발판으로 삼는 방법을 배울 수 있습니다.\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*"
+};
@@ -0,0 +1,869 @@
+// 자동 생성 파일 - 직접 수정하지 마세요 (generate_results.py 로 생성)
+import { ResultData } from '../types';
+
+export const results: Readonly<Record<string, Readonly<ResultData>>> = {
+  "IPAE": {
+    "name": "진보적 자유주의자 (Progressive Liberal)",
+    "category": "political",
+    "scores": {
+      "개인주의": 85,
+      "진보주의": 75,
+      "적극적 평등": 70,
+      "협력 우선": 80
+    },
+    "description": "당신은 \"원래 그래왔다\"는 말보다 \"더 나아질 수 있다\"는 말을 믿는 사람입니다. 당신의 머릿속은 어떻게 하면 세상을 더 합리적이고, 더 평등하고, 더 자유로운 곳으로 만들 수 있을지에 대한 아이디어로 가득 차 있습니다. 때로는 이상이 너무 높아 현실의 벽 앞에서 좌절하기도 하지만, 당신은 결코 변화에 대한 희망을 놓지 않습니다. 결국 당신을 움직이는 핵심 동력은 \"더 나은 세상은 가능하다\"는 꺾이지 않는 믿음입니다.",
+    "keywords": [
+      "자유로운영혼",
+      "프로변화러",
+      "이상주의자",
+      "토론환영",
+      "내가바꾸는세상"
+    ],
+    "strengths": [
+      "정의로운 공감 능력: 사회적 약자나 불평등 문제에 깊이 공감하며, 이를 해결하기 위해 목소리를 내는 것을 주저하지 않습니다.",
+      "유연한 사고: '원래 그래왔다'는 말에 얽매이지 않고, 더 나은 세상을 위해 새로운 아이디어를 적극적으로 수용합니다.",
+      "설득력 있는 소통: 이상주의자이지만, 감정적인 선동보다 합리적인 대화를 통해 사람들의 마음을 움직이는 힘이 있습니다.",
+      "개방성과 포용력: 나와 다른 배경을 가진 사람이나 새로운 문화를 편견 없이 받아들이고 함께 어울리는 것을 즐깁니다.",
+      "긍정적 행동주의: 현실을 비관하기보다 미래를 낙관하며, 더 나은 가능성을 향해 기꺼이 첫걸음을 내딛습니다."
+    ],
+    "weaknesses": [
+      "이상주의적 경향: 현실의 복잡성과 제약을 간과하고, 이상만으로 모든 것을 해결하려 할 수 있습니다.",
+      "느린 변화에 대한 조급함: 사회 변화의 속도가 더디다고 느끼면 쉽게 좌절하거나 냉소적으로 변할 수 있습니다.",
+      "현실 감각 부족: '대의'에 집중한 나머지, 먹고사는 문제와 같은 현실적인 문제의 중요성을 간과할 때가 있습니다.",
+      "감정적 소모: 타인의 문제에 깊이 공감하는 만큼, 감정적으로 쉽게 지치거나 소모될 수 있습니다.",
+      "원칙의 모호성: 유연함을 너무 강조한 나머지, 때로는 지켜야 할 원칙마저 흔들리는 것처럼 보일 수 있습니다."
+    ],
+    "html": {
+      "description": "<p class=\"mb-4 last:mb-0\">당신은 \"원래 그래왔다\"는 말보다 \"더 나아질 수 있다\"는 말을 믿는 사람입니다. 당신의 머릿속은 어떻게 하면 세상을 더 합리적이고, 더 평등하고, 더 자유로운 곳으로 만들 수 있을지에 대한 아이디어로 가득 차 있습니다. 때로는 이상이 너무 높아 현실의 벽 앞에서 좌절하기도 하지만, 당신은 결코 변화에 대한 희망을 놓지 않습니다. 결국 당신을 움직이는 핵심 동력은 \"더 나은 세상은 가능하다\"는 꺾이지 않는 믿음입니다.</p>"
+    }
+  },
+  "IPAS": {
+    "name": "급진적 자유주의자 (Radical Liberal)",
+    "category": "political",
+    "scores": {
+      "개인주의": 85,
+      "진보주의": 80,
+      "적극적 평등": 75,
+      "안보 우선": 85
+    },
+    "description": "당신은 \"미지근한 것\"을 견디지 못하는 사람입니다. 어중간한 타협보다는, 문제의 핵심을 꿰뚫고 가장 확실하게 해결하는 것을 선호합니다. 당신에게 세상은 더 효율적이고 자유로운 곳이 되어야 하며, 이를 가로막는 낡은 관습이나 기득권은 타파의 대상이라고 생각합니다. 결국 당신을 움직이는 핵심 동력은 \"비효율과 불합리에 대한 강한 저항 정신\"입니다.",
+    "keywords": [
+      "마이웨이",
+      "급진적개혁",
+      "강한신념",
+      "타협은없다",
+      "판을흔드는자"
+    ],
+    "strengths": [
+      "강력한 문제 해결 의지: 문제의 핵심을 파악하고, 기존의 틀을 깨서라도 해결하려는 강력한 추진력을 가지고 있습니다.",
+      "두려움 없는 도전 정신: 남들이 모두 불가능하다고 말하는 일에 과감히 도전하여 새로운 판을 짜는 것을 두려워하지 않습니다.",
+      "자기 확신: 자신의 신념과 판단에 대한 믿음이 강해, 외부의 비판에 쉽게 흔들리지 않습니다.",
+      "결단력: 복잡한 상황에서도 좌고우면하지 않고, 목표를 위해 빠른 결정을 내리는 능력이 있습니다.",
+      "높은 에너지: 자신의 목표를 향해 나아갈 때, 지치지 않는 열정과 에너지를 보여줍니다."
+    ],
+    "weaknesses": [
+      "지나친 독단성: 자신의 신념이 너무 강한 나머지, 다른 사람의 의견을 무시하거나 독선적으로 보일 수 있습니다.",
+      "과도한 리스크 감수: '모 아니면 도'라는 생각으로, 실패 시의 충격을 고려하지 않은 채 너무 큰 리스크를 짊어질 수 있습니다.",
+      "타협 능력 부족: 점진적인 개선이나 협상보다는, 모든 것을 한번에 바꾸려는 성향 때문에 불필요한 적을 만들곤 합니다.",
+      "과정의 무시: '결과'를 너무 중시한 나머지, 그 과정에서의 절차적 정당성이나 타인의 감정을 무시할 수 있습니다.",
+      "불안정성: 끊임없이 기존의 것을 파괴하려는 성향 때문에, 주변 사람들에게 예측 불가능하고 불안정한 사람이라는 인상을 줍니다."
+    ],
+    "html": {
+      "description": "<p class=\"mb-4 last:mb-0\">당신은 \"미지근한 것\"을 견디지 못하는 사람입니다. 어중간한 타협보다는, 문제의 핵심을 꿰뚫고 가장 확실하게 해결하는 것을 선호합니다. 당신에게 세상은 더 효율적이고 자유로운 곳이 되어야 하며, 이를 가로막는 낡은 관습이나 기득권은 타파의 대상이라고 생각합니다. 결국 당신을 움직이는 핵심 동력은 \"비효율과 불합리에 대한 강한 저항 정신\"입니다.</p>"
+    }
+  },
+  "IPUE": {
+    "name": "합리적 개인주의자 (Rational Individualist)",
+    "category": "political",
+    "scores": {
+      "개인주의": 80,
+      "진보주의": 65,
+      "보편적 평등": 70,
+      "협력 우선": 75
+    },
+    "description": "당신은 친구들과의 논쟁에서 \"그래서 네 주장의 근거가 뭔데?\"라는 질문을 던지는 편입니다. 당신에게 세상은 뜨거운 감정이 아닌 차가운 논리로 움직여야 하는 곳입니다. 어떤 문제든 감정적인 호소보다는, 객관적인 데이터와 합리적인 근거를 바탕으로 토론하고 설득하는 것을 선호합니다. 결국 당신을 움직이는 핵심 동력은 \"편견과 비논리를 걷어내고 가장 합리적인 해답을 찾으려는 지적 열망\"입니다.",
+    "keywords": [
+      "합리주의",
+      "이성",
+      "토론환영",
+      "팩트기반",
+      "중립적"
+    ],
+    "strengths": [
+      "논리적인 설득력: 감정에 호소하기보다, 객관적인 데이터와 사실을 바탕으로 상대방을 설득하는 데 매우 능숙합니다.",
+      "균형 잡힌 시각: 특정 진영 논리에 휩쓸리지 않고, 사안별로 장단점을 분석하여 가장 합리적인 결론을 도출하려 합니다.",
+      "높은 지적 정직성: 자신의 생각이 틀렸다는 것을 논리적으로 납득하면, 기꺼이 자신의 입장을 바꾸는 유연함을 가지고 있습니다.",
+      "일관성: 기분이나 상황에 따라 원칙이 흔들리지 않아, 주변 사람들로부터 공정하고 예측 가능한 사람이라는 신뢰를 얻습니다.",
+      "독립적 사고: 다수의 의견이나 사회적 압력에 휩쓸리지 않고, 자신만의 논리와 원칙에 따라 독립적으로 판단합니다."
+    ],
+    "weaknesses": [
+      "결정 장애: 모든 것을 너무 신중하고 합리적으로만 판단하려다, 정작 중요한 결정을 내려야 할 타이밍을 놓칠 수 있습니다.",
+      "차가운 인상: 이성적인 측면이 너무 강조되어, 타인에게 '공감 능력이 부족하다'거나 '인간미 없다'는 오해를 살 수 있습니다.",
+      "행동력 부족: 완벽한 논리가 세워지기 전까지는 행동에 나서기를 주저하여, '비판만 하는 방관자'로 비칠 위험이 있습니다.",
+      "과도한 이상주의: 세상이 항상 합리적이고 논리적으로 움직일 것이라고 믿어, 현실의 비이성적인 측면을 간과할 수 있습니다.",
+      "엘리트주의적 시각: 자신의 지적 능력을 과신한 나머지, 자신보다 덜 논리적이라고 생각하는 사람들의 의견을 무시하는 경향을 보일 수 있습니다."
+    ],
+    "html": {
+      "description": "<p class=\"mb-4 last:mb-0\">당신은 친구들과의 논쟁에서 \"그래서 네 주장의 근거가 뭔데?\"라는 질문을 던지는 편입니다. 당신에게 세상은 뜨거운 감정이 아닌 차가운 논리로 움직여야 하는 곳입니다. 어떤 문제든 감정적인 호소보다는, 객관적인 데이터와 합리적인 근거를 바탕으로 토론하고 설득하는 것을 선호합니다. 결국 당신을 움직이는 핵심 동력은 \"편견과 비논리를 걷어내고 가장 합리적인 해답을 찾으려는 지적 열망\"입니다.</p>"
+    }
+  },
+  "IPUS": {
+    "name": "고전적 자유주의자 (Classical Liberal)",
+    "category": "political",
+    "scores": {
+      "개인주의": 85,
+      "진보주의": 60,
+      "보편적 평등": 70,
+      "안보 우선": 80
+    },
+    "description": "\"국가가 나를 위해 무엇을 해줄지 기대하지 마라\"는 말을 마음속 깊이 동의하는 사람입니다. 당신은 각자의 삶은 각자가 책임지는 것이 가장 공정하고 효율적인 사회라고 믿습니다. 불필요한 규제나 과도한 세금은 개인의 창의성과 경제 전체의 활력을 앗아가는 것이라 생각합니다. 결국 당신을 움직이는 핵심 동력은 \"그 누구의 간섭도 받지 않고 스스로의 삶을 개척하려는 강한 독립 의지\"입니다.",
+    "keywords": [
+      "각자도생",
+      "작은정부",
+      "시장주의",
+      "현실주의",
+      "자유방임"
+    ],
+    "strengths": [
+      "강한 독립성과 책임감: 누구에게도 의존하지 않고, 자신의 삶은 스스로 책임져야 한다는 건강한 마음가짐을 가지고 있습니다.",
+      "효율성 중시: 불필요한 규제나 비효율적인 절차를 싫어하며, 가장 빠르고 효율적인 방식으로 문제를 해결하려 합니다.",
+      "현실적인 판단력: 이상적인 구호보다, 실제 개인의 삶에 어떤 이득이 되는지를 먼저 생각하는 현실적인 감각이 뛰어납니다.",
+      "자기 주도성: 누군가에게 이끌려가기보다, 스스로 목표를 설정하고 자신의 길을 개척해나가는 것을 선호합니다.",
+      "공정함 추구: 모든 사람이 동등한 규칙 아래서 자유롭게 경쟁하는 것을 가장 공정하다고 생각합니다."
+    ],
+    "weaknesses": [
+      "사회적 연대감 부족: '각자도생'의 신념이 너무 강해, 사회 구조적인 문제나 약자에 대한 공감대가 부족할 수 있습니다.",
+      "지나친 경쟁주의: 세상을 '제로섬 게임'으로 인식하여, 타인과의 협력보다 경쟁에서 이기는 것을 더 중요하게 생각할 수 있습니다.",
+      "냉소적인 태도: 공동체의 가치나 이타적인 행동을 '위선'이나 '비효율'로 치부하며 냉소적으로 바라보는 경향이 있습니다.",
+      "결과지상주의: 과정의 공정성보다는, 최종적인 결과와 효율성을 더 중요하게 여겨 과정의 문제점을 간과할 수 있습니다.",
+      "인간관계의 어려움: 지나치게 독립적이고 실리적인 태도 때문에, 깊고 정서적인 유대 관계를 맺는 데 어려움을 겪을 수 있습니다."
+    ],
+    "html": {
+      "description": "<p class=\"mb-4 last:mb-0\">\"국가가 나를 위해 무엇을 해줄지 기대하지 마라\"는 말을 마음속 깊이 동의하는 사람입니다. 당신은 각자의 삶은 각자가 책임지는 것이 가장 공정하고 효율적인 사회라고 믿습니다. 불필요한 규제나 과도한 세금은 개인의 창의성과 경제 전체의 활력을 앗아가는 것이라 생각합니다. 결국 당신을 움직이는 핵심 동력은 \"그 누구의 간섭도 받지 않고 스스로의 삶을 개척하려는 강한 독립 의지\"입니다.</p>"
+    }
+  },
+  "ITAE": {
+    "name": "실용주의적 보수주의자 (Pragmatic Conservative)",
+    "category": "political",
+    "scores": {
+      "개인주의": 65,
+      "전통주의": 75,
+      "적극적 평등": 65,
+      "협력 중시": 70
+    },
+    "description": "당신은 '옛것'의 가치를 알지만, '새것'을 무조건 배척하지는 않는 지혜로운 사람입니다. \"세상에는 정답이 없다\"는 것을 알고 있으며, 뜨거운 이념 논쟁보다는 실제 사람들의 삶에 도움이 되는 현실적인 해결책을 찾는 데 더 큰 가치를 둡니다. 결국 당신을 움직이는 핵심 동력은 '과거의 지혜와 현재의 변화 사이에서 최적의 균형점을 찾으려는 조화의 의지'입니다.",
+    "keywords": [
+      "지혜로운어른",
+      "외유내강",
+      "중용의미덕",
+      "실용주의",
+      "품격"
+    ],
+    "strengths": [
+      "균형 감각: 급진적인 변화와 완고한 현상 유지 사이에서, 현실적인 균형점을 찾아내는 능력이 탁월합니다.",
+      "실용적인 태도: 이념이나 명분보다, 실제 공동체에 어떤 이득이 되는지를 우선시하는 실용적인 사고를 합니다.",
+      "높은 포용력: 전통을 존중하면서도, 새로운 세대의 문화를 이해하고 소통하려는 열린 마음을 가지고 있습니다.",
+      "안정적인 리더십: 갈등을 중재하고, 다양한 의견을 조율하여 조직을 안정적으로 이끄는 능력이 있습니다.",
+      "인내심: 단기적인 성과에 조급해하지 않고, 장기적인 관점에서 공동체의 안정을 위해 꾸준히 노력합니다."
+    ],
+    "weaknesses": [
+      "결단력 부족: 너무 신중하게 모든 측면을 고려하다 보니, 위기 상황에서 과감한 결단을 내리지 못하고 우유부단하게 보일 수 있습니다.",
+      "모호한 정체성: 양쪽의 입장을 모두 이해하려는 태도 때문에, 때로는 '회색분자'처럼 보이거나 뚜렷한 자기 색깔이 없다는 비판을 받을 수 있습니다.",
+      "느린 의사결정: 빠른 변화가 필요한 상황에서, 그의 점진적인 접근 방식은 답답하게 느껴질 수 있습니다.",
+      "기회 상실: 안정을 너무 중시한 나머지, 리스크를 감수해야 얻을 수 있는 혁신적인 기회를 놓칠 수 있습니다.",
+      "권위에 대한 순응: 기존의 질서와 권위를 존중하는 태도가, 때로는 불합리한 점을 비판 없이 수용하는 모습으로 비칠 수 있습니다."
+    ],
+    "html": {
+      "description": "<p class=\"mb-4 last:mb-0\">당신은 <span class=\"text-accent font-medium\">'옛것'</span>의 가치를 알지만, <span class=\"text-accent font-medium\">'새것'</span>을 무조건 배척하지는 않는 지혜로운 사람입니다. \"세상에는 정답이 없다\"는 것을 알고 있으며, 뜨거운 이념 논쟁보다는 실제 사람들의 삶에 도움이 되는 현실적인 해결책을 찾는 데 더 큰 가치를 둡니다. 결국 당신을 움직이는 핵심 동력은 <span class=\"text-accent font-medium\">'과거의 지혜와 현재의 변화 사이에서 최적의 균형점을 찾으려는 조화의 의지'</span>입니다.</p>"
+    }
+  },
+  "ITAS": {
+    "name": "보수적 자유주의자 (Conservative Liberal)",
+    "category": "political",
+    "scores": {
+      "개인주의": 75,
+      "전통주의": 80,
+      "적극적 평등": 60,
+      "안보 우선": 85
+    },
+    "description": "당신은 \"감상적인 민족주의\"보다 \"현실적인 국익\"이 훨씬 중요하다고 생각하는 편입니다. 자유로운 시장 경쟁이 국가 전체의 파이를 키우며, 그렇게 얻은 부와 힘으로 국제 사회에서 당당히 목소리를 내야 한다고 믿습니다. 결국 당신을 움직이는 핵심 동력은 \"자유로운 개인들이 모여 위대한 국가를 만든다\"는 강한 믿음입니다.",
+    "keywords": [
+      "강한대한민국",
+      "국익이최고",
+      "시장주의자",
+      "보수논객",
+      "작은정부"
+    ],
+    "strengths": [
+      "명확한 경제 철학: '자유 시장'과 '작은 정부'라는 명확하고 일관된 철학을 가지고 있습니다.",
+      "강한 책임감: 국가와 사회에 기대기보다, 개인의 책임을 강조하며 스스로의 삶을 개척해나갑니다.",
+      "원칙 준수: 자신이 옳다고 믿는 원칙에 대해서는 어떠한 비판에도 타협하지 않는 굳건함을 보여줍니다.",
+      "국부에 대한 비전: 개인의 자유로운 경제 활동이 모여, 국가 전체의 부를 증진시킨다는 명확한 비전을 가지고 있습니다.",
+      "높은 효율성: 불필요한 규제와 절차를 제거하여, 가장 효율적인 방식으로 목표를 달성하는 것을 선호합니다."
+    ],
+    "weaknesses": [
+      "소외 계층에 대한 낮은 공감: 경제적 효율성을 너무 강조한 나머지, 경쟁에서 뒤처진 사회적 약자의 어려움을 간과할 수 있습니다.",
+      "과도한 이상주의: 모든 인간이 합리적이고 책임감 있게 행동할 것이라는, 시장에 대한 이상적인 믿음을 가질 수 있습니다.",
+      "비타협적인 태도: 자신의 경제 철학에 대한 믿음이 너무 강해, 다른 의견을 가진 사람들과 타협하는 것을 매우 어려워합니다.",
+      "공공 가치 경시: 교육, 의료, 환경 등 시장 논리로만 해결할 수 없는 공공의 가치를 경시하는 경향이 있습니다.",
+      "물질주의적 시각: 세상의 많은 가치를 '경제적 효용성'으로만 판단하여, 인간적인 가치를 놓칠 위험이 있습니다."
+    ],
+    "html": {
+      "description": "<p class=\"mb-4 last:mb-0\">당신은 \"감상적인 민족주의\"보다 \"현실적인 국익\"이 훨씬 중요하다고 생각하는 편입니다. 자유로운 시장 경쟁이 국가 전체의 파이를 키우며, 그렇게 얻은 부와 힘으로 국제 사회에서 당당히 목소리를 내야 한다고 믿습니다. 결국 당신을 움직이는 핵심 동력은 \"자유로운 개인들이 모여 위대한 국가를 만든다\"는 강한 믿음입니다.</p>"
+    }
+  },
+  "ITUE": {
+    "name": "원칙주의적 보수주의자 (Principled Conservative)",
+    "category": "political",
+    "scores": {
+      "개인주의": 70,
+      "전통주의": 80,
+      "보편적 평등": 75,
+      "협력 우선": 80
+    },
+    "description": "당신은 친구들과의 약속에서도 \"N분의 1\"을 선호하는 타입일 가능성이 높습니다. 모두가 동의할 수 있는 합리적인 규칙을 만드는 것을 중요하게 여기며, 논리 정연한 근거와 품격 있는 태도로 상대방을 설득하는 것을 선호합니다. 결국 당신을 움직이는 핵심 동력은 \"흔들리지 않는 원칙을 통해 예측 가능하고 공정한 사회를 만들려는 소망\"입니다.",
+    "keywords": [
+      "젠틀맨",
+      "합리적보수",
+      "원칙",
+      "신뢰",
+      "외교관"
+    ],
+    "strengths": [
+      "높은 신뢰도: 일관된 원칙과 품격 있는 태도로 주변 사람들로부터 깊은 신뢰를 얻습니다.",
+      "합리적인 판단력: 감정이나 진영 논리에 휩쓸리지 않고, 합리적인 원칙에 따라 사안을 판단합니다.",
+      "외교적 능력: 자신의 원칙을 지키면서도, 상대방을 존중하고 대화를 통해 문제를 해결하는 능력이 뛰어납니다.",
+      "장기적인 안목: 단기적인 이익보다, 장기적으로 공동체의 안정과 발전에 기여하는 결정을 내리려 합니다.",
+      "견고한 가치관: 외부의 압력에도 쉽게 흔들리지 않는, 잘 정립된 자신만의 가치관을 가지고 있습니다."
+    ],
+    "weaknesses": [
+      "지나친 신중함: 변화의 필요성을 인지하면서도, 기존의 원칙과 질서가 흔들릴 것을 우려하여 행동을 주저할 수 있습니다.",
+      "엘리트주의적 시각: 품격과 원칙을 너무 강조한 나머지, 대중의 솔직한 감정이나 욕구를 이해하지 못하고 거리감을 둘 수 있습니다.",
+      "유연성 부족: 한번 세운 원칙은 좀처럼 바꾸려 하지 않아, 급변하는 상황에 대처하는 능력이 부족할 수 있습니다.",
+      "과도한 명분 중시: 실리보다는 명분과 원칙을 우선시하여, 때로는 현실적으로 더 나은 선택을 놓칠 수 있습니다.",
+      "위선적으로 보일 위험: 그의 높은 이상과 원칙이, 실제 행동과 일치하지 않을 때 주변으로부터 '위선적'이라는 비판을 받을 수 있습니다."
+    ],
+    "html": {
+      "description": "<p class=\"mb-4 last:mb-0\">당신은 친구들과의 약속에서도 \"N분의 1\"을 선호하는 타입일 가능성이 높습니다. 모두가 동의할 수 있는 합리적인 규칙을 만드는 것을 중요하게 여기며, 논리 정연한 근거와 품격 있는 태도로 상대방을 설득하는 것을 선호합니다. 결국 당신을 움직이는 핵심 동력은 \"흔들리지 않는 원칙을 통해 예측 가능하고 공정한 사회를 만들려는 소망\"입니다.</p>"
+    }
+  },
+  "ITUS": {
+    "name": "고립주의적 자유주의자 (Isolationist Liberal)",
+    "category": "political",
+    "scores": {
+      "개인주의": 80,
+      "전통주의": 85,
+      "보편적 평등": 65,
+      "안보 우선": 90
+    },
+    "description": "당신에게 \"요즘 트렌드\"나 \"국제 사회의 평가\"는 큰 의미가 없습니다. 당신 안에는 시대를 초월하는 자신만의 굳건한 법과 원칙이 있기 때문입니다. 당신은 우리 국민의 삶과 안보를 지키는 데 모든 역량을 집중해야 한다고 믿습니다. 결국 당신을 움직이는 핵심 동력은 \"외부의 혼란스러운 영향으로부터 나의 삶과 공동체를 지켜내려는 강력한 방어 의지\"입니다.",
+    "keywords": [
+      "바위처럼",
+      "나만의법칙",
+      "절대고독",
+      "국내문제집중",
+      "간섭거부"
+    ],
+    "strengths": [
+      "불굴의 독립성: 그 어떤 집단이나 외부 세력에도 의존하지 않고, 오직 자신만의 힘과 원칙을 믿는 강인한 정신력을 가졌습니다.",
+      "일관된 원칙: 상황의 유불리에 따라 입장을 바꾸지 않고, 처음 세운 원칙을 끝까지 고수하여 예측 가능성과 신뢰를 줍니다.",
+      "현실주의적 시각: 국제 사회의 이상적인 구호나 명분을 믿지 않고, 오직 힘의 논리와 국익의 관점에서 현실을 냉정하게 판단합니다.",
+      "높은 집중력: 외부의 소음에 신경 쓰지 않고, 자신이 중요하다고 생각하는 국내 문제에 모든 에너지를 집중할 수 있습니다.",
+      "강한 주인의식: '내 삶, 내 공동체는 내가 지킨다'는 강한 주인의식을 가지고 있습니다."
+    ],
+    "weaknesses": [
+      "배타성: 외부 문화나 다른 가치관에 대해 폐쇄적이고 배타적인 태도를 보여, 고립을 자초할 수 있습니다.",
+      "변화에 대한 저항: 자신이 믿는 전통과 원칙을 지키려는 마음이 너무 강해, 시대의 변화를 거부하는 완고한 모습을 보일 수 있습니다.",
+      "협력 능력 부족: 타협이나 협력을 '굴복'이나 '손해'로 인식하여, 국제 사회나 다른 집단과의 협력에 어려움을 겪습니다.",
+      "시야의 협소함: 국내 문제에만 너무 집중한 나머지, 글로벌 시대에 더 큰 기회를 놓치거나 외부의 위협을 간과할 수 있습니다.",
+      "고립으로 인한 쇠퇴: 외부와의 교류를 거부하는 태도가, 장기적으로는 공동체를 발전이 아닌 쇠퇴의 길로 이끌 수 있습니다."
+    ],
+    "html": {
+      "description": "<p class=\"mb-4 last:mb-0\">당신에게 \"요즘 트렌드\"나 \"국제 사회의 평가\"는 큰 의미가 없습니다. 당신 안에는 시대를 초월하는 자신만의 굳건한 법과 원칙이 있기 때문입니다. 당신은 우리 국민의 삶과 안보를 지키는 데 모든 역량을 집중해야 한다고 믿습니다. 결국 당신을 움직이는 핵심 동력은 \"외부의 혼란스러운 영향으로부터 나의 삶과 공동체를 지켜내려는 강력한 방어 의지\"입니다.</p>"
+    }
+  },
+  "CPAE": {
+    "name": "진보적 공동체주의자 (Progressive Communitarian)",
+    "category": "political",
+    "scores": {
+      "공동체주의": 85,
+      "진보주의": 80,
+      "적극적 평등": 85,
+      "협력 우선": 80
+    },
+    "description": "당신은 불의를 보면 개인적으로 분노하기보다, \"이건 우리 모두의 문제야!\"라며 사람들을 모으고 행동에 나서는 사람입니다. 당신은 \"나 혼자 잘 사는 것\"보다 \"우리 모두가 함께 잘 사는 것\"에 훨씬 더 큰 가치를 둡니다. 결국 당신을 움직이는 핵심 동력은 \"더 정의롭고 평등한 공동체를 만들어야 한다는 강한 사명감\"입니다.",
+    "keywords": [
+      "리더십",
+      "대의명분",
+      "뜨거운심장",
+      "함께",
+      "사회혁신"
+    ],
+    "strengths": [
+      "강력한 포용력과 연대 의식: '우리'라는 의식이 강하며, 소외된 이웃을 돕고 함께 더 나은 공동체를 만들려는 마음이 따뜻합니다.",
+      "뜨거운 열정과 헌신: 자신이 옳다고 믿는 대의를 위해서라면, 기꺼이 자신을 희생하고 헌신하는 뜨거운 열정을 가지고 있습니다.",
+      "사람을 움직이는 힘: 그의 진정성 있는 모습은 주변 사람들에게 깊은 영감을 주며, 사회적 행동에 함께 참여하도록 이끄는 힘이 있습니다.",
+      "구조적 문제 인식: 개인의 불행을 개인의 탓으로 돌리지 않고, 그 이면에 있는 사회 구조적인 문제를 꿰뚫어 보는 통찰력이 있습니다.",
+      "긍정적인 사회 변화 추구: 더 평등하고 정의로운 사회를 만들 수 있다는 희망을 가지고, 끊임없이 행동합니다."
+    ],
+    "weaknesses": [
+      "개인의 자유 경시: '공동체'를 너무 강조한 나머지, 공동체의 목표와 다른 생각을 가진 개인의 자유나 의견을 억압할 수 있습니다.",
+      "비효율성: 모두의 의견을 듣고 함께하려는 과정이, 때로는 비효율적이거나 더딘 의사결정으로 이어질 수 있습니다.",
+      "감정적인 판단: 이성적인 분석보다, '안타까움'이나 '분노'와 같은 감정이 앞서 정책적 판단을 내릴 위험이 있습니다.",
+      "이상주의적 목표 설정: 현실적인 제약을 고려하지 않은 채, 너무 높고 이상적인 목표를 설정하여 구성원들을 지치게 만들 수 있습니다.",
+      "반대파에 대한 적대감: 자신과 다른 생각을 가진 사람들을 '개인의 이익만 좇는 이기주의자'로 규정하고, 과도하게 적대적인 태도를 보일 수 있습니다."
+    ],
+    "html": {
+      "description": "<p class=\"mb-4 last:mb-0\">당신은 불의를 보면 개인적으로 분노하기보다, \"이건 우리 모두의 문제야!\"라며 사람들을 모으고 행동에 나서는 사람입니다. 당신은 \"나 혼자 잘 사는 것\"보다 \"우리 모두가 함께 잘 사는 것\"에 훨씬 더 큰 가치를 둡니다. 결국 당신을 움직이는 핵심 동력은 \"더 정의롭고 평등한 공동체를 만들어야 한다는 강한 사명감\"입니다.</p>"
+    }
+  },
+  "CPAS": {
+    "name": "개혁적 국가주의자 (Reformist Nationalist)",
+    "category": "political",
+    "scores": {
+      "공동체주의": 80,
+      "진보주의": 75,
+      "적극적 평등": 80,
+      "안보 우선": 85
+    },
+    "description": "당신은 회의 시간에 아이디어만 내고 실행하지 않는 사람들을 답답해하는 편입니다. \"말만 하지 말고, 일단 해보자!\"라며 먼저 소매를 걷어붙이는 타입이죠. \"우리 팀\", \"우리 공동체\"의 성공을 위해 때로는 반대 의견을 묵살하고서라도 강력하게 목표를 향해 나아갑니다. 결국 당신을 움직이는 핵심 동력은 \"내가 속한 공동체를 누구보다 위대하게 만들고 싶다는 강한 열망\"입니다.",
+    "keywords": [
+      "행동파리더",
+      "우리팀",
+      "강력한개혁",
+      "추진력",
+      "결단력"
+    ],
+    "strengths": [
+      "강력한 추진력과 결단력: 목표가 정해지면, 반대를 무릅쓰고서라도 강력하게 밀어붙여 결과를 만들어내는 힘이 있습니다.",
+      "높은 애국심과 공동체 의식: 자신이 속한 공동체와 국가에 대한 자부심이 강하며, 이를 더 위대하게 만들고 싶다는 열망을 가지고 있습니다.",
+      "현실 개혁 의지: 이상적인 구호에만 머무르지 않고, 현실의 불합리한 시스템을 직접 바꾸려는 강한 의지를 가지고 있습니다.",
+      "위기관리 능력: 혼란스러운 상황에서, 강력한 리더십을 발휘하여 공동체를 하나로 모으고 위기를 돌파하는 능력이 있습니다.",
+      "가시적인 성과 창출: 명분보다는, 사람들의 삶을 실질적으로 바꾸는 가시적인 성과를 만들어내는 데 집중합니다."
+    ],
+    "weaknesses": [
+      "권위주의적 태도: 자신의 결정을 관철하기 위해, 민주적인 절차나 소수의 의견을 무시하는 권위주의적인 모습을 보일 수 있습니다.",
+      "과도한 국수주의: '우리 것'을 너무 강조한 나머지, 다른 문화나 국가에 대해 배타적이거나 적대적인 태도를 보일 수 있습니다.",
+      "목표지상주의: '결과'를 위해 '과정'의 희생을 정당화하여, 장기적으로는 공동체의 신뢰를 잃을 수 있습니다.",
+      "다양성 억압: 공동체의 통일성과 효율성을 위해, 개인의 다양성이나 비판적인 목소리를 억압하려는 경향이 있습니다.",
+      "성급한 일반화의 오류: 복잡한 문제의 원인을 단순화하고, 모든 것을 '적'과 '아군'으로 나누어 바라보는 흑백논리에 빠질 위험이 있습니다."
+    ],
+    "html": {
+      "description": "<p class=\"mb-4 last:mb-0\">당신은 회의 시간에 아이디어만 내고 실행하지 않는 사람들을 답답해하는 편입니다. \"말만 하지 말고, 일단 해보자!\"라며 먼저 소매를 걷어붙이는 타입이죠. \"우리 팀\", \"우리 공동체\"의 성공을 위해 때로는 반대 의견을 묵살하고서라도 강력하게 목표를 향해 나아갑니다. 결국 당신을 움직이는 핵심 동력은 \"내가 속한 공동체를 누구보다 위대하게 만들고 싶다는 강한 열망\"입니다.</p>"
+    }
+  },
+  "CPUE": {
+    "name": "사회민주주의자 (Social Democrat)",
+    "category": "political",
+    "scores": {
+      "공동체주의": 80,
+      "진보주의": 75,
+      "보편적 평등": 85,
+      "협력 우선": 80
+    },
+    "description": "당신은 \"왜 저 사람만 특혜를 받아?\" 혹은 \"왜 저 사람만 희생해야 해?\"라는 질문을 자주 던집니다. 모두에게 공평하고 합리적인 규칙을 만드는 것을 중요하게 생각하며, 갈등이 생겼을 때 한쪽 편을 들기보다 모두의 이야기를 듣고 중재하려는 경향이 있습니다. 결국 당신을 움직이는 핵심 동력은 \"단 한 사람도 소외되지 않는 따뜻한 공동체를 만들고 싶다는 이상\"입니다.",
+    "keywords": [
+      "선한영향력",
+      "합리적진보",
+      "상생",
+      "소통",
+      "보편적복지"
+    ],
+    "strengths": [
+      "합리적인 대안 제시: 감정적인 대립보다, 모두가 동의할 수 있는 합리적인 원칙과 제도를 통해 문제를 해결하려 합니다.",
+      "높은 사회적 공감대: 경쟁에서 뒤처진 사람도 최소한의 인간다운 삶을 누려야 한다는, 따뜻한 공동체 의식을 가지고 있습니다.",
+      "갈등 중재 능력: 첨예하게 대립하는 이해관계 속에서, 대화와 타협을 통해 합의점을 찾아내는 중재 능력이 뛰어납니다.",
+      "점진적 개혁 추구: 사회를 한 번에 바꾸려는 혁명보다, 부작용을 최소화하는 점진적인 개혁을 통해 안정적으로 사회를 발전시켜 나갑니다.",
+      "보편적 가치 존중: 인권, 복지, 평등과 같은 보편적인 가치를 존중하고, 이를 사회 시스템으로 구현하려 노력합니다."
+    ],
+    "weaknesses": [
+      "과도한 복지로 인한 비효율: 모두를 위한 복지를 너무 강조한 나머지, 국가 재정의 비효율이나 개인의 근로 의욕 저하 문제를 간과할 수 있습니다.",
+      "느린 실행 속도: 모두의 합의를 이끌어내는 과정이 너무 오래 걸려, 빠른 결단이 필요한 위기 상황에 대처하는 능력이 떨어질 수 있습니다.",
+      "이상론에 치우칠 위험: 현실적인 재원이나 인간의 이기심을 고려하지 않은 채, 너무 이상적인 복지 모델을 추구할 수 있습니다.",
+      "혁신 동력 부족: '경쟁'보다 '분배'를 강조하는 문화가, 사회 전체의 혁신적인 도전 정신이나 성장 동력을 약화시킬 수 있습니다.",
+      "포퓰리즘의 유혹: 대중의 인기를 얻기 위해, 국가의 장기적인 재정 건전성을 해치는 복지 정책을 남발할 유혹에 빠지기 쉽습니다."
+    ],
+    "html": {
+      "description": "<p class=\"mb-4 last:mb-0\">당신은 \"왜 저 사람만 특혜를 받아?\" 혹은 \"왜 저 사람만 희생해야 해?\"라는 질문을 자주 던집니다. 모두에게 공평하고 합리적인 규칙을 만드는 것을 중요하게 생각하며, 갈등이 생겼을 때 한쪽 편을 들기보다 모두의 이야기를 듣고 중재하려는 경향이 있습니다. 결국 당신을 움직이는 핵심 동력은 \"단 한 사람도 소외되지 않는 따뜻한 공동체를 만들고 싶다는 이상\"입니다.</p>"
+    }
+  },
+  "CPUS": {
+    "name": "기술주의적 국가주의자 (Technocratic Nationalist)",
+    "category": "political",
+    "scores": {
+      "공동체주의": 80,
+      "진보주의": 70,
+      "보편적 평등": 75,
+      "안보 우선": 85
+    },
+    "description": "당신은 주먹구구식으로 일하는 것을 싫어합니다. 어떤 문제든 가장 효율적이고 공정한 \"시스템\"을 만들어 해결해야 한다고 믿습니다. 개인의 감정적인 호소보다는 객관적인 데이터와 통계를 더 신뢰하며, 사회 전체의 최적화를 목표로 큰 그림을 그리는 사람입니다. 결국 당신을 움직이는 핵심 동력은 \"비효율적인 세상을 완벽한 시스템으로 재설계하려는 지적인 욕망\"입니다.",
+    "keywords": [
+      "엘리트",
+      "설계자",
+      "시스템",
+      "빅데이터",
+      "효율성"
+    ],
+    "strengths": [
+      "데이터 기반의 객관성: 이념이나 감정이 아닌, 객관적인 데이터와 통계를 바탕으로 의사결정을 하여 실수를 줄입니다.",
+      "높은 효율성: 비효율적인 모든 것을 걷어내고, 가장 효율적인 시스템을 설계하여 공동체의 자원을 절약하고 생산성을 높입니다.",
+      "장기적인 안목: 당장의 문제 해결을 넘어, 미래 사회의 변화를 예측하고 이를 대비하는 시스템을 설계하는 능력이 있습니다.",
+      "문제 해결 능력: 복잡하게 얽힌 문제를, 단순하고 명쾌한 시스템으로 풀어내는 탁월한 문제 해결 능력을 가졌습니다.",
+      "미래지향성: 과거의 관습에 얽매이지 않고, 새로운 기술과 데이터를 활용하여 사회를 더 나은 방향으로 '업그레이드'하려는 의지가 강합니다."
+    ],
+    "weaknesses": [
+      "인간적인 가치 간과: 효율성과 시스템을 너무 강조한 나머지, 데이터로 측정되지 않는 인간의 감정, 자유, 존엄성과 같은 가치를 간과할 수 있습니다.",
+      "과도한 통제 사회 지향: 모든 것을 시스템으로 관리하려는 욕구가, 개인의 삶을 감시하고 통제하는 '빅브라더' 사회로 이어질 위험이 있습니다.",
+      "엘리트주의: 데이터를 이해하고 시스템을 설계할 수 있는 소수의 전문가가, 대중을 이끌어야 한다는 엘리트주의에 빠질 수 있습니다.",
+      "예측 불가능성에 대한 취약성: 모든 것을 예측하고 통제하려 하지만, 예측 불가능한 위기(전쟁, 전염병 등) 앞에서는 시스템이 오히려 경직되어 제대로 작동하지 않을 수 있습니다.",
+      "민주적 절차 경시: 효율성을 위해, 시간이 걸리는 민주적인 토론이나 합의 과정을 무시하고 엘리트 집단의 결정을 강요할 수 있습니다."
+    ],
+    "html": {
+      "description": "<p class=\"mb-4 last:mb-0\">당신은 주먹구구식으로 일하는 것을 싫어합니다. 어떤 문제든 가장 효율적이고 공정한 \"시스템\"을 만들어 해결해야 한다고 믿습니다. 개인의 감정적인 호소보다는 객관적인 데이터와 통계를 더 신뢰하며, 사회 전체의 최적화를 목표로 큰 그림을 그리는 사람입니다. 결국 당신을 움직이는 핵심 동력은 \"비효율적인 세상을 완벽한 시스템으로 재설계하려는 지적인 욕망\"입니다.</p>"
+    }
+  },
+  "CTAE": {
+    "name": "실용주의적 공동체주의자 (Pragmatic Communitarian)",
+    "category": "political",
+    "scores": {
+      "공동체주의": 85,
+      "전통주의": 75,
+      "적극적 평등": 70,
+      "협력 우선": 80
+    },
+    "description": "당신은 \"명분보다 실리\"라는 말을 중요하게 생각하는 편입니다. 거창한 이념 대립보다는, 실제 우리 공동체에 어떤 이득이 되는지를 먼저 계산합니다. 적을 만들기보다 친구를 만드는 것이 남는 장사라고 믿으며, 부드러운 카리스마와 협상 능력으로 조용히 원하는 것을 얻어내는 타입입니다. 결국 당신을 움직이는 핵심 동력은 \"불필요한 갈등을 피하고, 우리 공동체의 이익을 극대화하려는 현실적인 지혜\"입니다.",
+    "keywords": [
+      "실리주의",
+      "인맥관리",
+      "우리편",
+      "협상의달인",
+      "유연함"
+    ],
+    "strengths": [
+      "뛰어난 현실 감각: 명분이나 이념보다, 우리 공동체에 어떤 것이 '실질적인 이득'이 되는지를 빠르게 판단합니다.",
+      "유연한 협상 능력: 적을 만들기보다 친구를 만드는 것이 낫다고 믿으며, 다양한 이해관계를 조율하여 모두에게 이로운 결과를 만들어냅니다.",
+      "인적 네트워크 활용: 폭넓은 인맥과 좋은 평판을 바탕으로, 어려운 문제를 해결하는 데 필요한 사람들을 효과적으로 움직일 수 있습니다.",
+      "위기관리 능력: 갈등 상황에서, 원칙만 내세우기보다 유연한 대안을 제시하여 최악의 상황을 피하는 위기관리 능력이 뛰어납니다.",
+      "높은 사회적 지능: 복잡한 사회적, 정치적 역학 관계를 빠르게 파악하고, 그 안에서 자신의 위치와 역할을 영리하게 찾아냅니다."
+    ],
+    "weaknesses": [
+      "원칙의 부재: 실리를 너무 강조한 나머지, 지켜야 할 원칙이나 가치를 쉽게 저버리는 '기회주의자'처럼 보일 수 있습니다.",
+      "단기적인 시야: 장기적인 비전보다는, 당장의 이익과 현상 유지에 급급하여 더 큰 변화의 흐름을 놓칠 수 있습니다.",
+      "정체성 혼란: 다양한 세력과 관계를 맺는 과정에서, \"그래서 당신의 진짜 생각은 무엇인가?\"라는 질문을 받으며 정체성의 혼란을 겪을 수 있습니다.",
+      "임시방편적 해결: 문제의 근본적인 해결보다는, 갈등을 잠시 덮어두는 임시방편적인 해결책에 만족하는 경향이 있습니다.",
+      "강한 리더십 부재: 모두에게 좋은 사람이 되려다, 정작 중요한 순간에 공동체를 이끌 강력한 리더십을 보여주지 못할 수 있습니다."
+    ],
+    "html": {
+      "description": "<p class=\"mb-4 last:mb-0\">당신은 \"명분보다 실리\"라는 말을 중요하게 생각하는 편입니다. 거창한 이념 대립보다는, 실제 우리 공동체에 어떤 이득이 되는지를 먼저 계산합니다. 적을 만들기보다 친구를 만드는 것이 남는 장사라고 믿으며, 부드러운 카리스마와 협상 능력으로 조용히 원하는 것을 얻어내는 타입입니다. 결국 당신을 움직이는 핵심 동력은 \"불필요한 갈등을 피하고, 우리 공동체의 이익을 극대화하려는 현실적인 지혜\"입니다.</p>"
+    }
+  },
+  "CTAS": {
+    "name": "애국주의적 보수주의자 (Patriotic Conservative)",
+    "category": "political",
+    "scores": {
+      "공동체주의": 85,
+      "전통주의": 80,
+      "적극적 평등": 75,
+      "안보 우선": 90
+    },
+    "description": "당신은 입으로만 애국하고 행동하지 않는 사람들을 경멸하는 경향이 있습니다. 옳다고 믿는 가치와 내가 속한 공동체를 위해서라면, 직접 거리로 나가거나 목소리를 내는 것을 주저하지 않습니다. 불의를 보면 욱하는 다혈질적인 면도 있지만, 그 근간에는 순수한 열정과 의리가 자리 잡고 있습니다. 결국 당신을 움직이는 핵심 동력은 \"내가 사랑하는 공동체를 내 손으로 직접 지키고 발전시키고 싶다는 뜨거운 애정\"입니다.",
+    "keywords": [
+      "애국보수",
+      "행동하는양심",
+      "전통수호",
+      "강한조직",
+      "의리"
+    ],
+    "strengths": [
+      "강한 소속감과 헌신: 자신이 속한 공동체에 대한 자부심과 사랑이 매우 강하며, 이를 위해 기꺼이 헌신할 준비가 되어 있습니다.",
+      "뜨거운 열정과 행동력: 옳다고 믿는 가치를 지키기 위해서라면, 말에만 그치지 않고 직접 행동으로 보여주는 뜨거운 열정을 가지고 있습니다.",
+      "명확한 선악관: 자신이 지켜야 할 '선(善)'과 싸워야 할 '악(惡)'에 대한 구분이 명확하여, 위기 상황에서 망설임 없이 행동합니다.",
+      "강력한 결집력: 그의 열정적인 모습은, 비슷한 생각을 가진 사람들을 하나로 모으고 공동체의 결속력을 다지는 중심점 역할을 합니다.",
+      "의리: '우리 편'이라고 생각하는 사람에게는, 손해를 감수하고서라도 끝까지 의리를 지키는 모습을 보여줍니다."
+    ],
+    "weaknesses": [
+      "흑백논리: 세상을 '우리 편'과 '적'으로 나누어 보는 경향이 강해, 중간 지대나 다른 의견을 용납하지 못할 수 있습니다.",
+      "과도한 감정 표출: 이성적인 판단보다 애국심이나 분노와 같은 감정이 앞서, 과격한 행동이나 발언으로 이어질 수 있습니다.",
+      "배타성: '우리 것'에 대한 자부심이 너무 강한 나머지, 다른 문화나 가치관에 대해 배타적이거나 적대적인 태도를 보일 수 있습니다.",
+      "역사 인식의 편향성: 자신이 믿는 공동체의 '자랑스러운 역사'만 강조하고, '부끄러운 역사'는 외면하려는 경향을 보일 수 있습니다.",
+      "권위주의에 대한 맹신: 공동체의 질서를 위해, 강력한 리더의 권위에 비판 없이 순응하는 모습을 보일 수 있습니다."
+    ],
+    "html": {
+      "description": "<p class=\"mb-4 last:mb-0\">당신은 입으로만 애국하고 행동하지 않는 사람들을 경멸하는 경향이 있습니다. 옳다고 믿는 가치와 내가 속한 공동체를 위해서라면, 직접 거리로 나가거나 목소리를 내는 것을 주저하지 않습니다. 불의를 보면 욱하는 다혈질적인 면도 있지만, 그 근간에는 순수한 열정과 의리가 자리 잡고 있습니다. 결국 당신을 움직이는 핵심 동력은 \"내가 사랑하는 공동체를 내 손으로 직접 지키고 발전시키고 싶다는 뜨거운 애정\"입니다.</p>"
+    }
+  },
+  "CTUE": {
+    "name": "중도 보수주의자 (Center-Right Conservative)",
+    "category": "political",
+    "scores": {
+      "공동체주의": 75,
+      "전통주의": 80,
+      "보편적 평등": 70,
+      "협력 우선": 75
+    },
+    "description": "당신은 갈등 상황에서 흥분하기보다, \"자, 양쪽 이야기 다 들어봅시다\"라고 말하며 중재에 나서는 사람입니다. 공동체의 평화와 신뢰를 중요하게 생각하며, 이를 위해 모두가 수긍할 수 있는 공정한 원칙을 세우고 지키는 것을 최우선으로 여깁니다. 결국 당신을 움직이는 핵심 동력은 \"균형과 안정을 통해 공동체를 예측 가능하고 살기 좋은 곳으로 만들려는 소망\"입니다.",
+    "keywords": [
+      "신사",
+      "중재자",
+      "합리적보수",
+      "원칙과신뢰",
+      "안정지향"
+    ],
+    "strengths": [
+      "안정적인 관리 능력: 급진적인 변화보다, 합리적인 원칙과 점진적인 개선을 통해 사회를 안정적으로 관리하는 능력이 탁월합니다.",
+      "높은 신뢰성: 일관된 원칙과 예측 가능한 행동으로, 주변 사람들로부터 '믿을 수 있는 사람'이라는 평을 듣습니다.",
+      "갈등 중재 능력: 극단적인 이념 대립 사이에서, 합리적인 중재안을 제시하여 갈등을 완화하고 사회 통합에 기여합니다.",
+      "존중하는 태도: 자신의 의견을 주장하면서도, 상대방의 의견을 경청하고 존중하는 성숙한 토론 자세를 가지고 있습니다.",
+      "현실 감각: 이상적인 목표보다는, 현재 상황에서 실현 가능한 최선의 목표를 설정하는 현실적인 감각을 가지고 있습니다."
+    ],
+    "weaknesses": [
+      "변화에 대한 둔감성: 안정을 너무 중시한 나머지, 사회가 근본적으로 변해야 하는 중요한 시그널을 놓치거나 외면할 수 있습니다.",
+      "과도한 신중함: 위기 상황에서 과감한 결단을 내리기보다, 너무 신중하게 접근하다가 골든타임을 놓칠 위험이 있습니다.",
+      "열정 및 비전 부족: 그의 안정적인 모습이, 때로는 '열정이 없다'거나 '큰 비전이 없다'는 인상을 줄 수 있습니다.",
+      "기득권 옹호: 기존의 질서와 안정을 지키려는 태도가, 의도치 않게 기존의 기득권을 옹호하는 결과로 이어질 수 있습니다.",
+      "매력 부족: 너무 합리적이고 예측 가능하여, 대중을 열광시키는 카리스마나 매력이 부족하게 느껴질 수 있습니다."
+    ],
+    "html": {
+      "description": "<p class=\"mb-4 last:mb-0\">당신은 갈등 상황에서 흥분하기보다, \"자, 양쪽 이야기 다 들어봅시다\"라고 말하며 중재에 나서는 사람입니다. 공동체의 평화와 신뢰를 중요하게 생각하며, 이를 위해 모두가 수긍할 수 있는 공정한 원칙을 세우고 지키는 것을 최우선으로 여깁니다. 결국 당신을 움직이는 핵심 동력은 \"균형과 안정을 통해 공동체를 예측 가능하고 살기 좋은 곳으로 만들려는 소망\"입니다.</p>"
+    }
+  },
+  "CTUS": {
+    "name": "국가주의적 보수주의자 (Nationalist Conservative)",
+    "category": "political",
+    "scores": {
+      "공동체주의": 90,
+      "전통주의": 85,
+      "보편적 평등": 70,
+      "안보 우선": 95
+    },
+    "description": "당신은 모래 위에 성을 쌓기보다, 단단한 반석 위에 집을 짓기를 원하는 사람입니다. 즉흥적인 감정이나 유행을 따르기보다, 오랫동안 검증된 원칙과 규칙을 신뢰합니다. 당신에게 \"질서\"와 \"안정\"은 결코 고리타분한 단어가 아닌, 우리 모두를 지켜주는 가장 중요한 가치입니다. 결국 당신을 움직이는 핵심 동력은 \"소중한 것들을 혼돈으로부터 지켜내려는 강한 책임감\"입니다.",
+    "keywords": [
+      "원칙이최고",
+      "안정이우선",
+      "우리것이좋은것",
+      "강력한리더십",
+      "현실주의자"
+    ],
+    "strengths": [
+      "강력한 책임감: 자신이 속한 공동체의 안정을 자신의 가장 큰 책무로 여기며, 이를 위해 헌신합니다.",
+      "불굴의 원칙주의: 한번 세운 원칙은 외부의 압력이나 유혹에 절대 흔들리지 않는 굳건함을 가지고 있습니다.",
+      "위기 상황에서의 침착함: 모두가 혼란에 빠졌을 때, 오히려 더 침착하게 원칙에 따라 행동하며 중심을 잡아줍니다.",
+      "질서 확립 능력: 무질서한 상황을 정리하고, 명확한 규칙과 위계를 통해 예측 가능한 시스템을 만드는 데 뛰어납니다.",
+      "높은 예측 가능성: 그의 행동은 철저히 원칙에 기반하므로, 주변 사람들은 그가 어떻게 행동할지 쉽게 예측하고 신뢰할 수 있습니다."
+    ],
+    "weaknesses": [
+      "경직된 사고: 변화하는 세상에 맞춰 원칙을 유연하게 적용하기보다, 낡은 원칙을 기계적으로 고수하려는 경향이 있습니다.",
+      "권위주의: 질서를 위해, 개인의 자유나 소수의 의견을 억압하는 권위주의적인 태도를 보일 수 있습니다.",
+      "공감 능력 부족: 원칙에 맞지 않는 개인의 딱한 사정을 '예외'로 인정해주지 못하여, '피도 눈물도 없다'는 비판을 받을 수 있습니다.",
+      "혁신에 대한 저항: 새로운 아이디어나 시도를, 기존의 안정된 질서를 파괴하는 '위험 요소'로 간주하고 저항합니다.",
+      "다양성 불인정: 공동체의 통일성을 위해, 자신과 다른 생각이나 삶의 방식을 가진 사람들을 '틀렸다'고 규정하고 배척할 수 있습니다."
+    ],
+    "html": {
+      "description": "<p class=\"mb-4 last:mb-0\">당신은 모래 위에 성을 쌓기보다, 단단한 반석 위에 집을 짓기를 원하는 사람입니다. 즉흥적인 감정이나 유행을 따르기보다, 오랫동안 검증된 원칙과 규칙을 신뢰합니다. 당신에게 \"질서\"와 \"안정\"은 결코 고리타분한 단어가 아닌, 우리 모두를 지켜주는 가장 중요한 가치입니다. 결국 당신을 움직이는 핵심 동력은 \"소중한 것들을 혼돈으로부터 지켜내려는 강한 책임감\"입니다.</p>"
+    }
+  },
+  "GVE": {
+    "name": "비전을 현실로 만드는 혁신가",
+    "category": "economic",
+    "code": "GVE",
+    "nickname": "비전을 현실로 만드는 혁신가",
+    "keywords": [
+      "성장지향",
+      "하이리스크하이리턴",
+      "미래에베팅",
+      "내사업",
+      "타고난리더"
+    ],
+    "scores": {
+      "성장 중시 vs 안정 중시": 95,
+      "비전 투자 vs 데이터 투자": 90,
+      "기업가 기질 vs 안정가 기질": 85
+    },
+    "description": "당신은 세상을 바꾸려는 순수한 모험가입니다. 당신의 그래프에서 볼 수 있듯, 3가지 척도 모두에서 '모험가'의 특성이 압도적으로 나타납니다. 당신은 안정보다는 성장을, 분석보다는 비전을, 조직보다는 창업을 선호하는, 의심의 여지 없는 순수한 모험가입니다. 당신의 경제적 활동은 단순히 돈을 버는 행위를 넘어, 세상에 없던 가치를 만들고 스스로의 가능성을 증명해 보이는 거대한 게임과도 같습니다. 정해진 규칙을 따르는 것보다 새로운 규칙을 만드는 데서 희열을 느끼며, '아무도 가보지 않은 길'을 탐험하는 것을 즐깁니다. 결국 당신을 움직이는 핵심 동력은 \"더 나은 미래는 내가 만들 수 있다\"는 꺾이지 않는 확신입니다.",
+    "strengths": [
+      "**미래를 예측하는 통찰력:** 당신은 현재의 데이터나 현상에 얽매이지 않고, 그 이면에 있는 거대한 변화의 흐름을 읽어내는 능력이 있습니다. 남들이 '문제'라고 인식하지 못하는 것을 '기회'로 발견하며, 세상이 앞으로 어떻게 변할지에 대한 강력한 비전을 제시하여 사람들을 이끕니다.",
+      "**두려움 없는 실행력:** 완벽한 계획을 세우느라 시간을 보내기보다, '일단 저질러보고 배우자'는 태도로 빠르게 실행에 옮깁니다. 당신에게 실패는 끝이 아니라, 비전을 현실로 만드는 과정에서 반드시 거쳐야 할 학습 단계일 뿐입니다.",
+      "**기회 포착 능력:** 안정된 시장의 작은 파이를 나누는 대신, 불확실하지만 성장 가능성이 폭발하는 새로운 시장(블루오션)에서 본능적으로 기회를 포착하는 재능이 있습니다.",
+      "**사람을 이끄는 카리스마:** 당신의 확신에 찬 비전과 긍정적인 에너지는 사람들에게 강력한 영감을 주며, 그들이 자신의 잠재력을 믿고 당신의 꿈에 기꺼이 동참하게 만드는 힘이 있습니다.",
+      "**빠른 회복탄력성:** 실패의 순간에 좌절하며 시간을 보내기보다, 그 원인을 빠르게 분석하고 다음 도전을 위한 교훈으로 삼는 뛰어난 회복탄력성을 가지고 있습니다."
+    ],
+    "weaknesses": [
+      "**현실감각 부재:** 당신의 위대한 비전은 때로 현실의 디테일(현금 흐름, 법률 문제, 실무적 제약)을 간과하게 만듭니다. '어떻게든 되겠지'라는 낙관주의가, 발밑에 있는 위험을 보지 못하게 만드는 가장 큰 원인이 될 수 있습니다.",
+      "**과도한 리스크 감수:** '모 아니면 도'라는 생각으로, 감당할 수 없는 리스크를 짊어져 단 한 번의 실패로 모든 것을 잃을 수 있습니다. 성공의 가능성만 보고, 실패했을 때의 최악의 시나리오를 대비하지 않는 경향이 있습니다.",
+      "**성급한 판단:** 충분한 분석 없이 직관과 속도에만 의존하여, 명백한 위험 신호를 무시하고 잘못된 결정을 내릴 수 있습니다. \"이거다!\" 싶은 순간, 다른 모든 것을 잊어버릴 수 있습니다.",
+      "**안정에 대한 경시:** 성장이 정체된 안정적인 상황을 '죽음'과 동일시하여, 이미 이룬 성공을 지키고 관리하는 데 쉽게 지루함을 느낍니다. 이 때문에 끊임없이 새로운 도전만 찾아다니다가 가진 것을 잃을 수 있습니다.",
+      "**독선적인 리더십:** 자신의 비전에 대한 확신이 너무 강해, 팀원들의 현실적인 우려나 반대 의견을 '도전 정신이 부족한 것'으로 치부하며 무시할 수 있습니다. 당신의 열정이 때로는 폭력이 될 수 있음을 인지해야 합니다.."
+    ],
+    "spectrum_analysis": "당신은 '세상을 바꾸려는 순수한 모험가'입니다.\n\n당신의 그래프에서 볼 수 있듯, 3가지 척도 모두에서 **'모험가'**의 특성이 압도적으로 나타납니다. 당신은 안정보다는 성장을, 분석보다는 비전을, 조직보다는 창업을 선호하는, 의심의 여지 없는 순수한 모험가입니다.",
+    "html": {
+      "description": "<p class=\"mb-4 last:mb-0\">당신은 세상을 바꾸려는 순수한 모험가입니다. 당신의 그래프에서 볼 수 있듯, 3가지 척도 모두에서 <span class=\"text-accent font-medium\">'모험가'</span>의 특성이 압도적으로 나타납니다. 당신은 안정보다는 성장을, 분석보다는 비전을, 조직보다는 창업을 선호하는, 의심의 여지 없는 순수한 모험가입니다. 당신의 경제적 활동은 단순히 돈을 버는 행위를 넘어, 세상에 없던 가치를 만들고 스스로의 가능성을 증명해 보이는 거대한 게임과도 같습니다. 정해진 규칙을 따르는 것보다 새로운 규칙을 만드는 데서 희열을 느끼며, <span class=\"text-accent font-medium\">'아무도 가보지 않은 길'</span>을 탐험하는 것을 즐깁니다. 결국 당신을 움직이는 핵심 동력은 \"더 나은 미래는 내가 만들 수 있다\"는 꺾이지 않는 확신입니다.</p>",
+      "spectrum_analysis": "<p class=\"mb-4 last:mb-0\">당신은 <span class=\"text-accent font-medium\">'세상을 바꾸려는 순수한 모험가'</span>입니다.</p><p class=\"mb-4 last:mb-0\">당신의 그래프에서 볼 수 있듯, 3가지 척도 모두에서 <strong class=\"font-semibold text-gray-900\"><span class=\"text-accent font-medium\">'모험가'</span></strong>의 특성이 압도적으로 나타납니다. 당신은 안정보다는 성장을, 분석보다는 비전을, 조직보다는 창업을 선호하는, 의심의 여지 없는 순수한 모험가입니다.</p>"
+    }
+  },
+  "GVW": {
+    "name": "미래를 예측하는 조직의 탐험가",
+    "category": "economic",
+    "code": "GVW",
+    "nickname": "미래를 예측하는 조직의 탐험가",
+    "keywords": [
+      "성장지향",
+      "비전",
+      "안정추구",
+      "신사업기획",
+      "미래전략"
+    ],
+    "scores": {
+      "성장 중시 vs 안정 중시": 80,
+      "비전 투자 vs 데이터 투자": 75,
+      "기업가 기질 vs 안정가 기질": 25
+    },
+    "description": "당신은 '성벽 안에서 별을 보는 몽상가'입니다. 미래의 성장(G)과 비전(V)을 꿈꾸는 모험가의 심장을 가졌지만, 동시에 안정적인 조직(W)이라는 성벽 안에서 보호받기를 원하는 수호자의 현실 감각도 가지고 있습니다. 당신은 안정된 조직 내에서 누구보다 먼저 미래의 시장 변화와 새로운 기술 트렌드를 포착하는 '레이더'와 같은 능력을 가졌으며, 조직의 강점과 현실적인 자원을 바탕으로 한 '실현 가능한 미래'를 제시합니다. 때로는 조직의 보수적인 분위기 속에서 답답함을 느끼기도 하지만, 당신은 결코 미래에 대한 비전을 포기하지 않습니다. 결국 당신을 움직이는 핵심 동력은 \"안정 속에서도 혁신은 가능하다\"는 현실적인 이상주의입니다.",
+    "strengths": [
+      "**미래 트렌드 예측:** 당신은 안정된 조직 내에서, 누구보다 먼저 미래의 시장 변화와 새로운 기술 트렌드를 포착하는 '레이더'와 같은 능력을 가졌습니다.",
+      "**안정적인 비전 제시:** 당신의 비전은 뜬구름 잡는 이야기가 아닌, 현재 조직의 강점과 현실적인 자원을 바탕으로 한 '실현 가능한 미래'입니다.",
+      "**높은 창의력:** 안정적인 환경 속에서, 기존의 자원을 새롭게 조합하여 리스크 없이 혁신적인 아이디어를 만들어내는 데 능숙합니다.",
+      "**지적인 설득력:** 당신의 아이디어는 깊이 있는 학습과 통찰을 기반으로 하므로, 동료와 보수적인 리더에게도 높은 신뢰를 주며 설득할 수 있습니다.",
+      "**낮은 실패 리스크:** 직접 모든 리스크를 짊어지지 않고, 조직의 지원을 받으며 아이디어를 실현하므로 실패에 대한 부담이 적어 더 안정적으로 도전할 수 있습니다."
+    ],
+    "weaknesses": [
+      "**실행 지연:** '언젠가 창업해야지', '언젠가 이 아이디어를 제안해야지'라고 생각만 하고, 안정적인 현재(W)를 떠나는 행동을 계속 미룰 수 있습니다. 꿈만 꾸는 '사내 몽상가'로 남을 위험이 있습니다.",
+      "**조직 내 고립:** 너무 앞서나가는 당신의 비전(V)을 동료들이 이해하지 못하여, '현실 감각 없는 사람'으로 취급받으며 고립될 수 있습니다.",
+      "**결정권의 부재:** 좋은 아이디어가 있어도, 최종 결정권을 가진 상사나 조직의 보수적인 문화 때문에 좌절되는 경험을 자주 할 수 있습니다.",
+      "**성취감 부족:** 성공의 과실을 온전히 내 것으로 가져오지 못하고 조직과 나누어야 한다는 점에서, 깊은 성취감을 느끼지 못할 수 있습니다.",
+      "**안주할 위험:** 조직의 안정적인 환경이 너무 편안한 나머지, 더 큰 잠재력을 실현할 기회를 스스로 포기하고 안주하게 될 수 있습니다."
+    ],
+    "spectrum_analysis": "당신은 '성벽 안에서 별을 보는 몽상가'입니다.\n\n당신은 미래의 성장(G)과 비전(V)을 꿈꾸는 **'모험가'**의 심장을 가졌지만, 동시에 안정적인 조직(W)이라는 성벽 안에서 보호받기를 원하는 **'수호자'**의 현실 감각도 가지고 있습니다. 이는 당신을 '위험한 몽상가'가 아닌, '현실적인 탐험가'로 만들어줍니다.",
+    "html": {
+      "description": "<p class=\"mb-4 last:mb-0\">당신은 <span class=\"text-accent font-medium\">'성벽 안에서 별을 보는 몽상가'</span>입니다. 미래의 성장(G)과 비전(V)을 꿈꾸는 모험가의 심장을 가졌지만, 동시에 안정적인 조직(W)이라는 성벽 안에서 보호받기를 원하는 수호자의 현실 감각도 가지고 있습니다. 당신은 안정된 조직 내에서 누구보다 먼저 미래의 시장 변화와 새로운 기술 트렌드를 포착하는 <span class=\"text-accent font-medium\">'레이더'</span>와 같은 능력을 가졌으며, 조직의 강점과 현실적인 자원을 바탕으로 한 <span class=\"text-accent font-medium\">'실현 가능한 미래'</span>를 제시합니다. 때로는 조직의 보수적인 분위기 속에서 답답함을 느끼기도 하지만, 당신은 결코 미래에 대한 비전을 포기하지 않습니다. 결국 당신을 움직이는 핵심 동력은 \"안정 속에서도 혁신은 가능하다\"는 현실적인 이상주의입니다.</p>",
+      "spectrum_analysis": "<p class=\"mb-4 last:mb-0\">당신은 <span class=\"text-accent font-medium\">'성벽 안에서 별을 보는 몽상가'</span>입니다.</p><p class=\"mb-4 last:mb-0\">당신은 미래의 성장(G)과 비전(V)을 꿈꾸는 <strong class=\"font-semibold text-gray-900\"><span class=\"text-accent font-medium\">'모험가'</span></strong>의 심장을 가졌지만, 동시에 안정적인 조직(W)이라는 성벽 안에서 보호받기를 원하는 <strong class=\"font-semibold text-gray-900\"><span class=\"text-accent font-medium\">'수호자'</span></strong>의 현실 감각도 가지고 있습니다. 이는 당신을 <span class=\"text-accent font-medium\">'위험한 몽상가'</span>가 아닌, <span class=\"text-accent font-medium\">'현실적인 탐험가'</span>로 만들어줍니다.</p>"
+    }
+  },
+  "GAE": {
+    "name": "계산된 성장을 추구하는 전략 창업가",
+    "category": "economic",
+    "code": "GAE",
+    "nickname": "계산된 성장을 추구하는 전략 창업가",
+    "keywords": [
+      "데이터기반창업",
+      "계산된리스크",
+      "성장전략",
+      "효율적확장",
+      "시스템빌더"
+    ],
+    "scores": {
+      "성장 중시 vs 안정 중시": 85,
+      "비전 투자 vs 데이터 투자": 20,
+      "기업가 기질 vs 안정가 기질": 90
+    },
+    "description": "당신은 '계산이 끝난' 전쟁에만 참여하는 냉철한 모험가입니다. 당신은 새로운 영토를 정복하여 크게 성장하고 싶어하는 모험가이지만, 절대로 무모한 전투를 벌이지 않습니다. 모든 전투는 철저한 데이터 분석을 통해 승률이 충분히 높다고 계산되었을 때만 시작하는, 지극히 이성적인 전략가입니다. 당신은 감이나 직관이 아닌 시스템을 만들며, 직접 모든 일을 하기보다 당신의 전략을 가장 효율적으로 실행할 수 있는 시스템을 구축하고 그 시스템을 통해 사업을 확장해나가는 데서 가장 큰 성취감을 느낍니다. 결국 당신을 움직이는 핵심 동력은 '예측과 통제'입니다. 불확실한 미래를 당신의 분석력으로 예측하고, 계산된 전략을 통해 통제하여, 결국 성공이라는 필연적인 결과를 만들어내는 것. 당신에게 성공이란, 뜨거운 열정의 산물이 아니라 차가운 이성이 설계한 필연적인 결과입니다.",
+    "strengths": [
+      "**데이터 기반의 높은 성공 확률:** 당신은 감이나 직관이 아닌, 철저한 데이터 분석을 통해 '이길 수 있는 싸움'만 골라서 합니다. 이 때문에 당신의 사업 성공 확률은 다른 유형보다 월등히 높습니다.",
+      "**효율적인 시스템 구축 능력:** 당신은 직접 모든 일을 하기보다, 당신의 전략을 가장 효율적으로 실행할 수 있는 시스템을 구축하고 자동화하는 데 능합니다.",
+      "**냉철한 판단력:** 시장의 거품이나 감성적인 비전에 흔들리지 않고, 오직 숫자가 보여주는 진실만을 믿는 냉철함을 가졌습니다.",
+      "**계산된 리스크 감수:** 당신은 리스크를 두려워하지 않지만, 절대로 무모한 도박은 하지 않습니다. 성공 시의 기대수익이 실패 시의 손실보다 월등히 높다고 계산되었을 때만 움직입니다.",
+      "**지적인 신뢰감:** 당신의 모든 주장은 데이터를 기반으로 하므로, 투자자나 팀원들에게 높은 지적인 신뢰감을 줍니다."
+    ],
+    "weaknesses": [
+      "**'타이밍' 상실:** 완벽한 데이터를 확보하고 시스템을 구축하는 데 너무 많은 시간을 쓴 나머지, 시장의 '골든타임'을 놓칠 수 있습니다.",
+      "**예측 불가능성에 대한 취약성:** 당신의 완벽한 시스템은, 데이터로 예측할 수 없는 갑작스러운 외부 충격(코로나, 전쟁 등) 앞에서는 무력해질 수 있습니다.",
+      "**인간적인 매력 부족:** 지나치게 효율과 시스템만 강조한 나머지, 팀원들에게 '차가운 기계'처럼 느껴져 그들의 마음을 얻는 데 실패할 수 있습니다.",
+      "**창의성 부족:** 데이터로 증명된 길만 가려 하기 때문에, 세상에 없던 새로운 길을 만들어내는 '창의적인 도약'을 하기 어렵습니다.",
+      "**작은 시장에 머무를 위험:** 데이터 분석이 용이한 '기존의 시장'을 개선하는 데는 능하지만, 아직 데이터가 존재하지 않는 '미지의 시장'을 개척하는 것을 주저할 수 있습니다."
+    ],
+    "spectrum_analysis": "당신은 '계산이 끝난' 전쟁에만 참여하는 냉철한 모험가입니다.\n\n당신은 새로운 영토를 정복(E)하여 크게 성장(G)하고 싶어하는 '모험가'입니다. 하지만 GVE 유형과 달리, 당신은 절대로 무모한 전투를 벌이지 않습니다. 모든 전투는 철저한 데이터 분석(A)을 통해 승률이 충분히 높다고 계산되었을 때만 시작하는, 지극히 이성적인 전략가입니다.",
+    "html": {
+      "description": "<p class=\"mb-4 last:mb-0\">당신은 <span class=\"text-accent font-medium\">'계산이 끝난'</span> 전쟁에만 참여하는 냉철한 모험가입니다. 당신은 새로운 영토를 정복하여 크게 성장하고 싶어하는 모험가이지만, 절대로 무모한 전투를 벌이지 않습니다. 모든 전투는 철저한 데이터 분석을 통해 승률이 충분히 높다고 계산되었을 때만 시작하는, 지극히 이성적인 전략가입니다. 당신은 감이나 직관이 아닌 시스템을 만들며, 직접 모든 일을 하기보다 당신의 전략을 가장 효율적으로 실행할 수 있는 시스템을 구축하고 그 시스템을 통해 사업을 확장해나가는 데서 가장 큰 성취감을 느낍니다. 결국 당신을 움직이는 핵심 동력은 <span class=\"text-accent font-medium\">'예측과 통제'</span>입니다. 불확실한 미래를 당신의 분석력으로 예측하고, 계산된 전략을 통해 통제하여, 결국 성공이라는 필연적인 결과를 만들어내는 것. 당신에게 성공이란, 뜨거운 열정의 산물이 아니라 차가운 이성이 설계한 필연적인 결과입니다.</p>",
+      "spectrum_analysis": "<p class=\"mb-4 last:mb-0\">당신은 <span class=\"text-accent font-medium\">'계산이 끝난'</span> 전쟁에만 참여하는 냉철한 모험가입니다.</p><p class=\"mb-4 last:mb-0\">당신은 새로운 영토를 정복(E)하여 크게 성장(G)하고 싶어하는 <span class=\"text-accent font-medium\">'모험가'</span>입니다. 하지만 GVE 유형과 달리, 당신은 절대로 무모한 전투를 벌이지 않습니다. 모든 전투는 철저한 데이터 분석(A)을 통해 승률이 충분히 높다고 계산되었을 때만 시작하는, 지극히 이성적인 전략가입니다.</p>"
+    }
+  },
+  "GAW": {
+    "name": "데이터를 통해 조직을 혁신하는 전문가",
+    "category": "economic",
+    "code": "GAW",
+    "nickname": "데이터를 통해 조직을 혁신하는 전문가",
+    "keywords": [
+      "성장지향",
+      "데이터기반",
+      "안정추구",
+      "시스템최적화",
+      "효율성"
+    ],
+    "scores": {
+      "성장 중시 vs 안정 중시": 75,
+      "비전 투자 vs 데이터 투자": 15,
+      "기업가 기질 vs 안정가 기질": 30
+    },
+    "description": "당신은 '데이터를 신뢰하는 신중한 모험가'입니다. 당신은 기본적으로 '성장(G)'을 추구하는 모험가의 기질을 가졌지만, 그 모든 과정은 반드시 데이터(A)로 검증되어야 하고 안정적인 시스템(W) 안에서 이루어져야 한다고 믿습니다. 당신은 조직의 방향을 결정하는 리더의 옆에서 가장 합리적이고 데이터에 기반한 조언을 해주는 '조직의 등대'와 같은 역할을 할 때 가장 큰 능력을 발휘합니다. 모두가 \"이게 맞는 것 같다\"고 말할 때, 당신은 \"데이터를 보니, 실제로는 저게 더 효과적입니다\"라고 말하며 조직이 잘못된 길로 가는 것을 막아줍니다. 때로는 완벽한 데이터를 확보하기 전까지 결정을 미루어 시장의 빠른 변화 속에서 기회를 놓칠 수도 있지만, 당신은 결코 명확성과 확실성을 포기하지 않습니다. 결국 당신을 움직이는 핵심 동력은 \"모든 것을 명확한 숫자로 증명하고 예측 가능한 시스템 안에서 관리하고 싶다\"는 욕망입니다.",
+    "strengths": [
+      "**데이터 기반의 객관성:** 감정이나 편견을 배제하고, 객관적인 데이터에 근거하여 의사결정을 내려 실수를 줄입니다.",
+      "**높은 효율성 추구:** 비효율적인 모든 것을 걷어내고, 가장 효율적인 시스템을 설계하여 조직의 자원을 절약하고 생산성을 높입니다.",
+      "**뛰어난 분석력:** 복잡하게 얽힌 문제 속에서 핵심 패턴과 인사이트를 찾아내는 탁월한 분석 능력을 가졌습니다.",
+      "**안정적인 실행력:** 안정적인 조직 안에서, 잘 짜인 계획에 따라 꾸준히 성과를 만들어내는 신뢰감을 줍니다.",
+      "**논리적인 커뮤니케이션:** 자신의 주장을 명확한 데이터와 논리로 전달하여, 감정적인 논쟁을 최소화하고 생산적인 토론을 이끌어냅니다."
+    ],
+    "weaknesses": [
+      "**인간적인 가치 간과:** 효율성을 너무 강조한 나머지, 데이터로 측정되지 않는 인간의 감정, 조직 문화, 창의성과 같은 가치를 간과할 수 있습니다.",
+      "**변화에 대한 저항:** 안정성을 추구하는 성향 때문에, 데이터가 부족한 초기 단계의 혁신적인 도전을 '리스크가 크다'는 이유로 회피할 수 있습니다.",
+      "**지나친 완벽주의:** 완벽한 데이터를 확보하기 전까지 결정을 미루어, 시장의 빠른 변화 속에서 '골든타임'을 놓칠 위험이 있습니다.",
+      "**분석 마비(Analysis Paralysis):** 너무 많은 데이터를 분석하느라, 정작 행동에 나서지 못하고 기회를 놓치는 우를 범할 수 있습니다.",
+      "**큰 그림 상실:** 세부적인 데이터 분석에 너무 몰두한 나머지, 시장 전체의 패러다임이 바뀌는 거대한 변화의 흐름을 놓칠 수 있습니다."
+    ],
+    "spectrum_analysis": "당신은 '데이터를 신뢰하는 신중한 모험가'입니다.\n\n당신은 기본적으로 '성장(G)'을 추구하는 모험가의 기질을 가졌지만, 그 모든 과정은 반드시 데이터(A)로 검증되어야 하고 안정적인 시스템(W) 안에서 이루어져야 한다고 믿습니다. 즉, **'이길 수 있는 싸움'**만 골라서 하는 영리한 모험가에 가깝습니다.",
+    "html": {
+      "description": "<p class=\"mb-4 last:mb-0\">당신은 <span class=\"text-accent font-medium\">'데이터를 신뢰하는 신중한 모험가'</span>입니다. 당신은 기본적으로 <span class=\"text-accent font-medium\">'성장(G)'</span>을 추구하는 모험가의 기질을 가졌지만, 그 모든 과정은 반드시 데이터(A)로 검증되어야 하고 안정적인 시스템(W) 안에서 이루어져야 한다고 믿습니다. 당신은 조직의 방향을 결정하는 리더의 옆에서 가장 합리적이고 데이터에 기반한 조언을 해주는 <span class=\"text-accent font-medium\">'조직의 등대'</span>와 같은 역할을 할 때 가장 큰 능력을 발휘합니다. 모두가 \"이게 맞는 것 같다\"고 말할 때, 당신은 \"데이터를 보니, 실제로는 저게 더 효과적입니다\"라고 말하며 조직이 잘못된 길로 가는 것을 막아줍니다. 때로는 완벽한 데이터를 확보하기 전까지 결정을 미루어 시장의 빠른 변화 속에서 기회를 놓칠 수도 있지만, 당신은 결코 명확성과 확실성을 포기하지 않습니다. 결국 당신을 움직이는 핵심 동력은 \"모든 것을 명확한 숫자로 증명하고 예측 가능한 시스템 안에서 관리하고 싶다\"는 욕망입니다.</p>",
+      "spectrum_analysis": "<p class=\"mb-4 last:mb-0\">당신은 <span class=\"text-accent font-medium\">'데이터를 신뢰하는 신중한 모험가'</span>입니다.</p><p class=\"mb-4 last:mb-0\">당신은 기본적으로 <span class=\"text-accent font-medium\">'성장(G)'</span>을 추구하는 모험가의 기질을 가졌지만, 그 모든 과정은 반드시 데이터(A)로 검증되어야 하고 안정적인 시스템(W) 안에서 이루어져야 한다고 믿습니다. 즉, <strong class=\"font-semibold text-gray-900\"><span class=\"text-accent font-medium\">'이길 수 있는 싸움'</span></strong>만 골라서 하는 영리한 모험가에 가깝습니다.</p>"
+    }
+  },
+  "SVE": {
+    "name": "사회적 가치와 비전으로 변화를 만드는 지속가능한 리더",
+    "category": "economic",
+    "code": "SVE",
+    "nickname": "사회적 가치와 비전으로 변화를 만드는 지속가능한 리더",
+    "keywords": [
+      "안정지향",
+      "가치추구",
+      "비전",
+      "마이웨이",
+      "지속가능성"
+    ],
+    "scores": {
+      "성장 중시 vs 안정 중시": 30,
+      "비전 투자 vs 데이터 투자": 80,
+      "기업가 기질 vs 안정가 기질": 75
+    },
+    "description": "당신은 '가치를 추구하는 낭만적 현실주의자'입니다. 당신은 세상을 바꾸려는 비전(V)을 가진 모험가(E)이지만, 동시에 폭발적인 성장보다는 지속가능한 안정(S)을 추구하는 수호자의 마음을 가졌습니다. 당신에게 돈보다 '가치'를 우선시하는 비전은 사람들에게 깊은 공감과 영감을 주며 진정한 팬을 만들어내며, 단기적인 이익 극대화보다 장기적으로 공동체와 함께 성장하는 '지속가능한' 모델을 만드는 데 능합니다. 때로는 수익성과 가치 사이에서 고민하기도 하지만, 당신은 결코 자신의 신념을 포기하지 않습니다. 결국 당신을 움직이는 핵심 동력은 \"세상을 더 나은 곳으로 만들되, 그 과정이 지속가능해야 한다\"는 원칙입니다.",
+    "strengths": [
+      "**진정성 있는 비전:** 돈보다 '가치'를 우선시하는 당신의 비전은, 사람들에게 깊은 공감과 영감을 주며 진정한 팬을 만들어냅니다.",
+      "**지속가능성에 대한 통찰:** 단기적인 이익 극대화보다, 장기적으로 공동체와 함께 성장하는 '지속가능한' 모델을 만드는 데 능합니다.",
+      "**강력한 내적 동기:** 외부의 평가나 금전적 보상보다, 자신의 신념을 실현하는 과정 자체에서 만족을 느끼므로 쉽게 지치지 않습니다.",
+      "**창의적인 문제 해결:** 부족한 자원 속에서도, 창의적인 아이디어와 커뮤니티의 힘을 활용하여 문제를 해결하는 능력이 뛰어납니다.",
+      "**위험 회피를 통한 안정성:** 무리한 확장을 지양하고, 안정적인 현금흐름을 중시하여 사업을 쉽게 위기에 빠뜨리지 않습니다."
+    ],
+    "weaknesses": [
+      "**수익성 악화:** '좋은 일'이라는 명분에 너무 집중한 나머지, 비즈니스의 본질인 '수익 창출'을 경시하여 지속가능성을 잃을 수 있습니다.",
+      "**성장의 한계:** 안정성을 너무 추구하여, 더 큰 임팩트를 만들 수 있는 성장의 기회를 놓치고 작은 규모에 머무를 수 있습니다.",
+      "**이상과 현실의 괴리:** '착한 의도'만으로는 비즈니스가 성공할 수 없다는 냉정한 현실 앞에서 쉽게 상처받거나 좌절할 수 있습니다.",
+      "**비즈니스 감각 부족:** 마케팅, 재무, 영업과 같은 '돈 버는 기술'을 배우는 것을 속물적인 것으로 여기며 멀리할 수 있습니다.",
+      "**자기희생:** 공동체의 가치를 위해, 자기 자신을 지나치게 희생하여 번아웃에 빠질 위험이 있습니다."
+    ],
+    "spectrum_analysis": "당신은 '가치를 추구하는 낭만적 현실주의자'입니다.\n\n당신은 세상을 바꾸려는 비전(V)을 가진 모험가(E)이지만, 동시에 폭발적인 성장보다는 지속가능한 안정(S)을 추구하는 수호자의 마음을 가졌습니다. 즉, **'꿈을 먹고 살지만, 밥은 굶지 않겠다'**는 매우 현명한 기질을 가지고 있습니다.",
+    "html": {
+      "description": "<p class=\"mb-4 last:mb-0\">당신은 <span class=\"text-accent font-medium\">'가치를 추구하는 낭만적 현실주의자'</span>입니다. 당신은 세상을 바꾸려는 비전(V)을 가진 모험가(E)이지만, 동시에 폭발적인 성장보다는 지속가능한 안정(S)을 추구하는 수호자의 마음을 가졌습니다. 당신에게 돈보다 <span class=\"text-accent font-medium\">'가치'</span>를 우선시하는 비전은 사람들에게 깊은 공감과 영감을 주며 진정한 팬을 만들어내며, 단기적인 이익 극대화보다 장기적으로 공동체와 함께 성장하는 <span class=\"text-accent font-medium\">'지속가능한'</span> 모델을 만드는 데 능합니다. 때로는 수익성과 가치 사이에서 고민하기도 하지만, 당신은 결코 자신의 신념을 포기하지 않습니다. 결국 당신을 움직이는 핵심 동력은 \"세상을 더 나은 곳으로 만들되, 그 과정이 지속가능해야 한다\"는 원칙입니다.</p>",
+      "spectrum_analysis": "<p class=\"mb-4 last:mb-0\">당신은 <span class=\"text-accent font-medium\">'가치를 추구하는 낭만적 현실주의자'</span>입니다.</p><p class=\"mb-4 last:mb-0\">당신은 세상을 바꾸려는 비전(V)을 가진 모험가(E)이지만, 동시에 폭발적인 성장보다는 지속가능한 안정(S)을 추구하는 수호자의 마음을 가졌습니다. 즉, <strong class=\"font-semibold text-gray-900\"><span class=\"text-accent font-medium\">'꿈을 먹고 살지만, 밥은 굶지 않겠다'</span></strong>는 매우 현명한 기질을 가지고 있습니다.</p>"
+    }
+  },
+  "SVW": {
+    "name": "신념을 지키는 조직의 이상가",
+    "category": "economic",
+    "code": "SVW",
+    "nickname": "신념을 지키는 조직의 이상가",
+    "keywords": [
+      "안정지향",
+      "비전",
+      "원칙주의",
+      "문화수호자",
+      "신념과현실"
+    ],
+    "scores": {
+      "성장 중시 vs 안정 중시": 15,
+      "비전 투자 vs 데이터 투자": 70,
+      "기업가 기질 vs 안정가 기질": 10
+    },
+    "description": "당신은 '오래된 가치를 미래로 전하는 이야기꾼'입니다. 당신은 변화와 리스크를 경계하는 확고한 **'수호자'**입니다. 하지만 당신이 지키려는 것은 단순한 시스템이 아닌, 조직이 가진 고유한 '정신'과 '비전(V)'입니다. 당신은 자신이 믿는 가치와 비전을 어떤 상황에서도 굳건히 지켜나가는 힘이 있으며, 단기적인 성과보다 조직이 가진 고유한 철학과 문화를 지키고 다음 세대에 전달하는 것을 더 중요하게 생각합니다. 때로는 변화의 속도에 뒤처질 수도 있지만, 당신은 결코 조직의 정체성을 포기하지 않습니다. 결국 당신을 움직이는 핵심 동력은 \"시간이 지나도 변하지 않는 가치를 지키고 전달하고 싶다\"는 신념입니다.",
+    "strengths": [
+      "**강력한 신념과 원칙:** 당신은 자신이 믿는 가치와 비전을 어떤 상황에서도 굳건히 지켜나가는 힘이 있습니다.",
+      "**조직 문화의 수호자:** 단기적인 성과보다, 조직이 가진 고유한 철학과 문화를 지키고 다음 세대에 전달하는 것을 더 중요하게 생각합니다.",
+      "**진정성 있는 소통:** 당신의 말에는 기교가 아닌 진심이 담겨있어, 동료들에게 깊은 신뢰와 영감을 줍니다.",
+      "**장기적인 안목:** 눈앞의 이익에 흔들리지 않고, 10년, 20년 뒤에도 조직이 올바른 방향으로 나아갈 수 있도록 방향을 제시합니다.",
+      "**안정적인 충성심:** 한번 마음을 준 조직이나 사람을 쉽게 떠나지 않고, 묵묵히 곁을 지키는 높은 충성심을 가졌습니다."
+    ],
+    "weaknesses": [
+      "**변화에 대한 저항:** 자신이 믿는 '초심'과 '비전'을 지키려는 마음이 너무 강한 나머지, 시대의 변화에 맞춰 꼭 필요한 혁신마저도 '변질'로 규정하고 저항할 수 있습니다.",
+      "**현실 감각 부족:** 숭고한 이상과 비전을 강조하지만, 그것을 뒷받침할 구체적인 수익 모델이나 현실적인 계획이 부족할 수 있습니다.",
+      "**'꼰대'로 비칠 위험:** 과거의 성공 방식이나 창업 정신만을 강조하는 모습이, 새로운 세대의 동료들에게는 낡고 고리타분한 '꼰대'처럼 비칠 수 있습니다.",
+      "**유연성 부족:** 한번 정한 원칙이나 신념을, 변화된 상황에 맞춰 유연하게 수정하는 것을 어려워합니다.",
+      "**실무 능력 약화:** '정신'과 '가치'를 강조하는 역할에만 집중한 나머지, 실제 성과를 만들어내는 실무적인 능력이 약화될 수 있습니다."
+    ],
+    "spectrum_analysis": "당신은 '오래된 가치를 미래로 전하는 이야기꾼'입니다.\n\n당신은 변화와 리스크를 경계하는 확고한 **'수호자'**입니다. 하지만 당신이 지키려는 것은 단순한 시스템이 아닌, 조직이 가진 고유한 '정신'과 '비전(V)'입니다. 당신은 안정적인(S) 조직(W) 안에서, 그 조직의 잊혀 가는 초심과 핵심 가치를 다음 세대에 전달하는 중요한 역할을 합니다.",
+    "html": {
+      "description": "<p class=\"mb-4 last:mb-0\">당신은 <span class=\"text-accent font-medium\">'오래된 가치를 미래로 전하는 이야기꾼'</span>입니다. 당신은 변화와 리스크를 경계하는 확고한 <strong class=\"font-semibold text-gray-900\"><span class=\"text-accent font-medium\">'수호자'</span></strong>입니다. 하지만 당신이 지키려는 것은 단순한 시스템이 아닌, 조직이 가진 고유한 <span class=\"text-accent font-medium\">'정신'</span>과 <span class=\"text-accent font-medium\">'비전(V)'</span>입니다. 당신은 자신이 믿는 가치와 비전을 어떤 상황에서도 굳건히 지켜나가는 힘이 있으며, 단기적인 성과보다 조직이 가진 고유한 철학과 문화를 지키고 다음 세대에 전달하는 것을 더 중요하게 생각합니다. 때로는 변화의 속도에 뒤처질 수도 있지만, 당신은 결코 조직의 정체성을 포기하지 않습니다. 결국 당신을 움직이는 핵심 동력은 \"시간이 지나도 변하지 않는 가치를 지키고 전달하고 싶다\"는 신념입니다.</p>",
+      "spectrum_analysis": "<p class=\"mb-4 last:mb-0\">당신은 <span class=\"text-accent font-medium\">'오래된 가치를 미래로 전하는 이야기꾼'</span>입니다.</p><p class=\"mb-4 last:mb-0\">당신은 변화와 리스크를 경계하는 확고한 <strong class=\"font-semibold text-gray-900\"><span class=\"text-accent font-medium\">'수호자'</span></strong>입니다. 하지만 당신이 지키려는 것은 단순한 시스템이 아닌, 조직이 가진 고유한 <span class=\"text-accent font-medium\">'정신'</span>과 <span class=\"text-accent font-medium\">'비전(V)'</span>입니다. 당신은 안정적인(S) 조직(W) 안에서, 그 조직의 잊혀 가는 초심과 핵심 가치를 다음 세대에 전달하는 중요한 역할을 합니다.</p>"
+    }
+  },
+  "SAE": {
+    "name": "데이터를 기반으로 도전하는 현실적 사업가",
+    "category": "economic",
+    "code": "SAE",
+    "nickname": "데이터를 기반으로 도전하는 현실적 사업가",
+    "keywords": [
+      "안정지향",
+      "데이터기반",
+      "계산된도전",
+      "리스크관리형창업",
+      "현실주의"
+    ],
+    "scores": {
+      "성장 중시 vs 안정 중시": 25,
+      "비전 투자 vs 데이터 투자": 10,
+      "기업가 기질 vs 안정가 기질": 70
+    },
+    "description": "당신은 '가장 안전한 길로 정상에 오르는 등반가'입니다. 당신은 정상을 정복하려는 모험가(E)의 심장을 가졌지만, 절대로 아무런 준비 없이 암벽에 오르지 않습니다. 당신은 날씨 데이터와 지형 분석(A)을 통해 가장 안전한(S) 루트를 찾아내고, 모든 장비를 점검한 뒤에야 첫걸음을 떼는, 지극히 **'계산적인 도전자'**입니다. 당신은 '대박'을 꿈꾸기보다 '망하지 않는 사업'을 만드는 것을 더 중요하게 생각하는 현실적인 사업가이며, 이미 시장성이 검증된 아이템을 더 나은 데이터 분석을 통해 개선하거나 안정적인 현금흐름이 보장되는 사업을 선호합니다. 때로는 큰 기회를 놓칠 수도 있지만, 당신은 결코 통제 가능한 성공을 포기하지 않습니다. 결국 당신을 움직이는 핵심 동력은 \"철저한 분석과 준비를 통해 성공의 확률을 최대한으로 높이고, 실패의 리스크를 최소화하고 싶다\"는 욕망입니다.",
+    "strengths": [
+      "**계산된 리스크 감수:** 당신은 무모한 도박을 하지 않습니다. 철저한 데이터 분석을 통해 '이길 확률이 높은 싸움'에만 참전하여, 실패 확률을 극적으로 낮춥니다.",
+      "**높은 생존력:** 안정적인 현금흐름을 중시하고, 최악의 시나리오를 항상 대비하므로, 어떤 위기 상황에서도 쉽게 무너지지 않는 강한 생존력을 가졌습니다.",
+      "**실용적인 문제 해결:** 뜬구름 잡는 비전보다, 당장 돈이 되는 현실적인 문제를 찾아내고, 가장 효율적인 방법으로 해결하는 데 능합니다.",
+      "**데이터 기반 설득력:** 당신의 사업 계획은 언제나 구체적인 숫자를 기반으로 하므로, 투자자나 팀원들을 설득하고 신뢰를 얻는 데 매우 유리합니다.",
+      "**시스템 구축 능력:** 한번 성공한 방식을, 누구나 따라 할 수 있는 '시스템'이나 '매뉴얼'로 만들어 효율적으로 사업을 확장하는 능력이 있습니다."
+    ],
+    "weaknesses": [
+      "**'대박'의 부재:** 지나치게 안정성만 추구한 나머지, 인생을 바꿀 수 있는 '큰 기회'를 놓치고, 언제나 '작은 성공'에만 머무를 수 있습니다.",
+      "**혁신에 대한 둔감성:** 이미 검증된 시장에만 집중하기 때문에, 시장의 판도를 완전히 바꾸는 새로운 기술이나 비즈니스 모델의 등장을 놓칠 수 있습니다.",
+      "**과도한 불신:** 자신의 데이터 분석을 제외한, 타인의 직관이나 비전을 믿지 못하여 좋은 파트너를 놓치거나 팀워크를 저해할 수 있습니다.",
+      "**성장의 한계:** 리스크가 적은 안정적인 사업 모델(예: 프랜차이즈)에만 집중하여, 기하급수적인 성장의 기회를 스스로 차단할 수 있습니다.",
+      "**지루함:** 너무 예측 가능한 성공만 반복하다 보면, 일에 대한 열정과 동기를 잃고 쉽게 지루함을 느낄 수 있습니다."
+    ],
+    "spectrum_analysis": "당신은 '가장 안전한 길로 정상에 오르는 등반가'입니다.\n\n당신은 정상을 정복하려는 모험가(E)의 심장을 가졌지만, 절대로 아무런 준비 없이 암벽에 오르지 않습니다. 당신은 날씨 데이터와 지형 분석(A)을 통해 가장 안전한(S) 루트를 찾아내고, 모든 장비를 점검한 뒤에야 첫걸음을 떼는, 지극히 **'계산적인 도전자'**입니다.",
+    "html": {
+      "description": "<p class=\"mb-4 last:mb-0\">당신은 <span class=\"text-accent font-medium\">'가장 안전한 길로 정상에 오르는 등반가'</span>입니다. 당신은 정상을 정복하려는 모험가(E)의 심장을 가졌지만, 절대로 아무런 준비 없이 암벽에 오르지 않습니다. 당신은 날씨 데이터와 지형 분석(A)을 통해 가장 안전한(S) 루트를 찾아내고, 모든 장비를 점검한 뒤에야 첫걸음을 떼는, 지극히 <strong class=\"font-semibold text-gray-900\"><span class=\"text-accent font-medium\">'계산적인 도전자'</span></strong>입니다. 당신은 <span class=\"text-accent font-medium\">'대박'</span>을 꿈꾸기보다 <span class=\"text-accent font-medium\">'망하지 않는 사업'</span>을 만드는 것을 더 중요하게 생각하는 현실적인 사업가이며, 이미 시장성이 검증된 아이템을 더 나은 데이터 분석을 통해 개선하거나 안정적인 현금흐름이 보장되는 사업을 선호합니다. 때로는 큰 기회를 놓칠 수도 있지만, 당신은 결코 통제 가능한 성공을 포기하지 않습니다. 결국 당신을 움직이는 핵심 동력은 \"철저한 분석과 준비를 통해 성공의 확률을 최대한으로 높이고, 실패의 리스크를 최소화하고 싶다\"는 욕망입니다.</p>",
+      "spectrum_analysis": "<p class=\"mb-4 last:mb-0\">당신은 <span class=\"text-accent font-medium\">'가장 안전한 길로 정상에 오르는 등반가'</span>입니다.</p><p class=\"mb-4 last:mb-0\">당신은 정상을 정복하려는 모험가(E)의 심장을 가졌지만, 절대로 아무런 준비 없이 암벽에 오르지 않습니다. 당신은 날씨 데이터와 지형 분석(A)을 통해 가장 안전한(S) 루트를 찾아내고, 모든 장비를 점검한 뒤에야 첫걸음을 떼는, 지극히 <strong class=\"font-semibold text-gray-900\"><span class=\"text-accent font-medium\">'계산적인 도전자'</span></strong>입니다.</p>"
+    }
+  },
+  "SAW": {
+    "name": "리스크를 관리하는 조직의 파수꾼",
+    "category": "economic",
+    "code": "SAW",
+    "nickname": "리스크를 관리하는 조직의 파수꾼",
+    "keywords": [
+      "안정지향",
+      "데이터기반",
+      "리스크관리",
+      "원칙주의",
+      "시스템수호자"
+    ],
+    "scores": {
+      "성장 중시 vs 안정 중시": 10,
+      "비전 투자 vs 데이터 투자": 15,
+      "기업가 기질 vs 안정가 기질": 5
+    },
+    "description": "당신은 '성벽을 쌓고 규칙을 만드는 철벽의 수호자'입니다. 당신은 불확실한 미래에 베팅하기보다, 데이터를 통해 검증된 원칙(A)을 바탕으로 현재의 자산을 안전하게 지키고(S), 이 모든 과정을 예측 가능하고 안정적인 조직(W) 안에서 수행하는 것을 최우선으로 합니다. 당신의 철저한 신중함은 모든 가능성을 검토하고 최악의 시나리오를 대비하여 조직을 치명적인 위험으로부터 구하는 최고의 방어막이며, 원칙과 규칙에 따라 업무를 처리하므로 주변 사람들로부터 '믿고 맡길 수 있는 사람'이라는 깊은 신뢰를 얻습니다. 때로는 변화의 기회를 놓칠 수도 있지만, 당신은 결코 안정성과 신뢰성을 포기하지 않습니다. 결국 당신을 움직이는 핵심 동력은 \"예측 가능하고 안정적인 시스템 안에서 모든 것을 완벽하게 관리하고 싶다\"는 욕망입니다.",
+    "strengths": [
+      "**철저한 신중함:** 모든 가능성을 검토하고 최악의 시나리오를 대비하는 당신의 신중함은, 조직을 치명적인 위험으로부터 구하는 최고의 방어막입니다.",
+      "**높은 신뢰도:** 원칙과 규칙에 따라 업무를 처리하므로, 주변 사람들로부터 '믿고 맡길 수 있는 사람'이라는 깊은 신뢰를 얻습니다.",
+      "**디테일에 대한 강점:** 다른 사람들이 놓치는 사소한 오류나 잠재적 위험 요소를 찾아내는 데 천부적인 재능이 있습니다.",
+      "**시스템 구축 능력:** 무질서한 상황을 정리하고, 명확한 규칙과 프로세스를 통해 예측 가능한 시스템을 만드는 데 뛰어납니다.",
+      "**꾸준함과 안정성:** 한번 맡은 일은 중간에 포기하지 않고, 꾸준하고 안정적으로 처리하여 조직에 기여합니다."
+    ],
+    "weaknesses": [
+      "**변화에 대한 저항:** 새로운 아이디어나 시도를, 기존의 안정된 질서를 파괴하는 '위험 요소'로 간주하고 저항하는 경향이 있습니다.",
+      "**지나친 비관주의:** 항상 최악의 시나리오를 먼저 생각하는 성향 때문에, 긍정적인 가능성을 보지 못하고 새로운 도전을 시작조차 못 하게 만들 수 있습니다.",
+      "**결정 지연:** 모든 리스크를 완벽하게 통제하려는 욕심 때문에, 중요한 의사결정을 제때 내리지 못하고 기회를 놓칠 수 있습니다.",
+      "**창의성 억압:** 당신의 지나친 원칙주의와 리스크 관리가, 당신 자신과 팀원들의 창의적인 아이디어를 억압하는 걸림돌이 될 수 있습니다.",
+      "**'안주'의 위험:** 변화를 '리스크'로만 간주하여, 정작 변화하지 않아서 발생하는 '도태의 리스크'를 간과할 수 있습니다."
+    ],
+    "spectrum_analysis": "당신은 '성벽을 쌓고 규칙을 만드는 철벽의 수호자'입니다.\n\n당신은 불확실한 미래에 베팅하기보다, 데이터를 통해 검증된 원칙(A)을 바탕으로 현재의 자산을 안전하게 지키고(S), **이 모든 과정을 예측 가능하고 안정적인 조직(W) 안에서 수행**하는 것을 최우선으로 합니다.",
+    "html": {
+      "description": "<p class=\"mb-4 last:mb-0\">당신은 <span class=\"text-accent font-medium\">'성벽을 쌓고 규칙을 만드는 철벽의 수호자'</span>입니다. 당신은 불확실한 미래에 베팅하기보다, 데이터를 통해 검증된 원칙(A)을 바탕으로 현재의 자산을 안전하게 지키고(S), 이 모든 과정을 예측 가능하고 안정적인 조직(W) 안에서 수행하는 것을 최우선으로 합니다. 당신의 철저한 신중함은 모든 가능성을 검토하고 최악의 시나리오를 대비하여 조직을 치명적인 위험으로부터 구하는 최고의 방어막이며, 원칙과 규칙에 따라 업무를 처리하므로 주변 사람들로부터 <span class=\"text-accent font-medium\">'믿고 맡길 수 있는 사람'</span>이라는 깊은 신뢰를 얻습니다. 때로는 변화의 기회를 놓칠 수도 있지만, 당신은 결코 안정성과 신뢰성을 포기하지 않습니다. 결국 당신을 움직이는 핵심 동력은 \"예측 가능하고 안정적인 시스템 안에서 모든 것을 완벽하게 관리하고 싶다\"는 욕망입니다.</p>",
+      "spectrum_analysis": "<p class=\"mb-4 last:mb-0\">당신은 <span class=\"text-accent font-medium\">'성벽을 쌓고 규칙을 만드는 철벽의 수호자'</span>입니다.</p><p class=\"mb-4 last:mb-0\">당신은 불확실한 미래에 베팅하기보다, 데이터를 통해 검증된 원칙(A)을 바탕으로 현재의 자산을 안전하게 지키고(S), <strong class=\"font-semibold text-gray-900\">이 모든 과정을 예측 가능하고 안정적인 조직(W) 안에서 수행</strong>하는 것을 최우선으로 합니다.</p>"
+    }
+  }
+};
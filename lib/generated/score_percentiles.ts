@@ -0,0 +1,400 @@
+// 자동 생성 파일 - 직접 수정하지 마세요 (peit-content percentiles 로 생성)
+// scorePercentiles[가정][축].percentile[점수], .strength[점수] (강도가 null이면 그 글자를 받을 수 없는 점수)
+
+export interface AxisPercentiles {
+  percentile: number[];
+  strength: (number | null)[];
+}
+
+export const scorePercentiles: Readonly<Record<string, Readonly<Record<string, AxisPercentiles>>>> = {
+  "uniform": {
+    "I": {
+      "percentile": [
+        0.1,
+        1.1,
+        5.5,
+        17.2,
+        37.7,
+        62.3,
+        82.8,
+        94.5,
+        98.9,
+        99.9
+      ],
+      "strength": [
+        null,
+        null,
+        null,
+        null,
+        null,
+        24.6,
+        65.6,
+        89.1,
+        97.9,
+        99.8
+      ]
+    },
+    "C": {
+      "percentile": [
+        0.1,
+        1.1,
+        5.5,
+        17.2,
+        37.7,
+        62.3,
+        82.8,
+        94.5,
+        98.9,
+        99.9
+      ],
+      "strength": [
+        null,
+        null,
+        null,
+        null,
+        null,
+        24.6,
+        65.6,
+        89.1,
+        97.9,
+        99.8
+      ]
+    },
+    "P": {
+      "percentile": [
+        0.1,
+        1.1,
+        5.5,
+        17.2,
+        37.7,
+        62.3,
+        82.8,
+        94.5,
+        98.9,
+        99.9
+      ],
+      "strength": [
+        null,
+        null,
+        null,
+        null,
+        null,
+        24.6,
+        65.6,
+        89.1,
+        97.9,
+        99.8
+      ]
+    },
+    "T": {
+      "percentile": [
+        0.1,
+        1.1,
+        5.5,
+        17.2,
+        37.7,
+        62.3,
+        82.8,
+        94.5,
+        98.9,
+        99.9
+      ],
+      "strength": [
+        null,
+        null,
+        null,
+        null,
+        null,
+        24.6,
+        65.6,
+        89.1,
+        97.9,
+        99.8
+      ]
+    },
+    "A": {
+      "percentile": [
+        0.1,
+        1.1,
+        5.5,
+        17.2,
+        37.7,
+        62.3,
+        82.8,
+        94.5,
+        98.9,
+        99.9
+      ],
+      "strength": [
+        null,
+        null,
+        null,
+        null,
+        null,
+        24.6,
+        65.6,
+        89.1,
+        97.9,
+        99.8
+      ]
+    },
+    "U": {
+      "percentile": [
+        0.1,
+        1.1,
+        5.5,
+        17.2,
+        37.7,
+        62.3,
+        82.8,
+        94.5,
+        98.9,
+        99.9
+      ],
+      "strength": [
+        null,
+        null,
+        null,
+        null,
+        null,
+        24.6,
+        65.6,
+        89.1,
+        97.9,
+        99.8
+      ]
+    },
+    "E": {
+      "percentile": [
+        0.1,
+        1.1,
+        5.5,
+        17.2,
+        37.7,
+        62.3,
+        82.8,
+        94.5,
+        98.9,
+        99.9
+      ],
+      "strength": [
+        null,
+        null,
+        null,
+        null,
+        null,
+        24.6,
+        65.6,
+        89.1,
+        97.9,
+        99.8
+      ]
+    },
+    "S": {
+      "percentile": [
+        0.1,
+        1.1,
+        5.5,
+        17.2,
+        37.7,
+        62.3,
+        82.8,
+        94.5,
+        98.9,
+        99.9
+      ],
+      "strength": [
+        null,
+        null,
+        null,
+        null,
+        null,
+        24.6,
+        65.6,
+        89.1,
+        97.9,
+        99.8
+      ]
+    },
+    "G": {
+      "percentile": [
+        0.0,
+        0.3,
+        1.9,
+        7.3,
+        19.4,
+        38.7,
+        61.3,
+        80.6,
+        92.7,
+        98.1,
+        99.7,
+        100.0
+      ],
+      "strength": [
+        null,
+        null,
+        null,
+        null,
+        null,
+        null,
+        22.6,
+        61.2,
+        85.4,
+        96.1,
+        99.4,
+        100.0
+      ]
+    },
+    "S2": {
+      "percentile": [
+        0.0,
+        0.3,
+        1.9,
+        7.3,
+        19.4,
+        38.7,
+        61.3,
+        80.6,
+        92.7,
+        98.1,
+        99.7,
+        100.0
+      ],
+      "strength": [
+        null,
+        null,
+        null,
+        null,
+        null,
+        null,
+        22.6,
+        61.2,
+        85.4,
+        96.1,
+        99.4,
+        100.0
+      ]
+    },
+    "V": {
+      "percentile": [
+        0.0,
+        0.3,
+        1.9,
+        7.3,
+        19.4,
+        38.7,
+        61.3,
+        80.6,
+        92.7,
+        98.1,
+        99.7,
+        100.0
+      ],
+      "strength": [
+        null,
+        null,
+        null,
+        null,
+        null,
+        null,
+        22.6,
+        61.2,
+        85.4,
+        96.1,
+        99.4,
+        100.0
+      ]
+    },
+    "A2": {
+      "percentile": [
+        0.0,
+        0.3,
+        1.9,
+        7.3,
+        19.4,
+        38.7,
+        61.3,
+        80.6,
+        92.7,
+        98.1,
+        99.7,
+        100.0
+      ],
+      "strength": [
+        null,
+        null,
+        null,
+        null,
+        null,
+        null,
+        22.6,
+        61.2,
+        85.4,
+        96.1,
+        99.4,
+        100.0
+      ]
+    },
+    "E2": {
+      "percentile": [
+        0.0,
+        0.3,
+        1.9,
+        7.3,
+        19.4,
+        38.7,
+        61.3,
+        80.6,
+        92.7,
+        98.1,
+        99.7,
+        100.0
+      ],
+      "strength": [
+        null,
+        null,
+        null,
+        null,
+        null,
+        null,
+        22.6,
+        61.2,
+        85.4,
+        96.1,
+        99.4,
+        100.0
+      ]
+    },
+    "W": {
+      "percentile": [
+        0.0,
+        0.3,
+        1.9,
+        7.3,
+        19.4,
+        38.7,
+        61.3,
+        80.6,
+        92.7,
+        98.1,
+        99.7,
+        100.0
+      ],
+      "strength": [
+        null,
+        null,
+        null,
+        null,
+        null,
+        null,
+        22.6,
+        61.2,
+        85.4,
+        96.1,
+        99.4,
+        100.0
+      ]
+    }
+  }
+};
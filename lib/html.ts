@@ -0,0 +1,6 @@
+// 빌드 시 미리 렌더링/정화된 HTML만 사용 (generate_results.py → 유형 항목의 html 맵)
+// 클라이언트에서 원문을 변환하지 않으며, 컴포넌트가 fieldHtml(data, '<필드>')로 읽는 필드의 HTML이 빠지면
+// `peit-content check`가 실패
+export function fieldHtml(data: any, field: string): string {
+  return data?.html?.[field] ?? '';
+}
@@ -1,1090 +1,14 @@
+import { loadTypeDetails } from './generated/details';
 import { ResultData } from './types';
-import { politicalDetails } from './political_details';
 
-export const results: Record<string, ResultData> = {
-  // 정치 유형 16개
-  IPAE: {
-    name: '진보적 자유주의자',
-    category: 'political',
-    scores: {
-      '개인주의': 85,
-      '진보주의': 75,
-      '적극적 평등': 70,
-      '협력 우선': 80
-    },
-    description: '당신은 "원래 그래왔다"는 말보다 "더 나아질 수 있다"는 말을 믿는 사람입니다. 당신의 머릿속은 어떻게 하면 세상을 더 합리적이고, 더 평등하고, 더 자유로운 곳으로 만들 수 있을지에 대한 아이디어로 가득 차 있습니다. 때로는 이상이 너무 높아 현실의 벽 앞에서 좌절하기도 하지만, 당신은 결코 변화에 대한 희망을 놓지 않습니다. 결국 당신을 움직이는 핵심 동력은 "더 나은 세상은 가능하다"는 꺾이지 않는 믿음입니다.',
-    keywords: ['자유로운영혼', '프로변화러', '이상주의자', '토론환영', '내가바꾸는세상'],
-    summary: '개인의 자유(I)를 최우선으로 삼되, 사회적 약자 보호(A)와 국제적 협력(E)을 통해 점진적인 사회 변화(P)를 추구하는 합리적 진보 이념에 가깝습니다.',
-    political_spectrum: '진보 (좌파) 성향',
-    political_spectrum_detail: '일반적으로, 현재 사회의 불평등이나 문제점을 인정하고, **\'변화\'와 \'개혁\'**을 통해 더 평등하고 자유로운 사회를 만들려는 경향을 의미합니다. 개인의 자유만큼이나 사회적 약자를 보호하기 위한 공동체의 역할과 연대를 중요하게 생각합니다.\n\n당신의 정치적 성향은 대체로 현대적인 의미의 \'진보(좌파)\' 이념 스펙트럼에 더 가깝다고 볼 수 있습니다. \'진보\'는 현재 사회의 문제점을 개선하고, 더 평등하고 자유로운 방향으로 \'변화\'하는 것을 중요하게 생각하는 관점입니다. 이는 개인의 자유를 존중하면서도 사회적 약자를 보호하고, 닫힌 사회보다는 국제 사회와 협력하며 함께 나아가야 한다는 당신의 신념과 일치합니다.',
-    detailed_description: '**이름은 \'진보적 자유주의자\', 그러나 진짜 정체는?**\n\n사실 당신의 진짜 정체는 \'이상 없이는 하루도 못 사는 사람\'입니다. 당신은 개인의 자유를 중시하면서도 함께 성장하고 발전할 수 있는 사회를 만드는 일에 진심인 사람입니다. 당신은 불의를 보면 그냥 넘어가지 못하고 "이게 말이 돼?"라며 따지는 타입입니다. 어쩌다 회사 워크숍에서도 "왜 이렇게 해야 하나요?"라며 근본적인 질문을 던져 팀장을 당황하게 만드는 사람이죠.\n\n**관심사:** 사회 정의, 환경 문제, 인권, 젠더 평등. 그러나 무겁지 않게, 재치 있게 접근하기를 좋아합니다.\n\n**라이프스타일:** 공정무역 커피를 마시고, 친환경 제품을 선택하며, 유기농 식품에 신경 쓰는 타입. 하지만 이런 것들을 타인에게 강요하지는 않는, 조용한 실천가입니다.\n\n**정치적 성향:** 진보적이지만 극단적이지 않습니다. 변화는 원하지만, 급진적인 혁명보다는 점진적인 개혁을 선호합니다.',
-    strengths: [
-      '정의로운 공감 능력: 사회적 약자나 불평등 문제에 깊이 공감하며, 이를 해결하기 위해 목소리를 내는 것을 주저하지 않습니다.',
-      '유연한 사고: \'원래 그래왔다\'는 말에 얽매이지 않고, 더 나은 세상을 위해 새로운 아이디어를 적극적으로 수용합니다.',
-      '설득력 있는 소통: 이상주의자이지만, 감정적인 선동보다 합리적인 대화를 통해 사람들의 마음을 움직이는 힘이 있습니다.',
-      '개방성과 포용력: 나와 다른 배경을 가진 사람이나 새로운 문화를 편견 없이 받아들이고 함께 어울리는 것을 즐깁니다.',
-      '긍정적 행동주의: 현실을 비관하기보다 미래를 낙관하며, 더 나은 가능성을 향해 기꺼이 첫걸음을 내딛습니다.'
-    ],
-    weaknesses: [
-      '이상주의적 경향: 현실의 복잡성과 제약을 간과하고, 이상만으로 모든 것을 해결하려 할 수 있습니다.',
-      '느린 변화에 대한 조급함: 사회 변화의 속도가 더디다고 느끼면 쉽게 좌절하거나 냉소적으로 변할 수 있습니다.',
-      '현실 감각 부족: \'대의\'에 집중한 나머지, 먹고사는 문제와 같은 현실적인 문제의 중요성을 간과할 때가 있습니다.',
-      '감정적 소모: 타인의 문제에 깊이 공감하는 만큼, 감정적으로 쉽게 지치거나 소모될 수 있습니다.',
-      '원칙의 모호성: 유연함을 너무 강조한 나머지, 때로는 지켜야 할 원칙마저 흔들리는 것처럼 보일 수 있습니다.'
-    ],
-    speech_style: '**친구들과의 모임에서도 "그런데 그게 정말 공평한 거야?"라고 묻는 사람**\n\n당신은 일상적인 대화에서도 자연스럽게 사회 정의나 공정성에 대한 이야기를 꺼내는 편입니다. 하지만 무겁거나 교조적으로 말하지는 않아요. 오히려 "어? 그런 식으로 생각해본 적 없었네"라며 상대방이 새로운 관점을 가질 수 있도록 자연스럽게 유도하는 재능이 있습니다.\n\n**특징:**\n- "근데 말이 안 되는 건... 왜 우리는..."\n- "그거 알아? 사실 이런 관점도 있어"\n- "그냥 궁금한 건데, 너는 어떻게 생각해?"\n\n이런 식으로 질문을 던지며 대화를 이끌어가는 스타일입니다.',
-    stress_moment: '**가장 스트레스 받는 순간: "원래 그래"라는 말 듣기**\n\n당신이 가장 답답해하는 순간은 불공정한 상황에 대해 이야기할 때 상대방이 "원래 그래"라고 체념적으로 말할 때입니다. 당신에게는 이런 태도가 문제를 방치하고 개선의 기회를 포기하는 것처럼 느껴집니다.',
-    solution: '**솔루션: \'If\' 화법을 사용해 보세요.**\n\n상대방을 설득할 때는 거대한 사회 변혁을 이야기하기보다, "만약 우리가 이렇게 한다면..."이라는 \'If\' 화법을 사용해 보세요. 예를 들어, "만약 우리가 작은 변화부터 시작한다면, 더 큰 변화로 이어질 수 있을 거예요"처럼 가정법을 활용하여 부드럽게 제안하는 거죠.',
-    love_value: '**연애 가치관: "함께 성장하는 동지적 사랑"**\n\n당신에게 이상적인 연애는 서로를 구속하지 않으면서도 함께 성장할 수 있는 관계입니다.\n\n**중요하게 생각하는 것들:**\n- **대화의 질**: 사소한 일상 이야기뿐만 아니라 사회 이슈나 철학적인 주제도 편하게 나눌 수 있는 사람\n- **독립성**: 각자의 관심사와 활동을 존중하고 지지하는 관계\n- **가치관의 공유**: 기본적인 사회적 가치관(공정함, 배려 등)을 공유하는 사람\n- **열린 마음**: 새로운 것을 함께 경험하고 배우려는 의지\n\n**데이트 스타일**: 영화보다는 전시회, 맛집보다는 공정무역 카페, 일반적인 여행보다는 의미 있는 체험을 함께 하는 것을 선호합니다.',
-    best_partner: '**최고의 연애 파트너: CPUE (사회민주주의자)**\n\n**왜 잘 맞나요?**\n\nCPUE는 당신의 이상주의적 성향을 현실적으로 구현할 수 있는 방법을 제시해줄 수 있는 파트너입니다. 당신이 "세상이 더 공정해져야 해!"라고 말하면, CPUE는 "그럼 구체적으로 어떤 정책이나 시스템이 필요할까?"라며 실현 가능한 방안을 함께 고민해줄 거예요.\n\n**함께 하면 좋은 활동:**\n- 사회적 기업 제품 쇼핑\n- 다큐멘터리 감상 후 토론\n- 자원봉사 활동\n- 북클럽이나 토론 모임 참여',
-    worst_partner: '**최악의 갈등 상대: ITUS (고립주의적 자유주의자)**\n\n**왜 갈등이 생기나요?**\n\n당신이 "우리나라도 난민을 더 많이 받아들여야 하지 않을까?"라고 말하면, ITUS는 "그런 건 우리가 신경 쓸 문제가 아니야. 우리 일부터 잘 해결하자"라고 답할 가능성이 높습니다.\n\n**구체적인 갈등 상황:**\n- 당신: "공정무역 제품을 사자"\n- ITUS: "왜 비싰 걸 굳이?"\n- 당신: "환경을 위해 대중교통을 이용하자"\n- ITUS: "시간 아까운데 차 타고 가자"\n\n이런 식으로 기본적인 가치관 차이로 인해 지속적인 마찰이 생길 수 있습니다.',
-    communication_barrier: '**소통의 벽: 당신이 보수주의자와 대화할 때 답답함을 느끼는 이유**\n\n혹시 보수적인 성향의 사람과 정치나 사회 문제에 대해 이야기할 때, "왜 저 사람은 변화에 이렇게 부정적일까?"라는 생각이 든 적이 있나요?\n\n**이유:**\n- **당신**: 가능성을 여는 대화 → "왜 안 돼?"\n- **보수주의자**: 안정과 검증된 경험을 중심으로 대화 → "굳이 왜?"\n\n**예시 대화:**\n- 당신: "최저임금을 더 올려야 하지 않을까요?"\n- 보수주의자: "그러면 중소기업들이 감당하기 어려워질 텐데요"\n- 당신: "그럼 정부 지원을 늘리면 되잖아요"\n- 보수주의자: "그 비용은 또 세금으로 충당해야 하는데..."\n\n이런 식으로 서로 다른 우선순위 때문에 대화가 평행선을 달리게 됩니다.',
-    career_value: '**돈과 일에 대한 태도: "의미 있는 일이 우선"**\n\n당신에게는 연봉의 크기보다 **"이 일이 세상에 어떤 긍정적인 영향을 미치는가?"**가 더 중요한 기준입니다.\n\n**선호하는 직장 문화:**\n- 수평적이고 민주적인 의사결정 과정\n- 직원들의 의견이 존중받는 환경\n- 사회적 책임을 다하는 기업\n- 일과 삶의 균형을 중시하는 곳\n\n**적성에 맞는 분야:**\n- 비영리단체\n- 사회적 기업\n- 미디어/언론\n- 교육 분야\n- 환경 관련 기업\n- 스타트업 (특히 사회적 가치 추구)\n\n**피하고 싶은 직장:**\n권위적이고 위계질서가 강한 조직, 사회적 가치보다 수익만을 추구하는 기업',
-    financial_style: '**잠재적 재무 스타일: "가치 투자가"**\n\n당신의 투자 철학은 단순한 수익률을 넘어 **"내가 투자하는 곳이 세상을 더 좋은 방향으로 만드는가?"**를 고려합니다.\n\n**투자 성향:**\n- **ESG 펀드**: 환경, 사회, 거버넌스를 고려한 투자\n- **사회적 채권**: 사회 문제 해결에 기여하는 채권\n- **해외 분산 투자**: 국경을 넘나드는 글로벌 시각\n- **공정무역 기업 주식**: 윤리적 경영을 하는 회사\n\n**소비 패턴:**\n- 조금 비싸도 공정무역 제품 구매\n- 친환경 제품 선호\n- 구독 서비스: 교육, 문화 콘텐츠 위주\n- 여행: 의미 있는 체험이나 봉사활동 포함\n\n**주의할 점:**\n가치 소비에 너무 치중하다 보면 실제 재정 관리에 소홀할 수 있어요. 이상과 현실 사이의 균형을 맞추는 것이 중요합니다.',
-    historical_avatar: '**역사적 아바타: 존 F. 케네디 (미국 35대 대통령)**\n\n**왜 케네디인가요?**\n\n케네디는 "Ask not what your country can do for you—ask what you can do for your country"(국가가 당신을 위해 무엇을 할지 묻지 말고, 당신이 국가를 위해 무엇을 할 수 있는지 물으십시오)라는 명언으로 유명한 대통령입니다.\n\n**당신과의 공통점:**\n- **진보적 비전**: 인종차별 철폐, 우주 개발 등 혁신적 정책 추진\n- **이상주의와 현실주의의 조화**: 큰 꿈을 꾸되 실현 가능한 방법 모색\n- **소통의 달인**: 대중과의 소통을 중시하고 설득력 있는 연설\n- **국제적 시각**: 평화봉사단 창설 등 글로벌 협력 중시\n\n**배울 점:**\n케네디는 이상만 추구하지 않고, 정치적 현실과 타협하며 점진적 변화를 추구했습니다. 당신도 완벽한 이상보다는 실현 가능한 개선에 집중하면 더 큰 변화를 만들 수 있을 거예요.',
-    real_avatar: '**현실 속 아바타: "합리적 대안을 제시하는 진보 지식인"**\n\n**누구를 말하는 건가요?**\n\n특정 정치인이나 활동가를 지지하기보다, 데이터와 논리를 바탕으로 사회 문제에 대한 대안을 제시하는 지식인이나 전문가들입니다.\n\n**특징:**\n- **팩트 체크**: 감정에 휩쓸리지 않고 사실에 기반한 판단\n- **대안 제시**: 비판에서 그치지 않고 구체적인 해결책 모색\n- **소통 능력**: 어려운 개념을 쉽게 설명하는 능력\n- **중립적 시각**: 특정 진영에 매몰되지 않는 균형감\n\n**예시:**\n- 사회 문제를 다루는 팟캐스트 진행자\n- 시민사회 단체의 정책 담당자\n- 언론사의 탐사보도 기자\n- 대학의 사회과학 교수\n\n**당신이 지향할 방향:**\n단순한 비판자가 아닌, 건설적인 대안을 제시하는 사람이 되세요.',
-    growth_direction: '**개인적 성장과 자기계발**\n\n당신의 가장 큰 강점은 **"더 나은 세상을 만들고자 하는 진정성"**입니다. 하지만 이 강점이 진정한 힘을 발휘하려면 현실감각과 실행력이 뒷받침되어야 합니다.\n\n**성장 방향:**\n\n**1. 이상과 현실의 연결고리 만들기**\n- **현재:** "세상이 더 공정해져야 해!"\n- **목표:** "이런 구체적인 방법으로 조금 더 공정하게 만들 수 있어"\n\n**2. 실행력 기르기**\n- **현재:** 문제점은 잘 찾지만 실천은 부족\n- **목표:** 작은 실천이라도 꾸준히 이어가는 힘\n\n**3. 소통 능력 발전시키기**\n- **현재:** 같은 생각을 가진 사람들과만 대화\n- **목표:** 다른 관점을 가진 사람들도 설득할 수 있는 능력\n\n**구체적인 액션 플랜:**\n- 한 달에 한 번, 작은 사회 참여 활동하기\n- 다양한 관점의 책이나 콘텐츠 접하기\n- 논리적 사고와 데이터 분석 능력 키우기',
-    growth_task: '\'이상\'과 \'현실\'을 연결하기',
-    final_goal: '당신 성장의 최종 목표는, 단순히 착하고 열정적인 사람에서 머무는 것이 아니라, 뜨거운 심장(이상)과 차가운 머리(현실 감각)를 모두 갖추어 **\'세상을 실제로 바꾸는 혁신가\'**가 되는 것입니다. 당신의 선한 영향력이 구체적인 성과로 이어질 때, 당신은 가장 큰 성취감을 느끼게 될 것입니다.'
-  },
+// 빌드 시 병합이 끝난 결과 데이터 (lib/results_base.ts + lib/political_details.ts → generate_results.py)
+// results에는 목록/카드/메타데이터용 요약 필드만 있고, 본문 상세 필드와 미리 렌더링된 html은
+// 유형별 모듈(lib/generated/details/<코드>.json)에 있어 상세를 보여 주는 화면만 자기 유형 것을 불러옴
+export { results } from './generated/results';
 
-  IPAS: {
-    name: '급진적 자유주의자',
-    category: 'political',
-    scores: {
-      '개인주의': 85,
-      '진보주의': 80,
-      '적극적 평등': 75,
-      '안보 우선': 85
-    },
-    description: '당신은 "미지근한 것"을 견디지 못하는 사람입니다. 어중간한 타협보다는, 문제의 핵심을 꿰뚫고 가장 확실하게 해결하는 것을 선호합니다. 당신에게 세상은 더 효율적이고 자유로운 곳이 되어야 하며, 이를 가로막는 낡은 관습이나 기득권은 타파의 대상이라고 생각합니다. 결국 당신을 움직이는 핵심 동력은 "비효율과 불합리에 대한 강한 저항 정신"입니다.',
-    keywords: ['마이웨이', '급진적개혁', '강한신념', '타협은없다', '판을흔드는자'],
-    summary: '개인의 자유(I)와 새로운 질서(P)를 위해, 기존 체제에 대한 적극적인 개입(A)과 강력한 힘의 논리(S)도 긍정하는 급진적인 자유주의 이념에 가깝습니다.',
-    political_spectrum: '중도 (급진적)',
-    political_spectrum_detail: '기존의 좌파/우파 이념 틀로는 설명하기 어려운, 제3의 길을 추구하는 성향입니다. 진보적인 \'목표\'(변화, 개혁)와 보수적인 \'수단\'(힘, 안보)을 동시에 추구 하는 등, 양측의 가장 급진적인 생각들을 일부 공유하며 새로운 질서를 만들고자 합니다.\n\n당신은 진보적 가치(변화, 개입)와 보수적 방법(힘, 안보)을 동시에 추구하는 독특한 위치에 있습니다. 스펙트럼 상으로는 **\'중도\'**에 해당하지만, 양측의 가장 급진적인 생각들을 일부 공유합니다. 이는 기존의 좌파/우파 이념 틀로는 설명하기 어려운, \'새로운 질서\'를 추구하는 제3의 길에 가깝습니다.',
-    detailed_description: '당신은 \'미지근한 것\'을 견디지 못하는 사람입니다. 어중간한 타협보다는, 문제의 핵심을 꿰뚫고 가장 확실하게 해결하는 것을 선호합니다. 당신에게 세상은 더 효율적이고 자유로운 곳이 되어야 하며, 이를 가로막는 낡은 관습이나 기득권은 타파의 대상이라고 생각합니다. 당신의 급진적인 아이디어는 때로 주변 사람들을 당황하게 만들지만, 누구도 생각지 못한 새로운 가능성을 열어주는 기폭제가 되기도 합니다. 당신은 "왜 안돼?"라고 질문하는 것을 두려워하지 않으며, 필요하다면 기꺼이 \'체제 전복자\'의 역할을 자처할 용기가 있습니다.\n\n결국 당신을 움직이는 핵심 동력은 \'비효율과 불합리에 대한 강한 저항 정신\'입니다. 당신은 잘못된 것을 바로잡기 위해 논쟁을 피하지 않으며, 세상을 바꾸기 위해서는 때로 충격 요법이 필요하다고 믿는 사람입니다.',
-    strengths: [
-      '강력한 문제 해결 의지: 문제의 핵심을 파악하고, 기존의 틀을 깨서라도 해결하려는 강력한 추진력을 가지고 있습니다.',
-      '두려움 없는 도전 정신: 남들이 모두 불가능하다고 말하는 일에 과감히 도전하여 새로운 판을 짜는 것을 두려워하지 않습니다.',
-      '자기 확신: 자신의 신념과 판단에 대한 믿음이 강해, 외부의 비판에 쉽게 흔들리지 않습니다.',
-      '결단력: 복잡한 상황에서도 좌고우면하지 않고, 목표를 위해 빠른 결정을 내리는 능력이 있습니다.',
-      '높은 에너지: 자신의 목표를 향해 나아갈 때, 지치지 않는 열정과 에너지를 보여줍니다.'
-    ],
-    weaknesses: [
-      '지나친 독단성: 자신의 신념이 너무 강한 나머지, 다른 사람의 의견을 무시하거나 독선적으로 보일 수 있습니다.',
-      '과도한 리스크 감수: \'모 아니면 도\'라는 생각으로, 실패 시의 충격을 고려하지 않은 채 너무 큰 리스크를 짊어질 수 있습니다.',
-      '타협 능력 부족: 점진적인 개선이나 협상보다는, 모든 것을 한번에 바꾸려는 성향 때문에 불필요한 적을 만들곤 합니다.',
-      '과정의 무시: \'결과\'를 너무 중시한 나머지, 그 과정에서의 절차적 정당성이나 타인의 감정을 무시할 수 있습니다.',
-      '불안정성: 끊임없이 기존의 것을 파괴하려는 성향 때문에, 주변 사람들에게 예측 불가능하고 불안정한 사람이라는 인상을 줍니다.'
-    ],
-    speech_style: '당신은 빙빙 돌려 말하는 것을 시간 낭비라고 생각하며, 문제의 핵심과 해결책을 바로 이야기하는 것을 선호합니다. 당신의 결론부터 말하는 대화는 복잡한 논의를 빠르게 진전시키는 힘이 있지만, 때로는 과정이나 상대방의 감정을 고려하지 않아 \'공격적\'이라는 오해를 사기도 합니다. 이러한 태도는 **\'애매하고 비효율적인 상황에 대한 스트레스\'**를 느끼는 사람들에게 명쾌함을 주지만, 안정과 합의를 중시하는 사람들에게는 당신이 토론이 아닌 전쟁을 하고 있다는 인상을 줄 수 있습니다.',
-    stress_moment: '중요한 문제 앞에서 "좋은 게 좋은 거지"라며 어물쩍 넘어가려는 태도는 당신의 분노를 유발합니다. 당신에게 그것은 문제의 본질을 회피하고 비효율을 용납하는, 가장 나쁜 태도이기 때문입니다. 당신은 불편한 진실을 마주하고서라도 문제를 근본적으로 해결하려는 파트너에게 가장 큰 신뢰를 느낍니다.',
-    solution: '상대방을 "답답한 사람"이라고 비판하는 대신, "지금 이 문제를 해결하지 않으면, 우리는 매달 OOO원의 손해를 보거나 OOO라는 기회를 놓치게 됩니다." 와 같이 기회비용을 숫자로 제시해보세요. 이는 상대방이 문제의 시급성을 현실적으로 깨닫게 하는 가장 효과적인 방법입니다.',
-    love_value: '당신에게 연애는 안락한 휴식처가 아니라, 세상을 향해 함께 싸우는 전우애입니다. 당신은 자신처럼 강한 신념(A)을 가진 파트너와 함께, 낡은 세상을 향해 과감하게 돌을 던지는(S) 삶을 꿈꿉니다. 관계가 너무 평온하고 안정적이면 오히려 지루함을 느끼며, 함께 논쟁하고 싸우며 성장하는 관계에서 살아있음을 느낍니다. 당신의 사랑은 때로는 너무 뜨거워 상대를 데게 할 수 있지만, 그만큼 순수하고 강력한 힘을 가지고 있습니다.',
-    best_partner: '**CPAE** (진보적 공동체주의자)\n\n왜 잘 맞는가? 당신의 급진적인 에너지를 사회적으로 긍정적인 방향으로 함께 이끌어줄 수 있는 최고의 파트너입니다. 둘 다 세상을 바꾸려는 열망이 강하며, 당신의 과감한 결단력과 그의 따뜻한 포용력이 결합되면 아무도 막을 수 없는 \'혁명가 커플\'이 될 수 있습니다.',
-    worst_partner: '**CTUE** (중도 보수주의자)\n\n왜 갈등하는가? 당신이 "일단 저지르고 보자!"라고 말할 때, 그는 "절차와 원칙부터 따져보자"고 말립니다. 예를 들어, 갑자기 해외로 떠나고 싶다는 당신의 제안에 그는 3개월짜리 여행 계획서와 예산안부터 요구할 것입니다. 당신이 보기엔 그는 답답한 관료주의자, 그가 보기엔 당신은 예측 불가능한 폭탄일 뿐입니다.',
-    communication_barrier: '혹시 온건한 성향의 사람과 대화할 때, "왜 저렇게 답답하게 점진적으로만 하려고 하지?" 라며 속이 터질 것 같았던 적 없으신가요? 이는 당신이 \'문제의 근본적인 해결\'을 위해 **\'빠르고 과감한 행동\'**을 선호하는 반면, 온건주의자는 \'부작용 최소화\'를 위해 **\'느리고 신중한 합의\'**를 더 중요한 가치로 여기기 때문입니다. 당신은 \'수술\'을 하려 하는데, 그는 \'물리치료\'를 권하는 셈입니다.',
-    career_value: '당신의 **급진적인 진보성(P)과 개인주의(I)**는 안정적이지만 변화 없는 조직을 \'무덤\'과 같다고 느끼게 합니다. 당신은 기존 시장의 룰을 파괴하는 \'게임 체인저\'가 되기를 원하며, 실패 확률이 높더라도 성공 시 모든 것을 바꿀 수 있는 혁신적인 분야(AI, 바이오 등)에 매력을 느낍니다.',
-    financial_style: '\'힘의 논리(S)\'를 신뢰하는 당신의 성향은 투자에서도 드러납니다. 안정적인 우량주보다는, 시장의 패러다임을 바꿀 수 있는 **\'초기 단계의 기술주\'나 \'암호화폐\'**에 과감하게 베팅할 가능성이 높습니다. "High Risk, High Return"은 당신의 투자 철학이자 삶의 방식입니다.',
-    historical_avatar: '**나폴레옹 보나파르트** (프랑스의 황제)\n\n나폴레옹은 프랑스 대혁명의 혼란을 평정하고, 낡은 봉건적 질서를 파괴한 급진적인 개혁가였습니다. 그는 유럽 전역을 무력으로 석권했지만, 동시에 모든 사람이 법 앞에서 평등하다는 원칙을 담은 \'나폴레옹 법전\'을 만들어 근대 시민 사회의 기틀을 닦았습니다. 기존의 질서를 파괴하고 자신만의 새로운 규칙을 만들어낸 그의 모습은, 개인의 자유와 새로운 질서를 위해 강력한 힘의 사용도 마다하지 않는 당신의 성향을 상징적으로 보여줍니다.',
-    real_avatar: '**"기성 정치에 반기를 드는 제3지대의 젊은 개혁가"**\n\n이들은 기존의 거대 양당 체제를 모두 비판하며, 낡은 정치를 끝내고 완전히 새로운 판을 짜야 한다고 주장하는 사람들입니다. 때로는 독단적이라는 비판을 받기도 하지만, 누구도 하지 못했던 과감한 발언과 행동으로 정치에 무관심했던 사람들의 주목을 이끌어내는 강력한 힘이 있습니다.',
-    growth_direction: '당신의 강력한 추진력은 낡은 것을 부수고 새로운 것을 만드는 데 최적화되어 있습니다. 하지만 당신이 바꾸려는 세상에는 \'사람\'이 살고 있음을 기억해야 합니다. 당신의 성장은, 당신의 혁명이 \'파괴\'가 아닌 \'건설\'이 되기 위해, 당신의 비전을 지지해 줄 \'동료\'를 만드는 법을 배우는 과정에 있습니다.',
-    growth_task: '\'과정\'의 가치를 존중하기',
-    final_goal: '당신 성장의 최종 목표는, 단순히 세상을 비판하는 \'아웃사이더 혁명가\'를 넘어, 사람들의 마음을 얻어 자신의 비전을 현실로 만드는 **\'판을 설계하는 전략가\'**가 되는 것입니다.'
-  },
-
-  IPUE: {
-    name: '합리적 개인주의자',
-    category: 'political',
-    scores: {
-      '개인주의': 80,
-      '진보주의': 65,
-      '보편적 평등': 70,
-      '협력 우선': 75
-    },
-    description: '당신은 친구들과의 논쟁에서 "그래서 네 주장의 근거가 뭔데?"라는 질문을 던지는 편입니다. 당신에게 세상은 뜨거운 감정이 아닌 차가운 논리로 움직여야 하는 곳입니다. 어떤 문제든 감정적인 호소보다는, 객관적인 데이터와 합리적인 근거를 바탕으로 토론하고 설득하는 것을 선호합니다. 결국 당신을 움직이는 핵심 동력은 "편견과 비논리를 걷어내고 가장 합리적인 해답을 찾으려는 지적 열망"입니다.',
-    strengths: ['논리적인 설득력', '균형 잡힌 시각', '높은 지적 정직성', '일관성', '독립적 사고'],
-    weaknesses: ['결정 장애', '차가운 인상', '행동력 부족', '과도한 이상주의', '엘리트주의적 시각']
-  },
-
-  IPUS: {
-    name: '고전적 자유주의자',
-    category: 'political',
-    scores: {
-      '개인주의': 85,
-      '진보주의': 60,
-      '보편적 평등': 70,
-      '안보 우선': 80
-    },
-    description: '"국가가 나를 위해 무엇을 해줄지 기대하지 마라"는 말을 마음속 깊이 동의하는 사람입니다. 당신은 각자의 삶은 각자가 책임지는 것이 가장 공정하고 효율적인 사회라고 믿습니다. 불필요한 규제나 과도한 세금은 개인의 창의성과 경제 전체의 활력을 앗아가는 것이라 생각합니다. 결국 당신을 움직이는 핵심 동력은 "그 누구의 간섭도 받지 않고 스스로의 삶을 개척하려는 강한 독립 의지"입니다.',
-    strengths: ['강한 독립성과 책임감', '효율성 중시', '현실적인 판단력', '자기 주도성', '공정함 추구'],
-    weaknesses: ['사회적 연대감 부족', '지나친 경쟁주의', '냉소적인 태도', '결과지상주의', '인간관계의 어려움'],
-    recommended_content: '추천 콘텐츠가 준비 중입니다.'
-  },
-
-  ITAE: {
-    name: '실용주의적 보수주의자',
-    category: 'political',
-    scores: {
-      '개인주의': 65,
-      '전통주의': 75,
-      '적극적 평등': 65,
-      '협력 중시': 70
-    },
-    description: '당신은 \'옛것\'의 가치를 알지만, \'새것\'을 무조건 배척하지는 않는 지혜로운 사람입니다. "세상에는 정답이 없다"는 것을 알고 있으며, 뜨거운 이념 논쟁보다는 실제 사람들의 삶에 도움이 되는 현실적인 해결책을 찾는 데 더 큰 가치를 둡니다. 결국 당신을 움직이는 핵심 동력은 \'과거의 지혜와 현재의 변화 사이에서 최적의 균형점을 찾으려는 조화의 의지\'입니다.',
-    strengths: ['안정적인 관리 능력', '높은 신뢰성', '갈등 중재 능력', '존중하는 태도', '현실 감각'],
-    weaknesses: ['변화에 대한 둔감성', '과도한 신중함', '열정 및 비전 부족', '기득권 옹호', '매력 부족']
-  },
-
-  ITAS: {
-    name: '보수적 자유주의자',
-    category: 'political',
-    scores: {
-      '개인주의': 75,
-      '전통주의': 80,
-      '적극적 평등': 60,
-      '안보 우선': 85
-    },
-    description: '당신은 "감상적인 민족주의"보다 "현실적인 국익"이 훨씬 중요하다고 생각하는 편입니다. 자유로운 시장 경쟁이 국가 전체의 파이를 키우며, 그렇게 얻은 부와 힘으로 국제 사회에서 당당히 목소리를 내야 한다고 믿습니다. 결국 당신을 움직이는 핵심 동력은 "자유로운 개인들이 모여 위대한 국가를 만든다"는 강한 믿음입니다.',
-    keywords: ['강한대한민국', '국익이최고', '시장주의자', '보수논객', '작은정부'],
-    summary: '일반적으로, 급진적인 변화가 가져올 혼란을 경계하고, 오랜 시간 검증된 **\'전통\'과 \'질서\'**를 통해 사회를 안정적으로 유지하는 것을 중요하게 생각하는 경향을 의미합니다.',
-    political_spectrum: '보수 (우파) 성향',
-    political_spectrum_detail: '당신의 정치적 성향은 \'보수(우파)\' 이념 스펙트럼, 그중에서도 정부의 개입을 최소화하고 개인과 기업의 자유를 극대화해야 국가가 부강해진다고 믿는 자유지상주의적 색채가 강하게 나타납니다. 이는 전통적 가치를 존중하면서도, 경제적으로는 급진적인 자유를 추구하는 모습입니다.',
-    detailed_description: '당신은 \'감상적인 민족주의\'보다 \'현실적인 국익\'이 훨씬 중요하다고 생각하는 편입니다. 자유로운 시장 경쟁이 국가 전체의 파이를 키우며, 그렇게 얻은 부와 힘으로 국제 사회에서 당당히 목소리를 내야 한다고 믿습니다. 당신에게 \'복지\'는 때로 사람들의 의존성을 키우는 달콤한 독처럼 느껴질 수 있습니다. 당신의 냉철함은 \'피도 눈물도 없다\'는 오해를 살 수 있지만, 이는 감정에 휘둘리지 않고 국가 전체의 이익을 생각하는 당신만의 방식입니다.\n\n**결국 당신을 움직이는 핵심 동력은 \'자유로운 개인들이 모여 위대한 국가를 만든다\'는 강한 믿음입니다. 당신은 국가가 개인의 삶에 시시콜콜 개입하는 \'온정주의\'가 아닌, 개인이 마음껏 능력을 펼칠 수 있는 \'강한 나라\'를 지향하는 사람입니다.**',
-    strengths: [
-      '명확한 경제 철학: \'자유 시장\'과 \'작은 정부\'라는 명확하고 일관된 철학을 가지고 있습니다.',
-      '강한 책임감: 국가와 사회에 기대기보다, 개인의 책임을 강조하며 스스로의 삶을 개척해나갑니다.',
-      '원칙 준수: 자신이 옳다고 믿는 원칙에 대해서는 어떠한 비판에도 타협하지 않는 굳건함을 보여줍니다.',
-      '국부에 대한 비전: 개인의 자유로운 경제 활동이 모여, 국가 전체의 부를 증진시킨다는 명확한 비전을 가지고 있습니다.',
-      '높은 효율성: 불필요한 규제와 절차를 제거하여, 가장 효율적인 방식으로 목표를 달성하는 것을 선호합니다.'
-    ],
-    weaknesses: [
-      '소외 계층에 대한 낮은 공감: 경제적 효율성을 너무 강조한 나머지, 경쟁에서 뒤처진 사회적 약자의 어려움을 간과할 수 있습니다.',
-      '과도한 이상주의: 모든 인간이 합리적이고 책임감 있게 행동할 것이라는, 시장에 대한 이상적인 믿음을 가질 수 있습니다.',
-      '비타협적인 태도: 자신의 경제 철학에 대한 믿음이 너무 강해, 다른 의견을 가진 사람들과 타협하는 것을 매우 어려워합니다.',
-      '공공 가치 경시: 교육, 의료, 환경 등 시장 논리로만 해결할 수 없는 공공의 가치를 경시하는 경향이 있습니다.',
-      '물질주의적 시각: 세상의 많은 가치를 \'경제적 효용성\'으로만 판단하여, 인간적인 가치를 놓칠 위험이 있습니다.'
-    ],
-    speech_style: '당신은 자신의 신념, 특히 \'자유 시장\'과 \'작은 정부\'라는 원칙에 대해 매우 강한 확신을 가지고 말합니다. 당신의 화법은 상대방을 설득하려는 \'대화\'라기보다, 진리를 선포하는 \'선언\'에 가깝습니다. 이러한 화법은 **\'애매한 태도에 대한 스트레스\'**를 느끼는 사람들에게 확신을 줍니다. 하지만 때로는 토론의 여지를 막는 독선적인 사람으로 비칠 수 있습니다.',
-    stress_moment: '개인의 문제를 국가의 책임으로 돌리며, 세금을 통해 해결해달라고 요구하는 말을 들을 때 가장 큰 스트레스를 받습니다. 당신에게 그것은 개인의 책임을 회피하고 공동체에 기생하려는, 매우 나약한 태도이기 때문입니다. 당신은 스스로의 삶을 개척하려는 의지를 가진 파트너를 가장 존중합니다.',
-    solution: '상대방의 방식을 "틀렸다"고 비판하기 전에, "우리 모두가 더 부유하고 성공적인 삶을 살기 원한다는 점에서는 같은 생각일 겁니다." 와 같이 공동의 목표를 먼저 제시하세요. 그리고 "그 목표를 위해, 국가의 도움을 기다리는 것보다 우리가 직접 할 수 있는 일은 무엇일까요?" 라고 질문을 던지면, 상대방은 당신의 주장을 \'비판\'이 아닌 \'대안\'으로 받아들이게 됩니다.',
-    love_value: '당신은 연인 관계를 단순히 감정적인 교류를 넘어, 두 사람의 성공과 부(富)를 함께 일구어 나가는 \'전략적 파트너십\'으로 생각하는 경향이 있습니다. 개인의 능력(I)을 존중하고, 전통적인(T) 가정을 꾸리되, 강력한 경제력과 안보(S)를 통해 누구도 넘볼 수 없는 견고한 관계를 만들고자 합니다. 당신에게 사랑은 때로, 세상이라는 전쟁터에서 등을 맡길 수 있는 가장 든든한 아군을 얻는 것과 같습니다.',
-    best_partner: '**왜 잘 맞는가?** 두 사람 모두 \'강한 우리\'를 지향한다는 공통점이 있습니다. 당신이 개인과 가정의 경제적 부를 추구할 때, 그는 국가와 공동체라는 더 큰 가치와 명예를 더하여 관계를 더욱 풍요롭게 만들어 줄 것입니다. 성공에 대한 열망을 함께 불태울 수 있는 파워 커플입니다.',
-    worst_partner: '**왜 갈등하는가?** 당신이 \'세금 감면\'과 \'개인의 성공\'을 이야기할 때, 그는 \'증세\'와 \'공동체의 분배\'를 외칩니다. 예를 들어, 자녀 교육 문제를 두고 당신은 최고의 교육을 위한 \'사교육\'을 주장하지만, 그는 모두를 위한 \'공교육 정상화\'가 먼저라고 말하며 근본적인 철학에서 부딪힐 것입니다.',
-    communication_barrier: '혹시 보편적 복지나 분배를 강조하는 사람과 대화할 때, "왜 노력한 사람을 역차별하고, 개인의 성공을 죄악시할까?" 라며 말이 통하지 않는다고 느껴본 적 없으신가요? 이는 당신이 \'성공\'의 동력을 **\'개인의 자유로운 경쟁\'**에서 찾는 반면, 그는 **\'공정한 기회 분배\'**에서 찾기 때문입니다. 당신은 \'효율성\'을 말하지만, 그는 \'평등\'을 이야기하는 셈입니다.',
-    career_value: '당신의 **자유지상주의(I, A)와 보수주의(T)**는, 국가의 개입이 적고 개인의 능력을 마음껏 펼칠 수 있는 성과주의 기반의 조직을 선호하게 만듭니다. 금융, 컨설팅, 법률 등 치열한 경쟁을 통해 높은 보상을 얻을 수 있는 분야에서 두각을 나타낼 가능성이 높습니다.',
-    financial_style: '**강력한 국가(S)**를 지지하는 당신의 성향은, 국가의 기간산업(반도체, 방산 등)이나 대표적인 대기업에 투자하여 \'국가의 성장\'과 \'개인의 부\'를 동시에 추구하려는 경향으로 나타날 수 있습니다. 세금(정부 개입)을 최소화하는 절세 전략에 매우 관심이 많습니다.',
-    historical_avatar: '\'철의 여인\'으로 불렸던 대처는 강력한 국가 안보를 바탕으로, 비효율적인 국영 기업을 과감히 민영화하고 규제를 철폐하여 영국 경제의 체질을 완전히 바꾸었습니다. "사회 같은 것은 없다. 오직 개인과 가족만 있을 뿐이다"라는 그의 말처럼, 전통적 가치를 옹호하면서도 경제적으로는 급진적인 개인의 자유를 추구했던 그녀의 모습에서 당신의 성향을 발견할 수 있습니다.',
-    real_avatar: '이들은 정부의 역할을 국방과 치안으로 한정하고, 경제는 시장의 원리에 맡겨야 국가가 부강해진다고 주장하는 사람들입니다. 이들의 목소리는 때로는 논쟁을 일으키지만, 건강한 시장 경제를 위한 필수적인 담론을 형성하는 역할을 합니다.',
-    growth_direction: '당신의 명확한 경제 철학과 원칙은 복잡한 세상을 이해하는 강력한 틀을 제공합니다. 하지만 그 틀이 너무 견고한 나머지, 데이터로 설명되지 않는 \'인간적인 가치\'나 \'사회적 연대\'의 중요성을 간과할 수 있습니다. 당신의 성장은, 효율적인 시스템만큼이나 그 시스템 안에서 살아가는 사람들의 마음에 공감하는 법을 배우는 과정에 있습니다.',
-    growth_task: '\'효율성\' 너머의 \'공감\' 배우기',
-    recommended_books: [
-      {title: '정의란 무엇인가', author: '마이클 샌델'},
-      {title: '돈의 심리학', author: '모건 하우절'}
-    ],
-    recommended_content: '**📚 추천 도서:** **『정의란 무엇인가』 (마이클 샌델):** <a href="https://link.coupang.com/a/c4naqO" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**📚 추천 도서:** **『돈의 심리학』 (모건 하우절):** <a href="https://link.coupang.com/a/c4na2F" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:** 유튜브에서 **\'사회적 기업가\'**들의 창업 스토리를 담은 다큐멘터리를 시청해보세요. \'돈 버는 것\' 이상의 가치를 추구하는 사람들의 이야기를 통해, 당신이 놓치고 있던 새로운 관점을 발견할 수 있습니다.\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*',
-    final_goal: '당신 성장의 최종 목표는, 단순히 부강한 국가를 만드는 \'냉철한 전략가\'를 넘어, 그 안에서 살아가는 **소외된 이웃의 삶까지 돌아볼 줄 아는 \'따뜻한 리더\'**가 되는 것입니다.'
-  },
-
-  ITUE: {
-    name: '원칙주의적 보수주의자',
-    category: 'political',
-    scores: {
-      '개인주의': 70,
-      '전통주의': 80,
-      '보편적 평등': 75,
-      '협력 우선': 80
-    },
-    description: '당신은 친구들과의 약속에서도 "N분의 1"을 선호하는 타입일 가능성이 높습니다. 모두가 동의할 수 있는 합리적인 규칙을 만드는 것을 중요하게 여기며, 논리 정연한 근거와 품격 있는 태도로 상대방을 설득하는 것을 선호합니다. 결국 당신을 움직이는 핵심 동력은 "흔들리지 않는 원칙을 통해 예측 가능하고 공정한 사회를 만들려는 소망"입니다.',
-    keywords: ['젠틀맨', '합리적보수', '원칙', '신뢰', '외교관'],
-    summary: '전통과 안정을 중시하는 \'보수(우파)\' 이념을 기본 바탕으로 하되, 시대의 변화를 인정하고 **일부 진보적인 가치를 수용하는 유연한 태도**를 의미합니다. 극단적인 대립보다는 실용적인 합의를 통해 공동체의 점진적인 발전을 추구합니다.',
-    political_spectrum: '중도 보수 성향',
-    political_spectrum_detail: '당신의 정치적 성향은 \'보수(우파)\' 이념을 기반으로 하되, 극단적인 국가주의를 경계하고 국제적 협력과 합리성을 중시하는 \'중도 보수\' 스펙트럼에 위치합니다. 원칙 없는 실리나 대화 없는 힘을 경계하며, 품격 있는 보수의 가치를 지향합니다.',
-    detailed_description: '당신은 친구들과의 약속에서도 \'N분의 1\'을 선호하는 타입일 가능성이 높습니다. 감정이나 관계에 따라 원칙이 흔들리는 것을 불공정하다고 생각하며, 모두가 동의할 수 있는 합리적인 규칙을 만드는 것을 중요하게 여깁니다. 당신은 목소리를 높여 싸우기보다, 논리 정연한 근거와 품격 있는 태도로 상대방을 설득하는 것을 선호합니다. 당신의 원칙주의적인 모습이 때로는 \'융통성 없다\'는 말을 들을 수 있지만, 사람들은 결국 당신의 일관성과 합리성 때문에 중요한 결정을 앞두고 당신을 찾게 됩니다.\n\n**결국 당신을 움직이는 핵심 동력은 \'흔들리지 않는 원칙을 통해 예측 가능하고 공정한 사회를 만들려는 소망\'입니다. 당신은 감정적인 선동이나 이기적인 실리 추구가 아닌, 모두가 동의하는 합리적 원칙만이 공동체를 지킬 수 있다고 믿는 사람입니다.**',
-    strengths: [
-      '높은 신뢰도: 일관된 원칙과 품격 있는 태도로 주변 사람들로부터 깊은 신뢰를 얻습니다.',
-      '합리적인 판단력: 감정이나 진영 논리에 휩쓸리지 않고, 합리적인 원칙에 따라 사안을 판단합니다.',
-      '외교적 능력: 자신의 원칙을 지키면서도, 상대방을 존중하고 대화를 통해 문제를 해결하는 능력이 뛰어납니다.',
-      '장기적인 안목: 단기적인 이익보다, 장기적으로 공동체의 안정과 발전에 기여하는 결정을 내리려 합니다.',
-      '견고한 가치관: 외부의 압력에도 쉽게 흔들리지 않는, 잘 정립된 자신만의 가치관을 가지고 있습니다.'
-    ],
-    weaknesses: [
-      '지나친 신중함: 변화의 필요성을 인지하면서도, 기존의 원칙과 질서가 흔들릴 것을 우려하여 행동을 주저할 수 있습니다.',
-      '엘리트주의적 시각: 품격과 원칙을 너무 강조한 나머지, 대중의 솔직한 감정이나 욕구를 이해하지 못하고 거리감을 둘 수 있습니다.',
-      '유연성 부족: 한번 세운 원칙은 좀처럼 바꾸려 하지 않아, 급변하는 상황에 대처하는 능력이 부족할 수 있습니다.',
-      '과도한 명분 중시: 실리보다는 명분과 원칙을 우선시하여, 때로는 현실적으로 더 나은 선택을 놓칠 수 있습니다.',
-      '위선적으로 보일 위험: 그의 높은 이상과 원칙이, 실제 행동과 일치하지 않을 때 주변으로부터 \'위선적\'이라는 비판을 받을 수 있습니다.'
-    ],
-    speech_style: '당신은 아무리 화가 나는 상황에서도, 언성을 높이거나 비속어를 사용하는 것을 스스로 용납하지 않습니다. 당신에게 \'대화의 방식\'은 내용만큼이나 중요하며, 정해진 규칙과 예의를 지키는 품격 있는 토론을 선호합니다. 이러한 태도는 **\'감정적인 싸움에 대한 스트레스\'**를 느끼는 사람들에게 안정감을 줍니다. 하지만 때로는 너무 형식적이어서 속마음을 알 수 없다는 인상을 주기도 합니다.',
-    stress_moment: '정해진 원칙을 무시하고 "이번 한 번만 예외로 하자"거나 "편법이지만 이게 더 빠르다"고 말하는 사람을 보면 극심한 스트레스를 받습니다. 당신에게 원칙을 무너뜨리는 것은, 둑에 작은 구멍을 내는 것과 같은 위험한 행동이기 때문입니다. 당신은 어떤 상황에서도 원칙을 지키려는 파트너에게 가장 큰 신뢰를 느낍니다.',
-    solution: '상대방을 "원칙도 없는 사람"이라고 비난하는 대신, "지금 이 예외를 허용하면, 앞으로 비슷한 모든 경우에 원칙이 무너져 더 큰 혼란이 생길 수 있습니다. 더 큰 문제를 막기 위해 지금의 원칙을 지키는 것이 왜 중요한지" 차분하게 설명해주세요. 이는 당신이 \'고집\'을 부리는 게 아니라, \'모두\'를 위해 멀리 보고 있음을 알려주는 방법입니다.',
-    love_value: '당신은 연인에게 열정적인 사랑고백보다, 약속 시간을 정확히 지키는 모습에서 더 큰 사랑을 느낍니다. 관계에서도 지켜야 할 \'원칙(U)\'과 \'예의(T)\'가 있다고 믿으며, 예측 가능하고 안정적인 관계를 선호합니다. 갈등이 생겨도 감정적으로 싸우기보다, 이성적인 대화(E)를 통해 품격 있게 해결하려 합니다. 당신에게 사랑은 감정의 혼돈이 아닌, 신뢰라는 질서 위에 세워진 평온한 건축물과 같습니다.',
-    best_partner: '**왜 잘 맞는가?** 두 사람 모두 개인의 독립성(I)과 합리적인 원칙(U)을 존중하기에, 서로에게 불필요한 간섭 없이 안정적인 신뢰 관계를 쌓을 수 있습니다. 그는 당신의 원칙을 \'답답함\'이 아닌 \'신뢰의 근거\'로 이해해 줄 수 있는 사람입니다.',
-    worst_partner: '**왜 갈등하는가?** 그가 \'대의\'를 위해 원칙을 무시하고 희생을 강요할 때, 당신은 \'보편적 원칙\'을 훼손하는 위험한 행동이라며 그의 앞을 막아설 것입니다. 예를 들어, 그가 "좋은 일을 위해서니, 데이트 약속을 취소하고 집회에 가자"고 말할 때, 당신은 \'개인 간의 약속\'이라는 원칙을 깬 것에 더 큰 실망을 느낄 것입니다.',
-    communication_barrier: '혹시 대의명분을 위해 행동을 강조하는 활동가와 대화할 때, "목적이 아무리 좋아도, 절차와 원칙을 무시하면 안 되지" 라며 답답함을 느껴본 적 없으신가요? 이는 당신이 **\'과정의 정당성\'**을 매우 중요한 가치로 여기는 반면, 그는 **\'결과의 정의로움\'**을 더 우선시하기 때문입니다. 당신은 \'어떻게\'에 집중하지만, 그는 \'무엇을 위해\'에 더 집중하는 것입니다',
-    career_value: '당신의 **원칙주의(U)와 보수성(T)**은 명확한 규율과 체계가 잡힌 조직에서 가장 큰 안정감을 느끼게 합니다. 당신은 즉흥적인 아이디어보다, 잘 짜인 계획과 프로세스에 따라 업무를 처리하는 것을 선호하며, \'신뢰\'를 가장 중요한 직업적 가치로 여깁니다.',
-    financial_style: '당신의 국제주의(E) 성향은 국내 자산을 넘어, 전 세계의 검증된 우량 자산에 분산 투자하는 글로벌 포트폴리오를 선호하게 만듭니다. 다만, 투자를 할 때는 반드시 법과 원칙(U)을 준수하며, \'내부자 정보\'나 \'작전주\' 같은 비윤리적인 방식은 극도로 경계하는 모습을 보입니다.',
-    historical_avatar: '그는 자유 시장과 작은 정부라는 확고한 보수적 원칙을 가지고 있었지만, 동시에 \'힘을 통한 평화\'를 추구하며 소련과의 대화와 협력을 통해 냉전을 종식시킨 품격 있는 외교가였습니다. 자신의 신념을 굳건히 지키면서도, 국제 사회와의 실용적인 외교를 놓치지 않았던 그의 모습은 당신의 성향과 닮아있습니다.',
-    real_avatar: '이들은 당장의 이익이나 여론에 흔들리지 않고, 보수주의의 본질적인 가치와 원칙을 지켜야 한다고 쓴소리를 하는 사람들입니다. 이들의 목소리는 보수 진영이 길을 잃지 않도록 방향을 제시하는 등대와 같은 역할을 합니다.',
-    growth_direction: '당신의 일관된 원칙과 품격은 주변에 깊은 신뢰감을 줍니다. 하지만 때로는 원칙을 지키는 것에 너무 몰두한 나머지, 그 원칙이 만들어진 \'진짜 목적\'을 잊어버릴 수 있습니다. 당신의 성장은, 원칙 그 자체를 넘어, 그 원칙이 궁극적으로 \'누구를 위한 것인지\'를 성찰하며 유연성을 배우는 과정에 있습니다.',
-    growth_task: '\'사람\'을 위한 유연성 기르기',
-    recommended_books: [
-      {title: '성공하는 사람들의 7가지 습관', author: '스티븐 코비'},
-      {title: '안티프래질', author: '나심 니콜라스 탈레브'}
-    ],
-    recommended_content: '**📚 추천 도서:** **『성공하는 사람들의 7가지 습관』 (스티븐 코비):** <a href="https://link.coupang.com/a/c4nbn4" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**📚 추천 도서:** **『안티프래질』 (나심 니콜라스 탈레브):** <a href="https://link.coupang.com/a/c4nbQX" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:** 역사 속에서 위대한 리더들이 **\'원칙을 깨고 예외를 허용하여\'** 더 큰 성공을 이룬 사례(예: 링컨의 노예 해방 선언)를 다룬 역사 다큐멘터리를 찾아보세요.\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*',
-    final_goal: '당신 성장의 최종 목표는, 단순히 규칙을 수호하는 \'엄격한 심판\'을 넘어, 때로는 규칙보다 **사람을 우선할 줄 아는 \'성숙한 리더\'**가 되는 것입니다.'
-  },
-
-  ITUS: {
-    name: '고립주의적 자유주의자',
-    category: 'political',
-    scores: {
-      '개인주의': 80,
-      '전통주의': 85,
-      '보편적 평등': 65,
-      '안보 우선': 90
-    },
-    description: '당신에게 "요즘 트렌드"나 "국제 사회의 평가"는 큰 의미가 없습니다. 당신 안에는 시대를 초월하는 자신만의 굳건한 법과 원칙이 있기 때문입니다. 당신은 우리 국민의 삶과 안보를 지키는 데 모든 역량을 집중해야 한다고 믿습니다. 결국 당신을 움직이는 핵심 동력은 "외부의 혼란스러운 영향으로부터 나의 삶과 공동체를 지켜내려는 강력한 방어 의지"입니다.',
-    keywords: ['바위처럼', '나만의법칙', '절대고독', '국내문제집중', '간섭거부'],
-    summary: '일반적으로, 급진적인 변화가 가져올 혼란을 경계하고, 오랜 시간 검증된 **\'전통\'과 \'질서\'**를 통해 사회를 안정적으로 유지하는 것을 중요하게 생각하는 경향을 의미합니다.',
-    political_spectrum: '보수 (우파) 성향',
-    political_spectrum_detail: '당신의 정치적 성향은 \'보수(우파)\' 이념 스펙트럼, 그중에서도 국제적 개입을 최소화하고 국내 문제에 집중하며, 개인의 자유를 최대한 보장해야 한다는 색채가 강하게 나타납니다. 이는 국가의 역할을 \'국방\'과 \'치안\'으로 한정하는 고전적인 자유주의의 이상과 맞닿아 있습니다.',
-    detailed_description: '당신에게 \'요즘 트렌드\'나 \'국제 사회의 평가\'는 큰 의미가 없습니다. 당신 안에는 시대를 초월하는 자신만의 굳건한 법과 원칙이 있기 때문입니다. 당신은 국가가 외교 문제에 과도하게 개입하여 국력을 낭비하기보다, 우리 국민의 삶과 안보를 지키는 데 모든 역량을 집중해야 한다고 믿습니다. "우리 일이나 잘하자"는 생각이 당신의 핵심 철학일 수 있습니다. 이는 때로 국수주의적이거나 배타적으로 비칠 수 있지만, 가장 확실하게 \'내 것\'을 지키는 방법이라고 당신은 생각합니다.\n\n**결국 당신을 움직이는 핵심 동력은 \'외부의 혼란스러운 영향으로부터 나의 삶과 공동체를 지켜내려는 강력한 방어 의지\'입니다. 당신은 불확실한 국제 관계에 기대기보다, 우리 스스로의 힘과 원칙을 믿어야 한다고 생각하는 현실주의자입니다.**',
-    strengths: [
-      '불굴의 독립성: 그 어떤 집단이나 외부 세력에도 의존하지 않고, 오직 자신만의 힘과 원칙을 믿는 강인한 정신력을 가졌습니다.',
-      '일관된 원칙: 상황의 유불리에 따라 입장을 바꾸지 않고, 처음 세운 원칙을 끝까지 고수하여 예측 가능성과 신뢰를 줍니다.',
-      '현실주의적 시각: 국제 사회의 이상적인 구호나 명분을 믿지 않고, 오직 힘의 논리와 국익의 관점에서 현실을 냉정하게 판단합니다.',
-      '높은 집중력: 외부의 소음에 신경 쓰지 않고, 자신이 중요하다고 생각하는 국내 문제에 모든 에너지를 집중할 수 있습니다.',
-      '강한 주인의식: \'내 삶, 내 공동체는 내가 지킨다\'는 강한 주인의식을 가지고 있습니다.'
-    ],
-    weaknesses: [
-      '배타성: 외부 문화나 다른 가치관에 대해 폐쇄적이고 배타적인 태도를 보여, 고립을 자초할 수 있습니다.',
-      '변화에 대한 저항: 자신이 믿는 전통과 원칙을 지키려는 마음이 너무 강해, 시대의 변화를 거부하는 완고한 모습을 보일 수 있습니다.',
-      '협력 능력 부족: 타협이나 협력을 \'굴복\'이나 \'손해\'로 인식하여, 국제 사회나 다른 집단과의 협력에 어려움을 겪습니다.',
-      '시야의 협소함: 국내 문제에만 너무 집중한 나머지, 글로벌 시대에 더 큰 기회를 놓치거나 외부의 위협을 간과할 수 있습니다.',
-      '고립으로 인한 쇠퇴: 외부와의 교류를 거부하는 태도가, 장기적으로는 공동체를 발전이 아닌 쇠퇴의 길로 이끌 수 있습니다.'
-    ],
-    speech_style: '당신은 대화할 때 "그래서, 그게 우리랑 무슨 상관인데?"라는 본질적인 질문을 자주 던집니다. 당신은 다른 사람의 문제나 국제적인 이슈보다, 지금 당장 나의 삶과 우리 공동체에 직접적인 영향을 미치는 문제에 집중하는 것을 선호합니다. 이러한 화법은 **\'뜬구름 잡는 이야기에 대한 스트레스\'**를 느끼는 사람들에게 현실 감각을 일깨워줍니다. 하지만 때로는 시야가 좁거나 이기적이라는 오해를 살 수 있습니다.',
-    stress_moment: '우리의 고유한 상황을 고려하지 않고, "요즘 세상이 어떤데", "세계적인 기준은 이렇다"와 같이 외부의 잣대를 들이대는 말에 가장 큰 스트레스를 받습니다. 당신에게 그것은 우리의 주체성을 무시하는 지적인 사대주의처럼 느껴집니다. 당신은 외부의 기준보다 우리만의 원칙을 존중하는 파트너를 신뢰합니다.',
-    solution: '상대방의 주장을 "우리 일이 아니다"라고 잘라버리는 대신, "좋습니다. 그 글로벌 스탠다드를 받아들였을 때, 장기적으로 우리에게 돌아올 실질적인 이득과 손해는 구체적으로 무엇일까요?" 라고 질문을 바꿔보세요. 이는 당신이 무조건적인 고립주의자가 아닌, 국익을 먼저 생각하는 현실주의자임을 보여주는 방법입니다',
-    love_value: '당신은 한번 마음을 주면 절대 변하지 않는 바위 같은 사랑을 합니다. 하지만 동시에 연인이 당신의 개인적인 영역이나 신념(I, T, U, S)을 침범하는 것을 극도로 경계합니다. 당신에게 이상적인 사랑은 매일 연락하며 모든 것을 공유하는 것이 아니라, 각자의 삶을 완벽히 존중하며 멀리서 묵묵히 응원하고 지지해주는 견고한 믿음의 관계입니다. 당신은 사랑이라는 이름으로 서로를 바꾸려 하는 것을 가장 싫어합니다.',
-    best_partner: '**왜 잘 맞는가?** 당신의 굳건한 신념과 원칙을 존경해주며, 공동체에 대한 비슷한 가치관을 공유하여 매우 안정적인 관계를 맺을 수 있습니다. 그는 당신의 \'독립성\'을 존중해주면서도, 당신이 외로울 때 든든한 \'우리 편\'이 되어줄 수 있는 사람입니다.',
-    worst_partner: '**왜 갈등하는가?** 당신이 \'절대 변하지 않는 것\'이라 믿는 모든 가치를, IPAE는 \'반드시 변해야 할 것\'으로 여기기 때문에 연인 관계로는 최악의 상성을 보입니다. 예를 들어, 해외여행 계획을 짤 때 당신은 \'안전한 휴양\'을 원하지만, 그는 \'새로운 문화를 체험하는 모험\'을 원하며 사사건건 부딪힐 것입니다.',
-    communication_barrier: '혹시 국제 사회와의 협력이나 개입을 강조하는 사람과 대화할 때, "뜬구름 잡는 소리 말고, 그래서 그게 우리한테 무슨 이득인데?" 라며 말이 통하지 않는다고 느껴본 적 없으신가요? 이는 당신이 **\'우리나라의 실질적인 이익과 안보\'**를 최우선으로 생각하는 반면, 그는 **\'인류의 보편적인 가치와 책임\'**을 더 중요하게 생각하기 때문입니다. 당신은 \'내 집\' 걱정을 하고 있는데, 그는 \'이웃집\' 걱정을 하고 있는 셈입니다.',
-    career_value: '당신의 **강한 독립성(I)**과 **원칙주의(U)**는, 다른 사람의 간섭 없이 혼자서 깊이 파고들 수 있는 전문적인 직업을 선호하게 만듭니다. 조직 생활을 하더라도, 팀워크보다는 개인의 역량이 명확하게 드러나는 업무에서 더 큰 성취감을 느낍니다.',
-    financial_style: '**고립주의(E-neg)와 안보(S)**를 중시하는 당신의 성향은, 해외 투자나 복잡한 금융 상품보다는 **\'대한민국 원화\'나 \'국내 우량주\', \'서울의 부동산\'**과 같이, 내가 직접 보고 관리할 수 있는 가장 확실하고 안전한 자산을 선호하는 경향으로 나타날 수 있습니다.',
-    historical_avatar: '로마 공화정 말기의 정치가였던 소(小)카토는, 부패와 타협을 거부하고 공화정의 전통과 원칙을 지키기 위해 평생을 바친 것으로 유명합니다. 그는 외부의 위협과 내부의 부패에 맞서, 흔들리지 않는 원칙과 신념으로 로마의 정신을 지키려 했던 고독한 수호자였습니다. 이는 당신의 불굴의 원칙주의를 상징합니다.',
-    real_avatar: '이들은 국제적 개입이나 과도한 해외 원조를 비판하며, 그 비용과 노력으로 자국의 서민 경제와 안보를 먼저 챙겨야 한다고 주장하는 사람들입니다. 이들의 주장은 때로 배타적으로 보일 수 있지만, \'우리 문제부터 해결하자\'는 강력한 현실주의에 기반하고 있습니다.',
-    growth_direction: '당신의 강력한 독립성과 원칙은 외부의 혼란에 흔들리지 않는 굳건함을 줍니다. 하지만 세상은 서로 연결되어 있으며, 때로는 내가 쌓은 벽이 나를 지키는 요새가 아닌, 나를 가두는 감옥이 될 수도 있습니다. 당신의 성장은, 외부 세계를 무조건적인 \'위협\'으로만 간주하는 태도에서 벗어나, \'새로운 기회\'가 될 수 있다는 가능성을 탐색하는 과정에 있습니다.',
-    growth_task: '\'건강한 연결\' 경험하기',
-    recommended_books: [
-      {title: '사피엔스', author: '유발 하라리'},
-      {title: '지리의 힘', author: '팀 마샬'}
-    ],
-    recommended_content: '**📚 추천 도서:** **『사피엔스』 (유발 하라리):** <a href="https://link.coupang.com/a/c4nv6c" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**📚 추천 도서:** **『지리의 힘』 (팀 마샬):** <a href="https://link.coupang.com/a/c4nmiu" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:** 유튜브에서 **\'성공적인 글로벌 파트너십\'** 사례에 대한 다큐멘터리나, 서로 다른 문화권의 사람들이 만나 교류하는 여행 콘텐츠를 시청해보세요. 당신이 몰랐던 \'연결\'의 긍정적인 측면을 발견할 수 있습니다.\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*',
-    final_goal: '당신 성장의 최종 목표는, 고독한 요새를 지키는 \'파수꾼\'을 넘어, 외부 세계와 **\'필요한 만큼 현명하게 교류\'**할 줄 아는 **\'강력한 독립 국가의 지도자\'**와 같은 지혜를 갖추는 것입니다.'
-  },
-
-  CPAE: {
-    name: '진보적 공동체주의자',
-    category: 'political',
-    scores: {
-      '공동체주의': 85,
-      '진보주의': 80,
-      '적극적 평등': 85,
-      '협력 우선': 80
-    },
-    description: '당신은 불의를 보면 개인적으로 분노하기보다, "이건 우리 모두의 문제야!"라며 사람들을 모으고 행동에 나서는 사람입니다. 당신은 "나 혼자 잘 사는 것"보다 "우리 모두가 함께 잘 사는 것"에 훨씬 더 큰 가치를 둡니다. 결국 당신을 움직이는 핵심 동력은 "더 정의롭고 평등한 공동체를 만들어야 한다는 강한 사명감"입니다.',
-    keywords: ['리더십', '대의명분', '뜨거운심장', '함께', '사회혁신'],
-    summary: '일반적으로, 현재 사회의 불평등이나 문제점을 인정하고, **\'변화\'와 \'개혁\'**을 통해 더 평등하고 자유로운 사회를 만들려는 경향을 의미합니다. 개인의 자유만큼이나 사회적 약자를 보호하기 위한 공동체의 역할과 연대를 중요하게 생각합니다.',
-    political_spectrum: '진보 (좌파) 성향',
-    political_spectrum_detail: '당신의 정치적 성향은 의심의 여지 없이 현대적인 의미의 \'진보(좌파)\' 이념 스펙트럼에 속합니다. 개인의 자유보다 공동체의 연대를 통해 사회 문제를 해결하려 하며, 불평등 해소를 위해 국가의 적극적인 역할을 강조하는 경향이 있습니다.',
-    detailed_description: '당신은 불의를 보면 개인적으로 분노하기보다, "이건 우리 모두의 문제야!"라며 사람들을 모으고 행동에 나서는 사람입니다. 당신은 \'나 혼자 잘 사는 것\'보다 \'우리 모두가 함께 잘 사는 것\'에 훨씬 더 큰 가치를 둡니다. 때로는 \'대의\'를 위해 개인의 이익이 일부 양보되어야 한다고 믿으며, 강력한 카리스마와 추진력으로 주변 사람들을 이끄는 힘이 있습니다. 당신의 헌신적인 모습은 많은 사람들에게 영감을 주지만, 때로는 목표에 너무 몰두한 나머지 반대 의견을 가진 개인을 소외시킬 수 있다는 점은 경계해야 합니다.\n\n**결국 당신을 움직이는 핵심 동력은 \'더 정의롭고 평등한 공동체를 만들어야 한다는 강한 사명감\'입니다. 당신은 세상의 부조리가 개인의 노력 부족이 아닌 사회 구조의 문제라고 믿으며, 그 구조를 바꾸기 위해 기꺼이 자신을 던지는 사람입니다.**',
-    strengths: [
-      '강력한 포용력과 연대 의식: \'우리\'라는 의식이 강하며, 소외된 이웃을 돕고 함께 더 나은 공동체를 만들려는 마음이 따뜻합니다.',
-      '뜨거운 열정과 헌신: 자신이 옳다고 믿는 대의를 위해서라면, 기꺼이 자신을 희생하고 헌신하는 뜨거운 열정을 가지고 있습니다.',
-      '사람을 움직이는 힘: 그의 진정성 있는 모습은 주변 사람들에게 깊은 영감을 주며, 사회적 행동에 함께 참여하도록 이끄는 힘이 있습니다.',
-      '구조적 문제 인식: 개인의 불행을 개인의 탓으로 돌리지 않고, 그 이면에 있는 사회 구조적인 문제를 꿰뚫어 보는 통찰력이 있습니다.',
-      '긍정적인 사회 변화 추구: 더 평등하고 정의로운 사회를 만들 수 있다는 희망을 가지고, 끊임없이 행동합니다.'
-    ],
-    weaknesses: [
-      '개인의 자유 경시: \'공동체\'를 너무 강조한 나머지, 공동체의 목표와 다른 생각을 가진 개인의 자유나 의견을 억압할 수 있습니다.',
-      '비효율성: 모두의 의견을 듣고 함께하려는 과정이, 때로는 비효율적이거나 더딘 의사결정으로 이어질 수 있습니다.',
-      '감정적인 판단: 이성적인 분석보다, \'안타까움\'이나 \'분노\'와 같은 감정이 앞서 정책적 판단을 내릴 위험이 있습니다.',
-      '이상주의적 목표 설정: 현실적인 제약을 고려하지 않은 채, 너무 높고 이상적인 목표를 설정하여 구성원들을 지치게 만들 수 있습니다.',
-      '반대파에 대한 적대감: 자신과 다른 생각을 가진 사람들을 \'개인의 이익만 좇는 이기주의자\'로 규정하고, 과도하게 적대적인 태도를 보일 수 있습니다.'
-    ],
-    speech_style: '당신은 대화할 때 특정 사람의 의견만 돋보이는 것을 경계하고, "혹시 다른 의견 있는 분 없으신가요?"라며 모두의 목소리를 들으려 노력합니다. 당신의 포용적인 화법은 공동체의 화합을 이끌어내지만, 때로는 논의가 길어지고 핵심이 흐려진다는 단점이 있습니다. 이러한 태도는 **\'소외되는 것에 대한 스트레스\'**를 느끼는 사람들에게 큰 안정감을 주지만, 빠른 결정을 원하는 사람에게는 답답하게 느껴질 수 있습니다.',
-    stress_moment: '공동체의 문제 앞에서 "나 하나 빠진다고 뭐 달라지겠어?"라며 무관심하거나 냉소적인 태도를 보이는 사람을 보면 가장 큰 스트레스를 받습니다. 당신에게 그것은 공동체를 무너뜨리는 이기적인 바이러스와 같기 때문입니다. 당신은 공동의 문제에 함께 책임감을 느끼는 파트너에게 가장 큰 유대감을 느낍니다.',
-    solution: '상대방을 "이기적인 사람"이라고 비난하는 대신, "당신 한 명의 힘은 작을지 몰라도, 당신과 같은 생각을 가진 100명이 모이면 세상을 바꿀 수 있습니다. 그 위대한 변화의 첫걸음이 되어주시겠어요?" 와 같이 그의 참여가 가진 상징적인 의미를 부여하고 동기를 자극해 보세요',
-    love_value: '당신은 연인과 단둘이 보내는 시간도 좋지만, 함께 사회를 위한 좋은 일을 할 때 더 큰 사랑을 느낍니다. 당신에게 사랑은 \'우리\'라는 공동체(C)를 넘어, 더 큰 세상을 향한 공동의 사명(P, A, E)을 함께 실천해나가는 동지애에 가깝습니다. 당신은 연인이 자신의 개인적인 성공뿐만 아니라, 사회 전체에 기여하려는 열망을 가진 사람이기를 바랍니다.',
-    best_partner: '**왜 잘 맞는가?** 당신의 뜨거운 열정과 그의 급진적인 에너지가 만나면, 세상을 바꾸는 가장 강력한 커플이 될 수 있습니다. 당신이 \'왜\' 해야 하는지에 대한 명분을 제시하면, 그는 \'어떻게\' 할 것인지에 대한 가장 과감한 실행 계획을 세워줄 것입니다.',
-    worst_partner: '**왜 갈등하는가?** 당신이 \'함께 세상으로 나아가자\'고 말할 때, 그는 \'혼자만의 요새를 지키겠다\'고 답합니다. 예를 들어, 당신이 "우리 수입의 일부는 기부하자"고 제안하면, 그는 "왜 우리가 남을 위해 희생해야 하지?"라며 근본적인 가치관의 차이를 보일 것입니다.',
-    communication_barrier: '혹시 개인의 자유나 권리를 우선시하는 사람과 대화할 때, "왜 저 사람은 저렇게 자기밖에 모를까? 우리 모두의 문제인데" 라며 답답함을 느껴본 적 없으신가요? 이는 당신이 문제의 해답을 **\'공동체의 연대와 헌신\'**에서 찾는 반면, 그는 **\'개인의 자율과 책임\'**에서 찾기 때문입니다. 당신은 \'함께\' 잘 살자고 말하지만, 그는 \'각자\' 잘 살자고 말하는 셈입니다.',
-    career_value: '당신의 **공동체주의(C)와 진보성(P, A)**은, 개인의 이익만을 추구하는 회사를 견디기 힘들게 합니다. 당신은 비영리단체(NPO), 사회적 기업, 공공기관, 교육계 등 사회 전체에 긍정적인 영향을 미치고, 동료들과 \'함께\'라는 가치를 실현할 수 있는 곳에서 일할 때 가장 큰 보람을 느낍니다.',
-    financial_style: '당신은 돈을 버는 것만큼이나 **\'어떻게 쓰는가\'**를 중요하게 생각합니다. 당신의 소비는 개인의 만족을 넘어, 사회적 약자를 돕거나(기부), 환경을 보호하거나(친환경 제품 구매), 지역 공동체를 살리는(로컬 매장 이용) \'정치적 행위\'가 될 수 있습니다. 이는 당신의 **연대 의식(C, E)**을 표현하는 방식입니다.',
-    historical_avatar: '27년간의 수감 생활에도 불구하고, 그는 개인적인 복수 대신 용서와 화합을 선택했습니다. 인종차별이라는 거대한 불의에 맞서, 흑인과 백인이 함께하는 \'무지개 국가\'라는 공동체의 비전을 제시하며 평생을 바친 그의 삶은, 당신이 추구하는 연대와 헌신의 가치를 보여줍니다.',
-    real_avatar: '이들은 사회적 약자의 목소리를 대변하며, 불평등한 사회 구조를 바꾸기 위해 시민들의 자발적인 참여를 조직하는 사람들입니다. 이들의 헌신은 당장 큰 변화를 만들지 못할 수도 있지만, 우리 사회를 더 나은 방향으로 이끄는 소중한 밑거름이 됩니다.',
-    growth_direction: '\'우리\'라는 공동체를 향한 당신의 뜨거운 헌신은 세상을 더 따뜻하게 만드는 소중한 가치입니다. 하지만 \'우리\'를 너무 강조한 나머지, 그 안에 속하지 않은 개인이나 반대 의견을 가진 사람들을 \'적\'으로 규정할 위험이 있습니다. 당신의 성장은, 당신의 따뜻한 연대의 범위를 \'나와 같은 생각을 하는 우리\'를 넘어, \'나와 다른 생각을 하는 그들\'에게까지 넓히는 과정에 있습니다.',
-    growth_task: '\'반대편\'의 목소리 듣기',
-    recommended_books: [
-      {title: '바른 마음', author: '조너선 하이트'},
-      {title: '설득의 심리학', author: '로버트 치알디니'}
-    ],
-    recommended_content: '**📚 추천 도서:** **『바른 마음』 (조너선 하이트):** <a href="https://link.coupang.com/a/c4ndre" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**📚 추천 도서:** **『설득의 심리학』 (로버트 치알디니):** <a href="https://link.coupang.com/a/c4neEQ" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:** 당신이 가장 비판적으로 생각하는 **보수 논객의 토론 영상** 중, 가장 논리적이라고 생각되는 영상을 하나 찾아 \'그 사람이 왜 저렇게 생각할까?\'를 이해하려는 목적으로 시청해보세요.\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*',
-    final_goal: '당신 성장의 최종 목표는, 단순히 \'우리 편\'을 이끄는 리더를 넘어, 나와 다른 생각을 가진 사람까지 포용하여 **\'더 큰 우리\'를 만들어내는 \'진정한 통합의 리더\'**가 되는 것입니다.'
-  },
-
-  CPAS: {
-    name: '개혁적 국가주의자',
-    category: 'political',
-    scores: {
-      '공동체주의': 80,
-      '진보주의': 75,
-      '적극적 평등': 80,
-      '안보 우선': 85
-    },
-    description: '당신은 회의 시간에 아이디어만 내고 실행하지 않는 사람들을 답답해하는 편입니다. "말만 하지 말고, 일단 해보자!"라며 먼저 소매를 걷어붙이는 타입이죠. "우리 팀", "우리 공동체"의 성공을 위해 때로는 반대 의견을 묵살하고서라도 강력하게 목표를 향해 나아갑니다. 결국 당신을 움직이는 핵심 동력은 "내가 속한 공동체를 누구보다 위대하게 만들고 싶다는 강한 열망"입니다.',
-    keywords: ['행동파리더', '우리팀', '강력한개혁', '추진력', '결단력'],
-    summary: '기존의 좌파/우파 이념 틀로는 설명하기 어려운, 제3의 길을 추구하는 성향입니다. **진보적인 \'목표\'(변화, 개혁)와 보수적인 \'수단\'(힘, 안보)을 동시에 추구**하는 등, 양측의 가장 급진적인 생각들을 일부 공유하며 새로운 질서를 만들고자 합니다.',
-    political_spectrum: '중도 (개혁적)',
-    political_spectrum_detail: '당신은 진보적인 목표(사회 개혁, 적극적 평등)를 보수적인 수단(강력한 국가, 공동체 우선)으로 이루려는 독특한 조합을 보입니다. 스펙트럼 상으로는 **\'중도\'**에 해당하지만, 현상 유지를 거부하고 강력한 행동을 추구한다는 점에서 매우 개혁적인 성향을 띕니다.',
-    detailed_description: '당신은 회의 시간에 아이디어만 내고 실행하지 않는 사람들을 답답해하는 편입니다. "말만 하지 말고, 일단 해보자!"라며 먼저 소매를 걷어붙이는 타입이죠. \'우리 팀\', \'우리 공동체\'의 성공을 위해 때로는 반대 의견을 묵살하고서라도 강력하게 목표를 향해 나아갑니다. 당신에게 \'국가\'는 낡은 개념이 아니라, 공동체의 발전을 위해 가장 효과적으로 힘을 쓸 수 있는 강력한 도구입니다. 당신의 결단력은 위기 상황에서 빛을 발하지만, 너무 성급한 결정으로 공동체의 안정을 해칠 수 있다는 점을 유의해야 합니다.\n\n**결국 당신을 움직이는 핵심 동력은 \'내가 속한 공동체를 누구보다 위대하게 만들고 싶다는 강한 열망\'입니다. 당신은 비판만 하는 방관자가 아닌, 직접 판에 뛰어들어 결과를 만들어내는 행동가이며, 목표 달성을 위해서라면 과감한 결단도 마다하지 않는 사람입니다.**',
-    strengths: [
-      '강력한 추진력과 결단력: 목표가 정해지면, 반대를 무릅쓰고서라도 강력하게 밀어붙여 결과를 만들어내는 힘이 있습니다.',
-      '높은 애국심과 공동체 의식: 자신이 속한 공동체와 국가에 대한 자부심이 강하며, 이를 더 위대하게 만들고 싶다는 열망을 가지고 있습니다.',
-      '현실 개혁 의지: 이상적인 구호에만 머무르지 않고, 현실의 불합리한 시스템을 직접 바꾸려는 강한 의지를 가지고 있습니다.',
-      '위기관리 능력: 혼란스러운 상황에서, 강력한 리더십을 발휘하여 공동체를 하나로 모으고 위기를 돌파하는 능력이 있습니다.',
-      '가시적인 성과 창출: 명분보다는, 사람들의 삶을 실질적으로 바꾸는 가시적인 성과를 만들어내는 데 집중합니다.'
-    ],
-    weaknesses: [
-      '권위주의적 태도: 자신의 결정을 관철하기 위해, 민주적인 절차나 소수의 의견을 무시하는 권위주의적인 모습을 보일 수 있습니다.',
-      '과도한 국수주의: \'우리 것\'을 너무 강조한 나머지, 다른 문화나 국가에 대해 배타적이거나 적대적인 태도를 보일 수 있습니다.',
-      '목표지상주의: \'결과\'를 위해 \'과정\'의 희생을 정당화하여, 장기적으로는 공동체의 신뢰를 잃을 수 있습니다.',
-      '다양성 억압: 공동체의 통일성과 효율성을 위해, 개인의 다양성이나 비판적인 목소리를 억압하려는 경향이 있습니다.',
-      '성급한 일반화의 오류: 복잡한 문제의 원인을 단순화하고, 모든 것을 \'적\'과 \'아군\'으로 나누어 바라보는 흑백논리에 빠질 위험이 있습니다.'
-    ],
-    speech_style: '당신은 토론의 결론이 나면, 즉시 "자, 그럼 A팀은 이거 맡아주시고, B팀은 저거 준비해주세요" 와 같이 각자의 역할을 정하고 행동을 지시하는 경향이 있습니다. 당신의 명쾌한 화법은 프로젝트를 빠르게 진척시키지만, 때로는 팀원들에게 일방적이고 권위적이라는 인상을 줄 수 있습니다. 이러한 화법은 **\'지루한 논의에 대한 스트레스\'**를 느끼는 사람들에게 시원한 해결책을 제시하지만, 민주적인 소통을 중시하는 사람들에게는 반감을 살 수 있습니다.',
-    stress_moment: '모든 것이 명확한데도 불구하고, 결단을 내리지 못하고 "일단 좀 더 상황을 지켜보자"며 시간을 끄는 상황을 견디지 못합니다. 당신에게 그것은 무능하고 책임감 없는 리더의 전형적인 모습이기 때문입니다. 당신은 당신의 결단을 믿고 함께 행동해주는 파트너를 가장 신뢰합니다.',
-    solution: '"그냥 제 말대로 하세요"라고 말하는 대신, "지금 우리가 할 수 있는 최선의 행동은 A안과 B안입니다. 둘 중 하나를 오늘 안에 결정해서, 내일부터 바로 실행에 옮깁시다." 와 같이 명확한 선택지를 제시하고 결단을 촉구하세요. 이는 당신의 추진력을 유지하면서도, 상대방에게 결정에 참여했다는 느낌을 주게 합니다.',
-    love_value: '당신은 연인 관계를 \'우리 팀\'이라고 생각하며, 두 사람이 함께 사회적으로 성공하고 더 높은 지위에 오르는 것을 중요하게 생각합니다. 당신의 강력한 리더십(A, S)으로 관계를 주도하며, 연인이 당신의 비전(P, C)을 믿고 따라와 줄 때 가장 큰 만족감을 느낍니다. 당신에게 사랑은 현실 안주가 아닌, 더 높은 곳을 향한 끊임없는 전진입니다.',
-    best_partner: '**왜 잘 맞는가?** 당신의 강력한 추진력을 그의 합리적인 원칙이 보완해주어, 가장 안정적이면서도 성공적인 커플이 될 수 있습니다. 당신이 목표를 향해 돌진할 때, 그는 뒤에서 발생할 수 있는 모든 리스크를 관리하고 명분을 만들어주는 최고의 참모 역할을 합니다.',
-    worst_partner: '**왜 갈등하는가?** 그는 당신의 \'우리 팀\'이라는 개념 자체를 개인의 자유(I)를 억압하는 구속으로 느낄 것입니다. 예를 들어, 당신이 "우리 미래를 위해 주말에도 일하자"고 말하면, 그는 "내 주말은 내 것"이라며 당신의 리더십에 끊임없이 저항하며 갈등을 일으킬 수 있습니다.',
-    communication_barrier: '혹시 신중한 토론이나 절차를 강조하는 사람과 대화할 때, "지금이 얼마나 중요한 때인데, 언제까지 토론만 하고 있을 건가?" 라며 답답함을 느껴본 적 없으신가요? 이는 당신이 공동체의 발전을 위해 **\'신속하고 과감한 결단\'**을 최우선으로 여기는 반면, 그는 **\'개인의 자유와 민주적 절차\'**를 더 중요한 가치로 생각하기 때문입니다. 당신은 \'전쟁\'을 치르려 하는데, 그는 \'회의\'를 하고 있는 것입니다.',
-    career_value: '당신의 개혁적(P) 국가주의(C, S) 성향은, 현실에 안주하는 조직을 참지 못하게 합니다. 당신은 강력한 리더십을 발휘하여 조직 전체를 혁신하고, 눈에 띄는 성과를 만들어내는 역할에 매력을 느낍니다. 정체되어 있는 공기업을 개혁하거나, 위기에 빠진 회사를 살리는 \'해결사\'의 역할에 강하게 끌릴 수 있습니다.',
-    financial_style: '당신은 **\'국가의 성장\'**에 직접적으로 베팅하는 투자 방식을 선호할 수 있습니다. 예를 들어, 정부가 강력하게 추진하는 특정 산업(예: 원전, 반도체)의 대표 기업에 집중 투자하여, 국가 정책의 성공과 나의 자산 증식을 일치시키려는 경향을 보입니다.',
-    historical_avatar: '2차 세계대전 당시 프랑스의 저항을 이끌었던 드골은, 전후 혼란스러운 프랑스의 정치를 안정시키기 위해 강력한 대통령 중심제(제5공화국)를 열었습니다. 그는 국가의 영광과 공동체의 발전을 위해서라면, 때로는 권위적으로 보일지라도 과감한 개혁을 밀어붙이는 결단력 있는 지도자였습니다.',
-    real_avatar: '이들은 여론의 반대를 무릅쓰고서라도 자신이 옳다고 믿는 대규모 개발 사업이나 정책을 강력하게 추진하여, 지역 사회의 모습을 완전히 바꾸어 놓는 가시적인 성과를 만들어내는 사람들입니다.',
-    growth_direction: '당신의 강력한 추진력과 결단력은 공동체를 위기에서 구하고 새로운 길로 이끄는 리더의 자질입니다. 하지만 \'속도\'와 \'결과\'를 너무 강조한 나머지, 그 과정에서 희생되는 소수의 목소리나 민주적 절차의 가치를 간과할 수 있습니다. 당신의 성장은, 강력한 힘을 올바른 방향으로 사용할 수 있도록 도와주는 \'견제와 균형\'의 중요성을 배우는 과정에 있습니다.',
-    growth_task: '\'속도 조절\'과 \'절차적 정당성\' 배우기',
-    recommended_books: [
-      {title: '아주 작은 습관의 힘', author: '제임스 클리어'},
-      {title: '군주론', author: '니콜로 마키아벨리'}
-    ],
-    recommended_content: '**📚 추천 도서:** **『아주 작은 습관의 힘』 (제임스 클리어):** <a href="https://link.coupang.com/a/c4nfHy" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**📚 추천 도서:** **『군주론』 (니콜로 마키아벨리):** <a href="https://link.coupang.com/a/c4ngi7" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:** 유튜브에서 **\'대한민국 헌법의 가치\'**나 **\'민주적 의사결정 과정\'**에 대한 교양 강의를 시청해보세요. 당신이 때로 답답하게 느끼는 \'절차\'가 왜 공동체를 지키기 위해 필수적인지 이해할 수 있습니다.\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*',
-    final_goal: '당신 성장의 최종 목표는, 단순히 목표를 향해 돌진하는 \'불도저 같은 리더\'를 넘어, 때로는 멈추고, 때로는 돌아가며 **\'과정의 정당성\'까지 확보하는 \'존경받는 지도자\'**가 되는 것입니다.'
-  },
-
-  CPUE: {
-    name: '사회민주주의자',
-    category: 'political',
-    scores: {
-      '공동체주의': 80,
-      '진보주의': 75,
-      '보편적 평등': 85,
-      '협력 우선': 80
-    },
-    description: '당신은 "왜 저 사람만 특혜를 받아?" 혹은 "왜 저 사람만 희생해야 해?"라는 질문을 자주 던집니다. 모두에게 공평하고 합리적인 규칙을 만드는 것을 중요하게 생각하며, 갈등이 생겼을 때 한쪽 편을 들기보다 모두의 이야기를 듣고 중재하려는 경향이 있습니다. 결국 당신을 움직이는 핵심 동력은 "단 한 사람도 소외되지 않는 따뜻한 공동체를 만들고 싶다는 이상"입니다.',
-    keywords: ['선한영향력', '합리적진보', '상생', '소통', '보편적복지'],
-    summary: '일반적으로, 현재 사회의 불평등이나 문제점을 인정하고, **\'변화\'와 \'개혁\'**을 통해 더 평등하고 자유로운 사회를 만들려는 경향을 의미합니다. 개인의 자유만큼이나 사회적 약자를 보호하기 위한 공동체의 역할과 연대를 중요하게 생각합니다.',
-    political_spectrum: '진보 (좌파) 성향',
-    political_spectrum_detail: '당신의 정치적 성향은 현대적인 의미의 \'진보(좌파)\' 이념 스펙트럼에 가깝다고 볼 수 있습니다. 급진적인 혁명보다는, 공동체 구성원들의 합의와 민주적 제도를 통해 점진적으로 보편적 복지를 확대해나가는 북유럽식 사회민주주의 모델을 지향합니다.',
-    detailed_description: '당신은 "왜 저 사람만 특혜를 받아?" 혹은 "왜 저 사람만 희생해야 해?"라는 질문을 자주 던집니다. 모두에게 공평하고 합리적인 규칙을 만드는 것을 중요하게 생각하며, 갈등이 생겼을 때 한쪽 편을 들기보다 모두의 이야기를 듣고 중재하려는 경향이 있습니다. 당신은 \'경쟁\'보다는 \'협력\'이, \'차별\'보다는 \'연대\'가 더 나은 사회를 만든다고 굳게 믿습니다. 당신의 합리성과 따뜻함은 주변에 안정감을 주지만, 때로는 모두를 만족시키려다 중요한 결정을 내리지 못하고 머뭇거릴 수 있습니다.\n\n**결국 당신을 움직이는 핵심 동력은 \'단 한 사람도 소외되지 않는 따뜻한 공동체를 만들고 싶다는 이상\'입니다. 당신은 승자독식의 세상이 아닌, 아픈 사람을 함께 돌보고 뒤처진 사람을 기다려주는 사회가 더 강한 사회라고 믿는 사람입니다.**',
-    strengths: [
-      '합리적인 대안 제시: 감정적인 대립보다, 모두가 동의할 수 있는 합리적인 원칙과 제도를 통해 문제를 해결하려 합니다.',
-      '높은 사회적 공감대: 경쟁에서 뒤처진 사람도 최소한의 인간다운 삶을 누려야 한다는, 따뜻한 공동체 의식을 가지고 있습니다.',
-      '갈등 중재 능력: 첨예하게 대립하는 이해관계 속에서, 대화와 타협을 통해 합의점을 찾아내는 중재 능력이 뛰어납니다.',
-      '점진적 개혁 추구: 사회를 한 번에 바꾸려는 혁명보다, 부작용을 최소화하는 점진적인 개혁을 통해 안정적으로 사회를 발전시켜 나갑니다.',
-      '보편적 가치 존중: 인권, 복지, 평등과 같은 보편적인 가치를 존중하고, 이를 사회 시스템으로 구현하려 노력합니다.'
-    ],
-    weaknesses: [
-      '과도한 복지로 인한 비효율: 모두를 위한 복지를 너무 강조한 나머지, 국가 재정의 비효율이나 개인의 근로 의욕 저하 문제를 간과할 수 있습니다.',
-      '느린 실행 속도: 모두의 합의를 이끌어내는 과정이 너무 오래 걸려, 빠른 결단이 필요한 위기 상황에 대처하는 능력이 떨어질 수 있습니다.',
-      '이상론에 치우칠 위험: 현실적인 재원이나 인간의 이기심을 고려하지 않은 채, 너무 이상적인 복지 모델을 추구할 수 있습니다.',
-      '혁신 동력 부족: \'경쟁\'보다 \'분배\'를 강조하는 문화가, 사회 전체의 혁신적인 도전 정신이나 성장 동력을 약화시킬 수 있습니다.',
-      '포퓰리즘의 유혹: 대중의 인기를 얻기 위해, 국가의 장기적인 재정 건전성을 해치는 복지 정책을 남발할 유혹에 빠지기 쉽습니다.'
-    ],
-    speech_style: '당신은 대화할 때 특정 사람의 의견만 돋보이는 것을 경계하고, "혹시 다른 의견 있는 분 없으신가요?"라며 모두의 목소리를 들으려 노력합니다. 당신의 포용적인 화법은 공동체의 화합을 이끌어내지만, 때로는 논의가 길어지고 핵심이 흐려진다는 단점이 있습니다. 이러한 태도는 **\'소외되는 것에 대한 스트레스\'**를 느끼는 사람들에게 큰 안정감을 주지만, 빠른 결정을 원하는 사람에게는 답답하게 느껴질 수 있습니다.',
-    stress_moment: '"능력 있는 사람이 더 많이 가져가는 건 당연한 거 아니야?" 와 같이, 결과의 평등을 무시하는 경쟁지상주의적인 말을 들을 때 스트레스를 받습니다. 당신에게 그것은 공동체의 약자를 버리고 가자는, 비정한 말처럼 들립니다. 당신은 경쟁의 결과보다는 과정의 공정함을 함께 고민해주는 파트너를 원합니다.',
-    solution: '상대방의 \'능력주의\'를 비판하는 대신, "능력에 따른 보상은 저도 동의합니다. 하지만 사람이 살다 보면 아프거나 실패할 수도 있습니다. 그럴 때를 대비해, 누구든 다시 일어설 수 있는 \'최소한의 안전망\'을 함께 만들어두는 것이, 결국 우리 모두에게 이득 아닐까요?" 라고 설득해보세요. 이는 상대방의 논리를 인정하면서도, 당신의 가치를 설득하는 효과적인 방법입니다.',
-    love_value: '당신은 연인과 매우 평등하고 수평적인 관계를 추구합니다. 누가 더 잘나고 못남을 따지기보다, 서로의 약점을 보듬어주고 함께 성장하는 \'돌봄의 연대(C, P)\'를 이상적인 사랑이라고 생각합니다. 모든 결정은 독단이 아닌, 충분한 대화와 합의(U, E)를 통해 이루어져야 한다고 믿습니다. 당신에게 사랑은, 경쟁이 아닌 세상에서 유일하게 기댈 수 있는 안전한 공동체를 만드는 것입니다.',
-    best_partner: '**왜 잘 맞는가?** 당신의 합리성과 다정함을 이해해주며, 대화가 잘 통하는 커플이 될 수 있습니다. 두 사람 모두 \'더 나은 세상\'을 꿈꾸며, 사회 문제에 대해 이야기하는 것을 즐깁니다. 당신은 그의 개인주의를 존중해주고, 그는 당신의 공동체 의식에 기꺼이 동참할 것입니다.',
-    worst_partner: '가부장적이거나 권위적인 성향을 가진 사람. 당신의 \'평등\'이라는 핵심 가치를 근본적으로 부정하기 때문에 깊은 관계를 맺기 어렵습니다. 예를 들어, 상대방이 "그래도 집안의 중요한 결정은 남자가 해야지"라고 말하는 순간, 당신은 돌아설 것입니다.',
-    communication_barrier: '혹시 개인의 성공과 무한 경쟁을 강조하는 사람과 대화할 때, "성공한 사람들은 그렇다 쳐도, 경쟁에서 뒤처진 사람들은 어떡하라고?" 라며 말이 통하지 않는다고 느껴본 적 없으신가요? 이는 당신이 사회의 수준을 **\'가장 약한 사람을 어떻게 대하는가\'**에서 찾는 반면, 그는 **\'가장 강한 사람이 어디까지 올라갈 수 있는가\'**에서 찾기 때문입니다. 당신은 \'안전망\'을 말하지만, 그는 \'유리천장\'을 이야기하는 셈입니다.',
-    career_value: '당신의 사회민주주의 성향은, 과도한 실적 경쟁이나 비정한 구조조정이 없는, 고용 안정이 보장되고 노동자의 권리가 존중받는 직장을 선호하게 만듭니다. 당신은 동료를 경쟁자가 아닌 \'함께 연대하는 동지\'로 생각하며, 협동조합이나 공공성이 강한 기업에서 일할 때 가장 큰 만족을 느낍니다.',
-    financial_style: '당신은 높은 수익률을 추구하기보다, \'모두에게 이로운\' 금융 시스템을 지지합니다. 예를 들어, 높은 이자를 받는 대부업체에 투자하기보다, 서민을 위한 금융 협동조합에 출자하는 것에서 더 큰 가치를 느낄 수 있습니다. **보편적 원칙(U)**에 따라, 특정인에게만 이익이 돌아가는 투자는 경계하는 경향이 있습니다.',
-    historical_avatar: '그는 대공황이라는 최악의 위기 속에서, \'뉴딜 정책\'을 통해 국가가 적극적으로 시장에 개입하여 실업자를 구제하고, 사회보장제도를 도입하여 공동체의 붕괴를 막았습니다. 그의 정책은 모든 국민이 최소한의 인간다운 삶을 누릴 권리가 있다는 사회민주주의 철학의 기반이 되었습니다.',
-    real_avatar: '이들은 모든 국민이 질병, 실업, 노령 등의 사회적 위험으로부터 보호받을 수 있도록, 보편적 의료보험, 실업 수당, 공적 연금과 같은 사회 안전망을 설계하고 주장하는 사람들입니다.',
-    growth_direction: '\'모두가 함께 잘 사는 사회\'를 꿈꾸는 당신의 이상은 매우 숭고합니다. 하지만 \'어떻게\' 그 이상을 실현할 것인가에 대한 현실적인 고민이 부족할 경우, 당신의 계획은 \'선한 의도\'에만 머무를 수 있습니다. 당신의 성장은, 따뜻한 이상을 현실에 구현할 수 있는 \'차가운 현실 감각\'과 \'효율성\'에 대한 고민을 더하는 과정에 있습니다.',
-    growth_task: '\'선한 의도\'를 \'지속 가능한 시스템\'으로 만들기',
-    recommended_books: [
-      {title: '국가는 왜 실패하는가', author: '대런 아세모글루'},
-      {title: '정치와 비전', author: '셸던 월린'}
-    ],
-    recommended_content: '**📚 추천 도서:** **『국가는 왜 실패하는가』 (대런 아세모글루):** <a href="https://link.coupang.com/a/c4ngW3" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**📚 추천 도서:** **『정치와 비전』 (셸던 월린):** <a href="https://link.coupang.com/a/c4njP6" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:** 유튜브에서 **\'북유럽 복지국가의 그림자\'**나 **\'베네수엘라 경제 위기의 원인\'**을 다룬 다큐멘터리를 시청해보세요. 복지 정책의 성공 조건과 실패 원인을 객관적으로 학습할 수 있습니다.\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*',
-    final_goal: '당신 성장의 최종 목표는, 단순히 \'착한 사람\'을 넘어, 공동체를 위한 선한 의도를 **\'지속 가능한 성공 모델\'로 만들어내는 \'유능한 설계자\'**가 되는 것입니다.'
-  },
-
-  CPUS: {
-    name: '기술주의적 국가주의자',
-    category: 'political',
-    scores: {
-      '공동체주의': 80,
-      '진보주의': 70,
-      '보편적 평등': 75,
-      '안보 우선': 85
-    },
-    description: '당신은 주먹구구식으로 일하는 것을 싫어합니다. 어떤 문제든 가장 효율적이고 공정한 "시스템"을 만들어 해결해야 한다고 믿습니다. 개인의 감정적인 호소보다는 객관적인 데이터와 통계를 더 신뢰하며, 사회 전체의 최적화를 목표로 큰 그림을 그리는 사람입니다. 결국 당신을 움직이는 핵심 동력은 "비효율적인 세상을 완벽한 시스템으로 재설계하려는 지적인 욕망"입니다.',
-    keywords: ['효율성마스터', '데이터중심', '시스템설계자', '국가최적화', '기술만능주의'],
-    summary: '공동체의 이익(C)과 점진적 개혁(P)을 통해, 평등한 사회(U)와 강한 안보(S)를 동시에 추구하는 기술 중심의 진보적 국가주의에 가깝습니다.',
-    political_spectrum: '진보-보수 중도 (기술 지향)',
-    political_spectrum_detail: '당신은 기술과 데이터를 활용한 효율적인 사회 시스템 구축을 통해 **\'국가 전체의 최적화\'**를 추구합니다. 진보적 목표(평등, 복지)와 보수적 수단(강력한 국가, 안보)을 기술적 합리성으로 조화시키려는 독특한 정치적 성향을 가지고 있습니다.\n\n이는 전통적인 좌파/우파 구분을 넘어서는 **\'기술주의적 국가주의\'**로, 싱가포르나 에스토니아 같은 디지털 강국 모델에 가깝습니다.',
-    detailed_description: '**이름은 \'기술주의적 국가주의자\', 그러나 진짜 정체는?**\n\n사실 당신의 진짜 정체는 \'21세기형 설계자\'입니다. 당신은 감정에 휩쓸리는 정치보다는 데이터와 논리로 사회 문제를 해결하려는 사람입니다. 카페에서 일하다가도 "이 주문 시스템 너무 비효율적인데?"라며 개선안을 생각해내는 타입이죠.\n\n**관심사:** 빅데이터, 인공지능, 전자정부, 스마트시티, 사회 시스템 최적화\n\n**라이프스타일:** 각종 앱으로 생활을 체계화하고, 데이터 기반으로 의사결정하며, 새로운 기술을 빠르게 도입하는 얼리어답터\n\n**정치적 성향:** 좌파의 복지 목표 + 우파의 강한 정부 + 기술적 효율성',
-    strengths: [
-      '데이터 기반의 객관성: 주관적 감정보다는 객관적 지표와 통계를 바탕으로 합리적 판단을 내립니다.',
-      '높은 효율성: 모든 일에서 가장 효율적인 방법을 찾아내어 시간과 자원을 절약합니다.',
-      '장기적인 안목: 단기적 이익보다 장기적 관점에서 사회 전체의 최적화를 고려합니다.',
-      '문제 해결 능력: 복잡한 사회 문제도 시스템적으로 접근하여 근본적 해결책을 제시합니다.',
-      '미래지향성: 새로운 기술과 변화를 적극적으로 수용하고 활용하려는 자세를 가지고 있습니다.'
-    ],
-    weaknesses: [
-      '인간적인 가치 간과: 효율성을 너무 중시한 나머지 인간의 감정이나 개별적 상황을 무시할 수 있습니다.',
-      '과도한 통제 지향: 완벽한 시스템을 추구하다가 지나치게 통제적이고 감시사회를 만들 위험이 있습니다.',
-      '엘리트주의: 데이터를 이해하지 못하는 일반인들을 무능하다고 여기는 경향이 있습니다.',
-      '예측 불가능성에 대한 취약성: 모든 것을 예측하고 통제하려다가 예상치 못한 변수에 당황할 수 있습니다.',
-      '민주적 절차 경시: 효율성을 위해 민주적 토론이나 합의 과정을 번거롭다고 여길 수 있습니다.'
-    ],
-    speech_style: '**"데이터를 보면 명확하게 나오는데요?"라는 말을 자주 하는 사람**\n\n당신은 대화할 때 구체적인 수치와 자료를 들어가며 논리적으로 설명하는 것을 선호합니다. 감정적인 호소보다는 객관적 근거를 바탕으로 상대방을 설득하려고 하죠.\n\n**특징:**\n- "통계를 보면..."\n- "이런 시스템을 도입하면..."\n- "효율성 측면에서 봤을 때..."\n\n이런 식으로 항상 근거와 데이터를 제시하며 대화하는 스타일입니다.',
-    stress_moment: '**가장 스트레스 받는 순간: "원래 그렇게 해왔으니까" 듣기**\n\n당신이 가장 답답해하는 순간은 명백히 비효율적인 시스템이나 관행에 대해 개선안을 제시했을 때, "원래 그렇게 해왔으니까"라는 답변을 들을 때입니다. 논리적 근거보다 관습을 앞세우는 태도에 크게 좌절감을 느낍니다.',
-    solution: '**솔루션: 단계적 개선 방안 제시하기**\n\n상대방에게 변화를 요구할 때는 한 번에 모든 것을 바꾸려 하지 말고, "1단계로 이것부터 해보시죠"라며 작고 구체적인 개선안부터 제시하세요. 성공 사례와 구체적인 효과를 보여주면 더욱 설득력이 있습니다.',
-    love_value: '**연애 가치관: "스마트한 파트너십"**\n\n당신에게 이상적인 연애는 서로의 강점을 최적화하여 시너지를 만들어내는 관계입니다.\n\n**중요하게 생각하는 것들:**\n- **효율적인 소통**: 감정 표현도 명확하고 건설적으로 하는 사람\n- **합리적 판단**: 중요한 결정을 내릴 때 감정보다는 논리를 우선하는 사람\n- **성장 지향**: 함께 더 나은 시스템을 만들어가려는 의지\n- **기술 친화적**: 새로운 도구나 방법을 거부감 없이 받아들이는 사람\n\n**데이트 스타일**: 계획적이고 효율적인 일정, 새로운 기술이나 시스템을 함께 체험하는 것을 선호합니다.',
-    best_partner: '**최고의 연애 파트너: IPAS (급진적 자유주의자)**\n\n**왜 잘 맞나요?**\n\nIPAS는 당신의 체계적인 접근 방식에 추진력과 실행력을 더해줄 수 있는 파트너입니다. 당신이 "이런 시스템이 필요해"라고 말하면, IPAS는 "그럼 바로 시작해보자!"라며 적극적으로 실행에 옮겨줄 거예요.\n\n**함께 하면 좋은 활동:**\n- 스타트업 창업이나 새로운 프로젝트\n- 기술 컨퍼런스 참가\n- 효율적인 생활 시스템 구축\n- 데이터 분석 및 개선 작업',
-    worst_partner: '**최악의 갈등 상대: CTUE (중도 보수주의자)**\n\n**왜 갈등이 생기나요?**\n\n당신이 "이 시스템 완전히 바꿔야 해"라고 말하면, CTUE는 "너무 급진적이야, 점진적으로 하자"라고 답할 가능성이 높습니다. 변화의 속도와 방식에서 지속적인 의견 충돌이 발생할 수 있습니다.\n\n**구체적인 갈등 상황:**\n- 당신: "AI로 업무를 자동화하자"\n- CTUE: "사람들 일자리는 어떻게 해?"\n- 당신: "데이터 기반으로 결정하자"\n- CTUE: "사람 감정도 고려해야지"',
-    communication_barrier: '**소통의 벽: 당신이 감정 중심 사고와 대화할 때 답답함을 느끼는 이유**\n\n혹시 감정에 치우쳐 판단하는 사람과 대화할 때, "왜 논리적으로 생각하지 못할까?"라는 답답함을 느낀 적이 있나요?\n\n**이유:**\n- **당신**: 데이터와 논리 중심 → "숫자가 말해줘"\n- **감정 중심 사고**: 느낌과 직관 중심 → "뭔가 이상해"\n\n**예시 대화:**\n- 당신: "통계적으로 이 정책이 더 효과적이에요"\n- 상대방: "그래도 뭔가 불안해요"\n- 당신: "구체적으로 어떤 부분이 문제인가요?"\n- 상대방: "그냥... 느낌이..."\n\n이런 식으로 근거를 요구하는 당신과 감정을 우선하는 상대방 간의 대화가 평행선을 달리게 됩니다.',
-    career_value: '**돈과 일에 대한 태도: "시스템을 만드는 일이 최고"**\n\n당신에게는 단순한 업무 수행보다는 **"비효율적인 것을 효율적으로 바꾸는 일"**에서 가장 큰 보람을 느낍니다.\n\n**선호하는 직장 문화:**\n- 데이터 기반 의사결정이 이루어지는 환경\n- 새로운 기술과 도구 도입에 적극적인 회사\n- 성과와 효율성이 명확하게 측정되는 곳\n- 혁신과 개선에 대한 보상이 있는 환경\n\n**적성에 맞는 분야:**\n- IT/소프트웨어 개발\n- 데이터 사이언스\n- 경영 컨설팅\n- 공공정책 설계\n- 시스템 엔지니어링\n- 핀테크\n\n**피하고 싶은 직장:**\n관료적이고 변화에 소극적인 조직, 감정노동이 많은 서비스업',
-    financial_style: '**잠재적 재무 스타일: "체계적 최적화 투자자"**\n\n당신의 투자 철학은 **"모든 결정은 데이터와 분석에 기반해야 한다"**입니다.\n\n**투자 성향:**\n- **로보어드바이저**: 알고리즘 기반 자동 투자\n- **테크주 선호**: IT, AI, 핀테크 관련 기업\n- **ETF 중심**: 개별 종목보다 분산투자\n- **정량적 분석**: 재무제표, 기술적 지표 중시\n\n**소비 패턴:**\n- 생산성 향상 도구 (앱, 가젯, 소프트웨어)\n- 효율적인 생활용품 (스마트홈, 자동화 기기)\n- 교육 투자: 온라인 강의, 기술 서적\n- 시간 절약 서비스: 배달, 청소, 세탁\n\n**주의할 점:**\n과도하게 최적화에 집착하다가 인생의 즐거움이나 예상치 못한 기회를 놓칠 수 있어요.',
-    historical_avatar: '**역사적 아바타: 비스마르크 (독일 철혈 재상)**\n\n**왜 비스마르크인가요?**\n\n비스마르크는 감정보다는 냉철한 계산과 현실정치를 통해 독일 통일이라는 거대한 시스템을 구축한 인물입니다.\n\n**당신과의 공통점:**\n- **현실적 이상주의**: 큰 목표를 체계적으로 실현\n- **효율성 추구**: 최소한의 비용으로 최대한의 효과\n- **시스템 설계**: 복잡한 정치적 균형을 안정적 체제로 구축\n- **데이터 중시**: 감정보다는 국력과 현실을 바탕으로 판단\n\n**배울 점:**\n비스마르크는 이상적인 시스템을 구축하되, 인간의 감정과 문화적 요소도 고려했습니다. 완벽한 논리만으로는 사람들의 마음을 얻기 어렵다는 것을 이해했죠.',
-    real_avatar: '**현실 속 아바타: "실리콘밸리의 시스템 설계자"**\n\n**누구를 말하는 건가요?**\n\n구글, 아마존, 테슬라 같은 기업에서 복잡한 시스템을 설계하고 최적화하는 엔지니어나 기획자들입니다.\n\n**특징:**\n- **데이터 드리븐**: 모든 결정을 데이터로 검증\n- **스케일 사고**: 개인이 아닌 시스템 전체를 고려\n- **효율성 집착**: 1%의 개선도 놓치지 않는 완벽주의\n- **기술 낙관주의**: 기술이 사회 문제를 해결할 수 있다고 믿음\n\n**예시:**\n- 구글의 검색 알고리즘 개발자\n- 아마존의 물류 시스템 설계자\n- 우버의 매칭 시스템 엔지니어\n- 정부의 디지털 전환 담당자\n\n**당신이 지향할 방향:**\n기술적 효율성과 인간적 가치 사이의 균형을 찾는 현명한 설계자가 되세요.',
-    growth_direction: '**개인적 성장과 자기계발**\n\n당신의 가장 큰 강점은 **"복잡한 문제를 시스템적으로 해결하는 능력"**입니다. 하지만 이 능력이 진정한 힘을 발휘하려면 인간에 대한 이해와 공감 능력이 뒷받침되어야 합니다.\n\n**성장 방향:**\n\n**1. 기술과 인간의 조화**\n- **현재:** "효율적이면 다 좋아"\n- **목표:** "사람들이 행복한 효율성"\n\n**2. 소통 능력 향상**\n- **현재:** 데이터로만 설득하려 함\n- **목표:** 상대방의 감정도 고려한 설득법\n\n**3. 유연성 기르기**\n- **현재:** 완벽한 시스템에 집착\n- **목표:** 불완전함도 받아들이는 여유\n\n**구체적인 액션 플랜:**\n- 인문학/심리학 도서 읽기\n- 다양한 사람들과의 대화 늘리기\n- 기술 윤리에 대한 고민하기',
-    growth_task: '\'완벽한 시스템\'과 \'인간적 가치\'의 균형 찾기',
-    recommended_books: [
-      {title: '미래의 일', author: '칼 베네딕트 프레이'},
-      {title: '호모 데우스', author: '유발 하라리'},
-      {title: '넛지', author: '리처드 탈러'},
-      {title: '빅데이터 인문학', author: '에르네스토 시메티'}
-    ],
-    recommended_content: '**📚 추천 도서:** **『린 스타트업』 (에릭 리스):** <a href="https://link.coupang.com/a/c4mXIL" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**📚 추천 도서:** **『호모 데우스』 (유발 하라리):** <a href="https://link.coupang.com/a/c4nv6c" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**📚 추천 도서:** **『넛지』 (리처드 탈러):** <a href="https://link.coupang.com/a/c4m3jT" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**📚 추천 도서:** **『권력의 법칙』 (로버트 그린):** <a href="https://link.coupang.com/a/c4m40N" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:**\n\n- **TED Talks**: "The future of work", "AI and society"\n- **유튜브**: "Computerphile", "3Blue1Brown" 등 기술 채널\n- **팟캐스트**: "AI Podcast", "Tech 따라잡기"\n- **온라인 강의**: 코세라의 데이터 사이언스, 시스템 설계 강의\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*',
-    final_goal: '당신 성장의 최종 목표는, 단순히 효율적인 시스템을 만드는 기술자를 넘어, 기술적 효율성과 인간적 가치를 동시에 고려하는 **\'휴머니즘이 있는 시스템 설계자\'**가 되는 것입니다. 당신의 기술이 단순히 효율적인 것이 아니라, 사람들을 더 행복하게 만들 때 진정한 성공을 경험하게 될 것입니다.'
-  },
-
-  CTAE: {
-    name: '실용주의적 공동체주의자',
-    category: 'political',
-    scores: {
-      '공동체주의': 85,
-      '전통주의': 75,
-      '적극적 평등': 70,
-      '협력 우선': 80
-    },
-    description: '당신은 "명분보다 실리"라는 말을 중요하게 생각하는 편입니다. 거창한 이념 대립보다는, 실제 우리 공동체에 어떤 이득이 되는지를 먼저 계산합니다. 적을 만들기보다 친구를 만드는 것이 남는 장사라고 믿으며, 부드러운 카리스마와 협상 능력으로 조용히 원하는 것을 얻어내는 타입입니다. 결국 당신을 움직이는 핵심 동력은 "불필요한 갈등을 피하고, 우리 공동체의 이익을 극대화하려는 현실적인 지혜"입니다.',
-    keywords: ['실용주의자', '협상왕', '중재전문가', '윈윈게임', '관계중심'],
-    summary: '공동체의 이익(C)과 검증된 방식(T)을 바탕으로, 균형 잡힌 평등(A)과 국제 협력(E)을 추구하는 실용적 중도주의에 가깝습니다.',
-    political_spectrum: '중도 (실용)',
-    political_spectrum_detail: '당신은 이념적 순수성보다는 **\'실제 결과\'**를 중시하는 현실주의적 접근을 선호합니다. 좌파의 평등 가치와 우파의 안정성을 모두 인정하되, 상황에 따라 가장 효과적인 방법을 선택하는 실용주의적 정치 성향을 가지고 있습니다.\n\n이는 독일의 사회시장경제나 북유럽 모델처럼 **\'이데올로기보다는 성과\'**를 중시하는 실용적 중도주의에 가깝습니다.',
-    detailed_description: '**이름은 \'실용주의적 공동체주의자\', 그러나 진짜 정체는?**\n\n사실 당신의 진짜 정체는 \'21세기 외교관\'입니다. 당신은 치열한 논쟁보다는 서로 다른 의견을 가진 사람들 사이에서 절묘한 균형점을 찾아내는 것에 탁월한 재능을 가진 사람입니다. 회사 회의에서도 "A안과 B안의 장점을 결합하면 어떨까?"라며 창의적인 제3의 대안을 제시하는 타입이죠.\n\n**관심사:** 사회통합, 경제발전, 국제협력, 지역공동체, 상생발전\n\n**라이프스타일:** 다양한 사람들과 폭넓은 네트워크를 유지하며, 갈등보다는 조화를 추구하는 원만한 성격\n\n**정치적 성향:** 진보와 보수의 장점을 적절히 조합하는 실용적 중도주의',
-    strengths: [
-      '뛰어난 현실 감각: 이상론보다는 실제 상황을 정확히 파악하고 현실적인 해결책을 제시합니다.',
-      '유연한 협상 능력: 상대방의 입장을 이해하고 서로 만족할 수 있는 타협점을 찾아내는 데 능숙합니다.',
-      '인적 네트워크 활용: 다양한 분야의 사람들과 좋은 관계를 유지하며 필요시 도움을 요청할 수 있습니다.',
-      '위기관리 능력: 갑작스러운 변화나 위기 상황에서도 침착하게 대응하며 안정을 유지합니다.',
-      '높은 사회적 지능: 상황과 사람을 읽는 능력이 뛰어나 적절한 때에 적절한 행동을 취할 수 있습니다.'
-    ],
-    weaknesses: [
-      '원칙의 부재: 상황에 따라 입장을 바꾸는 모습이 일관성 없어 보이거나 신념이 약하다는 인상을 줄 수 있습니다.',
-      '단기적인 시야: 당장의 문제 해결에 집중하다가 장기적인 비전이나 근본적 개선을 놓칠 수 있습니다.',
-      '정체성 혼란: 너무 많은 입장을 고려하다가 자신만의 확고한 정체성을 잃어버릴 수 있습니다.',
-      '임시방편적 해결: 근본적인 해결보다는 당장 갈등을 피하는 미봉책에 의존할 수 있습니다.',
-      '강한 리더십 부재: 조화를 중시하다가 때로는 필요한 강력한 결단력이나 추진력이 부족할 수 있습니다.'
-    ],
-    speech_style: '**"양쪽 다 일리가 있네요. 그럼 이런 방법은 어떨까요?"라는 말을 자주 하는 사람**\n\n당신은 대화할 때 한쪽 편을 들기보다는 모든 의견을 들어보고 합리적인 절충안을 제시하는 것을 선호합니다. 갈등 상황에서도 감정을 자극하지 않으면서 건설적인 대화로 이끌어가는 능력이 있어요.\n\n**특징:**\n- "모두의 의견을 종합해보면..."\n- "이렇게 하면 윈윈 아닐까요?"\n- "현실적으로 가능한 방법을 찾아보죠"\n\n이런 식으로 항상 균형과 조화를 추구하며 대화하는 스타일입니다.',
-    stress_moment: '**가장 스트레스 받는 순간: "네편 아니면 내편" 강요받기**\n\n당신이 가장 답답해하는 순간은 복잡한 문제를 단순히 흑백논리로만 판단하라고 강요받을 때입니다. "중간은 없어, 편을 선택해"라는 식의 압박을 받으면 크게 스트레스를 받습니다.',
-    solution: '**솔루션: "제3의 대안" 제시하기**\n\n양극화된 상황에서는 "이 문제를 다른 각도에서 봐볼까요?"라며 새로운 프레임을 제시하세요. A vs B의 구도가 아닌 C라는 완전히 새로운 접근법을 제안하면 갈등을 해소할 수 있습니다.',
-    love_value: '**연애 가치관: "안정적인 동반자 관계"**\n\n당신에게 이상적인 연애는 서로를 이해하고 지지하며 함께 성장해가는 성숙한 관계입니다.\n\n**중요하게 생각하는 것들:**\n- **상호 이해**: 서로의 다른 점을 인정하고 존중하는 관계\n- **안정감**: 갑작스러운 변화보다는 예측 가능하고 안정적인 관계\n- **소통**: 문제가 생겼을 때 감정적이지 않게 차분히 대화할 수 있는 사람\n- **현실성**: 지나치게 이상적이거나 감정적이지 않은 현실적인 사고\n\n**데이트 스타일**: 너무 자극적이거나 모험적인 것보다는 편안하고 안정적인 데이트를 선호합니다.',
-    best_partner: '**최고의 연애 파트너: CPUE (사회민주주의자)**\n\n**왜 잘 맞나요?**\n\nCPUE는 당신의 실용적 접근 방식을 이해하면서도 약간의 이상주의적 동기를 제공해줄 수 있는 파트너입니다. 당신이 "현실적으로 어려워"라고 말하면, CPUE는 "그래도 조금씩 개선해나가자"라며 적절한 균형을 맞춰줄 거예요.\n\n**함께 하면 좋은 활동:**\n- 지역사회 봉사활동\n- 문화공연이나 전시회 관람\n- 독서토론이나 스터디 모임\n- 여행 계획 세우고 실행하기',
-    worst_partner: '**최악의 갈등 상대: IPAS (급진적 자유주의자)**\n\n**왜 갈등이 생기나요?**\n\nIPAS의 급진적이고 즉각적인 변화 욕구는 당신의 점진적이고 안정적인 접근 방식과 충돌할 수 있습니다. 당신이 "천천히 신중하게"라고 말하면, IPAS는 "지금 당장 바꿔야 해!"라고 답할 가능성이 높습니다.\n\n**구체적인 갈등 상황:**\n- 당신: "단계적으로 접근해보자"\n- IPAS: "미온적이야, 확실하게 하자"\n- 당신: "모든 측면을 고려해야 해"\n- IPAS: "너무 복잡하게 생각하네"',
-    communication_barrier: '**소통의 벽: 당신이 극단적 사고와 대화할 때 답답함을 느끼는 이유**\n\n혹시 매우 강경하거나 극단적인 입장을 고수하는 사람과 대화할 때, "왜 저렇게 완고할까?"라는 답답함을 느낀 적이 있나요?\n\n**이유:**\n- **당신**: 균형과 절충 중심 → "서로 양보하면 돼"\n- **극단적 사고**: 원칙과 신념 중심 → "타협은 배신이야"\n\n**예시 대화:**\n- 당신: "양쪽 의견을 조합해서 해결책을 찾아보죠"\n- 극단주의자: "타협하면 안 돼, 원칙이 중요해"\n- 당신: "현실적으로 가능한 방법을 생각해봐야죠"\n- 극단주의자: "이상을 포기하면 의미가 없어"\n\n이런 식으로 유연함을 추구하는 당신과 확고함을 고수하는 상대방이 서로 이해하지 못하게 됩니다.',
-    career_value: '**돈과 일에 대한 태도: "안정성과 성장의 균형"**\n\n당신에게는 **"안정적이면서도 발전 가능성이 있는 일"**이 가장 이상적입니다.\n\n**선호하는 직장 문화:**\n- 수평적이고 소통이 원활한 조직\n- 급격한 변화보다는 점진적 성장을 추구하는 곳\n- 다양한 의견이 존중받는 민주적 환경\n- 장기적 비전을 가지고 있는 회사\n\n**적성에 맞는 분야:**\n- 인사/조직관리\n- 마케팅/기획\n- 외교/국제관계\n- 사회복지\n- 교육행정\n- 금융/보험\n\n**피하고 싶은 직장:**\n과도하게 경쟁적이거나 불안정한 업계, 극단적인 변화가 잦은 조직',
-    financial_style: '**잠재적 재무 스타일: "안정형 균형 투자자"**\n\n당신의 투자 철학은 **"큰 손실 없이 꾸준한 수익"**을 추구하는 것입니다.\n\n**투자 성향:**\n- **분산투자**: 리스크를 최소화하는 포트폴리오\n- **안정형 펀드**: 채권형, 혼합형 펀드 선호\n- **배당주**: 꾸준한 배당 수익을 주는 우량주\n- **부동산**: 안정적인 실물자산 투자\n\n**소비 패턴:**\n- 가성비 중심의 합리적 소비\n- 필요한 것과 원하는 것의 구분\n- 보험이나 연금 같은 미래 대비\n- 가족이나 지인과 함께하는 활동 중심\n\n**주의할 점:**\n너무 안정만 추구하다가 인플레이션이나 기회비용을 놓칠 수 있어요. 적절한 위험도 감수해야 합니다.',
-    historical_avatar: '**역사적 아바타: 아데나워 (독일 초대 총리)**\n\n**왜 아데나워인가요?**\n\n아데나워는 2차 대전 후 분단된 독일을 안정적으로 재건하면서도 서방과의 협력을 통해 국제사회로 복귀시킨 실용주의 정치가입니다.\n\n**당신과의 공통점:**\n- **실용적 접근**: 이념보다는 실제 결과를 중시\n- **점진적 발전**: 급진적 변화보다는 안정적 성장 추구\n- **국제협력**: 고립보다는 협력을 통한 문제 해결\n- **사회통합**: 갈등보다는 화합을 통한 발전\n\n**배울 점:**\n아데나워는 강한 신념을 가지고 있으면서도 상황에 따라 유연하게 대응했습니다. 원칙을 지키되 방법에서는 융통성을 발휘하는 지혜를 보여줬죠.',
-    real_avatar: '**현실 속 아바타: "경험 많은 중간관리자"**\n\n**누구를 말하는 건가요?**\n\n기업이나 공공기관에서 상부와 하부 사이에서 조율하고 중재하는 역할을 담당하는 관리자들입니다.\n\n**특징:**\n- **갈등 중재**: 서로 다른 이해관계를 조정\n- **현실 감각**: 이론보다는 실제 경험을 바탕으로 판단\n- **네트워크**: 다양한 사람들과의 관계 유지\n- **위기 관리**: 예상치 못한 상황에 침착하게 대응\n\n**예시:**\n- 대기업의 팀장이나 부장\n- 공공기관의 과장이나 국장\n- NGO의 사업담당자\n- 대학의 행정관리자\n\n**당신이 지향할 방향:**\n단순한 중재자를 넘어, 비전을 제시하고 사람들을 이끌어가는 리더가 되세요.',
-    growth_direction: '**개인적 성장과 자기계발**\n\n당신의 가장 큰 강점은 **"갈등을 조화로 바꾸는 능력"**입니다. 하지만 이 능력이 진정한 힘을 발휘하려면 자신만의 명확한 비전과 추진력이 뒷받침되어야 합니다.\n\n**성장 방향:**\n\n**1. 명확한 가치관 정립**\n- **현재:** 상황에 따라 입장이 바뀜\n- **목표:** 유연하되 흔들리지 않는 핵심 원칙\n\n**2. 리더십 발휘**\n- **현재:** 갈등 회피와 중재에 집중\n- **목표:** 방향을 제시하고 이끄는 리더십\n\n**3. 장기 비전 수립**\n- **현재:** 당장의 문제 해결에 치중\n- **목표:** 미래를 내다보는 전략적 사고\n\n**구체적인 액션 플랜:**\n- 자신만의 철학과 가치관 정립하기\n- 리더십 관련 교육이나 독서\n- 장기적 목표 설정하고 실행하기',
-    growth_task: '\'조화\'에서 \'리더십\'으로 발전하기',
-    recommended_books: [
-      {title: '성공하는 사람들의 7가지 습관', author: '스티븐 코비'},
-      {title: '어떻게 원하는 것을 얻는가', author: '스튜어트 다이아몬드'},
-      {title: '실용주의 사상', author: '윌리엄 제임스'},
-      {title: '협상의 기술', author: '로저 피셔'}
-    ],
-    recommended_content: '**📚 추천 도서:** **『성공하는 사람들의 7가지 습관』 (스티븐 코비):** <a href="https://link.coupang.com/a/c4nbn4" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**📚 추천 도서:** **『어떻게 원하는 것을 얻는가』 (스튜어트 다이아몬드):** <a href="https://link.coupang.com/a/c4m54a" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**📚 추천 도서:** **『인간관계론』 (데일 카네기):** <a href="https://link.coupang.com/a/c4m5yh" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**📚 추천 도서:** **『나 홀로 볼링』 (로버트 퍼트넘):** <a href="https://link.coupang.com/a/c4m75Q" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:**\n\n- **TED Talks**: "Successful negotiation", "Leadership in complexity"\n- **유튜브**: "하버드 협상강의", "리더십 특강" 등\n- **팟캐스트**: "성공하는 사람들의 대화", "경영 인사이트"\n- **온라인 강의**: 코세라의 리더십, 협상 관련 강의\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*',
-    final_goal: '당신 성장의 최종 목표는, 단순히 갈등을 피하고 중재하는 조정자를 넘어, 다양한 이해관계를 조화시키면서도 명확한 방향성을 제시하는 **\'통합형 리더\'**가 되는 것입니다. 당신의 포용력과 현실감각이 강력한 추진력과 만나 큰 변화를 이끌어낼 때 진정한 성취를 경험하게 될 것입니다.'
-  },
-
-  CTAS: {
-    name: '애국주의적 보수주의자',
-    category: 'political',
-    scores: {
-      '공동체주의': 85,
-      '전통주의': 80,
-      '적극적 평등': 75,
-      '안보 우선': 90
-    },
-    description: '당신은 입으로만 애국하고 행동하지 않는 사람들을 경멸하는 경향이 있습니다. 옳다고 믿는 가치와 내가 속한 공동체를 위해서라면, 직접 거리로 나가거나 목소리를 내는 것을 주저하지 않습니다. 불의를 보면 욱하는 다혈질적인 면도 있지만, 그 근간에는 순수한 열정과 의리가 자리 잡고 있습니다. 결국 당신을 움직이는 핵심 동력은 "내가 사랑하는 공동체를 내 손으로 직접 지키고 발전시키고 싶다는 뜨거운 애정"입니다.',
-    keywords: ['뜨거운가슴', '행동하는애국자', '의리충', '공동체수호자', '전통계승자'],
-    summary: '공동체의 결속(C)과 전통의 가치(T)를 바탕으로, 사회적 결속(A)과 강력한 국방(S)을 추구하는 전통적 보수주의에 가깝습니다.',
-    political_spectrum: '보수 (우파) 성향',
-    political_spectrum_detail: '당신은 **\'우리 공동체의 전통과 가치\'**를 지키는 것을 최우선으로 삼는 전통적인 보수주의 성향을 가지고 있습니다. 개인적 이익보다는 집단의 명예와 안전을 우선시하며, 검증된 전통과 관습을 통해 안정적인 사회를 만들어가려는 신념을 가지고 있습니다.\n\n이는 전통적인 의미의 **\'보수(우파)\'** 이념에 가깝습니다. 즉, 급진적 변화보다는 기존의 좋은 것들을 보존하고 발전시키면서, 강한 국가와 단결된 공동체를 통해 외부 위험으로부터 우리를 지키려는 관점입니다.',
-    detailed_description: '**이름은 \'애국주의적 보수주의자\', 그러나 진짜 정체는?**\n\n사실 당신의 진짜 정체는 \'현대판 무사\'입니다. 당신은 말로만 하는 사람들을 가장 싫어하고, 옳다고 믿는 가치를 위해서는 직접 행동에 나서는 것을 두려워하지 않는 사람입니다. SNS에서 논쟁이 벌어져도 "말로만 하지 말고 행동으로 보여라"라고 말하는 타입이죠.\n\n**관심사:** 국가의 명예, 전통문화 보존, 안보, 역사 교육, 공동체 결속\n\n**라이프스타일:** 전통을 소중히 여기며, 명분과 대의를 중시하고, 필요할 때는 개인적 손해를 감수하더라도 옳다고 믿는 일에 나서는 성격\n\n**정치적 성향:** 전통적 보수주의 + 강한 공동체 의식 + 행동하는 애국심',
-    strengths: [
-      '강한 소속감과 헌신: 자신이 속한 공동체를 위해서라면 개인적 희생도 마다하지 않는 강한 의무감을 가지고 있습니다.',
-      '뜨거운 열정과 행동력: 옳다고 믿는 일에 대해서는 말로만 하지 않고 직접 행동으로 실천하는 추진력이 있습니다.',
-      '명확한 선악관: 복잡하게 생각하지 않고 옳고 그름을 명확하게 구분하여 일관성 있는 행동을 보입니다.',
-      '강력한 결집력: 공동의 목표를 위해 사람들을 하나로 모으고 단결시키는 카리스마가 있습니다.',
-      '의리와 신의: 한번 맺은 관계나 약속을 끝까지 지키며, 배신하지 않는 신뢰할 만한 성격입니다.'
-    ],
-    weaknesses: [
-      '흑백논리: 복잡한 문제도 단순하게 이분법적으로 판단하여, 중간 지대나 회색 영역을 인정하지 않는 경향이 있습니다.',
-      '과도한 감정 표출: 불의를 보면 참지 못하고 감정적으로 반응하여 상황을 더 악화시킬 수 있습니다.',
-      '배타성: 우리 편과 남의 편을 명확히 구분하여, 다른 집단에 대해 배타적이거나 적대적일 수 있습니다.',
-      '역사 인식의 편향성: 우리 역사의 좋은 면만 보려 하고 부정적인 면은 인정하지 않으려는 경향이 있습니다.',
-      '권위주의 성향: 질서와 위계를 중시하다가 때로는 권위주의적이거나 독단적으로 보일 수 있습니다.'
-    ],
-    speech_style: '**"우리가 이래도 되는 거야?"라는 말을 자주 하는 사람**\n\n당신은 대화할 때 공동체의 명예나 전통적 가치를 기준으로 판단하는 경우가 많습니다. 개인적 이익보다는 집단의 대의와 명분을 앞세우며, 가끔 감정이 앞서서 목소리가 커지기도 해요.\n\n**특징:**\n- "우리 조상들은 그런 분들이 아니야"\n- "나라를 생각하면..."\n- "전통이 있는 이유가 있어"\n\n이런 식으로 항상 공동체와 전통의 가치를 강조하며 대화하는 스타일입니다.',
-    stress_moment: '**가장 스트레스 받는 순간: "그런 게 왜 중요해?" 듣기**\n\n당신이 가장 답답해하는 순간은 전통이나 공동체의 가치를 소중히 여기지 않는 사람들을 만날 때입니다. 특히 "그런 옛날 것들이 지금 왜 필요해?"라는 식의 반응을 들으면 크게 화가 납니다.',
-    solution: '**솔루션: "구체적 사례"로 설명하기**\n\n전통의 가치를 이해하지 못하는 사람들에게는 추상적인 이야기보다, "이런 일이 있었는데, 그때 이런 전통 덕분에..."라며 구체적인 역사적 사례나 실제 경험담을 들어서 설명하면 더 설득력이 있습니다.',
-    love_value: '**연애 가치관: "평생 동반자"**\n\n당신에게 이상적인 연애는 서로를 끝까지 지켜주는 든든한 동반자 관계입니다.\n\n**중요하게 생각하는 것들:**\n- **충성심**: 어떤 어려움이 와도 서로를 배신하지 않는 신의\n- **가족 중심**: 연애도 중요하지만 가족과의 관계를 소중히 여기는 사람\n- **전통적 가치**: 급진적이거나 파격적인 것보다는 검증된 가치관을 공유하는 사람\n- **책임감**: 말과 행동이 일치하고 약속을 지키는 신뢰할 만한 사람\n\n**데이트 스타일**: 화려하거나 자극적인 것보다는 의미 있고 진정성 있는 만남을 선호합니다.',
-    best_partner: '**최고의 연애 파트너: CTUE (중도 보수주의자)**\n\n**왜 잘 맞나요?**\n\nCTUE는 당신의 열정적인 면을 이해하면서도 때로는 진정시켜줄 수 있는 안정적인 파트너입니다. 당신이 "이건 절대 양보할 수 없어!"라고 말하면, CTUE는 "마음은 이해하지만 방법을 바꿔보자"라며 현명한 조언을 해줄 거예요.\n\n**함께 하면 좋은 활동:**\n- 전통문화 체험이나 역사 탐방\n- 가족 단위 모임이나 행사\n- 지역사회 봉사활동\n- 의미 있는 기념일 챙기기',
-    worst_partner: '**최악의 갈등 상대: IPAE (진보적 자유주의자)**\n\n**왜 갈등이 생기나요?**\n\nIPAE의 변화 지향적이고 개방적인 가치관은 당신의 전통 중시와 안정성 추구와 정면으로 충돌할 수 있습니다. 기본적인 가치관 자체가 다르기 때문에 대화가 평행선을 달릴 가능성이 높습니다.\n\n**구체적인 갈등 상황:**\n- 당신: "전통을 지켜야 해"\n- IPAE: "시대에 맞게 바꿔야지"\n- 당신: "우리나라부터 잘 하자"\n- IPAE: "글로벌 시대에 그게 무슨 소리야"',
-    communication_barrier: '**소통의 벽: 당신이 진보 성향과 대화할 때 답답함을 느끼는 이유**\n\n혹시 변화를 추구하고 전통에 비판적인 사람들과 대화할 때, "왜 우리 것을 그렇게 싫어할까?"라는 답답함을 느낀 적이 있나요?\n\n**이유:**\n- **당신**: 전통과 안정 중심 → "검증된 것이 안전해"\n- **진보 성향**: 변화와 개방 중심 → "새로운 것을 시도해봐"\n\n**예시 대화:**\n- 당신: "우리 전통이 소중한데 왜 바꾸려고 해?"\n- 진보주의자: "시대에 맞지 않는 건 바뀌어야지"\n- 당신: "조상들의 지혜를 무시하는 거야"\n- 진보주의자: "맹목적으로 따르면 발전이 없어"\n\n이런 식으로 보존을 중시하는 당신과 혁신을 추구하는 상대방이 서로의 가치를 이해하지 못하게 됩니다.',
-    career_value: '**돈과 일에 대한 태도: "명예로운 일"**\n\n당신에게는 단순히 돈을 많이 버는 것보다는 **"사회에 의미 있는 기여를 하는 일"**이 더 중요합니다.\n\n**선호하는 직장 문화:**\n- 명확한 위계질서와 체계가 있는 조직\n- 전통과 신뢰를 중시하는 회사\n- 사회적 책임을 다하는 기업\n- 장기근속을 우대하고 충성심을 인정해주는 곳\n\n**적성에 맞는 분야:**\n- 공무원/공공기관\n- 군인/경찰관\n- 교육 분야\n- 은행/금융\n- 제조업\n- 건설업\n\n**피하고 싶은 직장:**\n급변하고 불안정한 업계, 개인주의가 강한 스타트업, 전통을 무시하는 조직',
-    financial_style: '**잠재적 재무 스타일: "안정 추구형 보수 투자자"**\n\n당신의 투자 철학은 **"안전하고 검증된 것이 최고"**입니다.\n\n**투자 성향:**\n- **예금/적금**: 원금 보장되는 안전한 저축\n- **국공채**: 국가가 보장하는 채권 선호\n- **대기업 주식**: 오랫동안 검증된 우량 기업\n- **부동산**: 전통적으로 안전한 실물자산\n\n**소비 패턴:**\n- 품질 좋은 것을 오래 사용\n- 브랜드보다는 실용성 중시\n- 가족을 위한 지출 우선\n- 전통적인 가치를 담은 제품 선호\n\n**주의할 점:**\n너무 안전만 추구하다가 인플레이션을 이기지 못할 수 있어요. 어느 정도 위험은 감수해야 자산이 늘어납니다.',
-    historical_avatar: '**역사적 아바타: 이순신 (조선 명장)**\n\n**왜 이순신인가요?**\n\n이순신은 나라가 위기에 처했을 때 개인의 안위보다 공동체를 위해 몸을 바친 대표적인 인물입니다.\n\n**당신과의 공통점:**\n- **희생정신**: 개인보다는 공동체를 위한 헌신\n- **불굴의 의지**: 어려움 앞에서도 굴복하지 않는 강인함\n- **전통 중시**: 조선의 가치와 전통을 지키기 위한 노력\n- **실천하는 애국**: 말로만 하지 않고 행동으로 보여준 진정한 애국\n\n**배울 점:**\n이순신은 강직했지만 융통성도 있었습니다. 원칙을 지키되, 상황에 맞는 전략적 사고도 필요하다는 것을 보여줬죠.',
-    real_avatar: '**현실 속 아바타: "지역사회 리더"**\n\n**누구를 말하는 건가요?**\n\n지역사회에서 전통을 지키고 공동체를 위해 봉사하는 사람들입니다.\n\n**특징:**\n- **공동체 의식**: 지역발전을 위한 활동 참여\n- **전통 계승**: 지역 문화와 역사 보존 노력\n- **솔선수범**: 말보다는 행동으로 모범을 보임\n- **든든함**: 어려울 때 의지할 수 있는 신뢰감\n\n**예시:**\n- 동네 이장이나 통장\n- 전통문화 보존회 회장\n- 향군이나 재향군인회 간부\n- 지역 시민단체 리더\n\n**당신이 지향할 방향:**\n감정에만 의존하지 말고, 합리적 사고와 전략적 접근으로 더 큰 변화를 만들어보세요.',
-    growth_direction: '**개인적 성장과 자기계발**\n\n당신의 가장 큰 강점은 **"공동체를 위한 헌신과 실천력"**입니다. 하지만 이 강점이 더 큰 영향력을 발휘하려면 감정적 판단을 줄이고 전략적 사고를 늘려야 합니다.\n\n**성장 방향:**\n\n**1. 감정 조절 능력**\n- **현재:** 불의를 보면 즉시 감정적 반응\n- **목표:** 냉정한 판단 후 효과적인 대응\n\n**2. 포용적 리더십**\n- **현재:** 우리편/남의편 구분이 명확\n- **목표:** 다양성을 인정하면서도 단결시키는 능력\n\n**3. 전략적 사고**\n- **현재:** 정면승부만 고집\n- **목표:** 상황에 맞는 유연한 전술 구사\n\n**구체적인 액션 플랜:**\n- 다른 관점을 가진 사람들과 대화하기\n- 역사 공부를 통한 전략적 사고 키우기\n- 감정 조절을 위한 명상이나 운동',
-    growth_task: '\'감정적 애국\'에서 \'전략적 애국\'으로 발전하기',
-    recommended_books: [
-      {title: '징비록', author: '유성룡'},
-      {title: '난중일기', author: '이순신'},
-      {title: '삼국지', author: '나관중'},
-      {title: '역사의 교훈', author: '윌 듀런트'}
-    ],
-    recommended_content: '📚 추천 도서: 『총, 균, 쇠』 <a href="https://link.coupang.com/a/c5SMhH" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">https://link.coupang.com/a/c5SMhH</a>\n\n📚 추천 도서: 『리더십 불변의 법칙』 <a href="https://link.coupang.com/a/c5SLmg" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">https://link.coupang.com/a/c5SLmg</a>\n\n📚 추천 도서: 『삼국지』 (나관중): <a href="https://link.coupang.com/a/c4m9Zt" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n📚 추천 도서: 『역사의 교훈』 (윌 듀런트): <a href="https://link.coupang.com/a/c4naqO" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n🎬 추천 영상/강의:\n\n- 다큐멘터리: KBS 역사저널 그날, "이순신의 리더십"\n- 유튜브: "설민석의 한국사", "최태성의 한국사" 등\n- 팟캐스트: "역사 팟캐스트", "전쟁사 이야기"\n- 온라인 강의: 한국사 강의, 리더십 개발 프로그램\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*',
-    final_goal: '당신 성장의 최종 목표는, 감정적 애국심을 넘어서 전략적이고 포용적인 리더십으로 진정한 공동체 발전을 이끄는 **\'현명한 애국자\'**가 되는 것입니다. 당신의 뜨거운 가슴이 차가운 머리와 만날 때, 진짜로 나라와 공동체를 위한 큰 일을 해낼 수 있을 것입니다.'
-  },
-
-  CTUE: {
-    name: '중도 보수주의자',
-    category: 'political',
-    scores: {
-      '공동체주의': 75,
-      '전통주의': 80,
-      '보편적 평등': 70,
-      '협력 우선': 75
-    },
-    description: '당신은 갈등 상황에서 흥분하기보다, "자, 양쪽 이야기 다 들어봅시다"라고 말하며 중재에 나서는 사람입니다. 공동체의 평화와 신뢰를 중요하게 생각하며, 이를 위해 모두가 수긍할 수 있는 공정한 원칙을 세우고 지키는 것을 최우선으로 여깁니다. 결국 당신을 움직이는 핵심 동력은 "균형과 안정을 통해 공동체를 예측 가능하고 살기 좋은 곳으로 만들려는 소망"입니다.',
-    keywords: ['균형추', '중재자', '신뢰할수있는', '안정추구', '현실주의자'],
-    summary: '공동체의 결속(C)과 전통의 지혜(T)를 바탕으로, 보편적 복지(U)와 평화적 협력(E)을 추구하는 온건한 보수주의에 가깝습니다.',
-    political_spectrum: '중도 보수 성향',
-    political_spectrum_detail: '당신은 급진적인 변화보다는 **\'점진적이고 안정적인 발전\'**을 선호하는 온건한 보수주의 성향을 가지고 있습니다. 전통적 가치를 존중하되 시대의 요구에 맞는 합리적 개선을 추구하며, 사회 갈등보다는 합의와 조화를 중시합니다.\n\n이는 **\'중도 보수\'** 성향으로, 보수의 안정성과 진보의 합리성을 적절히 결합하려는 관점입니다. 독일의 기민당이나 영국의 보수당 같은 주류 보수정당의 온건파와 유사한 정치적 지향을 가지고 있습니다.',
-    detailed_description: '**이름은 \'중도 보수주의자\', 그러나 진짜 정체는?**\n\n사실 당신의 진짜 정체는 \'공동체의 현명한 어른\'입니다. 당신은 열정적으로 자신의 의견을 주장하기보다는, 모든 사람의 이야기를 차분히 들어보고 가장 합리적이고 공정한 결론을 찾아내려는 사람입니다. 회사 회의에서도 "잠깐, 반대 의견도 들어볼까요?"라며 균형 잡힌 시각을 제시하는 타입이죠.\n\n**관심사:** 사회 안정, 공정한 제도, 지속가능한 발전, 세대간 화합, 전통과 혁신의 조화\n\n**라이프스타일:** 급작스러운 변화보다는 검증된 것을 선호하며, 신중하고 책임감 있는 태도로 일관성 있게 살아가는 성격\n\n**정치적 성향:** 온건 보수 + 현실적 합리주의 + 사회통합 추구',
-    strengths: [
-      '안정적인 관리 능력: 예측 가능하고 일관성 있는 방식으로 일을 처리하며, 신뢰할 수 있는 결과를 만들어냅니다.',
-      '높은 신뢰성: 말과 행동이 일치하며, 약속을 지키고 책임감 있게 행동하여 주변 사람들의 신뢰를 얻습니다.',
-      '갈등 중재 능력: 서로 다른 의견을 가진 사람들 사이에서 공정한 중재자 역할을 하며 갈등을 해결합니다.',
-      '존중하는 태도: 다른 사람의 의견과 입장을 진심으로 존중하며, 편견 없이 대화에 임합니다.',
-      '현실 감각: 이상보다는 현실을 바탕으로 판단하며, 실현 가능한 대안을 제시하는 능력이 있습니다.'
-    ],
-    weaknesses: [
-      '변화에 대한 둔감성: 새로운 변화나 혁신에 대해 지나치게 신중하여 기회를 놓치는 경우가 있습니다.',
-      '과도한 신중함: 모든 것을 너무 꼼꼼히 검토하려다가 결정이 지연되거나 기회를 잃을 수 있습니다.',
-      '열정과 비전 부족: 안정을 중시하다가 때로는 필요한 추진력이나 혁신적 아이디어가 부족할 수 있습니다.',
-      '기득권 옹호 경향: 기존 시스템의 장점만 보고 필요한 개혁에 소극적일 수 있습니다.',
-      '매력 부족: 안전한 선택을 선호하다가 때로는 지루하거나 재미없다는 인상을 줄 수 있습니다.'
-    ],
-    speech_style: '**"양쪽 다 일리가 있으니, 차근차근 생각해봅시다"라는 말을 자주 하는 사람**\n\n당신은 대화할 때 성급하게 결론을 내리기보다는 모든 측면을 고려해보자고 제안하는 편입니다. 감정적으로 치우치지 않고 객관적이고 공정한 시각을 유지하려고 노력해요.\n\n**특징:**\n- "서두르지 말고 신중하게 생각해봐요"\n- "이런 관점에서도 봐야 할 것 같은데요"\n- "검증된 방법이 있는지 알아봅시다"\n\n이런 식으로 항상 균형과 신중함을 강조하며 대화하는 스타일입니다.',
-    stress_moment: '**가장 스트레스 받는 순간: "지금 당장 결정해!" 압박받기**\n\n당신이 가장 답답해하는 순간은 충분히 검토할 시간도 없이 성급하게 결정을 내리라고 압박받을 때입니다. 특히 "빨리빨리" 문화나 즉석에서 선택을 강요받는 상황에서 큰 스트레스를 받습니다.',
-    solution: '**솔루션: "최소한의 검토 시간" 요청하기**\n\n급한 결정을 요구받을 때는 "5분만 시간을 주시면 더 나은 답을 드릴 수 있어요"라며 최소한의 검토 시간을 요청하세요. 그리고 그 시간 안에 핵심 사안만 빠르게 정리해서 합리적인 판단을 내리는 연습을 하면 됩니다.',
-    love_value: '**연애 가치관: "믿을 수 있는 동반자"**\n\n당신에게 이상적인 연애는 서로를 신뢰하고 존중하며 안정적으로 함께 성장해가는 관계입니다.\n\n**중요하게 생각하는 것들:**\n- **신뢰성**: 약속을 지키고 거짓말하지 않는 정직한 사람\n- **안정성**: 감정의 기복이 심하지 않고 예측 가능한 행동을 하는 사람\n- **상호 존중**: 서로의 의견과 개성을 인정하고 존중하는 관계\n- **점진적 발전**: 급작스러운 변화보다는 천천히 함께 성장하는 관계\n\n**데이트 스타일**: 자극적이거나 모험적인 것보다는 편안하고 안정적인 시간을 함께 보내는 것을 선호합니다.',
-    best_partner: '**최고의 연애 파트너: CTAE (실용주의적 공동체주의자)**\n\n**왜 잘 맞나요?**\n\nCTAE는 당신의 신중한 성향을 이해하면서도 적절한 추진력을 제공해줄 수 있는 파트너입니다. 당신이 "좀 더 생각해보자"라고 말하면, CTAE는 "맞아, 그런데 이런 현실적인 방법도 있어"라며 건설적인 대안을 제시해줄 거예요.\n\n**함께 하면 좋은 활동:**\n- 박물관이나 전시회 관람\n- 독서모임이나 토론회 참가\n- 계획적인 여행이나 나들이\n- 지역사회 봉사활동',
-    worst_partner: '**최악의 갈등 상대: IPAS (급진적 자유주의자)**\n\n**왜 갈등이 생기나요?**\n\nIPAS의 즉흥적이고 급진적인 성향은 당신의 신중하고 안정적인 접근 방식과 정면으로 충돌할 수 있습니다. 변화의 속도와 방식에서 지속적인 의견 차이가 발생할 가능성이 높습니다.\n\n**구체적인 갈등 상황:**\n- 당신: "좀 더 신중하게 접근해보자"\n- IPAS: "지금이 기회야, 바로 결정하자"\n- 당신: "검증된 방법을 써보면 어떨까?"\n- IPAS: "새로운 방법을 시도해봐야지"',
-    communication_barrier: '**소통의 벽: 당신이 급진적 성향과 대화할 때 답답함을 느끼는 이유**\n\n혹시 매우 열정적이고 즉흥적인 사람들과 대화할 때, "왜 그렇게 성급하게 굴까?"라는 답답함을 느낀 적이 있나요?\n\n**이유:**\n- **당신**: 신중함과 안정 중심 → "차근차근 생각해보자"\n- **급진적 성향**: 열정과 즉시성 중심 → "지금 당장 행동하자"\n\n**예시 대화:**\n- 당신: "이런 부작용도 고려해야 하지 않을까요?"\n- 급진주의자: "너무 걱정만 하면 아무것도 못 해요"\n- 당신: "검증된 사례를 좀 더 알아보고 나서..."\n- 급진주의자: "완벽한 때는 없어요, 일단 시작해요"\n\n이런 식으로 신중함을 추구하는 당신과 즉시성을 중시하는 상대방이 서로 답답함을 느끼게 됩니다.',
-    career_value: '**돈과 일에 대한 태도: "안정적이고 의미 있는 일"**\n\n당신에게는 **"예측 가능하면서도 사회에 도움이 되는 일"**이 가장 이상적입니다.\n\n**선호하는 직장 문화:**\n- 체계적이고 안정적인 조직 운영\n- 공정하고 투명한 평가 시스템\n- 상호 존중하는 수평적 문화\n- 장기적 비전을 가진 회사\n\n**적성에 맞는 분야:**\n- 공무원/공공기관\n- 금융/보험업\n- 교육 분야\n- 의료/복지\n- 대기업 관리직\n- 법무/행정\n\n**피하고 싶은 직장:**\n극도로 경쟁적인 환경, 불안정한 스타트업, 급변하는 트렌드 업계',
-    financial_style: '**잠재적 재무 스타일: "신중한 장기 투자자"**\n\n당신의 투자 철학은 **"안전하면서도 꾸준한 성장"**을 추구하는 것입니다.\n\n**투자 성향:**\n- **혼합형 펀드**: 주식과 채권을 적절히 섞은 상품\n- **배당주 투자**: 꾸준한 배당 수익을 주는 우량주\n- **정기 적금**: 매월 일정 금액 저축\n- **연금 상품**: 노후를 위한 장기 투자\n\n**소비 패턴:**\n- 계획적이고 신중한 소비\n- 품질과 가성비를 고려한 선택\n- 가족 중심의 지출 계획\n- 비상금 확보를 우선시\n\n**주의할 점:**\n너무 안전만 추구하다가 인플레이션을 이기지 못할 수 있어요. 적절한 위험을 감수하는 것도 필요합니다.',
-    historical_avatar: '**역사적 아바타: 정조 (조선 22대 임금)**\n\n**왜 정조인가요?**\n\n정조는 개혁의 필요성을 인정하면서도 급진적 변화보다는 점진적이고 안정적인 방식으로 조선을 발전시키려 했던 인물입니다.\n\n**당신과의 공통점:**\n- **점진적 개혁**: 급작스러운 변화보다는 단계적 개선 추구\n- **균형감각**: 신하들의 다양한 의견을 듣고 균형 잡힌 결정\n- **안정 추구**: 사회 갈등보다는 조화와 통합을 중시\n- **현실주의**: 이상과 현실 사이의 적절한 균형점 모색\n\n**배울 점:**\n정조는 신중했지만 필요한 때에는 과감한 결단도 내렸습니다. 균형 감각을 유지하되, 때로는 추진력도 발휘하는 지혜가 필요해요.',
-    real_avatar: '**현실 속 아바타: "신뢰받는 관리자"**\n\n**누구를 말하는 건가요?**\n\n조직에서 안정적으로 일을 처리하고 사람들로부터 신뢰받는 중간 관리자들입니다.\n\n**특징:**\n- **일관성**: 예측 가능하고 신뢰할 수 있는 업무 처리\n- **공정성**: 편견 없이 공평하게 사람들을 대하는 자세\n- **안정성**: 급작스러운 변화보다는 점진적 개선 추구\n- **조화**: 갈등 상황에서 중재자 역할 수행\n\n**예시:**\n- 대기업의 부서장이나 팀장\n- 공공기관의 관리직\n- 병원이나 학교의 행정 책임자\n- 금융기관의 지점장\n\n**당신이 지향할 방향:**\n안정성을 유지하되, 변화하는 시대에 맞는 적응력과 리더십을 기르세요.',
-    growth_direction: '**개인적 성장과 자기계발**\n\n당신의 가장 큰 강점은 **"신뢰성과 안정성"**입니다. 하지만 이 강점이 더 큰 영향력을 발휘하려면 변화에 대한 적응력과 추진력을 기를 필요가 있습니다.\n\n**성장 방향:**\n\n**1. 변화 적응력 기르기**\n- **현재:** 변화에 대한 경계심\n- **목표:** 변화의 기회도 볼 수 있는 유연성\n\n**2. 리더십 발휘하기**\n- **현재:** 중재자 역할에 만족\n- **목표:** 방향을 제시하고 이끄는 리더\n\n**3. 추진력 기르기**\n- **현재:** 너무 신중한 의사결정\n- **목표:** 적절한 속도로 결정하고 실행하는 능력\n\n**구체적인 액션 플랜:**\n- 새로운 분야에 대한 학습과 경험\n- 리더십 관련 교육이나 독서\n- 적절한 위험을 감수하는 연습하기',
-    growth_task: '\'안정\'에서 \'적응적 리더십\'으로 발전하기',
-    recommended_books: [
-      {title: '좋은 기업을 넘어 위대한 기업으로', author: '짐 콜린스'},
-      {title: '변화하는 세상의 불변하는 법칙', author: '존 맥스웰'},
-      {title: '성공하는 사람들의 7가지 습관', author: '스티븐 코비'},
-      {title: '조직의 재발견', author: '헨리 민츠버그'}
-    ],
-    recommended_content: '**📚 추천 도서:** **『좋은 기업을 넘어 위대한 기업으로』 (짐 콜린스):** <a href="https://link.coupang.com/a/c4nlnX" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**📚 추천 도서:** **『변화하는 세상의 불변하는 법칙』 (존 맥스웰):** <a href="https://link.coupang.com/a/c4m8BG" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**📚 추천 도서:** **『성공하는 사람들의 7가지 습관』 (스티븐 코비):** <a href="https://link.coupang.com/a/c4nbn4" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**📚 추천 도서:** **『조직의 재발견』 (헨리 민츠버그):** <a href="https://link.coupang.com/a/c4nceA" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:**\n\n- **TED Talks**: "Leadership in uncertainty", "Building trust"\n- **유튜브**: "경영학 강의", "리더십 개발" 등\n- **팟캐스트**: "성장하는 리더", "조직 관리의 지혜"\n- **온라인 강의**: 코세라의 조직관리, 리더십 강의\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*',
-    final_goal: '당신 성장의 최종 목표는, 단순히 안정을 유지하는 관리자를 넘어, 변화하는 시대에도 사람들이 믿고 따를 수 있는 **\'적응적 리더\'**가 되는 것입니다. 당신의 신뢰성과 안정성이 유연성과 추진력과 만날 때, 진정한 리더십을 발휘하게 될 것입니다.'
-  },
-
-  CTUS: {
-    name: '국가주의적 보수주의자',
-    category: 'political',
-    scores: {
-      '공동체주의': 90,
-      '전통주의': 85,
-      '보편적 평등': 70,
-      '안보 우선': 95
-    },
-    description: '당신은 모래 위에 성을 쌓기보다, 단단한 반석 위에 집을 짓기를 원하는 사람입니다. 즉흥적인 감정이나 유행을 따르기보다, 오랫동안 검증된 원칙과 규칙을 신뢰합니다. 당신에게 "질서"와 "안정"은 결코 고리타분한 단어가 아닌, 우리 모두를 지켜주는 가장 중요한 가치입니다. 결국 당신을 움직이는 핵심 동력은 "소중한 것들을 혼돈으로부터 지켜내려는 강한 책임감"입니다.',
-    keywords: ['철벽수호자', '원칙주의자', '질서수호', '강한나라', '전통수호자'],
-    summary: '강력한 공동체(C)와 확고한 전통(T)을 바탕으로, 체계적 복지(U)와 강력한 국방(S)을 추구하는 권위주의적 보수주의에 가깝습니다.',
-    political_spectrum: '강성 보수 (우파) 성향',
-    political_spectrum_detail: '당신은 전통적 가치와 강력한 국가를 무엇보다 중시하는 **\'권위주의적 보수주의\'** 성향을 가지고 있습니다. 개인의 자유보다는 공동체의 질서와 안전을 우선시하며, 검증되지 않은 변화보다는 오랫동안 검증된 전통과 제도를 신뢰합니다.\n\n이는 전통적인 **\'강성 보수(우파)\'** 이념으로, 급진적 변화나 사회 혼란을 강력히 경계하면서 강한 국가와 명확한 질서를 통해 사회 안정을 확보하려는 관점입니다.',
-    detailed_description: '**이름은 \'국가주의적 보수주의자\', 그러나 진짜 정체는?**\n\n사실 당신의 진짜 정체는 \'현대판 수문장\'입니다. 당신은 혼돈과 무질서를 가장 경계하며, 모든 것이 제자리에 있고 예측 가능한 상태를 만들고 유지하는 것에서 안정감을 느끼는 사람입니다. 회사에서도 "규정대로 하시죠"라고 말하며 원칙을 고수하는 타입이죠.\n\n**관심사:** 국가 안보, 법과 질서, 전통 문화, 사회 안정, 체계와 규율\n\n**라이프스타일:** 계획적이고 규칙적인 생활을 선호하며, 예측 가능하고 안정적인 환경에서 최고의 능력을 발휘하는 성격\n\n**정치적 성향:** 강성 보수주의 + 권위주의적 질서 + 강력한 국가관',
-    strengths: [
-      '강력한 책임감: 자신에게 맡겨진 일이나 역할에 대해 끝까지 책임지려는 강한 의무감을 가지고 있습니다.',
-      '불굴의 원칙주의: 어떤 상황에서도 자신이 옳다고 믿는 원칙을 굽히지 않는 확고한 신념을 가지고 있습니다.',
-      '위기 상황에서의 침착함: 혼란스러운 상황에서도 당황하지 않고 냉정하게 상황을 판단하고 대처합니다.',
-      '질서 확립 능력: 무질서한 상황을 체계적으로 정리하고 안정적인 시스템을 구축하는 능력이 뛰어납니다.',
-      '높은 예측 가능성: 일관성 있는 행동으로 주변 사람들이 당신의 반응을 예측할 수 있어 신뢰감을 줍니다.'
-    ],
-    weaknesses: [
-      '경직된 사고: 기존 방식에 너무 매몰되어 새로운 아이디어나 변화에 대해 거부감을 보일 수 있습니다.',
-      '권위주의적 성향: 위계질서를 중시하다가 때로는 독단적이거나 권위주의적으로 보일 수 있습니다.',
-      '공감 능력 부족: 원칙을 중시하다가 개별적 상황이나 감정적 요소를 간과할 수 있습니다.',
-      '혁신에 대한 저항: 검증되지 않은 새로운 시도나 실험을 위험하다고 여겨 혁신을 막을 수 있습니다.',
-      '다양성에 대한 불관용: 표준에서 벗어나는 것을 용납하기 어려워하며 획일성을 강요할 수 있습니다.'
-    ],
-    speech_style: '**"원칙대로 하는 게 맞습니다"라는 말을 자주 하는 사람**\n\n당신은 대화할 때 감정이나 상황적 요소보다는 규칙과 원칙을 기준으로 판단하는 경우가 많습니다. 명확하고 단호한 어조로 말하며, 애매한 표현보다는 확실한 결론을 선호해요.\n\n**특징:**\n- "규정에 따르면..."\n- "전례를 보면..."\n- "질서를 위해서는..."\n\n이런 식으로 항상 원칙과 질서를 강조하며 대화하는 스타일입니다.',
-    stress_moment: '**가장 스트레스 받는 순간: "융통성 좀 발휘해요" 듣기**\n\n당신이 가장 답답해하는 순간은 명확한 규칙이나 원칙이 있는데도 "상황에 따라 융통성을 발휘하자"는 식의 제안을 들을 때입니다. 원칙을 지키는 것이 장기적으로 더 좋다고 생각하는데 이를 이해받지 못할 때 스트레스를 받습니다.',
-    solution: '**솔루션: "원칙의 이유" 설명하기**\n\n원칙을 고수하려 할 때는 단순히 "규정이니까"라고 하지 말고, "이 원칙이 있는 이유는 이런 문제를 방지하기 위해서입니다"라며 구체적인 근거와 장기적 이익을 설명하면 더 설득력이 있습니다.',
-    love_value: '**연애 가치관: "평생 약속"**\n\n당신에게 이상적인 연애는 서로에 대한 확실한 약속과 신뢰를 바탕으로 한 안정적인 관계입니다.\n\n**중요하게 생각하는 것들:**\n- **확실한 약속**: 결혼을 전제로 한 진지하고 책임감 있는 관계\n- **전통적 가치**: 가족과 혈연을 중시하고 전통적인 역할을 인정하는 사람\n- **안정성**: 감정의 기복이나 변화보다는 일관되고 안정적인 사람\n- **신뢰성**: 말과 행동이 일치하고 약속을 철저히 지키는 사람\n\n**데이트 스타일**: 진부해 보일 수 있지만 의미 있고 격식을 갖춘 전통적인 데이트를 선호합니다.',
-    best_partner: '**최고의 연애 파트너: CTAS (애국주의적 보수주의자)**\n\n**왜 잘 맞나요?**\n\nCTAS는 당신의 원칙적인 성향을 이해하면서도 적절한 열정과 활력을 제공해줄 수 있는 파트너입니다. 당신이 "원칙을 지켜야 해"라고 말하면, CTAS는 "맞아, 그리고 우리가 직접 실천하자!"라며 함께 행동해줄 거예요.\n\n**함께 하면 좋은 활동:**\n- 전통 문화 행사나 기념일 참가\n- 역사 유적지 탐방\n- 가족 모임이나 공식적인 행사\n- 의미 있는 사회 활동이나 봉사',
-    worst_partner: '**최악의 갈등 상대: IPAE (진보적 자유주의자)**\n\n**왜 갈등이 생기나요?**\n\nIPAE의 변화 지향적이고 실험적인 성향은 당신의 안정성과 전통 중시와 근본적으로 충돌할 수 있습니다. 가치관 자체가 정반대여서 합의점을 찾기가 매우 어렵습니다.\n\n**구체적인 갈등 상황:**\n- 당신: "검증된 방법을 써야 해"\n- IPAE: "새로운 시도를 해봐야지"\n- 당신: "질서가 우선이야"\n- IPAE: "너무 경직되어 있어"\n- 당신: "안정이 중요해"\n- IPAE: "변화가 필요해"',
-    communication_barrier: '**소통의 벽: 당신이 진보 성향과 대화할 때 답답함을 느끼는 이유**\n\n혹시 변화를 추구하고 기존 질서에 의문을 제기하는 사람들과 대화할 때, "왜 멀쩡한 걸 굳이 바꾸려고 하지?"라는 답답함을 느낀 적이 있나요?\n\n**이유:**\n- **당신**: 질서와 안정 중심 → "현재 시스템이 안전해"\n- **진보 성향**: 변화와 혁신 중심 → "더 나은 방법이 있을 거야"\n\n**예시 대화:**\n- 당신: "지금까지 잘 해왔는데 왜 바꿔?"\n- 진보주의자: "더 좋은 방법이 있을 수도 있잖아"\n- 당신: "검증되지 않은 건 위험해"\n- 진보주의자: "시도해봐야 알 수 있지"\n- 당신: "혹시 문제가 생기면 어떻게 할래?"\n- 진보주의자: "그때 가서 해결하면 되지"\n\n이런 식으로 안전을 우선하는 당신과 도전을 추구하는 상대방이 평행선을 달리게 됩니다.',
-    career_value: '**돈과 일에 대한 태도: "사명감 있는 일"**\n\n당신에게는 **"국가나 사회에 기여하면서 안정적인 일"**이 가장 이상적입니다.\n\n**선호하는 직장 문화:**\n- 명확한 위계질서와 체계가 확립된 조직\n- 국가나 공공의 이익을 추구하는 기관\n- 전통과 규율을 중시하는 보수적 환경\n- 장기 근속과 충성도를 인정해주는 곳\n\n**적성에 맞는 분야:**\n- 공무원/공공기관\n- 군인/경찰/소방관\n- 법조계\n- 교육 분야 (특히 전통 교육)\n- 대기업 관리직\n- 국영기업\n\n**피하고 싶은 직장:**\n불안정하고 변화가 잦은 스타트업, 개인주의가 강한 조직, 전통을 경시하는 회사',
-    financial_style: '**잠재적 재무 스타일: "초안정형 보수 투자자"**\n\n당신의 투자 철학은 **"원금 보장이 최우선"**입니다.\n\n**투자 성향:**\n- **예금/적금**: 은행의 원금 보장 상품 선호\n- **국채**: 국가가 보장하는 가장 안전한 투자\n- **보험**: 미래 위험에 대비하는 각종 보장성 보험\n- **부동산**: 전통적이고 안전한 실물 자산\n\n**소비 패턴:**\n- 검증되고 신뢰할 수 있는 브랜드 선호\n- 유행보다는 실용성과 내구성 중시\n- 가족의 안전과 미래를 위한 지출 우선\n- 절약하고 저축하는 것을 미덕으로 여김\n\n**주의할 점:**\n너무 안전만 추구하다가 인플레이션도 이기지 못할 수 있어요. 최소한의 위험도 감수해야 자산이 보호됩니다.',
-    historical_avatar: '**역사적 아바타: 세종대왕 (조선 4대 임금)**\n\n**왜 세종대왕인가요?**\n\n세종대왕은 강력한 왕권과 체계적인 국가 시스템을 바탕으로 조선을 안정적으로 발전시킨 대표적인 성군입니다.\n\n**당신과의 공통점:**\n- **체계적 통치**: 명확한 원칙과 제도를 바탕으로 한 안정적 운영\n- **국가 우선**: 개인적 이익보다 국가 전체의 발전을 우선시\n- **질서 중시**: 계급과 예법을 중시하는 체계적 사회 운영\n- **전통 계승**: 기존의 좋은 것을 보존하면서 점진적 발전 추구\n\n**배울 점:**\n세종대왕은 보수적이었지만 혁신도 마다하지 않았습니다. 안정적 기반 위에서 필요한 개혁을 추진하는 지혜가 필요해요.',
-    real_avatar: '**현실 속 아바타: "공직자의 모범"**\n\n**누구를 말하는 건가요?**\n\n공직이나 공공부문에서 원칙과 규정을 철저히 지키며 국가와 국민을 위해 봉사하는 사람들입니다.\n\n**특징:**\n- **원칙 준수**: 개인적 편의보다 공정한 규정 적용\n- **사명감**: 국가와 공동체를 위한 강한 책임감\n- **안정성**: 예측 가능하고 신뢰할 수 있는 업무 처리\n- **체계성**: 모든 일을 절차와 원칙에 따라 처리\n\n**예시:**\n- 성실한 공무원이나 판사\n- 원칙을 지키는 군인이나 경찰\n- 교육 현장의 베테랑 교장\n- 대기업의 준법 담당자\n\n**당신이 지향할 방향:**\n원칙을 지키되, 시대 변화에 맞는 합리적 유연성도 발휘하는 현명한 리더가 되세요.',
-    growth_direction: '**개인적 성장과 자기계발**\n\n당신의 가장 큰 강점은 **"흔들리지 않는 원칙과 책임감"**입니다. 하지만 이 강점이 더 큰 영향력을 발휘하려면 시대 변화에 맞는 유연성과 포용성을 기를 필요가 있습니다.\n\n**성장 방향:**\n\n**1. 적응적 원칙주의**\n- **현재:** 모든 상황에 동일한 원칙 적용\n- **목표:** 핵심은 지키되 방법은 유연하게 조정\n\n**2. 포용적 리더십**\n- **현재:** 표준에서 벗어나는 것을 경계\n- **목표:** 다양성을 인정하면서도 질서를 유지\n\n**3. 미래 지향적 사고**\n- **현재:** 과거의 검증된 방식만 신뢰\n- **목표:** 새로운 변화도 수용할 수 있는 개방성\n\n**구체적인 액션 플랜:**\n- 다양한 관점을 가진 사람들과 대화하기\n- 새로운 분야에 대한 학습과 이해\n- 변화 관리에 대한 공부와 실습',
-    growth_task: '\'경직된 원칙\'에서 \'유연한 원칙\'으로 발전하기',
-    recommended_books: [
-      {title: '원칙', author: '레이 달리오'},
-      {title: '리더십의 순간', author: '마이클 유심'},
-      {title: '조직의 힘', author: '짐 콜린스'},
-      {title: '변화관리 이론과 실제', author: '존 코터'}
-    ],
-    recommended_content: '**📚 추천 도서:** **『원칙』 (레이 달리오):** <a href="https://link.coupang.com/a/c4nnLZ" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**📚 추천 도서:** **『리더십의 순간』 (마이클 유심):** <a href="https://link.coupang.com/a/c4m8BG" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**📚 추천 도서:** **『조직의 힘』 (짐 콜린스):** <a href="https://link.coupang.com/a/c4nlnX" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**📚 추천 도서:** **『생각에 관한 생각』 (다니엘 카너먼):** <a href="https://link.coupang.com/a/c4m65M" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:**\n\n- **다큐멘터리**: "위대한 리더들", "역사 속 통치자들"\n- **유튜브**: "리더십 강의", "조직관리 이론" 등\n- **팟캐스트**: "리더의 조건", "경영과 리더십"\n- **온라인 강의**: 코세라의 조직론, 리더십 개발 프로그램\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*',
-    final_goal: '당신 성장의 최종 목표는, 단순히 규칙을 고수하는 관리자를 넘어, 원칙은 지키되 시대 변화도 수용할 수 있는 **\'지혜로운 통치자\'**가 되는 것입니다. 당신의 확고한 원칙이 유연한 지혜와 만날 때, 진정으로 사람들이 따르고 존경하는 리더가 될 수 있을 것입니다.'
-  },
-
-  // 경제 유형 8개
-  GVE: {
-    name: '비전을 현실로 만드는 혁신가',
-    category: 'economic',
-    code: 'GVE',
-    nickname: '비전을 현실로 만드는 혁신가',
-    keywords: ['성장지향', '하이리스크하이리턴', '미래에베팅', '내사업', '타고난리더'],
-    scores: {
-      '성장 중시 vs 안정 중시': 95,
-      '비전 투자 vs 데이터 투자': 90,
-      '기업가 기질 vs 안정가 기질': 85
-    },
-    description: '당신은 세상을 바꾸려는 순수한 모험가입니다. 당신의 그래프에서 볼 수 있듯, 3가지 척도 모두에서 \'모험가\'의 특성이 압도적으로 나타납니다. 당신은 안정보다는 성장을, 분석보다는 비전을, 조직보다는 창업을 선호하는, 의심의 여지 없는 순수한 모험가입니다. 당신의 경제적 활동은 단순히 돈을 버는 행위를 넘어, 세상에 없던 가치를 만들고 스스로의 가능성을 증명해 보이는 거대한 게임과도 같습니다. 정해진 규칙을 따르는 것보다 새로운 규칙을 만드는 데서 희열을 느끼며, \'아무도 가보지 않은 길\'을 탐험하는 것을 즐깁니다. 결국 당신을 움직이는 핵심 동력은 "더 나은 미래는 내가 만들 수 있다"는 꺾이지 않는 확신입니다.',
-    strengths: [
-      '**미래를 예측하는 통찰력:** 당신은 현재의 데이터나 현상에 얽매이지 않고, 그 이면에 있는 거대한 변화의 흐름을 읽어내는 능력이 있습니다. 남들이 \'문제\'라고 인식하지 못하는 것을 \'기회\'로 발견하며, 세상이 앞으로 어떻게 변할지에 대한 강력한 비전을 제시하여 사람들을 이끕니다.',
-      '**두려움 없는 실행력:** 완벽한 계획을 세우느라 시간을 보내기보다, \'일단 저질러보고 배우자\'는 태도로 빠르게 실행에 옮깁니다. 당신에게 실패는 끝이 아니라, 비전을 현실로 만드는 과정에서 반드시 거쳐야 할 학습 단계일 뿐입니다.',
-      '**기회 포착 능력:** 안정된 시장의 작은 파이를 나누는 대신, 불확실하지만 성장 가능성이 폭발하는 새로운 시장(블루오션)에서 본능적으로 기회를 포착하는 재능이 있습니다.',
-      '**사람을 이끄는 카리스마:** 당신의 확신에 찬 비전과 긍정적인 에너지는 사람들에게 강력한 영감을 주며, 그들이 자신의 잠재력을 믿고 당신의 꿈에 기꺼이 동참하게 만드는 힘이 있습니다.',
-      '**빠른 회복탄력성:** 실패의 순간에 좌절하며 시간을 보내기보다, 그 원인을 빠르게 분석하고 다음 도전을 위한 교훈으로 삼는 뛰어난 회복탄력성을 가지고 있습니다.'
-    ],
-    weaknesses: [
-      '**현실감각 부재:** 당신의 위대한 비전은 때로 현실의 디테일(현금 흐름, 법률 문제, 실무적 제약)을 간과하게 만듭니다. \'어떻게든 되겠지\'라는 낙관주의가, 발밑에 있는 위험을 보지 못하게 만드는 가장 큰 원인이 될 수 있습니다.',
-      '**과도한 리스크 감수:** \'모 아니면 도\'라는 생각으로, 감당할 수 없는 리스크를 짊어져 단 한 번의 실패로 모든 것을 잃을 수 있습니다. 성공의 가능성만 보고, 실패했을 때의 최악의 시나리오를 대비하지 않는 경향이 있습니다.',
-      '**성급한 판단:** 충분한 분석 없이 직관과 속도에만 의존하여, 명백한 위험 신호를 무시하고 잘못된 결정을 내릴 수 있습니다. "이거다!" 싶은 순간, 다른 모든 것을 잊어버릴 수 있습니다.',
-      '**안정에 대한 경시:** 성장이 정체된 안정적인 상황을 \'죽음\'과 동일시하여, 이미 이룬 성공을 지키고 관리하는 데 쉽게 지루함을 느낍니다. 이 때문에 끊임없이 새로운 도전만 찾아다니다가 가진 것을 잃을 수 있습니다.',
-      '**독선적인 리더십:** 자신의 비전에 대한 확신이 너무 강해, 팀원들의 현실적인 우려나 반대 의견을 \'도전 정신이 부족한 것\'으로 치부하며 무시할 수 있습니다. 당신의 열정이 때로는 폭력이 될 수 있음을 인지해야 합니다..'
-    ],
-    spectrum_analysis: '당신은 \'세상을 바꾸려는 순수한 모험가\'입니다.\n\n당신의 그래프에서 볼 수 있듯, 3가지 척도 모두에서 **\'모험가\'**의 특성이 압도적으로 나타납니다. 당신은 안정보다는 성장을, 분석보다는 비전을, 조직보다는 창업을 선호하는, 의심의 여지 없는 순수한 모험가입니다.',
-    detailed_analysis: '종합적으로 볼 때, 당신은 \'현재를 관리\'하는 사람이 아니라 **\'미래를 창조\'**하는 사람입니다. 당신의 경제적 활동은 단순히 돈을 버는 행위를 넘어, 세상에 없던 가치를 만들고 스스로의 가능성을 증명해 보이는 거대한 게임과도 같습니다.\n\n**직장이나 사업에서 당신은,** 정해진 규칙을 따르는 것보다 새로운 규칙을 만드는 데서 희열을 느낍니다. \'아무도 가보지 않은 길\'을 탐험하는 것을 즐기며, 현상 유지를 이야기하는 동료나 상사를 보면 답답함을 느낍니다. 당신은 안정적인 관리자보다, 리스크를 감수하더라도 판을 뒤엎을 수 있는 \'게임 체인저\'가 되기를 원합니다.\n\n**투자에 있어서도 당신의 이런 기질은 그대로 드러납니다.** 당신은 지난 10년간의 재무제표보다, 앞으로 10년간 세상을 바꿀 CEO의 비전에 더 큰돈을 베팅할 수 있습니다. 안정적인 배당주보다는, 성공 시 막대한 부를 가져다줄 초기 단계의 기술주나 암호화폐에서 당신의 심장이 뛰는 것을 느낍니다.\n\n**당신을 움직이는 가장 깊은 곳의 욕망은 \'자율성\'과 \'영향력\'입니다.** 누군가에게 통제받지 않고, 나 자신의 판단과 비전으로 세상에 의미 있는 흔적을 남기고 싶은 열망이 당신의 모든 경제적 결정을 이끌어 갑니다. 남들이 \'리스크\'라고 부르는 것을 당신은 \'기회\'라고 읽으며, 0에서 1을 만들어내는 과정에서 살아있음을 느끼는, 당신은 타고난 \'창조적 파괴자\'입니다.',
-    synergy_partner: '**🤝 시너지 파트너: `SWA` (조직의 파수꾼)**\n\n당신은 시장의 판도를 바꾸는 **\'비전 제시\'**와 **\'자원 유치(펀딩, 인재 영입)\'**에 극적인 강점을 보이는 반면, SWA는 안정적인 **\'시스템 구축\'**과 **\'재무 및 법률 리스크 관리\'**에 특화되어 있습니다. 왜냐하면, 당신의 폭발적인 성장 전략이 간과하는 운영상의 허점을 SWA의 데이터 기반 분석과 원칙주의가 완벽하게 보완해주기 때문입니다. 따라서, 당신이 \'CEO\'로서 외부 활동에 집중할 때, SWA는 내부 살림을 책임지는 \'최고운영책임자(COO)\'의 역할을 수행하며 가장 이상적인 시너지를 창출합니다.',
-    risk_partner: '**🔥 리스크 파트너: `GVE` (당신과 동일 유형)**\n\n당신과 동일한 유형의 파트너와 함께할 경우, 초기 아이디어 단계에서는 폭발적인 에너지를 냅니다. 하지만, 두 사람 모두 비전 제시에만 집중한 나머지, 실무적인 오퍼레이션과 리스크 관리는 누구도 책임지지 않는 상황이 발생합니다. 이는 마치, 뛰어난 공격수 두 명만으로 팀을 꾸려, 화려한 공격을 펼치다가 어이없는 수비 실수 하나로 무너지는 것과 같습니다. 서로의 약점을 전혀 보완해주지 못해 실패 확률이 극적으로 높아집니다.',
-    success_formula: '**💰 성공 공식: 부 = 비전(V) x 실행력(E)²**\n\n당신의 부는 세상에 없던 새로운 **\'비전(V)\'**을 제시하는 것에서 시작됩니다. 하지만 아이디어만으로는 부족합니다. 당신의 진정한 힘은, 실패를 두려워하지 않고 과감하게 **\'실행(E)\'**에 옮기는 데서 나옵니다. 특히 당신의 실행력은 한번의 성공에 그치지 않고, 실패의 경험을 자산 삼아 다음 도전을 더 강력하게 만드는 \'제곱\'의 효과를 발휘하여, 결국 누구도 따라올 수 없는 부를 창출하게 됩니다.\n\n**🚀 성공 전략 레벨업:**\n당신의 성공을 가속하기 위한 핵심은, 당신의 비전(V)을 단순히 \'설명\'하는 것을 넘어, 다른 사람들이 **\'체험\'**하게 만드는 것입니다. 시제품(Prototype)이나 데모 영상을 통해, 당신이 보는 미래를 다른 사람들의 눈앞에 생생하게 펼쳐 보이십시오. 사람들은 당신의 말을 믿는 것이 아니라, **당신이 보여주는 미래를 믿고 투자하게 될 것입니다.**',
-    failure_formula: '**💸 실패 공식: 파산 = (비전 + 과신) ÷ 리스크 관리(0)**\n\n반대로 당신의 실패는, 위대한 비전이 현실 감각 없는 **\'과신\'**으로 변질될 때 시작됩니다. \'나는 무조건 성공할 것\'이라는 믿음이, 당장의 현금흐름이나 시장의 위험 신호를 무시하게 만드는 것이죠. 여기에, 리스크 관리를 \'겁쟁이들의 변명\'이라 여기고 \'0\'으로 무시해버리면, 당신의 열정적인 엔진은 브레이크 없이 낭떠러지로 질주하게 됩니다.\n\n**🚨 치명적 리스크 경고:**\n당신에게 가장 치명적인 순간은, **초기 투자금 유치에 성공한 직후**입니다. 당신은 그 돈을 \'비전\'을 증명하는 데 모두 쏟아붓지만(과감한 마케팅, 최고의 인재 영입), 정작 \'수익 모델\'을 검증하는 것을 잊을 수 있습니다. 결국 **\'멋진 비전\'과 \'텅 빈 통장\'**만 남게 되는 것, 이것이 `GVE` 유형이 겪는 가장 흔하고 치명적인 실패 시나리오입니다.',
-    benchmarking: '### **성공 DNA 벤치마킹: 당신의 잠재력, \'스티브 잡스\'와 닮았다**\n\n**유사 인물:** **스티브 잡스 (Apple 창업자)**\n\n인물 소개: 차고에서 Apple을 창업하여 개인용 컴퓨터 시대를 열었고, 아이팟과 아이폰을 통해 인류의 라이프스타일을 완전히 바꾼, 시대를 상징하는 혁신가입니다.\n\n**[성공의 일대기: 0에서 1을 만든 GVE의 여정]**\n\n스티브 잡스는 주류 공학도가 아니었습니다. 그는 대학을 중퇴하고, 서체(Calligraphy) 수업을 듣는 등 자신만의 비전(V)을 따라 움직였습니다. 그는 \'기술\'이 아닌 \'인간\'을 중심에 놓고, \'누구나 쉽고 아름답게 쓸 수 있는 컴퓨터\'라는, 당시로서는 불가능해 보였던 꿈을 꾸었습니다.\n\n그의 여정은 순탄치 않았습니다. 현실과 타협하지 않는 그의 성격 때문에 자신이 만든 회사에서 쫓겨나는 최악의 실패를 겪기도 했습니다. 하지만 그는 좌절하는 대신, NeXT와 PIXAR를 연달아 성공시키며 자신의 비전이 틀리지 않았음을 증명해냈고(E), 결국 위기에 빠진 Apple로 돌아와 \'iMac\'을 시작으로 세상을 놀라게 할 혁신을 연달아 성공시켰습니다.\n\n그의 일대기는, **세상이 \'불가능하다\'고 말하는 것을 \'아직 오지 않은 미래\'라고 읽는** 당신 같은 GVE 유형이, 결국 어떻게 세상을 바꾸는지를 보여주는 완벽한 교과서입니다.\n\n**💡 차별점 및 시사점 (당신을 위한 인생 플랜 조언)**\n\n스티브 잡스 역시 \'현실 감각이 없다\', \'독선적이다\'라는 수많은 비판을 받았습니다. 하지만 그는 결국 자신의 비전을 믿고 밀어붙여 승리했습니다. **지금 당신의 머릿속에 있는 아이디어, 남들이 \'말도 안 된다\'고 비웃는 바로 그 비전이, 당신의 가장 강력한 무기일 수 있음을 잊지 마십시오.**\n\n다만, 그는 때로 지나친 독선으로 수많은 동료에게 상처를 주었습니다. 만약 당신의 정치 성향(P-Type)이 소통과 연대를 중시하는 **`IPAE`(진보적 자유주의자)**나 **`CPAE`(진보적 공동체주의자)**라면, 당신은 스티브 잡스의 단점마저 보완한 **\'더 위대한 리더\'**가 될 잠재력을 가졌습니다. 당신의 비전을 실현시키되, 그 과정에서 더 많은 사람들을 당신의 \'팬\'으로 만드십시오.',
-    career_navigation: '**커리어 네비게이션**\n\n- **추천 직업:**\n    - 스타트업 창업가 (특히 기술, 플랫폼, 콘텐츠 분야)\n    - 신사업 개발팀 / 사내벤처 총괄\n    - 벤처 투자자(VC) / 엔젤 투자자\n    - 브랜드 전략가 / 광고 기획자(AE)\n\n- **성장 로드맵: \'나만의 왕국\'을 건설하는 여정**\n    - **1단계: 주니어 레벨 (1~5년차) - \'성공\'이 아닌 \'학습\'을 목표로 하라.**\n        \n        이 시기의 당신에게 안정적인 직장은 독이 될 수 있습니다. 당신의 목표는 성공이 아닌, \'빠른 실패\'와 \'다양한 경험\'을 통해 창업에 필요한 핵심 역량을 흡수하는 것입니다. 유망한 스타트업에 합류하여, A부터 Z까지 모든 과정을 직접 경험하며 당신의 비전을 현실로 만드는 법을 배우십시오.\n        주의해야 할 함정: 성급한 퇴사. 충분한 경험과 네트워크 없이, 아이디어 하나만 믿고 창업 전선에 뛰어드는 것입니다.\n        \n    - **2단계: 시니어 레벨 (5~15년차) - 당신만의 \'작은 왕국\'을 증명하라.**\n        \n        이제 당신의 리더십과 비전을 증명해야 할 때입니다. 직접 창업을 하거나, 조직 내에서 신사업팀을 이끌어 \'매출\'이라는 구체적인 결과물로 당신의 가치를 보여주어야 합니다. 당신의 비전을 믿고 따라와 줄 초기 팀원을 모으는 것이 이 시기의 가장 중요한 과제입니다.\n        주의해야 할 함정: 독선적인 리더십. 당신의 비전이 너무 강한 나머지, 팀원의 현실적인 조언을 무시하고 혼자만의 길을 가는 것입니다.\n        \n    - **3단계: 엑스퍼트/리더 레벨 (15년차 이후) - \'생태계\'를 창조하라.**\n        \n        하나의 성공을 넘어, 당신의 성공 경험을 바탕으로 새로운 혁신가들을 키워내는 \'생태계\'를 만들어야 합니다. 직접 투자자(엔젤/VC)가 되어 후배 창업가를 양성하거나, 당신의 사업을 플랫폼으로 만들어 더 많은 사람들이 당신의 왕국에 참여하게 만드십시오. 당신의 최종 역할은 \'왕\'이 아닌 \'킹메이커\'입니다.\n        주의해야 할 함정: 초심 상실과 번아웃. 성공에 취해, 당신이 처음 왜 이 일을 시작했는지에 대한 \'진정성\'을 잃어버리는 것입니다.\n        \n- **🎯 핵심 성장 과제:** \'과정\'과 \'사람\'의 가치를 존중하기. 비전을 향한 빠른 실행력은 훌륭하지만, 때로는 동료나 파트너의 의견을 경청하고 과정의 디테일을 살피는 혜안이 필요합니다.',
-    recommended_books: [
-      {title: '제로 투 원', author: '피터 틸'},
-      {title: '그릿', author: '앤젤라 더크워스'}
-    ],
-    recommended_content: '**📚 추천 도서:** **『제로 투 원』 (피터 틸):** <a href="https://link.coupang.com/a/c4nwtT" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**📚 추천 도서:** **『그릿』 (앤젤라 더크워스):** <a href="https://link.coupang.com/a/c4nwQU" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:** 유튜브에서 **\'스타트업 성공 전략\', \'혁신 리더십\', \'실행력 강화\'** 관련 강의나 영상을 찾아보세요. 당신의 비전을 더욱 빠르고 효과적으로 현실화하는 데 필요한 실질적인 지식과 영감을 얻을 수 있습니다.\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*'
-  },
-
-  GVW: {
-    name: '미래를 예측하는 조직의 탐험가',
-    category: 'economic',
-    code: 'GVW',
-    nickname: '미래를 예측하는 조직의 탐험가',
-    keywords: ['성장지향', '비전', '안정추구', '신사업기획', '미래전략'],
-    scores: {
-      '성장 중시 vs 안정 중시': 80,
-      '비전 투자 vs 데이터 투자': 75,
-      '기업가 기질 vs 안정가 기질': 25
-    },
-    description: '당신은 \'성벽 안에서 별을 보는 몽상가\'입니다. 미래의 성장(G)과 비전(V)을 꿈꾸는 모험가의 심장을 가졌지만, 동시에 안정적인 조직(W)이라는 성벽 안에서 보호받기를 원하는 수호자의 현실 감각도 가지고 있습니다. 당신은 안정된 조직 내에서 누구보다 먼저 미래의 시장 변화와 새로운 기술 트렌드를 포착하는 \'레이더\'와 같은 능력을 가졌으며, 조직의 강점과 현실적인 자원을 바탕으로 한 \'실현 가능한 미래\'를 제시합니다. 때로는 조직의 보수적인 분위기 속에서 답답함을 느끼기도 하지만, 당신은 결코 미래에 대한 비전을 포기하지 않습니다. 결국 당신을 움직이는 핵심 동력은 "안정 속에서도 혁신은 가능하다"는 현실적인 이상주의입니다.',
-    strengths: [
-      '**미래 트렌드 예측:** 당신은 안정된 조직 내에서, 누구보다 먼저 미래의 시장 변화와 새로운 기술 트렌드를 포착하는 \'레이더\'와 같은 능력을 가졌습니다.',
-      '**안정적인 비전 제시:** 당신의 비전은 뜬구름 잡는 이야기가 아닌, 현재 조직의 강점과 현실적인 자원을 바탕으로 한 \'실현 가능한 미래\'입니다.',
-      '**높은 창의력:** 안정적인 환경 속에서, 기존의 자원을 새롭게 조합하여 리스크 없이 혁신적인 아이디어를 만들어내는 데 능숙합니다.',
-      '**지적인 설득력:** 당신의 아이디어는 깊이 있는 학습과 통찰을 기반으로 하므로, 동료와 보수적인 리더에게도 높은 신뢰를 주며 설득할 수 있습니다.',
-      '**낮은 실패 리스크:** 직접 모든 리스크를 짊어지지 않고, 조직의 지원을 받으며 아이디어를 실현하므로 실패에 대한 부담이 적어 더 안정적으로 도전할 수 있습니다.'
-    ],
-    weaknesses: [
-      '**실행 지연:** \'언젠가 창업해야지\', \'언젠가 이 아이디어를 제안해야지\'라고 생각만 하고, 안정적인 현재(W)를 떠나는 행동을 계속 미룰 수 있습니다. 꿈만 꾸는 \'사내 몽상가\'로 남을 위험이 있습니다.',
-      '**조직 내 고립:** 너무 앞서나가는 당신의 비전(V)을 동료들이 이해하지 못하여, \'현실 감각 없는 사람\'으로 취급받으며 고립될 수 있습니다.',
-      '**결정권의 부재:** 좋은 아이디어가 있어도, 최종 결정권을 가진 상사나 조직의 보수적인 문화 때문에 좌절되는 경험을 자주 할 수 있습니다.',
-      '**성취감 부족:** 성공의 과실을 온전히 내 것으로 가져오지 못하고 조직과 나누어야 한다는 점에서, 깊은 성취감을 느끼지 못할 수 있습니다.',
-      '**안주할 위험:** 조직의 안정적인 환경이 너무 편안한 나머지, 더 큰 잠재력을 실현할 기회를 스스로 포기하고 안주하게 될 수 있습니다.'
-    ],
-    spectrum_analysis: '당신은 \'성벽 안에서 별을 보는 몽상가\'입니다.\n\n당신은 미래의 성장(G)과 비전(V)을 꿈꾸는 **\'모험가\'**의 심장을 가졌지만, 동시에 안정적인 조직(W)이라는 성벽 안에서 보호받기를 원하는 **\'수호자\'**의 현실 감각도 가지고 있습니다. 이는 당신을 \'위험한 몽상가\'가 아닌, \'현실적인 탐험가\'로 만들어줍니다.',
-    detailed_analysis: '종합적으로 볼 때, 당신은 조직에 새로운 영감과 미래 방향성을 제시하는 \'등대\'와 같은 존재입니다. 당신은 회사의 미래 먹거리(G)가 무엇일지, 시장의 판도를 바꿀 새로운 기술(V)이 무엇인지 가장 먼저 탐색합니다.\n\n**직장이나 사업에서 당신은,** 안정적인 시스템(W) 안에서 미래의 가능성을 탐색하는 \'내부 탐험가\'입니다. 모두가 현재의 업무에 매몰되어 있을 때, 당신은 홀로 미래의 트렌드를 연구하고, "3년 뒤 우리 회사는 무엇을 해야 할까요?"라는 중요한 질문을 던집니다. 당신은 직접 배를 만들어 떠나는 선장(E)이 되기보다, 안전한 함대(W) 안에서 다음 항로를 제안하는 \'1등 항해사\'의 역할을 선호합니다.\n\n**투자에 있어서도 당신의 이런 기질은 그대로 드러납니다.** 당신은 시장을 지배하는 현재의 1등 기업보다, 지금은 작지만 미래에 1등이 될 가능성이 있는 \'차세대 기술\'이나 \'새로운 라이프스타일\'에 매력을 느낍니다. 하지만 동시에, 그 투자가 당신의 안정적인 자산을 위협할 만큼 과도해지는 것을 경계하는 현실적인 감각도 가지고 있습니다.\n\n**당신을 움직이는 가장 깊은 곳의 욕망은 \'안정적인 환경 속에서의 지적 탐험\'입니다.** 리스크를 감수하는 짜릿함보다, 남들이 보지 못하는 미래를 먼저 발견하고 그것을 조직의 성공에 기여하게 만드는 과정에서 가장 큰 성취감을 느끼는, 당신은 \'현실적인 몽상가\'입니다.',
-    synergy_partner: '**🤝 시너지 파트너: `GAE` (계산된 성장을 추구하는 전략 창업가)**\n\n당신이 조직 내에서 발견한 \'미래의 비전\'을, GAE는 가장 빠르고 효율적으로 현실의 \'사업 모델\'로 만들어 줄 최고의 파트너입니다. 왜냐하면, 당신이 \'무엇을(What)\'과 \'왜(Why)\'에 대한 창의적인 영감을 제공하면, GAE는 \'어떻게(How)\'와 \'얼마에(How much)\'에 대한 완벽한 실행 계획을 세우기 때문입니다. 이는 마치, 당신이 아무도 발견하지 못한 \'유전\'의 위치를 찾아내면, GAE는 가장 효율적인 시추 장비를 동원해 원유를 뽑아 올리는 것과 같은 완벽한 역할 분담입니다.',
-    risk_partner: '**🔥 리스크 파트너: `SAW` (리스크를 관리하는 조직의 파수꾼)**\n\n당신과 SAW의 파트너십은 끊임없는 제자리걸음으로 끝날 수 있습니다. 왜냐하면, 당신이 제시하는 모든 미래의 가능성을, SAW는 \'과거 데이터로 검증되지 않은 리스크\'로 판단하고 제동을 걸 것이기 때문입니다. 이는 마치, 최고의 탐험가가 신대륙을 발견하고 돌아왔지만, 항구의 안전 규정만을 따지는 신중한 관리자가 \'전례가 없다\'는 이유로 단 한 명의 선원도 보내주지 않는 것과 같은 상황입니다.',
-    success_formula: '**💰 성공 공식: 부 = (조직의 신뢰 x 미래 예측) + 작은 실행**\n\n당신의 부는 안정적인 조직(W) 안에서, 누구보다 먼저 미래(V)를 예측하고 그 비전을 공유하여 **\'신뢰\'**를 얻는 것에서 시작됩니다. 여기에, 비전을 보고서로만 남겨두는 것이 아니라, 조직의 자원을 활용하여 \'작은 프로토타입\'이라도 직접 만들어 증명해낼 때, 당신은 조직 내에서 가장 가치 있는 인재로 인정받고 큰 보상을 얻게 될 것입니다.\n\n**🚀 성공 전략 레벨업:**\n당신의 예측을 \'개인의 의견\'이 아닌 \'조직의 공식적인 자산\'으로 만드십시오. 정기적으로 **\'미래 트렌드 리포트\'**를 작성하여 내부적으로 공유하는 것을 시스템화하세요. 이는 당신을 단순한 실무자가 아닌, 조직의 미래를 책임지는 \'전략가\'로 각인시키는 가장 확실한 방법입니다.',
-    failure_formula: '**💸 실패 공식: 안주 = 위대한 비전 - 실행력(0)**\n\n하지만 당신의 실패는, 조직의 안정성(W)이라는 벽 뒤에 숨어, 위대한 비전을 머릿속에만 간직한 채 \'실행력\'이 \'0\'이 될 때 찾아옵니다. 당신의 완벽한 예측은 아무도 알아주지 않는 \'혼잣말\'이 되고, 당신은 결국 변화하지 못하는 조직과 함께 서서히 안주하게 됩니다.\n\n**🚨 치명적 리스크 경고:**\n당신에게 가장 치명적인 순간은, **당신의 아이디어가 마침내 인정받았지만 그 프로젝트의 리더가 되기를 거부할 때**입니다. 당신은 "저는 분석가이지, 리더가 아닙니다"라고 말하며 안정적인 자리로 돌아가려 할 수 있습니다. 하지만 진정한 성공의 과실은, 리스크를 감수하고 자신의 비전을 직접 실행한 사람에게만 돌아간다는 것을 기억해야 합니다.',
-    benchmarking: '### **성공 DNA 벤치마킹: 당신의 잠재력, \'구글의 20% 룰\'과 닮았다**\n\n**유사 인물/문화:** **구글(Google)의 \'20% 타임\' 문화**\n\n소개: 구글의 엔지니어들이 근무 시간의 20%를 자신의 핵심 업무가 아닌, 개인적으로 흥미로운 혁신적인 아이디어에 사용할 수 있도록 허락한 전설적인 사내 문화입니다. Gmail, 구글 뉴스 등이 이 문화를 통해 탄생했습니다.\n\n**[성공의 배경: 안정 속에서 탄생한 혁신의 여정]**\n\n구글은 이미 검색 엔진이라는 강력하고 안정적인(W) 사업을 가지고 있었습니다. 하지만 그들은 현재에 안주하지 않고, 직원들의 내면에 숨겨진 \'미래를 향한 비전(V)\'을 마음껏 펼칠 수 있는 제도적 장치를 만들었습니다. 직원들은 해고의 리스크 없이, 회사의 든든한 지원 아래 마음껏 새로운 아이디어를 실험하고 성장(G)시킬 수 있었습니다.\n\n이 \'20% 타임\' 문화는, **안정적인 시스템이 어떻게 창의적인 비전을 질식시키는 것이 아니라, 오히려 마음껏 피어날 수 있는 \'최고의 토양\'이 될 수 있는지**를 보여주는 완벽한 사례입니다.\n\n**💡 차별점 및 시사점 (당신을 위한 인생 플랜 조언)**\n\n많은 `GVW` 유형들은 자신의 혁신적인 아이디어가 안정적인 현실과 충돌한다고 생각하며 좌절합니다. 하지만 구글의 사례는 그 반대를 보여줍니다. **당신의 성공은 \'퇴사 후 창업\'이 아닌, \'현재 조직 안에서 당신만의 20% 타임을 확보하는 것\'에서 시작될 수 있습니다.**\n\n만약 당신의 정치 성향(P-Type)이 공동체의 화합을 중시하는 **`CTAE`(실용주의적 공동체주의자)**라면, 당신은 조직 내에서 가장 뛰어난 \'협상가\'가 되어 당신의 비전을 현실로 만들 자원을 얻어낼 수 있습니다. 당신의 비전을 조직의 목표와 연결하여, 먼저 지금 당장 당신의 비전을 실현하기 위해 하루에 최소 1시간의 시간을 확보하는 것부터 시작하십시오. 아침에 1시간 일찍 일어나거나, 퇴근 후 1시간만 투자하여 미래를 위한 작은 실험(관련 서적 읽기, 아이디어 구체화 등)을 꾸준히 해나가는 것입니다. 당신은 안정적인 월급을 받으며 세상을 바꿀 아이디어를 키워낼 수 있는, 가장 현명한 혁신가입니다.',
-    career_navigation: '**커리어 네비게이션**\n\n- **추천 직업:**\n    - 대기업/IT 기업의 미래 전략팀, 신사업 기획팀\n    - R&D 연구원 (특히 선행 기술 연구)\n    - 대학교수, 미래학 연구원\n    - 트렌드 분석가\n\n- **성장 로드맵: \'조직의 등대\'가 되는 여정**\n    - **1단계: 주니어 레벨 (1~5년차) - \'전문성\'과 \'데이터\'를 흡수하라.**\n        \n        이 시기의 목표는, 당신의 비전을 뒷받침할 수 있는 깊이 있는 \'전문 지식\'을 쌓는 것입니다. 안정적인 조직 안에서, 해당 산업의 핵심 데이터와 기술을 누구보다 빠르게 습득하고 당신의 것으로 만드십시오. 당신의 상상력은 전문성과 만났을 때 비로소 힘을 얻습니다.\n        주의해야 할 함정: 현실과 동떨어진 아이디어. 현장의 실무 경험 없이, 책상 위에서만 미래를 예측하여 \'뜬구름 잡는 소리\'만 한다는 평가를 받는 것입니다.\n        \n    - **2-단계: 시니어 레벨 (5~15년차) - \'내부 보고서\'로 영향력을 증명하라.**\n        \n        이제 당신의 통찰을 조직의 공식적인 자산으로 만들어야 합니다. 정기적으로 \'미래 트렌드 리포트\'나 \'신사업 제안서\'를 작성하여 내부적으로 공유하는 것을 시스템화하십시오. 당신의 보고서가 조직의 중요한 의사결정에 영향을 미치기 시작할 때, 당신의 가치는 증명됩니다.\n        주의해야 할 함정: 실행 의지 부족. 훌륭한 보고서를 쓰고도, "누군가 해주겠지"라며 실제 프로젝트로 연결하려는 적극적인 노력을 하지 않는 것입니다.\n        \n    - **3단계: 엑스퍼트/리더 레벨 (15년차 이후) - \'최고미래책임자(CFO)\'가 되어라.**\n        \n        당신은 조직의 장기적인 생존을 책임지는 \'최고미래책임자(Chief Future Officer)\' 또는 \'사내 자문\' 역할을 수행해야 합니다. 당신의 통찰력이 CEO의 중요한 결정에 나침반이 되고, 조직 전체가 미래를 대비할 수 있도록 이끄는 것이 당신의 최종 목표입니다.\n        주의해야 할 함정: 과거의 비전에 갇히는 것. 과거에 성공했던 자신의 예측 모델을 맹신한 나머지, 새로운 패러다임의 변화를 놓치고 \'낡은 현자\'가 되는 것입니다.\n        \n- **🎯 핵심 성장 과제:** \'개방적 사고\'로 시야 넓히기. 탐험가적 기질로 미래를 예측하는 능력은 뛰어나지만, 때로는 익숙한 길 밖의 의외의 발견을 놓칠 수 있습니다. 다양한 관점과 미지의 영역에 대한 개방성이 필요합니다.',
-    recommended_books: [
-      {title: '변화의 시작 5초의 법칙', author: '멜 로빈스'},
-      {title: '생각의 탄생', author: '로버트 루트번스타인, 미셸 루트번스타인'}
-    ],
-    recommended_content: '**📚 추천 도서:** **『변화의 시작 5초의 법칙』 (멜 로빈스):** <a href="https://link.coupang.com/a/c4nxt5" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**📚 추천 도서:** **『생각의 탄생』 (로버트 루트번스타인, 미셸 루트번스타인):** <a href="https://link.coupang.com/a/c4nx4z" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:** 유튜브에서 **\'미래학 트렌드\', \'거시 경제 분석\', \'선행 지표 분석\'** 관련 강의나 영상을 찾아보세요. 당신의 예측 능력을 데이터 기반의 통찰과 결합하여, 조직에 더욱 명확한 방향성을 제시하는 데 필요한 지식을 얻을 수 있습니다.\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*'
-  },
-
-  GAE: {
-    name: '계산된 성장을 추구하는 전략 창업가',
-    category: 'economic',
-    code: 'GAE',
-    nickname: '계산된 성장을 추구하는 전략 창업가',
-    keywords: ['데이터기반창업', '계산된리스크', '성장전략', '효율적확장', '시스템빌더'],
-    scores: {
-      '성장 중시 vs 안정 중시': 85,
-      '비전 투자 vs 데이터 투자': 20,
-      '기업가 기질 vs 안정가 기질': 90
-    },
-    description: "당신은 '계산이 끝난' 전쟁에만 참여하는 냉철한 모험가입니다. 당신은 새로운 영토를 정복하여 크게 성장하고 싶어하는 모험가이지만, 절대로 무모한 전투를 벌이지 않습니다. 모든 전투는 철저한 데이터 분석을 통해 승률이 충분히 높다고 계산되었을 때만 시작하는, 지극히 이성적인 전략가입니다. 당신은 감이나 직관이 아닌 시스템을 만들며, 직접 모든 일을 하기보다 당신의 전략을 가장 효율적으로 실행할 수 있는 시스템을 구축하고 그 시스템을 통해 사업을 확장해나가는 데서 가장 큰 성취감을 느낍니다. 결국 당신을 움직이는 핵심 동력은 '예측과 통제'입니다. 불확실한 미래를 당신의 분석력으로 예측하고, 계산된 전략을 통해 통제하여, 결국 성공이라는 필연적인 결과를 만들어내는 것. 당신에게 성공이란, 뜨거운 열정의 산물이 아니라 차가운 이성이 설계한 필연적인 결과입니다.",
-    strengths: [
-      '**데이터 기반의 높은 성공 확률:** 당신은 감이나 직관이 아닌, 철저한 데이터 분석을 통해 \'이길 수 있는 싸움\'만 골라서 합니다. 이 때문에 당신의 사업 성공 확률은 다른 유형보다 월등히 높습니다.',
-      '**효율적인 시스템 구축 능력:** 당신은 직접 모든 일을 하기보다, 당신의 전략을 가장 효율적으로 실행할 수 있는 시스템을 구축하고 자동화하는 데 능합니다.',
-      '**냉철한 판단력:** 시장의 거품이나 감성적인 비전에 흔들리지 않고, 오직 숫자가 보여주는 진실만을 믿는 냉철함을 가졌습니다.',
-      '**계산된 리스크 감수:** 당신은 리스크를 두려워하지 않지만, 절대로 무모한 도박은 하지 않습니다. 성공 시의 기대수익이 실패 시의 손실보다 월등히 높다고 계산되었을 때만 움직입니다.',
-      '**지적인 신뢰감:** 당신의 모든 주장은 데이터를 기반으로 하므로, 투자자나 팀원들에게 높은 지적인 신뢰감을 줍니다.'
-    ],
-    weaknesses: [
-      "**'타이밍' 상실:** 완벽한 데이터를 확보하고 시스템을 구축하는 데 너무 많은 시간을 쓴 나머지, 시장의 '골든타임'을 놓칠 수 있습니다.",
-      '**예측 불가능성에 대한 취약성:** 당신의 완벽한 시스템은, 데이터로 예측할 수 없는 갑작스러운 외부 충격(코로나, 전쟁 등) 앞에서는 무력해질 수 있습니다.',
-      "**인간적인 매력 부족:** 지나치게 효율과 시스템만 강조한 나머지, 팀원들에게 '차가운 기계'처럼 느껴져 그들의 마음을 얻는 데 실패할 수 있습니다.",
-      '**창의성 부족:** 데이터로 증명된 길만 가려 하기 때문에, 세상에 없던 새로운 길을 만들어내는 \'창의적인 도약\'을 하기 어렵습니다.',
-      "**작은 시장에 머무를 위험:** 데이터 분석이 용이한 '기존의 시장'을 개선하는 데는 능하지만, 아직 데이터가 존재하지 않는 '미지의 시장'을 개척하는 것을 주저할 수 있습니다."
-    ],
-    spectrum_analysis: '당신은 \'계산이 끝난\' 전쟁에만 참여하는 냉철한 모험가입니다.\n\n당신은 새로운 영토를 정복(E)하여 크게 성장(G)하고 싶어하는 \'모험가\'입니다. 하지만 GVE 유형과 달리, 당신은 절대로 무모한 전투를 벌이지 않습니다. 모든 전투는 철저한 데이터 분석(A)을 통해 승률이 충분히 높다고 계산되었을 때만 시작하는, 지극히 이성적인 전략가입니다.',
-    detailed_analysis: '종합적으로 볼 때, 당신은 \'뜬구름 잡는 비전\'이 아닌 **\'시장의 빈틈을 보여주는 데이터\'**에서 사업 기회를 포착하는 냉철한 전략가입니다. GVE가 "화성에 도시를 건설하자!"는 꿈에서 시작한다면, 당신은 "글로벌 소형 위성 운송 시장이 연 30%씩 성장하고 있으니, 이 시장을 공략해야 한다"는 데이터에서 사업을 시작합니다.\n\n**직장이나 사업에서 당신은,** 감이나 직관이 아닌 시스템을 만듭니다. 당신은 직접 모든 일을 하기보다, 당신의 전략을 가장 효율적으로 실행할 수 있는 시스템을 구축(A)하고, 그 시스템을 통해 사업을 확장(G, E)해나가는 데서 가장 큰 성취감을 느낍니다. 당신은 열정적인 혁명가보다, 전쟁에서 반드시 이기는 \'전략가\'가 되기를 원합니다.\n\n**투자에 있어서도 당신의 이런 기질은 그대로 드러납니다.** 당신은 \'대박\'이라는 단어를 신뢰하지 않습니다. 대신, 철저한 시장 분석과 경쟁사 분석을 통해 \'승률 80% 이상\'이라는 확신이 들 때만 과감하게 베팅합니다. 당신의 포트폴리오는 소수의 성장주에 집중될 가능성이 높으며, 그 모든 종목은 당신의 엄격한 데이터 분석을 통과한 것들입니다.\n\n**당신을 움직이는 가장 깊은 곳의 욕망은 \'예측과 통제\'입니다.** 불확실한 미래를 당신의 분석력으로 예측하고, 계산된 전략을 통해 통제하여, 결국 성공이라는 필연적인 결과를 만들어내는 것. 당신에게 성공이란, 뜨거운 열정의 산물이 아니라 **차가운 이성이 설계한 필연적인 결과**입니다.',
-    synergy_partner: '**🤝 시너지 파트너: `GVW` (미래를 예측하는 조직의 탐험가)**\n\n당신의 데이터 기반 전략에, GVW는 시장의 판도를 바꿀 \'창의적인 비전\'이라는 변수를 더해줄 수 있습니다. 왜냐하면, 당신이 \'어떻게 이길 것인가\'에 대한 완벽한 계획을 세울 때, 그는 \'어떤 전쟁터에서 싸울 것인가\'에 대한 새로운 관점을 제시하기 때문입니다. 그의 통찰력은 당신의 성공 규모를 한 단계 더 끌어올려 줄 것입니다.',
-    risk_partner: '**🔥 리스크 파트너: `SVE` (자신만의 속도로 세상을 바꾸는 사회적 기업가)**\n\n당신과 SVE의 파트너십은 사업의 \'목표\' 설정에서 근본적인 갈등을 겪을 수 있습니다. 왜냐하면, 당신은 \'수익 성장(G, A)\'을 최우선 목표로 삼는 반면, SVE는 \'사회적 가치(S, V)\'를 최우선 목표로 삼기 때문입니다. 이는 마치, 동일한 프로젝트를 두고 당신은 \'최대 이윤\'을, SVE 파트너는 \'최소한의 환경 피해\'를 더 중요하게 생각하는 상황을 반복하게 될 수 있습니다.',
-    success_formula: '**💰 성공 공식: 부 = (시장 분석 x 시스템 구축) + 과감한 베팅**\n\n당신의 부는 철저한 **\'시장 분석(A)\'**을 통해 \'이길 수 있는 시장\'을 찾아내는 것에서 시작됩니다. 그리고 그 시장을 가장 효율적으로 공략할 수 있는 **\'시스템\'**을 구축하고, 계산된 확신 위에서 **과감하게 베팅(E)**할 때, 당신의 성공은 운이 아닌 필연이 됩니다. 당신은 감이 아닌, 계산으로 성공하는 사업가입니다.\n\n**🚀 성공 전략 레벨업:**\n당신의 성공을 가속화하는 핵심은 **\'자동화\'**입니다. 당신의 분석 시스템을 기반으로, 마케팅, 영업, 고객 관리 등 사업의 모든 영역을 최대한 자동화하여, 당신이 없어도 사업이 성장하는 \'머니 머신\'을 구축하십시오. 당신은 사업의 \'노동자\'가 아닌, \'설계자\'가 되어야 합니다.',
-    failure_formula: '**💸 실패 공식: 타이밍 상실 = 완벽한 분석 - 빠른 실행**\n\n반대로 당신의 실패는, 완벽한 분석(A)에 너무 오랜 시간을 쓴 나머지, 시장에 진입해야 할 **\'골든타임\'**을 놓칠 때 발생합니다. 당신의 100점짜리 사업 계획서가 완성되었을 때, 시장은 이미 70점짜리 계획으로 빠르게 실행에 옮긴 경쟁자가 장악한 뒤일 수 있습니다.\n\n**🚨 치명적 리스크 경고:**\n당신에게 가장 치명적인 순간은, **예상치 못한 변수(경쟁사의 출현, 정부 규제 등)가 발생했을 때**입니다. 당신의 완벽한 시스템은 예측 가능한 변수에는 강하지만, 예측 불가능한 변수 앞에서는 경직되어 무너질 수 있습니다. 데이터가 설명해주지 않는 \'세상의 불확실성\'을 항상 염두에 두어야 합니다.',
-    benchmarking: '### **성공 DNA 벤치마킹: 당신의 잠재력, \'제프 베이조스\'와 닮았다**\n\n**유사 인물:** **제프 베이조스 (Amazon 창업자)**\n\n인물 소개: 온라인 서점으로 시작하여, 아마존을 세계 최대의 이커머스 및 클라우드 기업으로 키워낸, 데이터 기반 경영의 대가입니다.\n\n**[성공의 일대기: 데이터로 제국을 건설한 GAE의 여정]**\n\n제프 베이조스는 처음부터 \'모든 것을 파는 가게\'를 꿈꾸지 않았습니다. 그는 사업을 시작하기 전, 인터넷에서 가장 많이 성장(G)할 품목을 데이터로 분석(A)했고, \'책\'이라는 결론을 얻었습니다. 그는 자신의 비전이 아닌, 시장의 데이터가 보여주는 가장 확률 높은 길을 선택한 것입니다.\n\n그는 아마존을 운영하는 모든 과정을 데이터화했습니다. 고객의 구매 데이터를 분석하여 개인화 추천 시스템을 만들었고, 물류 창고의 모든 움직임을 시스템으로 최적화했습니다. 그는 자신의 왕국을 \'감\'이 아닌 \'숫자\'로 건설(E)했습니다.\n\n그의 일대기는, **뜨거운 열정만큼이나 차가운 데이터가 위대한 기업을 만든다는 진실**을 보여주는, 당신 같은 GAE 유형의 완벽한 성공 사례입니다.\n\n**💡 차별점 및 시사점 (당신을 위한 인생 플랜 조언)**\n\n제프 베이조스는 \'고객 집착\'이라는 확고한 원칙 아래 모든 데이터를 활용했습니다. **당신의 성공 역시, 단순히 데이터를 분석하는 것을 넘어, 그 분석을 통해 \'누구의 문제를 해결할 것인가\'라는 명확한 목표를 설정하는 데서 시작됩니다.**\n\n만약 당신의 정치 성향(P-Type)이 공동체를 중시하는 **`CPAE`(진보적 공동체주의자)**라면, 당신은 데이터를 통해 이윤뿐만 아니라 \'사회적 가치\'를 창출하는, 베이조스를 넘어선 차세대 혁신가가 될 수 있습니다.',
-    career_navigation: '**커리어 네비게이션**\n\n- **추천 직업:**\n    - 데이터 기반 스타트업 창업가 (핀테크, 커머스, EdTech 등)\n    - 경영 컨설턴트 (신사업 전략, M&A 부문)\n    - 사모펀드(PE) / 벤처캐피탈(VC) 심사역\n    - 그로스 해커(Growth Hacker)\n\n- **성장 로드맵: 당신의 커리어 네비게이션**\n    - **1단계: 주니어 레벨 (1~5년차) - \'분석\'과 \'실행\' 능력을 결합하라.**\n        \n        이 시기의 목표는, 단순히 데이터를 분석하는 \'분석가\'를 넘어, 그 분석을 실제 사업 성과로 연결시키는 \'실행가\'의 역량을 갖추는 것입니다. 스타트업이나 컨설팅펌에서, 데이터 분석이 어떻게 실제 매출로 이어지는지 직접 경험하고 성공 사례를 만들어야 합니다.\n        주의해야 할 함정: 이론에만 매몰되는 것. 완벽한 분석 모델을 만드는 데만 집중하고, 실제 시장의 불확실성과 고객의 비합리성을 경험하지 못하는 것입니다.\n        \n    - **2단계: 시니어 레벨 (5~15년차) - 당신의 \'시스템\'을 구축하라.**\n        \n        이제 당신의 성공 공식을 \'시스템\'으로 만들어야 합니다. 당신의 분석 모델과 실행 노하우를 바탕으로, 당신 없이도 팀이 성과를 낼 수 있는 \'자동화된 성장 엔진\'을 구축하십시오. 이 시스템이 바로 당신의 첫 번째 사업체의 핵심이 될 것입니다.\n        주의해야 할 함정: 과도한 통제. 당신의 완벽한 시스템을 팀원들이 그대로 따르기를 강요한 나머지, 그들의 창의성이나 자율성을 억압하는 것입니다.\n        \n    - **3단계: 엑스퍼트/리더 레벨 (15년차 이후) - \'연쇄 창업가\' 또는 \'킹메이커\'가 되어라.**\n        \n        성공적으로 시스템을 구축했다면, 이제 그 시스템을 다른 산업에 \'복제\'하여 제2, 제3의 사업을 일으키는 \'연쇄 창업가\'가 될 수 있습니다. 또는, 당신의 분석력과 시스템 구축 노하우를 다른 창업가에게 전수하고 투자하는 \'킹메이커(VC, 엑셀러레이터)\'의 길을 걸을 수도 있습니다.\n        주의해야 할 함정: 인간적인 매력 상실. 지나치게 효율과 시스템만 강조한 나머지, 팀원들에게 \'차가운 기계\'처럼 느껴져 그들의 마음을 얻는 데 실패하는 것입니다.\n        \n- **🎯 핵심 성장 과제:** \'직관\'의 가치를 신뢰하기. 뛰어난 분석력과 전략 수립 능력은 강점이지만, 때로는 데이터만으로는 포착하기 어려운 시장의 \'직관\'이나 \'감\'의 영역도 있습니다. 때로는 과감한 시도도 필요합니다.',
-    recommended_books: [
-      {title: '스타트업 바이블', author: '빌 올렛'},
-      {title: '경영의 모험', author: '존 브룩스'}
-    ],
-    recommended_content: '**📚 추천 도서:** **『스타트업 바이블』 (빌 올렛):** <a href="https://link.coupang.com/a/c4nyOa" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**📚 추천 도서:** **『경영의 모험』 (존 브룩스):** <a href="https://link.coupang.com/a/c4nzc5" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:** 유튜브에서 **\'린 스타트업\', \'비즈니스 모델 캔버스\', \'데이터 기반 의사결정\'** 관련 강의나 영상을 찾아보세요. 당신의 전략적인 창업 역량에 실행력을 더하고, 성장을 가속화하는 데 필요한 실질적인 지식과 노하우를 얻을 수 있습니다.\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*'
-  },
-
-  GAW: {
-    name: '데이터를 통해 조직을 혁신하는 전문가',
-    category: 'economic',
-    code: 'GAW',
-    nickname: '데이터를 통해 조직을 혁신하는 전문가',
-    keywords: ['성장지향', '데이터기반', '안정추구', '시스템최적화', '효율성'],
-    scores: {
-      '성장 중시 vs 안정 중시': 75,
-      '비전 투자 vs 데이터 투자': 15,
-      '기업가 기질 vs 안정가 기질': 30
-    },
-    description: '당신은 \'데이터를 신뢰하는 신중한 모험가\'입니다. 당신은 기본적으로 \'성장(G)\'을 추구하는 모험가의 기질을 가졌지만, 그 모든 과정은 반드시 데이터(A)로 검증되어야 하고 안정적인 시스템(W) 안에서 이루어져야 한다고 믿습니다. 당신은 조직의 방향을 결정하는 리더의 옆에서 가장 합리적이고 데이터에 기반한 조언을 해주는 \'조직의 등대\'와 같은 역할을 할 때 가장 큰 능력을 발휘합니다. 모두가 "이게 맞는 것 같다"고 말할 때, 당신은 "데이터를 보니, 실제로는 저게 더 효과적입니다"라고 말하며 조직이 잘못된 길로 가는 것을 막아줍니다. 때로는 완벽한 데이터를 확보하기 전까지 결정을 미루어 시장의 빠른 변화 속에서 기회를 놓칠 수도 있지만, 당신은 결코 명확성과 확실성을 포기하지 않습니다. 결국 당신을 움직이는 핵심 동력은 "모든 것을 명확한 숫자로 증명하고 예측 가능한 시스템 안에서 관리하고 싶다"는 욕망입니다.',
-    strengths: [
-      '**데이터 기반의 객관성:** 감정이나 편견을 배제하고, 객관적인 데이터에 근거하여 의사결정을 내려 실수를 줄입니다.',
-      '**높은 효율성 추구:** 비효율적인 모든 것을 걷어내고, 가장 효율적인 시스템을 설계하여 조직의 자원을 절약하고 생산성을 높입니다.',
-      '**뛰어난 분석력:** 복잡하게 얽힌 문제 속에서 핵심 패턴과 인사이트를 찾아내는 탁월한 분석 능력을 가졌습니다.',
-      '**안정적인 실행력:** 안정적인 조직 안에서, 잘 짜인 계획에 따라 꾸준히 성과를 만들어내는 신뢰감을 줍니다.',
-      '**논리적인 커뮤니케이션:** 자신의 주장을 명확한 데이터와 논리로 전달하여, 감정적인 논쟁을 최소화하고 생산적인 토론을 이끌어냅니다.'
-    ],
-    weaknesses: [
-      '**인간적인 가치 간과:** 효율성을 너무 강조한 나머지, 데이터로 측정되지 않는 인간의 감정, 조직 문화, 창의성과 같은 가치를 간과할 수 있습니다.',
-      '**변화에 대한 저항:** 안정성을 추구하는 성향 때문에, 데이터가 부족한 초기 단계의 혁신적인 도전을 \'리스크가 크다\'는 이유로 회피할 수 있습니다.',
-      '**지나친 완벽주의:** 완벽한 데이터를 확보하기 전까지 결정을 미루어, 시장의 빠른 변화 속에서 \'골든타임\'을 놓칠 위험이 있습니다.',
-      '**분석 마비(Analysis Paralysis):** 너무 많은 데이터를 분석하느라, 정작 행동에 나서지 못하고 기회를 놓치는 우를 범할 수 있습니다.',
-      '**큰 그림 상실:** 세부적인 데이터 분석에 너무 몰두한 나머지, 시장 전체의 패러다임이 바뀌는 거대한 변화의 흐름을 놓칠 수 있습니다.'
-    ],
-    spectrum_analysis: '당신은 \'데이터를 신뢰하는 신중한 모험가\'입니다.\n\n당신은 기본적으로 \'성장(G)\'을 추구하는 모험가의 기질을 가졌지만, 그 모든 과정은 반드시 데이터(A)로 검증되어야 하고 안정적인 시스템(W) 안에서 이루어져야 한다고 믿습니다. 즉, **\'이길 수 있는 싸움\'**만 골라서 하는 영리한 모험가에 가깝습니다.',
-    detailed_analysis: '종합적으로 볼 때, 당신은 \'감\'이나 \'직관\'이 아닌, **오직 \'객관적인 데이터(A)\'로 조직의 비효율을 개선하고 새로운 성장 동력(G)을 찾아내는 \'지적인 전문가\'**입니다. 당신은 리스크가 큰 도전을 하기보다, 안정적인 시스템(W) 안에서 데이터라는 확실한 무기를 가지고 움직이는 것을 선호합니다.\n\n**직장이나 사업에서 당신은,** 조직의 방향을 결정하는 리더의 옆에서 가장 합리적이고 데이터에 기반한 조언을 해주는 **\'조직의 등대\'**와 같은 역할을 할 때 가장 큰 능력을 발휘합니다. 모두가 "이게 맞는 것 같다"고 말할 때, 당신은 "데이터를 보니, 실제로는 저게 더 효과적입니다"라고 말하며 조직이 잘못된 길로 가는 것을 막아줍니다.\n\n**투자에 있어서도 당신의 이런 기질은 그대로 드러납니다.** 당신은 \'성장\'을 추구하지만, 그 방식은 매우 보수적이고 신중합니다. 성장 가능성이 높은 기술주에 투자하더라도, 동시에 안정적인 채권이나 배당주를 함께 담아 포트폴리오의 변동성을 철저하게 관리하려 합니다.\n\n**당신을 움직이는 가장 깊은 곳의 욕망은 \'명확성과 확실성\'입니다.** 당신은 애매하고 불확실한 것을 싫어하며, 모든 것을 명확한 숫자로 증명하고 예측 가능한 시스템 안에서 관리될 때 가장 큰 안정감과 만족감을 느낍니다. 당신에게 성공이란, 화려한 성취가 아니라 단 하나의 실수도 없는 완벽한 관리입니다.',
-    synergy_partner: '**🤝 시너지 파트너: `GWE` (안정된 조직의 성장을 이끄는 사내 기업가)**\n\n당신이 데이터 분석을 통해 \'무엇을 해야 하는지\'에 대한 완벽한 보고서를 작성했을 때, GWE는 그 보고서를 들고 경영진을 설득하고, 프로젝트 팀을 꾸려 \'실행\'해 줄 최고의 파트너입니다. 왜냐하면, 당신의 날카로운 \'분석\'과 그의 역동적인 \'실행력\'은 조직 내에서 가장 이상적인 시너지를 내기 때문입니다. 당신이 \'설계자\'라면, 그는 \'현장 감독\'입니다.',
-    risk_partner: '**🔥 리스크 파트너: `GAW` (당신과 동일 유형)**\n\n당신과 동일한 유형의 파트너와 함께할 경우, 문제 분석 능력은 극대화되지만 실행력은 \'0\'에 수렴할 수 있습니다. 왜냐하면, 두 사람 모두 행동에 나서기 전에 완벽한 데이터를 원하기 때문에, 서로의 신중함을 강화시켜주며 결정을 끝없이 미루는 \'분석 마비(Analysis Paralysis)\' 상태에 빠지기 때문입니다. 이는 마치, 두 명의 완벽주의자 건축가가 평생 설계도만 수정하다가, 단 하나의 건물도 짓지 못하는 것과 같습니다.',
-    success_formula: '**💰 성공 공식: 부 = 데이터 분석(A) x 조직 내 영향력**\n\n당신의 부는 뛰어난 \'데이터 분석(A)\' 능력을 통해 조직의 문제를 해결하고 새로운 성장 기회를 발견하는 것에서 시작됩니다. 그리고 그 분석 결과를 조직의 리더들이 \'실제 의사결정\'에 반영하게 만드는 **\'영향력\'**이 곱해질 때, 당신의 가치는 폭발적으로 증가합니다. 당신의 연봉은, 당신의 분석이 회사의 운명을 바꾼 만큼 오르게 될 것입니다.\n\n**🚀 성공 전략 레벨업:**\n당신의 영향력을 극대화하는 최고의 방법은 **\'스토리텔링\'**입니다. 차가운 데이터를, 사람들이 공감하고 행동하게 만드는 뜨거운 스토리로 바꾸어 전달하십시오. 당신의 다음 보고서는 숫자 나열이 아닌, **"데이터가 우리에게 들려주는 이야기"**라는 제목의 한 편의 프레젠테이션이 되어야 합니다.',
-    failure_formula: '**💸 실패 공식: 소모 = 완벽한 분석 ÷ 낮은 설득력**\n\n반대로, 당신이 아무리 훌륭한 데이터 분석 결과를 내놓아도, 그것이 조직의 리더나 동료들을 설득하지 못하고 \'그들만의 리그\'로 남게 되면, 당신의 노력은 보상받지 못하는 **\'소모적인 활동\'**으로 끝날 수 있습니다. 데이터만으로는 세상을 바꿀 수 없다는 현실을 마주하게 되는 것입니다.\n\n**🚨 치명적 리스크 경고:**\n당신에게 가장 치명적인 순간은, **당신의 분석이 \'정치적으로\' 이용당할 때**입니다. 조직 내의 특정 세력이 자신의 주장을 합리화하기 위해 당신의 데이터를 아전인수격으로 해석하고, 당신은 그들의 \'도구\'로 전락할 수 있습니다. 당신의 분석은 언제나 객관적이어야 하며, 특정인의 이익이 아닌 조직 전체의 이익을 향해야 함을 잊지 마십시오.',
-    benchmarking: '### **성공 DNA 벤치마킹: 당신의 잠재력, \'머니볼의 빌리 빈\'과 닮았다**\n\n**유사 인물:** **빌리 빈 (메이저리그 오클랜드 어슬레틱스 단장)**\n\n인물 소개: 영화 \'머니볼\'의 실제 주인공. 가난한 구단에, 베테랑 스카우터들의 \'감\'이 아닌 통계 데이터를 바탕으로 저평가된 선수들을 영입하여 기적을 만들어낸 혁신가입니다.\n\n**[성공의 일대기: 데이터로 편견을 깬 GAW의 여정]**\n\n빌리 빈이 마주한 세상은 \'경험\'과 \'직관\'이 지배하는 곳이었습니다. 모든 베테랑 스카우터들은 자신들의 눈을 믿었지만, 그는 그들의 눈이 얼마나 많은 편견에 사로잡혀 있는지 알고 있었습니다. 그는 안정된 프로 스포츠 시스템(W) 안에서, 아무도 주목하지 않던 \'데이터(A)\'라는 새로운 무기를 꺼내 들었습니다.\n\n그는 \'출루율\'이라는 핵심 데이터 하나가 스타 선수의 화려한 홈런보다 팀의 승리에 더 크게 기여한다는 사실을 증명해냈습니다. 그는 데이터 분석을 통해 시장의 비효율을 찾아내고, 최소 비용으로 최고의 성장(G)을 이끌어냈습니다.\n\n그의 일대기는, **모두가 \'감\'으로 이야기할 때, 냉정한 \'숫자\'로 진실을 증명해내는** 당신 같은 GAW 유형이 어떻게 조직의 운명을 바꾸는지를 보여줍니다.\n\n**💡 차별점 및 시사점 (당신을 위한 인생 플랜 조언)**\n\n빌리 빈은 초기에 기존 스카우터들과 감독의 엄청난 저항에 부딪혔습니다. 당신의 데이터 기반 제안도 처음에는 \'현실을 모르는 소리\'라는 비판을 받을 수 있습니다. **당신의 성공은, 뛰어난 분석 능력(A)뿐만 아니라, 그 분석 결과를 사람들이 이해하고 받아들이도록 \'설득\'하고 \'소통\'하는 능력에 달려있음을 기억해야 합니다.**\n\n만약 당신의 정치 성향(P-Type)이 합리적 토론을 중시하는 **`IPUE`(합리적 개인주의자)**라면, 당신은 데이터를 통해 사람들의 편견을 깨고 새로운 합의를 이끌어내는 데 최고의 재능을 발휘할 것입니다.',
-    career_navigation: '**커리어 네비게이션**\n\n- **추천 직업:**\n    - 경영기획 / 전략팀 / CEO Staff\n    - 데이터 분석가 / 비즈니스 분석가(BA)\n    - 퍼포먼스 마케터\n    - MBA 이후 경영 컨설턴트\n\n- **성장 로드맵: 당신의 커리어 네비게이션**\n    - **1단계: 주니어 레벨 (1~5년차) - \'데이터\'와 \'현장\'을 모두 장악하라.**\n        \n        이 시기의 목표는, 단순히 데이터를 분석하는 기술을 넘어, 그 데이터가 의미하는 \'현실의 비즈니스\'를 완벽하게 이해하는 것입니다. 재무제표와 현장의 목소리를 연결할 수 있을 때, 당신의 분석은 깊이를 갖게 됩니다. 당신은 조직 내에서 가장 정확하고 신뢰도 높은 데이터를 제공하는 전문가가 되어야 합니다.\n        주의해야 할 함정: 데이터 속의 함정. 데이터 자체에만 매몰되어, 그 데이터가 수집되는 과정의 오류나 편견을 인지하지 못하고 잘못된 분석 결과를 내놓는 것입니다.\n        \n    - **2단계: 시니어 레벨 (5~15년차) - \'통찰\'을 판매하라.**\n        \n        이제 단순한 \'데이터 분석\'을 넘어, 그 분석을 통해 남들이 보지 못하는 \'통찰(Insight)\'을 제공해야 합니다. "데이터가 이렇습니다"에서 그치는 것이 아니라, "이 데이터는 우리 회사가 OOO 방향으로 나아가야 함을 의미합니다"라고 명확한 전략을 제시할 수 있어야 합니다.\n        주의해야 할 함정: 소통의 실패. 당신의 뛰어난 분석 결과를, 비전문가인 리더나 동료들이 이해할 수 있는 \'쉬운 언어\'와 \'시각 자료\'로 번역하는 데 실패하는 것입니다.\n        \n    - **3단계: 엑스퍼트/리더 레벨 (15년차 이후) - \'데이터 기반 의사결정 문화\'를 전파하라.**\n        \n        당신은 조직 전체가 \'감\'이 아닌 \'데이터\'에 기반하여 의사결정을 내리도록 만드는 \'문화 설계자\'의 역할을 해야 합니다. 당신이 구축한 데이터 시스템과 분석 모델이, 당신 없이도 조직의 중요한 의사결정을 돕는 단계에 이르러야 합니다.\n        주의해야 할 함정: 인간에 대한 이해 부족. 모든 것을 데이터로만 설명하려 하고, 숫자로 측정되지 않는 인간의 비합리적인 감정이나 조직 문화를 무시하여, 최고의 시스템이 최악의 결과를 낳게 만드는 것입니다.\n        \n- **🎯 핵심 성장 과제:** \'소통\'과 \'설득\'의 기술 연마하기. 데이터 기반의 명확한 분석력은 강점이지만, 때로는 혁신의 저항에 부딪힐 수 있습니다. 복잡한 데이터를 비전문가도 이해하기 쉽게 설명하고, 변화의 필요성을 설득하는 능력이 필요합니다.',
-    recommended_books: [
-      {title: '데이터는 어떻게 세상을 지배하는가', author: '강성호'},
-      {title: '데일 카네기 인간관계론', author: '데일 카네기'}
-    ],
-    recommended_content: '**📚 추천 도서:** **『데이터는 어떻게 세상을 지배하는가』 (강성호):** <a href="https://link.coupang.com/a/c4nzLo" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**📚 추천 도서:** **『인간관계론』 (데일 카네기):** <a href="https://link.coupang.com/a/c4nAUH" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:** 유튜브에서 **\'데이터 시각화\', \'비즈니스 프레젠테이션\', \'설득의 기술\'** 관련 강의나 영상을 찾아보세요. 당신의 강력한 데이터 분석 역량을 조직 내 변화를 이끄는 실질적인 동력으로 전환하는 데 필요한 노하우를 얻을 수 있습니다.\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*'
-  },
-
-  SVE: {
-    name: '사회적 가치와 비전으로 변화를 만드는 지속가능한 리더',
-    category: 'economic',
-    code: 'SVE',
-    nickname: '사회적 가치와 비전으로 변화를 만드는 지속가능한 리더',
-    keywords: ['안정지향', '가치추구', '비전', '마이웨이', '지속가능성'],
-    scores: {
-      '성장 중시 vs 안정 중시': 30,
-      '비전 투자 vs 데이터 투자': 80,
-      '기업가 기질 vs 안정가 기질': 75
-    },
-    description: '당신은 \'가치를 추구하는 낭만적 현실주의자\'입니다. 당신은 세상을 바꾸려는 비전(V)을 가진 모험가(E)이지만, 동시에 폭발적인 성장보다는 지속가능한 안정(S)을 추구하는 수호자의 마음을 가졌습니다. 당신에게 돈보다 \'가치\'를 우선시하는 비전은 사람들에게 깊은 공감과 영감을 주며 진정한 팬을 만들어내며, 단기적인 이익 극대화보다 장기적으로 공동체와 함께 성장하는 \'지속가능한\' 모델을 만드는 데 능합니다. 때로는 수익성과 가치 사이에서 고민하기도 하지만, 당신은 결코 자신의 신념을 포기하지 않습니다. 결국 당신을 움직이는 핵심 동력은 "세상을 더 나은 곳으로 만들되, 그 과정이 지속가능해야 한다"는 원칙입니다.',
-    strengths: [
-      '**진정성 있는 비전:** 돈보다 \'가치\'를 우선시하는 당신의 비전은, 사람들에게 깊은 공감과 영감을 주며 진정한 팬을 만들어냅니다.',
-      '**지속가능성에 대한 통찰:** 단기적인 이익 극대화보다, 장기적으로 공동체와 함께 성장하는 \'지속가능한\' 모델을 만드는 데 능합니다.',
-      '**강력한 내적 동기:** 외부의 평가나 금전적 보상보다, 자신의 신념을 실현하는 과정 자체에서 만족을 느끼므로 쉽게 지치지 않습니다.',
-      '**창의적인 문제 해결:** 부족한 자원 속에서도, 창의적인 아이디어와 커뮤니티의 힘을 활용하여 문제를 해결하는 능력이 뛰어납니다.',
-      '**위험 회피를 통한 안정성:** 무리한 확장을 지양하고, 안정적인 현금흐름을 중시하여 사업을 쉽게 위기에 빠뜨리지 않습니다.'
-    ],
-    weaknesses: [
-      '**수익성 악화:** \'좋은 일\'이라는 명분에 너무 집중한 나머지, 비즈니스의 본질인 \'수익 창출\'을 경시하여 지속가능성을 잃을 수 있습니다.',
-      '**성장의 한계:** 안정성을 너무 추구하여, 더 큰 임팩트를 만들 수 있는 성장의 기회를 놓치고 작은 규모에 머무를 수 있습니다.',
-      '**이상과 현실의 괴리:** \'착한 의도\'만으로는 비즈니스가 성공할 수 없다는 냉정한 현실 앞에서 쉽게 상처받거나 좌절할 수 있습니다.',
-      '**비즈니스 감각 부족:** 마케팅, 재무, 영업과 같은 \'돈 버는 기술\'을 배우는 것을 속물적인 것으로 여기며 멀리할 수 있습니다.',
-      '**자기희생:** 공동체의 가치를 위해, 자기 자신을 지나치게 희생하여 번아웃에 빠질 위험이 있습니다.'
-    ],
-    spectrum_analysis: '당신은 \'가치를 추구하는 낭만적 현실주의자\'입니다.\n\n당신은 세상을 바꾸려는 비전(V)을 가진 모험가(E)이지만, 동시에 폭발적인 성장보다는 지속가능한 안정(S)을 추구하는 수호자의 마음을 가졌습니다. 즉, **\'꿈을 먹고 살지만, 밥은 굶지 않겠다\'**는 매우 현명한 기질을 가지고 있습니다.',
-    detailed_analysis: '종합적으로 볼 때, 당신에게 돈과 일은 그 자체가 목적이 아니라, **\'자신이 믿는 신념과 비전(V)\'을 세상에 실현시키기 위한(E) \'지속가능한 수단(S)\'**에 가깝습니다. 당신은 부의 폭발적인 성장보다는, 굶지 않을 정도의 안정적인 삶을 기반으로, 자신이 옳다고 믿는 가치를 꾸준히 추구하는 삶에서 가장 큰 행복을 느낍니다.\n\n**직장이나 사업에서 당신은,** \'돈을 버는 것\'보다 \'의미 있는 일\'을 하는 것에서 훨씬 큰 동기를 얻습니다. 당신은 높은 연봉을 제안하는 담배 회사보다, 월급은 적더라도 환경을 보호하는 사회적 기업에서 일할 때 더 행복할 사람입니다. 당신은 경쟁에서 이기기보다, 당신의 일을 통해 누군가를 돕고 세상을 더 나은 곳으로 만드는 과정에서 보람을 느낍니다.\n\n**투자에 있어서도 당신의 이런 기질은 그대로 드러납니다.** 당신은 단순히 수익률이 높은 기업보다, 그 기업이 가진 \'사회적 가치\'나 \'스토리\'에 더 큰 매력을 느낍니다. 당신의 소비와 투자는, 당신이 지지하는 세상을 만들어가는 \'투표 행위\'와도 같습니다.\n\n**당신을 움직이는 가장 깊은 곳의 욕망은 \'진정성\'과 \'자기 일치\'입니다.** 당신의 신념과 당신의 실제 삶이 일치할 때, 당신은 가장 큰 만족감을 느낍니다. 돈과 이상 사이에서 끊임없이 균형을 잡으려는, 당신은 \'가장 인간적인 사업가\'의 모습을 가지고 있습니다.',
-    synergy_partner: '**🤝 시너지 파트너: `GAW` (데이터를 통해 조직을 혁신하는 전문가)**\n\n당신이 "세상을 구하자!"는 위대한 비전을 제시할 때, GAW는 "좋습니다. 그러기 위해선 먼저 월 1,000만원의 안정적인 수익 모델부터 만듭시다"라며 당신의 선한 영향력을 \'지속가능한 시스템\'으로 만들어 줄 최고의 경영 파트너입니다. 왜냐하면, 당신의 뜨거운 \'열정\'을 그의 차가운 \'데이터\'가 뒷받침해 줄 때, 당신의 비전은 단순한 꿈이 아닌 현실적인 사업이 되기 때문입니다.',
-    risk_partner: '**🔥 리스크 파트너: `GAE` (계산된 성장을 추구하는 전략 창업가)**\n\n둘 다 기업가(E)이지만, 당신의 핵심 동력은 \'가치 실현(S, V)\'이고 그의 동력은 \'수익 성장(G, A)\'입니다. 이는 마치, 당신이 만든 친환경 레스토랑을 GAE 파트너가 "수익성이 낮다"는 이유로, 더 저렴한 수입 식자재를 사용하는 프랜차이즈로 바꾸자고 제안하는 것과 같은 갈등을 유발할 수 있습니다.',
-    success_formula: '**💰 성공 공식: 부 = (선한 비전 x 진정성) + 지속가능성**\n\n당신의 부는 세상을 바꾸려는 **\'선한 비전(V)\'**과 그것을 꾸준히 실천하는 **\'진정성\'**에서 나옵니다. 사람들은 당신의 제품이 아닌, 당신의 이야기에 돈을 지불하며 기꺼이 팬이 됩니다. 여기에, 단기적 이익을 포기하더라도 오래 살아남는 **\'지속가능성(S)\'**이라는 가치가 더해질 때, 당신은 돈과 명예를 모두 얻게 됩니다.\n\n**🚀 성공 전략 레벨업:**\n당신의 진정성을 더 널리 알리기 위해, **\'커뮤니티\'**를 적극적으로 활용하십시오. 당신의 비전에 공감하는 팬들이 서로 소통하고 연대할 수 있는 공간을 만들어주세요. 잘 만들어진 커뮤니티는 그 어떤 마케팅보다 강력한, 당신의 비전을 지키는 든든한 군대가 되어줄 것입니다.',
-    failure_formula: '**💸 실패 공식: 고갈 = 이상주의 - 비즈니스 모델**\n\n하지만 \'좋은 일\'을 한다는 이상주의만 앞세우고, 수익을 창출하여 스스로 살아남을 수 있는 현실적인 **\'비즈니스 모델\'**을 구축하지 못하면, 당신의 열정과 선한 의지는 결국 고갈되고 말 것입니다. 지속가능성이 없는 선함은 결국 자기희생으로 끝나게 된다는 것을 기억해야 합니다.\n\n**🚨 치명적 리스크 경고:**\n당신에게 가장 치명적인 순간은, 초기의 \'선한 마음\'이 \'도덕적 우월감\'으로 변질될 때입니다. "우리는 좋은 일을 하니까"라는 생각에, 비판적인 의견에 귀를 닫거나 함께 일하는 동료들에게 비현실적인 헌신을 강요할 수 있습니다. 선한 비전일수록 더 겸손하고 열린 자세가 필요합니다.',
-    benchmarking: '### **성공 DNA 벤치마킹: 당신의 잠재력, \'이본 쉬나드\'와 닮았다**\n\n**유사 인물:** **이본 쉬나드 (파타고니아 창업자)**\n\n인물 소개: 세계적인 아웃도어 브랜드 \'파타고니아\'의 창업자입니다. 그는 회사를 소유하는 대신, 지구를 유일한 주주로 삼아 모든 수익을 환경 보호에 기부하는 파격적인 경영으로 유명합니다.\n\n**[성공의 일대기: 가치를 지키며 성공한 SVE의 여정]**\n\n이본 쉬나드는 처음부터 거대한 사업을 꿈꾸지 않았습니다. 그는 자신이 사랑하는 암벽 등반을 위해, 환경을 파괴하지 않는 더 좋은 장비를 직접 만들며(E) 사업을 시작했습니다. 그는 "이 회사를 100년 동안 지속시키고 싶다"고 말하며, 폭발적인 성장(G)이 아닌 지속가능한 안정(S)을 추구했습니다.\n\n그는 "우리는 최고의 제품을 만들되, 불필요한 환경 피해를 유발하지 않으며, 비즈니스를 통해 환경 위기에 대한 해결책을 제시하고 실행한다"는 강력한 비전(V)을 평생 지켜왔습니다.\n\n그의 일대기는, **돈을 좇지 않고 자신만의 \'가치\'를 뚝심 있게 지켜나갈 때, 역설적으로 돈과 명예가 함께 따라온다**는 것을 증명해 낸 당신 같은 SVE 유형의 가장 위대한 성공 사례입니다.\n\n**💡 차별점 및 시사점 (당신을 위한 인생 플랜 조언)**\n\n파타고니아의 성공은 \'착한 회사\'라는 이미지뿐만 아니라, 그 어떤 브랜드보다 뛰어난 \'제품의 퀄리티\'가 바탕이 되었습니다. **당신의 선한 비전(V)이 사람들의 지지를 얻기 위해서는, 그 비전을 뒷받침할 \'압도적인 실력\'과 \'전문성\'을 갖추는 것이 무엇보다 중요합니다.** 진정성은 실력과 만났을 때 가장 강력한 힘을 발휘합니다.\n\n만약 당신의 정치 성향(P-Type)이 공동체의 연대를 중시하는 **`CPAE`(진보적 공동체주의자)**라면, 당신은 당신의 비전에 공감하는 사람들을 모아 세상을 바꾸는 강력한 \'커뮤니티\'를 만들어낼 수 있습니다.',
-    career_navigation: '**커리어 네비게이션**\n\n- **추천 직업:**\n    - 사회적 기업가 / 소셜 벤처 창업가\n    - 비영리단체(NPO) 설립자 또는 활동가\n    - 예술가, 작가, 다큐멘터리 감독 등 \'메시지\'를 전달하는 창작자\n\n- **성장 로드맵: 당신의 커리어 네비게이션**\n    - **1단계: 주니어 레벨 (1~5년차) - \'진정성\'과 \'실력\'을 증명하라.**\n        \n        이 시기의 목표는, 당신이 추구하는 \'가치\'가 단순한 아마추어의 열정이 아님을 증명하는 것입니다. 당신의 분야에서 누구에게도 뒤지지 않는 \'압도적인 실력\'을 갖추어야 합니다. 동시에, 당신의 진정성을 알아봐 줄 초기 \'팬\'과 \'동료\'를 만들어나가는 것이 중요합니다.\n        주의해야 할 함정: \'좋은 의도\'만으로 모든 것이 해결될 것이라는 착각. 선한 의도만큼이나, 그것을 지속가능하게 만들 현실적인 비즈니스 감각이 부족한 것입니다.\n        \n    - **2단계: 시니어 레벨 (5~15년차) - \'지속가능한 모델\'을 구축하라.**\n        \n        이제 당신의 비전을 \'지속가능한 시스템\'으로 만들어야 합니다. 후원에만 의존하는 대신, 스스로 수익을 창출할 수 있는 비즈니스 모델을 구축하거나, 안정적인 파트너십을 확보해야 합니다. 당신의 \'가치\'가 당신과 팀원들의 \'생계\'를 책임질 수 있음을 증명해야 하는 단계입니다.\n        주의해야 할 함정: 성장에 대한 두려움. 사업이 커지면서 초심을 잃을 것을 두려워한 나머지, 더 큰 임팩트를 만들 수 있는 성장의 기회를 스스로 외면하는 것입니다.\n        \n    - **3단계: 엑스퍼트/리더 레벨 (15년차 이후) - \'선한 영향력\'을 확장하라.**\n        \n        하나의 성공적인 모델을 만드는 것을 넘어, 당신의 철학과 성공 경험을 다른 사람들에게 전파하여 더 많은 \'사회적 기업가\'를 키워내는 \'멘토\'이자 \'생태계 조성자\'가 되어야 합니다. 당신의 최종 목표는 개인의 성공이 아닌, 당신이 추구하는 \'가치\'의 사회 전체로의 확장입니다.\n        주의해야 할 함정: 자기희생과 번아웃. 공동체의 가치를 위해, 자기 자신을 지나치게 희생하여 모든 열정이 소진되고 마는 것입니다.\n        \n- **🎯 핵심 성장 과제:** \'지속 가능한 수익 모델\' 구축. 사회적 가치 추구는 중요하지만, 이를 현실에서 지속 가능하게 만들기 위해서는 견고한 경제적 기반 마련이 필수적입니다. 이윤 추구를 위한 전략적 사고도 필요합니다.',
-    recommended_books: [
-      {title: '부자의 그릇', author: '이즈미 마사토'},
-      {title: '나쁜 사마리아인들', author: '장하준'}
-    ],
-    recommended_content: '**📚 추천 도서:** **『부자의 그릇』 (이즈미 마사토):** <a href="https://link.coupang.com/a/c4nBlc" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**📚 추천 도서:** **『나쁜 사마리아인들』 (장하준):** <a href="https://link.coupang.com/a/c4nBHo" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:** 유튜브에서 **\'사회적 기업가 정신\', \'임팩트 투자\', \'비영리 조직의 수익 모델\'** 관련 강의나 영상을 찾아보세요. 당신의 따뜻한 비전이 현실에서 단단하고 지속 가능한 힘을 가질 수 있도록 돕는 실용적인 지식을 얻을 수 있습니다.\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*'
-  },
-
-  SVW: {
-    name: '신념을 지키는 조직의 이상가',
-    category: 'economic',
-    code: 'SVW',
-    nickname: '신념을 지키는 조직의 이상가',
-    keywords: ['안정지향', '비전', '원칙주의', '문화수호자', '신념과현실'],
-    scores: {
-      '성장 중시 vs 안정 중시': 15,
-      '비전 투자 vs 데이터 투자': 70,
-      '기업가 기질 vs 안정가 기질': 10
-    },
-    description: '당신은 \'오래된 가치를 미래로 전하는 이야기꾼\'입니다. 당신은 변화와 리스크를 경계하는 확고한 **\'수호자\'**입니다. 하지만 당신이 지키려는 것은 단순한 시스템이 아닌, 조직이 가진 고유한 \'정신\'과 \'비전(V)\'입니다. 당신은 자신이 믿는 가치와 비전을 어떤 상황에서도 굳건히 지켜나가는 힘이 있으며, 단기적인 성과보다 조직이 가진 고유한 철학과 문화를 지키고 다음 세대에 전달하는 것을 더 중요하게 생각합니다. 때로는 변화의 속도에 뒤처질 수도 있지만, 당신은 결코 조직의 정체성을 포기하지 않습니다. 결국 당신을 움직이는 핵심 동력은 "시간이 지나도 변하지 않는 가치를 지키고 전달하고 싶다"는 신념입니다.',
-    strengths: [
-      '**강력한 신념과 원칙:** 당신은 자신이 믿는 가치와 비전을 어떤 상황에서도 굳건히 지켜나가는 힘이 있습니다.',
-      '**조직 문화의 수호자:** 단기적인 성과보다, 조직이 가진 고유한 철학과 문화를 지키고 다음 세대에 전달하는 것을 더 중요하게 생각합니다.',
-      '**진정성 있는 소통:** 당신의 말에는 기교가 아닌 진심이 담겨있어, 동료들에게 깊은 신뢰와 영감을 줍니다.',
-      '**장기적인 안목:** 눈앞의 이익에 흔들리지 않고, 10년, 20년 뒤에도 조직이 올바른 방향으로 나아갈 수 있도록 방향을 제시합니다.',
-      '**안정적인 충성심:** 한번 마음을 준 조직이나 사람을 쉽게 떠나지 않고, 묵묵히 곁을 지키는 높은 충성심을 가졌습니다.'
-    ],
-    weaknesses: [
-      '**변화에 대한 저항:** 자신이 믿는 \'초심\'과 \'비전\'을 지키려는 마음이 너무 강한 나머지, 시대의 변화에 맞춰 꼭 필요한 혁신마저도 \'변질\'로 규정하고 저항할 수 있습니다.',
-      '**현실 감각 부족:** 숭고한 이상과 비전을 강조하지만, 그것을 뒷받침할 구체적인 수익 모델이나 현실적인 계획이 부족할 수 있습니다.',
-      '**\'꼰대\'로 비칠 위험:** 과거의 성공 방식이나 창업 정신만을 강조하는 모습이, 새로운 세대의 동료들에게는 낡고 고리타분한 \'꼰대\'처럼 비칠 수 있습니다.',
-      '**유연성 부족:** 한번 정한 원칙이나 신념을, 변화된 상황에 맞춰 유연하게 수정하는 것을 어려워합니다.',
-      '**실무 능력 약화:** \'정신\'과 \'가치\'를 강조하는 역할에만 집중한 나머지, 실제 성과를 만들어내는 실무적인 능력이 약화될 수 있습니다.'
-    ],
-    spectrum_analysis: '당신은 \'오래된 가치를 미래로 전하는 이야기꾼\'입니다.\n\n당신은 변화와 리스크를 경계하는 확고한 **\'수호자\'**입니다. 하지만 당신이 지키려는 것은 단순한 시스템이 아닌, 조직이 가진 고유한 \'정신\'과 \'비전(V)\'입니다. 당신은 안정적인(S) 조직(W) 안에서, 그 조직의 잊혀 가는 초심과 핵심 가치를 다음 세대에 전달하는 중요한 역할을 합니다.',
-    detailed_analysis: '종합적으로 볼 때, 당신은 조직의 \'역사학자\'이자 \'문화 수호자\'입니다. 당신은 단기적인 성과나 효율성보다, 조직이 오랫동안 지켜온 **핵심적인 가치와 비전(V)**이 더 중요하다고 믿습니다. 신입사원들에게 회사의 역사와 설립자의 철학을 이야기해주며 가장 큰 보람을 느끼고, 조직이 단기적인 이익 때문에 핵심 가치를 훼손하려 할 때 가장 큰 목소리를 냅니다.\n\n**직장이나 사업에서 당신은,** 조직의 \'영혼\'을 지키는 역할을 합니다. 모두가 \'숫자\'를 이야기할 때, 당신은 \'우리가 왜 이 일을 시작했는가\'라는 근본적인 질문을 던집니다. 당신은 안정적인(S) 시스템(W) 안에서, 조직이 길을 잃지 않도록 방향을 제시하는 \'나침반\'과 같은 존재입니다.\n\n**투자에 있어서도 당신의 이런 기질은 그대로 드러납니다.** 당신은 유행하는 테마주에 투자하기보다, 창업자의 철학을 존경하고 그 비전을 지지하는 기업에 장기적으로 동행하는 것을 선호합니다. 당신에게 투자는 단순한 돈벌이가 아니라, 당신이 믿는 가치에 대한 \'지지\'의 표현입니다.\n\n**당신을 움직이는 가장 깊은 곳의 욕망은 \'의미\'와 \'연결\'입니다.** 당신은 자신이 하는 일이 더 큰 비전과 연결되어 있다고 느낄 때, 그리고 그 가치를 동료들과 함께 지켜나갈 때 가장 큰 안정감과 만족감을 느낍니다.',
-    synergy_partner: '**🤝 시너지 파트너: `GAE` (계산된 성장을 추구하는 전략 창업가)**\n\n당신이 조직의 \'정신적 지주\'로서 지켜온 핵심 가치와 비전(V)을, GAE는 현대적인 비즈니스 모델과 데이터 기반 시스템으로 만들어 \'수익\'을 창출하는 방법을 알고 있습니다. 왜냐하면, 당신의 \'신념\'이 그의 \'전략\'과 만날 때, 조직은 돈과 명예를 모두 얻게 되기 때문입니다. 당신은 \'왜(Why)\'를, 그는 \'어떻게(How)\'를 제공하는 이상적인 조합입니다.',
-    risk_partner: '**🔥 리스크 파트너: `GVE` (비전을 현실로 만드는 혁신가)**\n\n당신과 GVE의 파트너십은 \'전통\'과 \'혁신\'의 끝없는 전쟁으로 이어질 수 있습니다. 왜냐하면, 당신이 \'지켜야 할 가치\'를 이야기할 때, 그는 \'부숴야 할 관습\'에 대해 이야기하기 때문입니다. 이는 마치, 오래된 성당을 지키려는 당신에게, GVE 파트너가 그 자리에 최신식 유리 빌딩을 짓자고 제안하는 것과 같은 상황입니다.',
-    success_formula: '**💰 성공 공식: 부 = (핵심 가치 x 시간) + 신뢰 자산**\n\n당신의 부는 단기적인 성과가 아닌, 조직의 **\'핵심 가치(V)\'**를 오랜 \'시간(S)\' 동안 묵묵히 지켜냄으로써 쌓이는 **\'신뢰 자산\'**에서 나옵니다. 당신은 조직의 \'영혼\'을 지키는 존재이며, 이 진정성은 돈으로 환산할 수 없는 가장 큰 가치를 만들어냅니다. 사람들은 당신의 전문성뿐만 아니라, 당신의 신념을 믿고 따르게 될 것입니다.\n\n**🚀 성공 전략 레벨업:**\n당신의 가치를 극대화하려면, 당신의 비전을 \'과거의 이야기\'가 아닌 \'미래의 나침반\'으로 만들어야 합니다. 조직의 중요한 의사결정 순간마다, "이 결정이 과연 우리가 처음 가졌던 비전과 일치합니까?"라는 질문을 던져, 조직이 길을 잃지 않도록 이끄는 **\'조직의 양심\'** 역할을 하십시오.',
-    failure_formula: '**💸 실패 공식: 고립 = 과거의 비전 - 현재의 변화**\n\n하지만 당신이 지키려는 비전이 **\'과거의 영광\'**에만 머물러 있고, **\'현재의 변화\'**를 수용하지 못할 때, 당신의 신념은 \'지혜\'가 아닌 \'고집\'이 되어 조직의 발전을 가로막는 걸림돌이 될 수 있습니다. 존경받는 원로가 아닌, \'꼰대\'로 남게 될 위험입니다.\n\n**🚨 치명적 리스크 경고:**\n당신에게 가장 치명적인 순간은, **조직이 위기에 처해 \'현실적인 생존\'을 위해 어쩔 수 없이 비전을 일부 포기해야 할 때**입니다. 이때 당신이 현실을 고려하지 않고 원칙과 신념만을 고수한다면, 당신은 조직을 구하는 사람이 아니라 위기에 빠뜨리는 이상주의자로 낙인찍힐 수 있습니다.',
-    benchmarking: '### **성공 DNA 벤치마킹: 당신의 잠재력, \'조너선 아이브\'와 닮았다**\n\n**유사 인물:** **조너선 아이브 (전 Apple 최고 디자인 책임자)**\n\n인물 소개: 스티브 잡스와 함께 iMac, 아이팟, 아이폰 등 Apple의 전설적인 제품들을 디자인한 세계적인 디자이너입니다. 그는 Apple 디자인 철학의 \'영혼\'으로 불립니다.\n\n**[성공의 일대기: 조직의 영혼을 만든 SVW의 여정]**\n\n조너선 아이브는 CEO가 아니었습니다. 그는 30년 가까이 Apple의 직원(W)으로 일하며, 조직의 안정적인(S) 시스템 안에서 자신의 디자인 철학을 구현했습니다. 그에게는 \'더 단순하고, 더 인간적인 기술\'이라는 확고한 비전(V)이 있었습니다.\n\n그는 매년 새로운 디자인 트렌드를 좇지 않았습니다. 대신, Apple 제품 전체를 관통하는 일관된 디자인 언어를 수십 년간 지켜내고 발전시켰습니다. 스티브 잡스가 \'무엇을 만들지\'를 결정했다면, 조너선 아이브는 \'그것이 어떤 영혼을 가져야 하는지\'를 결정했습니다.\n\n그의 일대기는, **반드시 리더가 되지 않더라도, 조직 내에서 뚝심 있게 자신의 비전을 지켜낼 때 그 사람이 곧 조직의 \'정체성\'이 될 수 있음**을 보여주는 당신 같은 SVW 유형의 성공 스토리입니다.\n\n**💡 차별점 및 시사점 (당신을 위한 인생 플랜 조언)**\n\n조너선 아이브는 스티브 잡스라는, 그의 비전을 알아봐 주는 최고의 파트너가 있었습니다. **당신의 성공 역시, 당신의 이상과 가치를 알아보고 지지해 줄 수 있는 \'조력자\'나 \'리더\'를 만나는 것에 달려있을 수 있습니다.** 당신의 재능은 혼자일 때보다, 훌륭한 파트너와 함께할 때 몇 배 더 강력하게 빛날 것입니다.\n\n만약 당신의 정치 성향(P-Type)이 품격을 중시하는 **`ITUE`(원칙주의적 보수주의자)**라면, 당신은 단기적인 이익 때문에 조직의 철학을 바꾸려는 유혹에 맞서 싸우는, 모두가 존경하는 조직의 \'수호자\'가 될 것입니다.',
-    career_navigation: '**커리어 네비게이션**\n\n- **추천 직업:**\n    - 기업/기관의 문화 담당자, 역사 기록 담당자\n    - 대학교수, 연구원 (특정 학문 분야의 정신을 계승하는)\n    - 종교 지도자, 철학가\n    - 박물관, 미술관의 큐레이터\n\n- **성장 로드맵: 당신의 커리어 네비게이션**\n    - **1단계: 주니어 레벨 (1~5년차) - 조직의 \'역사\'와 \'철학\'을 흡수하라.**\n        \n        이 시기의 목표는, 당신이 속한 조직의 설립 이념과 핵심 가치를 누구보다 깊이 이해하고 체화하는 것입니다. 조직의 오래된 자료를 연구하고, 창업자나 원로들의 이야기를 경청하며 조직의 \'영혼\'이 무엇인지 파악해야 합니다.\n        주의해야 할 함정: 현실 감각 부재. 과거의 이상에만 매몰되어, 현재 조직이 마주한 현실적인 문제들을 외면하는 것입니다.\n        \n    - **2단계: 시니어 레벨 (5~15년차) - \'스토리텔러\'가 되어 비전을 전파하라.**\n        \n        이제 당신은 조직의 핵심 가치를 다음 세대에 전달하는 \'스토리텔러\'가 되어야 합니다. 신입사원 교육이나 사내 커뮤니케이션을 통해, 잊혀 가는 조직의 비전을 다시 일깨우고 구성원들에게 자부심을 심어주는 역할을 해야 합니다.\n        주의해야 할 함정: \'꼰대\'로 비칠 위험. 과거의 성공 방식이나 창업 정신만을 강조하는 모습이, 새로운 세대의 동료들에게는 낡고 고리타분한 \'꼰대\'처럼 비칠 수 있습니다.\n        \n    - **3단계: 엑스퍼트/리더 레벨 (15년차 이후) - 조직의 \'양심\'이자 \'나침반\'이 되어라.**\n        \n        당신은 조직이 단기적인 이익 때문에 길을 잃으려 할 때, "우리가 왜 이 일을 시작했는가?"라는 근본적인 질문을 던져 방향을 바로잡아주는 \'조직의 양심\'이 되어야 합니다. 이사회의 비상임 이사나 고문으로서, 조직의 장기적인 비전을 지키는 최종 수호자의 역할을 수행할 수 있습니다.\n        주의해야 할 함정: 변화에 대한 저항. 자신이 믿는 \'초심\'과 \'비전\'을 지키려는 마음이 너무 강한 나머지, 시대의 변화에 맞춰 꼭 필요한 혁신마저도 \'변질\'로 규정하고 저항하는 것입니다.\n        \n- **🎯 핵심 성장 과제:** \'현실과의 타협점\' 찾기. 확고한 신념과 이상은 조직의 나침반이 되지만, 때로는 현실적인 제약과 실질적인 실행 가능성을 고려한 유연한 접근이 필요합니다.',
-    recommended_books: [
-      {title: '어떻게 원하는 것을 얻는가', author: '스튜어트 다이아몬드'},
-      {title: '기브 앤 테이크', author: '애덤 그랜트'}
-    ],
-    recommended_content: '**📚 추천 도서:** **『어떻게 원하는 것을 얻는가』 (스튜어트 다이아몬드):** <a href="https://link.coupang.com/a/c4nB5n" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**📚 추천 도서:** **『기브 앤 테이크』 (애덤 그랜트):** <a href="https://link.coupang.com/a/c4nCox" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:** 유튜브에서 **\'조직 문화 혁신\', \'변화 관리 리더십\', \'내부 브랜딩\'** 관련 강의나 영상을 찾아보세요. 당신의 확고한 신념이 조직 전체의 동력으로 작용하도록 만드는 효과적인 소통 및 실행 전략을 배울 수 있습니다.\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*'
-  },
-
-  SAE: {
-    name: '데이터를 기반으로 도전하는 현실적 사업가',
-    category: 'economic',
-    code: 'SAE',
-    nickname: '데이터를 기반으로 도전하는 현실적 사업가',
-    keywords: ['안정지향', '데이터기반', '계산된도전', '리스크관리형창업', '현실주의'],
-    scores: {
-      '성장 중시 vs 안정 중시': 25,
-      '비전 투자 vs 데이터 투자': 10,
-      '기업가 기질 vs 안정가 기질': 70
-    },
-    description: '당신은 \'가장 안전한 길로 정상에 오르는 등반가\'입니다. 당신은 정상을 정복하려는 모험가(E)의 심장을 가졌지만, 절대로 아무런 준비 없이 암벽에 오르지 않습니다. 당신은 날씨 데이터와 지형 분석(A)을 통해 가장 안전한(S) 루트를 찾아내고, 모든 장비를 점검한 뒤에야 첫걸음을 떼는, 지극히 **\'계산적인 도전자\'**입니다. 당신은 \'대박\'을 꿈꾸기보다 \'망하지 않는 사업\'을 만드는 것을 더 중요하게 생각하는 현실적인 사업가이며, 이미 시장성이 검증된 아이템을 더 나은 데이터 분석을 통해 개선하거나 안정적인 현금흐름이 보장되는 사업을 선호합니다. 때로는 큰 기회를 놓칠 수도 있지만, 당신은 결코 통제 가능한 성공을 포기하지 않습니다. 결국 당신을 움직이는 핵심 동력은 "철저한 분석과 준비를 통해 성공의 확률을 최대한으로 높이고, 실패의 리스크를 최소화하고 싶다"는 욕망입니다.',
-    strengths: [
-      '**계산된 리스크 감수:** 당신은 무모한 도박을 하지 않습니다. 철저한 데이터 분석을 통해 \'이길 확률이 높은 싸움\'에만 참전하여, 실패 확률을 극적으로 낮춥니다.',
-      '**높은 생존력:** 안정적인 현금흐름을 중시하고, 최악의 시나리오를 항상 대비하므로, 어떤 위기 상황에서도 쉽게 무너지지 않는 강한 생존력을 가졌습니다.',
-      '**실용적인 문제 해결:** 뜬구름 잡는 비전보다, 당장 돈이 되는 현실적인 문제를 찾아내고, 가장 효율적인 방법으로 해결하는 데 능합니다.',
-      '**데이터 기반 설득력:** 당신의 사업 계획은 언제나 구체적인 숫자를 기반으로 하므로, 투자자나 팀원들을 설득하고 신뢰를 얻는 데 매우 유리합니다.',
-      '**시스템 구축 능력:** 한번 성공한 방식을, 누구나 따라 할 수 있는 \'시스템\'이나 \'매뉴얼\'로 만들어 효율적으로 사업을 확장하는 능력이 있습니다.'
-    ],
-    weaknesses: [
-      '**\'대박\'의 부재:** 지나치게 안정성만 추구한 나머지, 인생을 바꿀 수 있는 \'큰 기회\'를 놓치고, 언제나 \'작은 성공\'에만 머무를 수 있습니다.',
-      '**혁신에 대한 둔감성:** 이미 검증된 시장에만 집중하기 때문에, 시장의 판도를 완전히 바꾸는 새로운 기술이나 비즈니스 모델의 등장을 놓칠 수 있습니다.',
-      '**과도한 불신:** 자신의 데이터 분석을 제외한, 타인의 직관이나 비전을 믿지 못하여 좋은 파트너를 놓치거나 팀워크를 저해할 수 있습니다.',
-      '**성장의 한계:** 리스크가 적은 안정적인 사업 모델(예: 프랜차이즈)에만 집중하여, 기하급수적인 성장의 기회를 스스로 차단할 수 있습니다.',
-      '**지루함:** 너무 예측 가능한 성공만 반복하다 보면, 일에 대한 열정과 동기를 잃고 쉽게 지루함을 느낄 수 있습니다.'
-    ],
-    spectrum_analysis: '당신은 \'가장 안전한 길로 정상에 오르는 등반가\'입니다.\n\n당신은 정상을 정복하려는 모험가(E)의 심장을 가졌지만, 절대로 아무런 준비 없이 암벽에 오르지 않습니다. 당신은 날씨 데이터와 지형 분석(A)을 통해 가장 안전한(S) 루트를 찾아내고, 모든 장비를 점검한 뒤에야 첫걸음을 떼는, 지극히 **\'계산적인 도전자\'**입니다.',
-    detailed_analysis: '종합적으로 볼 때, 당신은 \'대박\'을 꿈꾸기보다 **\'망하지 않는 사업\'**을 만드는 것을 더 중요하게 생각하는 현실적인 사업가입니다. 당신은 창업(E)을 하더라도, 이미 시장성이 검증된 아이템을 더 나은 데이터(A) 분석을 통해 개선하거나, 안정적인(S) 현금흐름이 보장되는 프랜차이즈 사업 등을 선호합니다.\n\n**직장이나 사업에서 당신은,** \'가장 안전한 길로 정상에 오르는 등반가\'와 같습니다. 당신은 정상을 정복하려는 모험가(E)의 심장을 가졌지만, 절대로 아무런 준비 없이 암벽에 오르지 않습니다. 당신은 날씨 데이터와 지형 분석(A)을 통해 가장 안전한(S) 루트를 찾아내고, 모든 장비를 점검한 뒤에야 첫걸음을 떼는, 지극히 \'계산적인 도전자\'입니다.\n\n**투자에 있어서도 당신의 이런 기질은 그대로 드러납니다.** 당신은 미래의 비전보다는 과거의 데이터를 신뢰하며, 투자의 제1원칙은 \'원금 보장\'입니다. 하지만 동시에, 예금만으로는 부자가 될 수 없다는 것을 알기에, 데이터 분석을 통해 \'안정적이면서도 성장 가능성이 검증된\' 투자처를 끊임없이 탐색합니다.\n\n**당신을 움직이는 가장 깊은 곳의 욕망은 \'통제 가능한 성공\'입니다.** 당신은 예측 불가능한 행운을 바라기보다, 철저한 분석과 준비를 통해 성공의 확률을 최대한으로 높이고, 실패의 리스크를 최소화하는 과정에서 가장 큰 안정감과 성취감을 느낍니다.',
-    synergy_partner: '**🤝 시너지 파트너: `GVW` (미래를 예측하는 조직의 탐험가)**\n\n당신은 \'현재\' 시장에서 가장 안전하게 성공하는 법을 알고 있지만, GVW는 \'미래\' 시장이 어떻게 변할지를 봅니다. 왜냐하면, 그가 제시하는 미래 트렌드를, 당신의 데이터 분석력과 실행력으로 검증하고 사업화할 때, 당신은 누구보다 빠르고 안전하게 새로운 시장을 선점할 수 있기 때문입니다. 그의 \'비전\'이 당신의 \'실행력\'에 날개를 달아주는 격입니다.',
-    risk_partner: '**🔥 리스크 파트너: `SVE` (자신만의 속도로 세상을 바꾸는 사회적 기업가)**\n\n당신과 SVE의 파트너십은 \'돈\'과 \'가치\'의 우선순위에서 계속 충돌합니다. 왜냐하면, 당신은 \'최저가\' 원료를 찾아 수익률을 높이려 하지만, 그는 "가격이 20% 비싸더라도, 친환경 원료를 써야 합니다"라고 주장하기 때문입니다. 사업의 모든 의사결정 과정에서 피로감을 느낄 수 있습니다.',
-    success_formula: '**💰 성공 공식: 부 = (철저한 분석 x 계산된 실행) + 시스템화**\n\n당신의 부는 철저한 **\'데이터 분석(A)\'**을 통해 리스크를 최소화하고, \'이길 수 있는 싸움\'에만 **\'계산된 실행(E)\'**을 하는 현실적인 접근에서 나옵니다. 그리고 한번 성공한 방식을, 누구나 따라 할 수 있는 **\'시스템\'**으로 만들어 복제하고 확장해 나갈 때, 당신의 부는 안정적으로 성장하게 됩니다.\n\n**🚀 성공 전략 레벨업:**\n당신의 성공을 가속화하는 것은 **\'리스크 자체를 상품화\'**하는 것입니다. 당신의 뛰어난 데이터 분석 능력을 활용하여, 다른 사람들이 두려워하는 \'고위험\' 시장(예: 부실 채권, 회생 기업)에서 \'진주\'를 찾아내는 전문가가 되십시오. 남들이 보지 못하는 데이터를 통해, 당신은 가장 안전하게 가장 높은 수익을 얻을 수 있습니다.',
-    failure_formula: '**💸 실패 공식: 정체 = 안정 추구 - 최소한의 모험**\n\n반대로 당신의 실패는, \'망하지 않는 것(S)\'에만 너무 집중한 나머지, **\'최소한의 계산된 모험(E)\'**조차 시도하지 않을 때 발생합니다. 리스크 \'0\'의 사업은 존재하지 않습니다. 당신의 지나친 신중함이, 당신을 평생 \'준비만 하는 사람\'으로 만들 수 있다는 것을 경계해야 합니다.\n\n**🚨 치명적 리스트 경고:**\n당신에게 가장 치명적인 순간은, **당신의 완벽한 데이터 분석 모델이 설명하지 못하는 시장의 \'비이성적 광기\'를 마주했을 때**입니다. 데이터상으로는 절대 일어날 수 없는 일이 벌어질 때, 당신은 모든 것을 잃을 수 있다는 패닉에 빠져 잘못된 결정을 내릴 수 있습니다. 시장은 언제나 당신의 계산보다 한 수 위일 수 있음을 인정해야 합니다.',
-    benchmarking: '### **성공 DNA 벤치마킹: 당신의 잠재력, \'레이 크록\'과 닮았다**\n\n**유사 인물:** **레이 크록 (맥도날드 프랜차이즈 창업자)**\n\n인물 소개: 52세의 나이에 맥도날드 형제의 작은 햄버거 가게에서 잠재력을 발견하고, 이것을 세계 최대의 패스트푸드 제국으로 키워낸 \'시스템 경영\'의 대가입니다.\n\n**[성공의 일대기: 시스템으로 제국을 건설한 SAE의 여정]**\n\n레이 크록은 햄버거를 발명하지 않았습니다. 그는 이미 성공적으로 운영되고 있던 맥도날드 형제의 \'빠른 서비스 시스템\'을 발견하고, 그 시스템의 효율성(A)과 안정성(S)에 주목했습니다. 그는 새로운 것을 창조하기보다, **\'성공이 검증된 모델을 어떻게 복제하고 확장할 것인가\'**를 고민했습니다.\n\n그의 기업가 정신(E)은 \'혁신적인 제품 개발\'이 아닌, \'완벽한 프랜차이즈 시스템 구축\'에서 발휘되었습니다. 그는 캘리포니아의 햄버거 맛과 뉴욕의 햄버거 맛이 정확히 똑같도록 만드는, 데이터 기반의 철저한 매뉴얼과 관리 시스템을 만들었습니다.\n\n그의 일대기는, **세상에 없던 아이디어가 아니더라도, 기존의 성공 모델을 데이터로 분석하고 시스템화하는 능력**이 얼마나 위대한 사업을 만들 수 있는지 보여주는, 당신 같은 SAE 유형의 완벽한 교과서입니다.\n\n**💡 차별점 및 시사점 (당신을 위한 인생 플랜 조언)**\n\n레이 크록의 천재성은 \'시스템\'의 힘을 간파하고 그것을 극대화한 데 있습니다. **당신의 성공은, 그의 시스템 구축 능력에 당신만의 \'가치\'를 더하는 것에서 한 단계 더 진화할 수 있습니다.**\n\n만약 당신의 정치 성향(P-Type)이 공동체의 화합을 중시하는 **`CTAE`(실용주의적 공동체주의자)**라면, 당신은 단순히 효율적인 프랜차이즈를 넘어, 모든 가맹점주들과 함께 성장하고 이익을 공유하는 **\'상생의 플랫폼\'**을 설계할 수 있습니다. 이는 당신을 냉정한 사업가를 넘어, 존경받는 리더로 만들어 줄 것입니다. 당신의 데이터 분석 능력을, 더 따뜻하고 의미 있는 제국을 건설하는 데 사용하십시오',
-    career_navigation: '**커리어 네비게이션**\n\n- **추천 직업:**\n    - 프랜차이즈 창업가 / 가맹 사업 본부장\n    - M&A 전문가, 기업 인수 전문가\n    - 부동산 개발업자(디벨로퍼)\n    - 데이터 기반의 커머스 사업가\n\n- **성장 로드맵: 당신의 커리어 네비게이션**\n    - **1단계: 주니어 레벨 (1~5년차) - \'성공 시스템\'을 학습하고 분석하라.**\n        \n        이 시기의 목표는, 이미 성공이 검증된 비즈니스 모델(예: 성공적인 프랜차이즈, 유망한 상권)을 철저히 학습하고, 그 성공 요인을 데이터로 분석하는 것입니다. 당신은 \'왜 성공했는가\'를 남들보다 더 깊이 있게 설명할 수 있어야 합니다.\n        주의해야 할 함정: 어설픈 모방. 성공의 핵심 원리를 분석하기보다, 겉모습만 따라 하다가 실패하는 것입니다.\n        \n    - **2단계: 시니어 레벨 (5~15년차) - 첫 번째 \'성공 복제\'를 경험하라.**\n        \n        이제 당신의 분석을 바탕으로, 검증된 모델을 직접 \'복제\'하여 성공시키는 경험을 해야 합니다. 직접 프랜차이즈 점포를 열어 성공시키거나, 저평가된 소규모 사업체를 인수하여 데이터 기반으로 개선하고 가치를 높이는 프로젝트를 실행하십시오.\n        주의해야 할 함정: 디테일의 실패. 시스템의 핵심은 \'디테일\'에 있습니다. "이 정도는 괜찮겠지"라는 안일한 생각으로 시스템의 작은 부분을 무시하다가, 전체 시스템이 무너지는 경험을 할 수 있습니다.\n        \n    - **3단계: 엑스퍼트/리더 레벨 (15년차 이후) - \'시스템 확장 전문가\'가 되어라.**\n        \n        하나의 성공 복제 경험을 바탕으로, 이제 당신은 성공을 \'확장\'시키는 전문가가 되어야 합니다. 더 많은 프랜차이즈 점포를 관리하거나, 유망한 사업체를 계속 인수하며 당신의 \'성공 시스템\' 제국을 건설해나가야 합니다. 당신의 최종 목표는 하나의 사업가가 아닌, 여러 사업체를 거느린 \'자산가\'입니다.\n        주의해야 할 함정: 문어발식 확장. 자신의 시스템이 통하지 않는 새로운 분야에, 과거의 성공 공식만 믿고 무리하게 진출하다가 위기를 맞을 수 있습니다.\n        \n- **🎯 핵심 성장 과제:** \'인간적인 관계\'에 대한 투자. 데이터와 효율성에 기반한 판단은 강점이지만, 사업은 결국 사람과 사람의 연결입니다. 때로는 숫자 너머의 인간적인 신뢰와 관계 형성에 더 많은 에너지를 투자해야 합니다.',
-    recommended_books: [
-      {title: '한국형 장사의 신', author: '김유진'},
-      {title: '아이디어 불패의 법칙', author: '알베르토 사보이아'}
-    ],
-    recommended_content: '**📚 추천 도서:** **『한국형 장사의 신』 (김유진):** <a href="https://link.coupang.com/a/c4nCQe" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**📚 추천 도서:** **『아이디어 불패의 법칙』 (알베르토 사보이아):** <a href="https://link.coupang.com/a/c4nDkm" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:** 유튜브에서 **\'고객 관계 관리 (CRM)\', \'네트워킹 전략\', \'사업 제휴 노하우\'** 관련 강의나 영상을 찾아보세요. 당신의 데이터 기반 사업 역량에 사람을 얻는 기술을 더하여, 사업의 지속적인 성공을 위한 기반을 다질 수 있습니다.\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*'
-  },
-
-  SAW: {
-    name: '리스크를 관리하는 조직의 파수꾼',
-    category: 'economic',
-    code: 'SAW',
-    nickname: '리스크를 관리하는 조직의 파수꾼',
-    keywords: ['안정지향', '데이터기반', '리스크관리', '원칙주의', '시스템수호자'],
-    scores: {
-      '성장 중시 vs 안정 중시': 10,
-      '비전 투자 vs 데이터 투자': 15,
-      '기업가 기질 vs 안정가 기질': 5
-    },
-    description: '당신은 \'성벽을 쌓고 규칙을 만드는 철벽의 수호자\'입니다. 당신은 불확실한 미래에 베팅하기보다, 데이터를 통해 검증된 원칙(A)을 바탕으로 현재의 자산을 안전하게 지키고(S), 이 모든 과정을 예측 가능하고 안정적인 조직(W) 안에서 수행하는 것을 최우선으로 합니다. 당신의 철저한 신중함은 모든 가능성을 검토하고 최악의 시나리오를 대비하여 조직을 치명적인 위험으로부터 구하는 최고의 방어막이며, 원칙과 규칙에 따라 업무를 처리하므로 주변 사람들로부터 \'믿고 맡길 수 있는 사람\'이라는 깊은 신뢰를 얻습니다. 때로는 변화의 기회를 놓칠 수도 있지만, 당신은 결코 안정성과 신뢰성을 포기하지 않습니다. 결국 당신을 움직이는 핵심 동력은 "예측 가능하고 안정적인 시스템 안에서 모든 것을 완벽하게 관리하고 싶다"는 욕망입니다.',
-    strengths: [
-      '**철저한 신중함:** 모든 가능성을 검토하고 최악의 시나리오를 대비하는 당신의 신중함은, 조직을 치명적인 위험으로부터 구하는 최고의 방어막입니다.',
-      '**높은 신뢰도:** 원칙과 규칙에 따라 업무를 처리하므로, 주변 사람들로부터 \'믿고 맡길 수 있는 사람\'이라는 깊은 신뢰를 얻습니다.',
-      '**디테일에 대한 강점:** 다른 사람들이 놓치는 사소한 오류나 잠재적 위험 요소를 찾아내는 데 천부적인 재능이 있습니다.',
-      '**시스템 구축 능력:** 무질서한 상황을 정리하고, 명확한 규칙과 프로세스를 통해 예측 가능한 시스템을 만드는 데 뛰어납니다.',
-      '**꾸준함과 안정성:** 한번 맡은 일은 중간에 포기하지 않고, 꾸준하고 안정적으로 처리하여 조직에 기여합니다.'
-    ],
-    weaknesses: [
-      '**변화에 대한 저항:** 새로운 아이디어나 시도를, 기존의 안정된 질서를 파괴하는 \'위험 요소\'로 간주하고 저항하는 경향이 있습니다.',
-      '**지나친 비관주의:** 항상 최악의 시나리오를 먼저 생각하는 성향 때문에, 긍정적인 가능성을 보지 못하고 새로운 도전을 시작조차 못 하게 만들 수 있습니다.',
-      '**결정 지연:** 모든 리스크를 완벽하게 통제하려는 욕심 때문에, 중요한 의사결정을 제때 내리지 못하고 기회를 놓칠 수 있습니다.',
-      '**창의성 억압:** 당신의 지나친 원칙주의와 리스크 관리가, 당신 자신과 팀원들의 창의적인 아이디어를 억압하는 걸림돌이 될 수 있습니다.',
-      '**\'안주\'의 위험:** 변화를 \'리스크\'로만 간주하여, 정작 변화하지 않아서 발생하는 \'도태의 리스크\'를 간과할 수 있습니다.'
-    ],
-    spectrum_analysis: '당신은 \'성벽을 쌓고 규칙을 만드는 철벽의 수호자\'입니다.\n\n당신은 불확실한 미래에 베팅하기보다, 데이터를 통해 검증된 원칙(A)을 바탕으로 현재의 자산을 안전하게 지키고(S), **이 모든 과정을 예측 가능하고 안정적인 조직(W) 안에서 수행**하는 것을 최우선으로 합니다.',
-    detailed_analysis: '종합적으로 볼 때, 당신은 \'안정적인 조직(W)\' 안에서 \'데이터(A)\'를 기반으로 \'리스크를 최소화(S)\'하는 역할에 가장 특화된 사람입니다. 당신은 화려한 영웅이 되기보다, 보이지 않는 곳에서 조직이 무너지지 않도록 묵묵히 성벽을 쌓고 규칙을 정비하는 \'수호자\'의 역할에서 가장 큰 안정감과 성취를 느낍니다.\n\n**직장이나 사업에서 당신은,** 조직의 \'면역 체계\'와 같습니다. 동료가 새로운 아이디어를 제안할 때, 당신은 그 아이디어의 장점보다 "그래서 예산은 얼마고, 법적인 문제는 없으며, 실패 시 책임은 누가 지나요?"라는 질문을 먼저 던져, 조직이 치명적인 위험에 빠지는 것을 예방합니다.\n\n**투자에 있어서도 당신의 이런 기질은 그대로 드러납니다.** 당신은 \'수익률\'보다 \'원금 손실 가능성 0%\'라는 문구에 더 큰 신뢰를 보냅니다. 당신의 포트폴리오는 예금, 국채, 최고 등급의 회사채 등 세상에서 가장 안전한 자산들로 구성될 가능성이 높습니다.\n\n**당신을 움직이는 가장 깊은 곳의 욕망은 \'확실성\'과 \'예측 가능성\'입니다.** 당신은 불확실한 모든 것을 경계하며, 잘 짜인 시스템과 원칙 안에서 모든 것이 예측 가능하게 움직일 때 가장 큰 평온함을 느낍니다. 당신의 철저함과 신중함은 당신이 속한 조직을 모든 위험으로부터 지켜주는 가장 든든한 방패입니다.',
-    synergy_partner: '**🤝 시너지 파트너: `GWE` (안정된 조직의 성장을 이끄는 사내 기업가)**\n\nGWE가 조직 안에서 새로운 도전을 할 때, 당신은 그 도전이 일으킬 수 있는 모든 법적, 재무적 리스크를 미리 찾아내고 대비시키는 최고의 \'리스크 관리자\'가 될 수 있습니다. 왜냐하면, 그의 \'성장 엔진\'에 당신이라는 \'안전벨트\'가 더해질 때, 조직은 가장 빠르면서도 가장 안전하게 성장할 수 있기 때문입니다.',
-    risk_partner: '**🔥 리스크 파트너: `SVE` (자신만의 속도로 세상을 바꾸는 사회적 기업가)**\n\n당신은 \'규칙과 절차\'를 생명처럼 여기지만, SVE는 \'대의와 가치\'를 위해 때로는 규칙을 무시할 수 있다고 믿습니다. 이는 마치, 재난 상황에서 SVE 파트너가 회사 물품을 즉시 기부하려 할 때, 당신은 "규정상 품의서를 먼저 올려야 합니다"라고 막아서는 것과 같은 갈등을 유발할 수 있습니다.',
-    success_formula: '**💰 성공 공식: 부 = 시스템 구축 x 시간**\n\n당신의 부는 \'시스템\'을 통해 창출됩니다. 당신은 실수가 발생할 수 있는 모든 위험 요소를 데이터(A)로 분석하고, 그것을 방지하는 안정적인 **시스템(S, W)**을 구축하는 데 능합니다. 잘 만들어진 시스템은 특별한 노력 없이도, **\'시간\'**이 흐를수록 당신에게 꾸준한 안정과 부를 가져다줄 것입니다.\n\n**🚀 성공 전략 레벨업:**\n당신의 가치를 극대화하는 방법은, 당신의 리스크 관리 능력을 \'개인\'이 아닌 \'조직\' 전체의 자산으로 만드는 것입니다. 당신만 알고 있는 노하우를 \'체크리스트\', \'매뉴얼\', \'자동화 시스템\'으로 만들어, 당신이 없어도 조직 전체가 더 안전하게 일할 수 있도록 만드십시오. 당신은 단순한 실무자가 아닌, \'시스템 설계자\'가 되어야 합니다.',
-    failure_formula: '**💸 실패 공식: 도태 = 현재의 완벽함 - 미래 변화 대비(0)**\n\n하지만 당신이 만든 **\'현재의 완벽한 시스템\'**을 맹신한 나머지, 미래의 기술적, 사회적 변화에 대비하는 것을 **\'0\'**으로 놓을 때, 당신의 시스템은 어느 날 갑자기 쓸모없게 되어 도태될 수 있습니다. 어제의 정답이 오늘의 오답이 될 수 있다는 것을 잊으면, 당신의 안정성은 한순간에 무너질 수 있습니다.\n\n**🚨 치명적 리스크 경고:**\n당신에게 가장 치명적인 순간은, **당신의 \'NO\'가 조직의 성장을 막는 걸림돌이 될 때**입니다. 당신은 리스크를 막기 위해 \'안된다\'고 말하지만, 리더의 입장에서는 \'새로운 도전을 방해하는 사람\'으로 비칠 수 있습니다. \'안된다\'고 말하기 전에, "이러이러한 조건이 충족된다면, 안전하게 할 수 있습니다"라는 대안을 함께 제시하는 습관을 들여야 합니다.',
-    benchmarking: '### **성공 DNA 벤치마킹: 당신의 잠재력, \'워런 버핏\'과 닮았다**\n\n**유사 인물:** **워런 버핏 (버크셔 해서웨이 회장)**\n\n인물 소개: \'오마하의 현인\'이라 불리는, 역사상 가장 성공적인 투자자입니다. 그는 단기적인 시세차익이 아닌, 기업의 내재가치에 장기적으로 투자하는 \'가치 투자\'의 대명사입니다.\n\n**[성공의 일대기: 원칙으로 부를 쌓은 SAW의 여정]**\n\n워런 버핏의 투자 철학은 단순하고 명확합니다. "첫 번째 규칙: 절대 돈을 잃지 마라. 두 번째 규칙: 첫 번째 규칙을 절대 잊지 마라." 그는 화려한 비전(V)이 아닌, 기업의 내재가치를 철저히 데이터(A)로 분석하여 \'안전마진\'을 확보(S)하는 투자 원칙을 평생 지켜왔습니다.\n\nIT 버블이 한창일 때 모두가 그를 \'시대에 뒤떨어진 투자자\'라고 비웃었지만, 그는 자신의 원칙을 지켰고 결국 거품이 꺼진 후 최후의 승자가 되었습니다. 그는 안정적인 조직(W)을 선호하며, 예측 불가능한 것에 베팅하지 않습니다.\n\n그의 일대기는, **시장의 소음에 흔들리지 않고, 자신만의 \'원칙\'과 \'시간\'이라는 가장 강력한 무기**로 꾸준히 부를 쌓아나가는 당신 같은 SAW 유형의 위대함을 보여줍니다.\n\n**💡 차별점 및 시사점 (당신을 위한 인생 플랜 조언)**\n\n워런 버핏은 "10년 동안 보유할 주식이 아니면, 10분도 쳐다보지 말라"고 말했습니다. **당신의 성공은 단순히 기업을 잘 분석하는 것(A)을 넘어, 시장의 공포와 탐욕 속에서도 \'기다릴 줄 아는 인내심\'을 갖추는 것에 달려있습니다.** 시간이 당신의 편이라는 것을 믿어야 합니다.\n\n만약 당신의 정치 성향(P-Type)이 원칙을 중시하는 **`CTUS`(국가주의적 보수주의자)**라면, 당신은 그 어떤 외부의 압력에도 흔들리지 않고, 공동체의 안정을 위한 원칙을 끝까지 지켜내는 최고의 수호자가 될 것입니다.',
-    career_navigation: '**커리어 네비게이션**\n\n- **추천 직업:**\n    - 공무원(감사, 재무 직렬), 공기업 경영지원팀, 대기업 재무/회계/인사팀\n\n- **성장 로드맵: 당신의 커리어 네비게이션**\n    - **1단계: 주니어 레벨 (1~5년차) - \'룰북\'과 \'데이터\'를 완벽하게 마스터하라.**\n        \n        이 시기의 목표는, 당신이 몸담은 분야의 모든 규칙과 데이터를 완벽하게 당신의 것으로 만드는 것입니다. 당신의 꼼꼼함과 정확성은 조직의 실수를 방지하는 가장 중요한 자산입니다. 실수를 하지 않는 것만으로도, 당신은 조직에서 가장 높은 신뢰를 얻게 될 것입니다.\n        주의해야 할 함정: 나무만 보고 숲을 보지 못하는 것. 세부적인 규칙과 데이터에만 매몰되어, 그 규칙이 존재하는 이유나 회사의 더 큰 비즈니스 전략을 이해하지 못하고 기계적인 실무자로 남는 것입니다.\n        \n    - **2단계: 시니어 레벨 (5~15년차) - \'더 나은 시스템\'을 설계하라.**\n        \n        단순히 규칙을 따르는 것을 넘어, \'더 나은 규칙과 시스템\'을 직접 설계하고 도입하는 단계로 나아가야 합니다. 당신의 경험과 데이터를 바탕으로, 조직의 잠재적 리스크를 예방하고 효율성을 높이는 새로운 프로세스를 제안하십시오. 당신은 이제 규칙의 \'수호자\'에서 \'설계자\'가 됩니다.\n        주의해야 할 함정: 변화에 대한 과도한 저항. 자신이 만든 안정적인 시스템을 맹신한 나머지, 새로운 기술이나 외부 환경의 변화를 \'위협\'으로만 간주하고 저항하는 것입니다.\n        \n    - **3단계: 엑스퍼트/리더 레벨 (15년차 이후) - 조직의 \'최고의사결정자\'를 조언하라.**\n        \n        당신은 조직 전체의 리스크를 관리하고, CEO나 이사회의 가장 신뢰받는 \'브레이크\'이자 \'안전벨트\'가 되어야 합니다. 당신의 최종 역할은, 리더가 내리는 모든 중요한 의사결정에 숨겨진 리스크를 명확히 제시하고, 가장 안전한 성공의 길로 안내하는 최고리스크책임자(CRO) 또는 최고재무책임자(CFO)입니다.\n        주의해야 할 함정: 성장의 기회를 완전히 차단하는 것. 리스크 관리에만 너무 집중한 나머지, 조직이 성장하기 위해 반드시 감수해야 할 \'계산된 리스크\'마저도 \'NO\'라고 말하며 조직을 정체시키는 것입니다.\n        \n- **🎯 핵심 성장 과제:** \'변화에 대한 유연성\' 확보. 조직의 안정과 리스크 관리는 최우선 가치이지만, 때로는 과도한 보수성이 기회 비용으로 작용할 수 있습니다. 계산된 위험을 감수하고 변화를 포용하는 유연한 태도가 필요합니다.',
-    recommended_books: [
-      {title: '블랙 스완', author: '나심 니콜라스 탈레브'},
-      {title: '더 골', author: '엘리 골드렛'}
-    ],
-    recommended_content: '**📚 추천 도서:** **『블랙 스완』 (나심 니콜라스 탈레브):** <a href="https://link.coupang.com/a/c4nDIP" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**📚 추천 도서:** **『더 골』 (엘리 골드렛):** <a href="https://link.coupang.com/a/c4nD4E" target="_blank" rel="noopener noreferrer" class="text-blue-600 underline">(도서 최저가 구매하기)</a>\n\n**🎬 추천 영상/강의:** 유튜브에서 **\'위기 관리 전략\', \'준법 경영\', \'사업 연속성 계획(BCP)\'** 관련 강의나 영상을 찾아보세요. 당신의 탁월한 리스크 관리 능력을 조직의 지속 가능한 성장을 위한 강력한 방패이자, 때로는 새로운 기회를 모색하는 발판으로 삼는 방법을 배울 수 있습니다.\n\n*이 포스팅은 쿠팡 파트너스 활동의 일환으로, 이에 따른 일정액의 수수료를 제공받습니다.*'
-  }
-};
-
-// Merge rich political details parsed from text into political entries
-// political_details.ts의 내용이 results.ts의 하드코딩된 내용을 완전히 덮어씁니다
-try {
-  Object.entries(politicalDetails).forEach(([code, details]) => {
-    if (results[code] && results[code].category === 'political') {
-      // results.ts에서 제거해야 할 하드코딩된 상세 필드들
-      const fieldsToRemove = [
-        'speech_style',
-        'stress_moment',
-        'solution',
-        'love_value',
-        'best_partner',
-        'worst_partner',
-        'communication_barrier',
-        'career_value',
-        'financial_style', // political_details.ts의 money_value로 대체됨
-        'historical_avatar',
-        'real_avatar',
-        'growth_direction',
-        'final_goal',
-        'recommended_books',
-        'recommended_content',
-        'growth_task',
-        'detailed_description', // political_details.ts의 것으로 대체됨
-        'political_spectrum_detail', // political_details.ts의 것으로 대체됨
-        'summary', // political_details.ts의 것으로 대체됨
-        'political_spectrum', // political_details.ts의 것으로 대체됨
-        'strengths', // political_details.ts의 것으로 대체됨
-        'weaknesses', // political_details.ts의 것으로 대체됨
-        'keywords', // political_details.ts의 것으로 대체됨
-      ];
-      
-      // 하드코딩된 필드들 제거
-      fieldsToRemove.forEach(field => {
-        delete (results[code] as any)[field];
-      });
-      
-      // political_details.ts의 모든 필드를 results.ts에 덮어씁니다
-      Object.assign(results[code], details);
-      
-      // recommended_content가 있는 경우 명시적으로 설정 (IPAE, IPAS 등)
-      if (details.recommended_content) {
-        (results[code] as any).recommended_content = details.recommended_content;
-      }
-      
-      // money_value를 financial_style로 alias (컴포넌트 호환성을 위해)
-      if ((results[code] as any).money_value) {
-        (results[code] as any).financial_style = (results[code] as any).money_value;
-      }
-      
-      // Remove accidental growth_task strings (e.g., parsed '추천 도서' 라인)
-      if ((results[code] as any).growth_task && typeof (results[code] as any).growth_task === 'string') {
-        const taskStr = (results[code] as any).growth_task;
-        if (taskStr.includes('📚 추천 도서') || taskStr.includes('추천 도서')) {
-          delete (results[code] as any).growth_task;
-        }
-      }
-    }
-  });
-} catch (e) {
-  // no-op: keep base data if merge fails
+/**
+ * 유형 하나의 상세 필드(html 포함)만 불러옵니다. results[code]와 합쳐서 씁니다.
+ */
+export async function loadResultDetails(code: string): Promise<Partial<ResultData> | null> {
+  return (await loadTypeDetails(code)) as Partial<ResultData> | null;
 }
@@ -46,6 +46,7 @@ export interface ResultData {
   worst_partner?: string;
   communication_barrier?: string;
   career_value?: string;
+  money_value?: string;
   financial_style?: string;
   historical_avatar?: string;
   real_avatar?: string;
@@ -54,6 +55,8 @@ export interface ResultData {
   recommended_books?: Array<{title: string; author: string; link?: string}>;
   recommended_content?: string;
   final_goal?: string;
+  // 빌드 시 미리 렌더링된 본문 HTML (필드 이름 → HTML 조각, 요약 모듈에는 ResultCard용 설명 필드만 있음)
+  html?: Record<string, string>;
 }
 
 export interface Scores {
@@ -0,0 +1,5 @@
+# -*- coding: utf-8 -*-
+"""
+PEIT 콘텐츠 파이프라인 공용 모듈
+- lib/*.ts 의 데이터 리터럴 파싱 및 수정
+"""
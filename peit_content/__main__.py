@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+"""python -m peit_content → peit-content 명령줄 도구"""
+
+import sys
+
+from peit_content.cli import main
+
+sys.exit(main())
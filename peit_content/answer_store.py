@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+"""
+응답 벡터 저장소 (비트 압축 + numpy.memmap, NumPy 필요)
+- 응답자 한 명 = uint64 두 워드: 정치 q1~q36 / 경제 q37~q69, 문항마다 한 비트 (1이면 'B')
+- 답한 문항 비트마스크, 시각(ms), 검사 종류를 같은 순서의 열 파일로 따로 둠
+- 열 파일에는 뒤에 덧붙이기만 하고, 마지막에 meta.json의 count를 갱신해 커밋
+  (manifest.save_cache - 고유 임시 파일에 쓴 뒤 os.replace)
+  (count 뒤에 남은 쓰다 만 바이트는 무시하고 다음 append 때 잘라냄)
+- 읽기는 memmap을 청크 단위로 훑으므로 메모리 사용량이 건수와 무관
+- 다시 채점은 축별 문항 마스크와 AND한 비트의 popcount 합 (행렬을 풀지 않음, NumPy 2.0+)
+
+    store/
+      meta.json       {"version": 1, "count": N, "words": [[1..36], [37..69]]}
+      answers.u64     (N × 2) 'B' 비트
+      answered.u64    (N × 2) 답한 문항 비트
+      timestamp.i64   (N,) 유닉스 시각 ms (모르면 0)
+      test_type.u8    (N,) 0 전체(both), 1 정치, 2 경제
+"""
+
+import json
+import os
+from datetime import datetime
+
+import numpy as np
+
+from peit_content.manifest import save_cache
+from peit_content.scoring import question_number
+
+VERSION = 1
+WORDS = [list(range(1, 37)), list(range(37, 70))]
+# 검사 종류 (ResultLandingClient의 testType, 'both'와 미기록은 전체 검사)
+TEST_TYPE_NAMES = ['both', 'political', 'economic']
+TEST_TYPES = {name: code for code, name in enumerate(TEST_TYPE_NAMES)}
+CHUNK_ROWS = 1 << 20
+# 채점 청크 (축 마스크와의 AND 임시 배열이 행 × 14 × 8바이트)
+SCORE_ROWS = 1 << 16
+
+# 열 이름 → (파일 이름, dtype, 행당 값 개수)
+COLUMNS = {
+    'answers': ('answers.u64', np.dtype('<u8'), len(WORDS)),
+    'answered': ('answered.u64', np.dtype('<u8'), len(WORDS)),
+    'timestamp': ('timestamp.i64', np.dtype('<i8'), 1),
+    'test_type': ('test_type.u8', np.dtype('u1'), 1),
+}
+
+_WORD_MASK = (1 << 64) - 1
+_B_SHIFT = 64 * len(WORDS)
+_MASK = (1 << _B_SHIFT) - 1
+
+# 문항 번호 → (워드, 비트)
+_POSITION = {q: (w, bit) for w, word in enumerate(WORDS) for bit, q in enumerate(word)}
+
+
+def parse_timestamp(value):
+    """숫자(초 또는 ms)나 ISO 8601 문자열 → 유닉스 시각 ms"""
+    if value is None or value == '':
+        return 0
+    if isinstance(value, (int, float)):
+        # 10^11 미만이면 초 단위로 봄 (ms로 읽으면 1973년 이전이라 실제 기록과 겹치지 않음)
+        return int(value * 1000) if abs(value) < 1e11 else int(value)
+    return int(datetime.fromisoformat(str(value).replace('Z', '+00:00')).timestamp() * 1000)
+
+
+class AnswerStore:
+    """디렉터리 하나에 있는 열 파일 묶음"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.meta_path = os.path.join(directory, 'meta.json')
+        self.count = 0
+        self._flags_cache = {}
+        if os.path.exists(self.meta_path):
+            with open(self.meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if meta.get('version') != VERSION or meta.get('words') != WORDS:
+                raise ValueError(f'{directory}: 지원하지 않는 저장소 형식')
+            self.count = meta['count']
+
+    def _path(self, column):
+        return os.path.join(self.directory, COLUMNS[column][0])
+
+    def _write_meta(self):
+        save_cache(self.meta_path, {'version': VERSION, 'count': self.count, 'words': WORDS})
+
+    def _flags(self, item):
+        """(문항 키, 답) → 답한 문항 비트 | B 비트 << 128 (행 전체를 정수 하나로 볼 때 워드 w는 64·w 비트부터)"""
+        key, answer = item
+        position = _POSITION.get(question_number(key)) if isinstance(answer, str) else None
+        if position is None or answer not in ('A', 'B'):
+            return 0
+        word, bit = position
+        flag = 1 << (64 * word + bit)
+        return flag | (flag << _B_SHIFT if answer == 'B' else 0)
+
+    def _encode(self, answers):
+        """{'q1': 'A', ...} → (B 비트, 답한 문항 비트) 정수 - 같은 문항이 또 나오면 나중 답으로 덮어씀"""
+        cache = self._flags_cache
+        try:
+            values = list(map(cache.__getitem__, answers.items()))
+        except (KeyError, TypeError):
+            values = [cache.setdefault(item, self._flags(item)) if isinstance(item[1], str) else 0
+                      for item in answers.items()]
+        # 문항이 겹치지 않으면 합 = OR
+        total = sum(values)
+        mask = total & _MASK
+        if mask.bit_count() == len(values) - values.count(0):
+            return total >> _B_SHIFT, mask
+        bits = mask = 0
+        for value in values:
+            flag = value & _MASK
+            mask |= flag
+            bits = bits & ~flag | value >> _B_SHIFT
+        return bits, mask
+
+    def append(self, records):
+        """(answers, timestamp, test_type) 들을 덧붙임 → 덧붙인 건수
+
+        같은 문항으로 해석되는 키가 여러 개면 마지막 답만 남음 (문항당 한 비트)
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        # 지난번에 쓰다 만 꼬리 제거
+        for column, (_, dtype, width) in COLUMNS.items():
+            path = self._path(column)
+            if os.path.exists(path) and os.path.getsize(path) != self.count * dtype.itemsize * width:
+                os.truncate(path, self.count * dtype.itemsize * width)
+
+        files = {column: open(self._path(column), 'ab') for column in COLUMNS}
+        added = 0
+        try:
+            batch = []
+            for answers, timestamp, test_type in records:
+                bits, mask = self._encode(answers)
+                batch.append((bits, mask, parse_timestamp(timestamp), TEST_TYPES.get(test_type, 0)))
+                if len(batch) == CHUNK_ROWS:
+                    added += self._write_batch(files, batch)
+                    batch = []
+            if batch:
+                added += self._write_batch(files, batch)
+        finally:
+            for f in files.values():
+                f.close()
+        self.count += added
+        self._write_meta()
+        return added
+
+    @staticmethod
+    def _write_batch(files, batch):
+        bits, mask, timestamps, test_types = zip(*batch)
+        files['answers'].write(_split_words(bits).tobytes())
+        files['answered'].write(_split_words(mask).tobytes())
+        files['timestamp'].write(np.array(timestamps, dtype='<i8').tobytes())
+        files['test_type'].write(np.array(test_types, dtype='u1').tobytes())
+        return len(batch)
+
+    def column(self, name):
+        """커밋된 count 행만 보이는 읽기 전용 memmap"""
+        _, dtype, width = COLUMNS[name]
+        if self.count == 0:
+            return np.zeros((0, width) if width > 1 else 0, dtype=dtype)
+        shape = (self.count, width) if width > 1 else (self.count,)
+        return np.memmap(self._path(name), dtype=dtype, mode='r', shape=shape)
+
+    def iter_chunks(self, rows=CHUNK_ROWS):
+        """(시작 행, answers, answered, timestamp, test_type) 청크"""
+        columns = [self.column(name) for name in COLUMNS]
+        for start in range(0, self.count, rows):
+            yield (start,) + tuple(np.asarray(column[start:start + rows]) for column in columns)
+
+
+def _split_words(values):
+    """행별 정수 → (행 × 워드) uint64 배열"""
+    words = np.empty((len(values), len(WORDS)), dtype='<u8')
+    for w in range(len(WORDS)):
+        words[:, w] = [value >> (64 * w) & _WORD_MASK for value in values]
+    return words
+
+
+def unpack_choices(answers, answered, questions):
+    """비트 워드 청크 → (행 × 문항) uint8 선택 배열 (0 무응답, 1 A, 2 B), 열 순서는 questions"""
+    choices = np.zeros((len(answers), len(questions)), dtype=np.uint8)
+    for column, q in enumerate(questions):
+        position = _POSITION.get(q)
+        if position is None:
+            continue
+        word, bit = position
+        flag = np.uint64(1 << bit)
+        is_answered = (answered[:, word] & flag) != 0
+        choices[:, column] = is_answered.astype(np.uint8) + (is_answered & ((answers[:, word] & flag) != 0))
+    return choices
+
+
+def answer_counts(store, rows=SCORE_ROWS):
+    """문항별 (답한 사람 수, B를 고른 사람 수) → {문항 번호: (답함, B)}"""
+    answered_counts = np.zeros((len(WORDS), 64), dtype=np.int64)
+    b_counts = np.zeros((len(WORDS), 64), dtype=np.int64)
+    shifts = np.arange(64, dtype=np.uint64)
+    for _, answers, answered, _, _ in store.iter_chunks(rows):
+        for word in range(len(WORDS)):
+            answered_counts[word] += ((answered[:, word, None] >> shifts) & np.uint64(1)).sum(axis=0, dtype=np.int64)
+            b_counts[word] += ((answered[:, word, None] & answers[:, word, None]) >> shifts
+                               & np.uint64(1)).sum(axis=0, dtype=np.int64)
+    return {q: (int(answered_counts[word, bit]), int(b_counts[word, bit])) for q, (word, bit) in _POSITION.items()}
+
+
+def axis_masks(scorer):
+    """scorer의 가중치 → (2, 14축, 워드) uint64 마스크 - [A 답 | B 답]마다 그 축에 더해지는 문항 비트"""
+    masks = np.zeros((2, scorer.weights.shape[1], len(WORDS)), dtype=np.uint64)
+    count = len(scorer.questions)
+    for q, (word, bit) in _POSITION.items():
+        i = scorer.column.get(q)
+        if i is None:
+            continue
+        for half, offset in ((0, 0), (1, count)):
+            # mapping.ts의 답은 축 하나에만 1점
+            for axis in np.flatnonzero(scorer.weights[offset + i]):
+                masks[half, axis, word] |= np.uint64(1 << bit)
+    return masks
+
+
+def tally_bits(answers, answered, masks):
+    """비트 워드 청크 → (행 × 14축) int32 점수 = 축 마스크와 AND한 A/B 비트의 popcount 합 (NumPy 2.0+)"""
+    tallies = np.zeros((len(answers), masks.shape[1]), dtype=np.int32)
+    for half, bits in enumerate((answered & ~answers, answered & answers)):
+        for word in range(bits.shape[1]):
+            tallies += np.bitwise_count(bits[:, word, None] & masks[half, :, word])
+    return tallies
+
+
+def iter_scores(store, scorer, rows=SCORE_ROWS):
+    """저장소 전체를 청크 단위로 다시 채점 → (시작 행, 정치 코드, 경제 코드, 점수) 청크"""
+    masks = axis_masks(scorer)
+    for start, answers, answered, _, _ in store.iter_chunks(rows):
+        tallies = tally_bits(answers, answered, masks)
+        political, economic = scorer.codes(tallies)
+        yield start, political, economic, tallies
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+콘텐츠 파이프라인 라이브러리 API
+- 파일 입출력 없이 Document → Document 로 동작하는 순수 함수 (입력 문서는 바꾸지 않음)
+- 장시간 실행되는 프로세스(watch, CI)에서 그대로 import해서 사용
+
+    doc = api.load('lib/political_details.ts')
+    doc = api.fix(api.clean(doc))
+    errors, warnings = api.check(doc)
+    text = api.emit(doc)
+"""
+
+from peit_content.dedupe import dedupe_block
+from peit_content.fixups import fix_fields
+from peit_content.parallel import map_units
+from peit_content.pipeline import POLITICAL_CODES, validate_block
+from peit_content.sections import ECONOMIC_FIELDS_TO_CLEAN, FIELDS_TO_CLEAN, clean_unit
+from peit_content.tsliteral import load_document, parse_document
+
+# 유형 분류 → 정리할 필드 (final_cleanup.py의 FIELDS와 같은 목록)
+# 단, 예전 final_cleanup.py는 final_goal만 '성장의 최종 목표' 뒤를 strip 없이 남겼고,
+# 지금은 섹션 분할기가 다른 필드처럼 final_goal도 앞뒤 공백을 잘라냄 (의도한 차이)
+CLEAN_FIELDS = {
+    'political': ['weaknesses'] + FIELDS_TO_CLEAN,
+    'economic': ECONOMIC_FIELDS_TO_CLEAN,
+}
+
+
+def load(path, name=None):
+    """TS 데이터 모듈 파일을 Document로 파싱"""
+    return load_document(path, name)
+
+
+def parse(source, name=None):
+    """TS 데이터 모듈 텍스트를 Document로 파싱"""
+    return parse_document(source, name)
+
+
+def clean(document, fields=None, categories=None, jobs=1):
+    """필드를 섹션 스키마대로 정리한 새 Document
+
+    fields: 유형 분류 → 정리할 필드 목록 (기본 CLEAN_FIELDS)
+    categories: 정리할 유형 분류 (기본 fields의 모든 분류)
+    """
+    fields = CLEAN_FIELDS if fields is None else fields
+    categories = set(fields if categories is None else categories)
+    result = document.copy()
+    units = []
+    for code in result:
+        kind = result.get(code, 'category', 'political')
+        if kind not in categories:
+            continue
+        names = [name for name in fields.get(kind, ()) if name in result.blocks[code]]
+        if names:
+            units.append((kind, code, {name: result.get(code, name) for name in names}))
+    for code, cleaned in map_units(clean_unit, units, jobs):
+        for name, value in cleaned.items():
+            result.set(code, name, value)
+    return result
+
+
+def fix(document):
+    """필드 값 보정 (fix_format 규칙)을 적용한 새 Document"""
+    result = document.copy()
+    for code in result:
+        for name, value in fix_fields(result.data(code)).items():
+            result.set(code, name, value)
+    return result
+
+
+def dedupe(document, fields=None):
+    """필드 간 중복 문장을 처음 나온 필드에만 남긴 새 Document → (Document, 중복 목록)
+
+    중복 목록: [(유형 코드, 필드, 처음 나온 필드, 문장)]
+    """
+    result = document.copy()
+    report = []
+    for code in result:
+        changed, repeats = dedupe_block(result.data(code), fields)
+        for name, value in changed.items():
+            result.set(code, name, value)
+        report.extend((code,) + repeat for repeat in repeats)
+    return result, report
+
+
+def check(document, codes=POLITICAL_CODES):
+    """정치 유형 상세 Document 검증 → (errors, [(빈 필드, 유형 코드)])"""
+    errors = []
+    warnings = []
+    for code in document:
+        block_errors, block_warnings = validate_block(code, document.data(code))
+        errors.extend(block_errors)
+        warnings.extend(block_warnings)
+    missing = [code for code in codes if code not in document]
+    if missing:
+        errors.append('누락된 유형: ' + ', '.join(missing))
+    return errors, warnings
+
+
+def emit(document, canonical=True):
+    """Document → TS 모듈 텍스트 (canonical이면 표준 형식, 아니면 수정된 필드만 다시 씀)"""
+    return document.format() if canonical else document.render()
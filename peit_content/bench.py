@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+"""
+콘텐츠 파이프라인 벤치마크
+- 실제 소스(data/political_details.txt)의 유형 블록으로 ×N 크기의 합성 코퍼스 생성
+  - types: 블록을 N번 복제 (섹션 형식과 필드 길이는 원본 그대로, 유형 코드만 새로 부여)
+  - fields: 유형 수는 그대로 두고 섹션 본문 줄을 ~N배로 늘림 (긴 필드에서의 정규식/직렬화 비용)
+- 단계마다 새 프로세스에서 입력을 준비한 뒤 측정 → 경과 시간, 처리량(MB/s),
+  측정 함수가 실행되는 동안 늘어난 최대 RSS (입력 준비에 쓴 메모리는 빼고)
+- 기준값 파일과 비교해 느려진 단계를 표시 (비율과 절대 시간 차이가 모두 넘을 때만)
+"""
+
+import gc
+import itertools
+import json
+import multiprocessing
+import os
+import re
+import resource
+import string
+import tempfile
+import time
+
+from peit_content.fixups import fix_fields
+from peit_content.ingest import ingest, read_blocks
+from peit_content.markdown import render_fields
+from peit_content.paths import SOURCE_PATH
+from peit_content.pipeline import process_block
+from peit_content.sections import FIELDS_TO_CLEAN, clean_unit
+from peit_content.tsliteral import iter_module, parse_document
+
+BASELINE_PATH = 'benchmarks/baseline.json'
+DEFAULT_SCALES = [1, 16, 256]
+SCALE_MODES = ['types', 'fields']
+DEFAULT_REPEAT = 3
+# 기준값보다 이 비율 이상, 그리고 이 초 이상 느려져야 느려짐으로 판정 (x1의 1ms 미만 단계는 흔들림이 더 큼)
+DEFAULT_TOLERANCE = 0.25
+DEFAULT_MIN_DELTA = 0.05
+CLEANUP_FIELDS = ['weaknesses'] + FIELDS_TO_CLEAN
+
+# 측정 순서 (앞 단계의 출력이 뒤 단계의 입력)
+STAGES = ['ingest', 'clean', 'fixups', 'emit', 'parse', 'cleanup', 'format', 'markdown', 'end_to_end']
+
+
+def synthetic_codes():
+    """머리줄 형식(`[A-Z]{4}`)을 따르는 겹치지 않는 유형 코드"""
+    for letters in itertools.product(string.ascii_uppercase, repeat=4):
+        yield ''.join(letters)
+
+
+_SENTENCE_RE = re.compile(r'[^.!?\n]*[.!?]')
+# 이보다 짧은 줄(머리줄, 소제목, 목록 번호)은 늘리지 않음
+MIN_BODY_LINE = 80
+
+
+def lengthen_line(line, scale):
+    """본문 줄 끝에 마지막 문장을 덧붙여 길이를 ~scale배로 (소제목 표시가 있는 앞부분은 그대로)"""
+    if scale <= 1 or len(line) < MIN_BODY_LINE:
+        return line
+    sentences = _SENTENCE_RE.findall(line)
+    if not sentences:
+        return line
+    # '한 줄 요약: ...' 처럼 문장 안에 표시가 있으면 표시 뒤쪽만 사용
+    filler = sentences[-1].rsplit(':', 1)[-1].strip()
+    if len(filler) < 20:
+        return line
+    copies = round(len(line) * (scale - 1) / (len(filler) + 1))
+    return line + (' ' + filler) * copies
+
+
+def write_corpus(path, scale, source=SOURCE_PATH, mode='types'):
+    """합성 소스 파일 생성 → 바이트 수
+
+    types: 원본 유형 블록을 scale 번 복제, fields: 블록 수는 그대로 두고 본문 줄을 ~scale배로 늘림
+    """
+    if mode not in SCALE_MODES:
+        raise ValueError(f'unknown scale mode: {mode}')
+    blocks = list(read_blocks(source))
+    codes = synthetic_codes()
+    with open(path, 'w', encoding='utf-8') as f:
+        for _ in range(scale if mode == 'types' else 1):
+            for block in blocks:
+                text = block.text
+                if mode == 'fields':
+                    text = '\n'.join(lengthen_line(line, scale) for line in text.split('\n'))
+                f.write(f'{next(codes)} → {block.name}\n')
+                f.write(text)
+                f.write('\n')
+    return os.path.getsize(path)
+
+
+def corpus_key(scale, mode='types'):
+    """보고서/기준값의 코퍼스 키 ('16', 'fields-16')"""
+    return str(scale) if mode == 'types' else f'{mode}-{scale}'
+
+
+def _extract(path):
+    return list(ingest(path))
+
+
+def _clean(extracted):
+    for code, data in extracted:
+        fields = {name: data[name] for name in CLEANUP_FIELDS if name in data}
+        data.update(clean_unit(('political', code, fields))[1])
+    return extracted
+
+
+def _fix(extracted):
+    for _, data in extracted:
+        data.update(fix_fields(data))
+    return extracted
+
+
+def _emit(processed):
+    return ''.join(iter_module('politicalDetails', processed))
+
+
+def _cleanup(doc):
+    for code in doc:
+        fields = {name: doc.get(code, name) for name in CLEANUP_FIELDS if name in doc.blocks[code]}
+        for name, value in clean_unit(('political', code, fields))[1].items():
+            doc.set(code, name, value)
+    return doc.render()
+
+
+def _markdown(processed):
+    return [render_fields(data) for _, data in processed]
+
+
+def _end_to_end(path):
+    with tempfile.TemporaryFile('w', encoding='utf-8') as f:
+        blocks = (
+            (code, process_block(code, data))
+            for code, data in ingest(path)
+        )
+        for chunk in iter_module('politicalDetails', blocks):
+            f.write(chunk)
+
+
+def _prepare(stage, path):
+    """측정 대상 함수와 입력, 입력 바이트 수"""
+    source_bytes = os.path.getsize(path)
+    if stage == 'ingest':
+        return _extract, path, source_bytes
+    if stage == 'end_to_end':
+        return _end_to_end, path, source_bytes
+    extracted = _extract(path)
+    if stage == 'clean':
+        return _clean, extracted, source_bytes
+    _clean(extracted)
+    if stage == 'fixups':
+        return _fix, extracted, source_bytes
+    _fix(extracted)
+    if stage == 'emit':
+        return _emit, extracted, source_bytes
+    if stage == 'markdown':
+        return _markdown, extracted, source_bytes
+    module = _emit(extracted)
+    module_bytes = len(module.encode('utf-8'))
+    del extracted
+    if stage == 'parse':
+        return parse_document, module, module_bytes
+    doc = parse_document(module)
+    if stage == 'cleanup':
+        return _cleanup, doc, module_bytes
+    if stage == 'format':
+        return (lambda d: d.format()), doc, module_bytes
+    raise ValueError(f'unknown stage: {stage}')
+
+
+def _status_kb(name):
+    """/proc/self/status의 VmRSS, VmHWM 등 (kB, 없으면 None)"""
+    try:
+        with open('/proc/self/status', 'r') as f:
+            for line in f:
+                if line.startswith(name + ':'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def _reset_peak_rss():
+    """최대 RSS(VmHWM)를 현재 RSS로 되돌림 (Linux 4.0+) → 성공 여부"""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except OSError:
+        return False
+    return True
+
+
+def _peak_growth_kb(func, arg):
+    """func(arg) 한 번을 실행하는 동안 최대 RSS가 실행 직전 RSS보다 늘어난 양 (kB)
+
+    VmHWM을 되돌릴 수 없는 플랫폼에서는 ru_maxrss 차이 (입력 준비 때의 최대치보다 작으면 0)
+    """
+    gc.collect()
+    if _reset_peak_rss():
+        before = _status_kb('VmRSS')
+        func(arg)
+        return max(0, _status_kb('VmHWM') - before)
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    func(arg)
+    return max(0, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - before)
+
+
+def _measure(stage, path, repeat):
+    """자식 프로세스에서 실행 - 입력 준비 후 실행 중 늘어난 최대 RSS와 repeat 번 측정한 최소 시간"""
+    func, arg, size = _prepare(stage, path)
+    # 메모리는 준비 직후 첫 실행에서 잼 (시간 측정 반복이 남긴 빈 메모리를 다시 쓰지 않게)
+    growth_kb = _peak_growth_kb(func, arg)
+    best = None
+    for _ in range(repeat):
+        # cleanup처럼 입력을 바꾸는 단계는 매번 새로 준비
+        if stage in ('clean', 'fixups', 'cleanup'):
+            func, arg, size = _prepare(stage, path)
+        start = time.perf_counter()
+        func(arg)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return {
+        'seconds': round(best, 4),
+        'bytes': size,
+        'mb_per_s': round(size / 1e6 / best, 2) if best else None,
+        'peak_rss_growth_mb': round(growth_kb / 1024, 1),
+    }
+
+
+def run_stage(stage, path, repeat=DEFAULT_REPEAT):
+    """단계 하나를 새 프로세스(spawn)에서 측정해 최대 RSS가 다른 단계와 섞이지 않게 함"""
+    context = multiprocessing.get_context('spawn')
+    with context.Pool(1) as pool:
+        return pool.apply(_measure, (stage, path, repeat))
+
+
+def run_benchmarks(scales=DEFAULT_SCALES, stages=STAGES, repeat=DEFAULT_REPEAT, modes=('types',), log=print):
+    """모드와 scale별 합성 코퍼스를 만들어 모든 단계를 측정 → {코퍼스 키: {stage: 결과}}"""
+    report = {}
+    with tempfile.TemporaryDirectory(prefix='peit-bench-') as tmp:
+        for mode in modes:
+            for scale in scales:
+                key = corpus_key(scale, mode)
+                path = os.path.join(tmp, f'corpus-{key}.txt')
+                size = write_corpus(path, scale, mode=mode)
+                log(f"{mode} x{scale}: {size / 1e6:.1f} MB 합성 코퍼스")
+                report[key] = {}
+                for stage in stages:
+                    result = run_stage(stage, path, repeat)
+                    report[key][stage] = result
+                    log(f"  {stage:<11} {result['seconds']:>9.3f}s {result['mb_per_s'] or 0:>8.2f} MB/s "
+                        f"+{result['peak_rss_growth_mb']:>7.1f} MB")
+    return report
+
+
+def load_baseline(path=BASELINE_PATH):
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_baseline(report, path=BASELINE_PATH):
+    """측정 결과를 기준값으로 저장 (다른 scale의 기존 기준값은 유지)"""
+    baseline = load_baseline(path)
+    baseline.update(report)
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def compare(report, baseline, tolerance=DEFAULT_TOLERANCE, min_delta=DEFAULT_MIN_DELTA):
+    """기준값보다 tolerance 비율 이상, 그리고 min_delta 초 이상 느려진 (코퍼스 키, 단계, 기준 시간, 현재 시간) 목록"""
+    regressions = []
+    for key, stages in report.items():
+        for stage, result in stages.items():
+            base = baseline.get(key, {}).get(stage)
+            if not base:
+                continue
+            slower = result['seconds'] - base['seconds']
+            if result['seconds'] > base['seconds'] * (1 + tolerance) and slower >= min_delta:
+                regressions.append((key, stage, base['seconds'], result['seconds']))
+    return regressions
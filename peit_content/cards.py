@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+"""
+결과 공유 카드 미리 렌더링 (Pillow 필요)
+- components/SimpleResultView.tsx가 브라우저에서 html2canvas로 찍던 카드를 빌드 때 24개 유형 모두 미리 그림
+- 카드 내용은 유형 코드, 이름, 키워드, 유형 이미지뿐이라 lib/generated/results.ts와 public/images만 있으면 됨
+- 글꼴은 저장소의 fonts/ 디렉터리에 둔 Pretendard 파일을 씀 (시스템 글꼴에 의존하지 않음)
+- 크기는 SNS 표준 (og 1200×630, square 1080×1080, story 1080×1920), PNG와 WebP로 public/cards/에 기록
+- 유형 하나가 작업 단위 하나 (--jobs N이면 프로세스 풀), 입력 다이제스트가 같고 출력이 남아 있으면 건너뜀
+- 저장 버튼용 매니페스트는 lib/generated/cards.ts (유형 코드 → 크기 → 형식 → URL)
+"""
+
+import json
+import os
+
+from peit_content.fonts import FONT_DIR, find_font
+from peit_content.images import public_url
+from peit_content.manifest import CACHE_DIR, DigestCache, digest, file_digest
+from peit_content.parallel import map_units
+
+CARD_DIR = 'public/cards'
+CARD_CACHE = os.path.join(CACHE_DIR, 'cards.json')
+CACHE_VERSION = 1
+
+SIZES = {
+    'og': (1200, 630),
+    'square': (1080, 1080),
+    'story': (1080, 1920),
+}
+FORMATS = [
+    ('png', 'PNG', {'optimize': True}),
+    ('webp', 'WEBP', {'quality': 90, 'method': 6}),
+]
+
+# SimpleResultView의 Tailwind 색 (bg-light-purple, accent, gray-800, gray-500, gray-200)
+BACKGROUND = '#FAF7FF'
+CARD = '#FFFFFF'
+ACCENT = '#8B5CF6'
+TEXT = '#1F2937'
+MUTED = '#6B7280'
+DIVIDER = '#E5E7EB'
+FOOTER = 'PEIT - 당신의 정치·경제 좌표'
+
+# 역할 → 글꼴 굵기 파일 이름
+WEIGHTS = {
+    'code': 'Bold',
+    'name': 'Medium',
+    'keywords': 'Regular',
+    'footer': 'Regular',
+}
+
+
+def find_fonts(font_dir=FONT_DIR):
+    """역할 → 글꼴 파일 경로 (fonts/Pretendard-<굵기>.otf 등, 없으면 FileNotFoundError)"""
+    return {role: find_font(weight, font_dir) for role, weight in WEIGHTS.items()}
+
+
+def type_image(code, category, image_dir='public/images'):
+    """유형 이미지 경로 (IPUE처럼 확장자가 다른 것도 찾음)"""
+    directory = os.path.join(image_dir, category)
+    for extension in ('.jpg', '.png', '.jpeg', '.webp'):
+        path = os.path.join(directory, code + extension)
+        if os.path.exists(path):
+            return path
+    raise FileNotFoundError(f'유형 이미지 없음: {directory}/{code}.*')
+
+
+def _wrap(draw, text, font, max_width, max_lines):
+    """공백 단위로 줄바꿈 (한 단어가 너무 길면 글자 단위), 넘치면 마지막 줄 끝을 …로"""
+    lines = []
+    line = ''
+    for word in text.split():
+        candidate = f'{line} {word}' if line else word
+        if draw.textlength(candidate, font=font) <= max_width:
+            line = candidate
+            continue
+        if line:
+            lines.append(line)
+        line = ''
+        for char in word:
+            if line and draw.textlength(line + char, font=font) > max_width:
+                lines.append(line)
+                line = ''
+            line += char
+    if line:
+        lines.append(line)
+    if len(lines) > max_lines:
+        lines = lines[:max_lines]
+        last = lines[-1]
+        while last and draw.textlength(last + '…', font=font) > max_width:
+            last = last[:-1]
+        lines[-1] = last.rstrip() + '…'
+    return lines
+
+
+def _draw_lines(draw, lines, font, fill, center_x, top, spacing):
+    """가운데 정렬로 여러 줄 → 마지막 줄 아래 y"""
+    for line in lines:
+        draw.text((center_x, top), line, font=font, fill=fill, anchor='mt')
+        top += font.size + spacing
+    return top
+
+
+def draw_card(size, code, name, keywords, photo, fonts):
+    """카드 이미지 한 장 (가로로 긴 크기는 이미지 왼쪽 / 글 오른쪽, 나머지는 위아래)"""
+    from PIL import Image, ImageDraw, ImageFont
+
+    width, height = size
+    unit = min(width, height)
+    canvas = Image.new('RGB', size, BACKGROUND)
+    draw = ImageDraw.Draw(canvas)
+
+    # rounded-3xl border-4 border-accent 카드
+    margin = round(unit * 0.05)
+    box = (margin, margin, width - margin, height - margin)
+    draw.rounded_rectangle(box, radius=round(unit * 0.05), fill=CARD, outline=ACCENT, width=max(2, round(unit * 0.007)))
+    padding = round(unit * 0.06)
+    left, top, right, bottom = box[0] + padding, box[1] + padding, box[2] - padding, box[3] - padding
+
+    def font(role, scale):
+        return ImageFont.truetype(fonts[role], max(10, round(unit * scale)))
+
+    code_font, name_font = font('code', 0.11), font('name', 0.05)
+    keyword_font, footer_font = font('keywords', 0.034), font('footer', 0.028)
+    landscape = width > height * 1.3
+
+    # 유형 이미지 (object-contain) - 가로형은 왼쪽 절반, 세로형은 위쪽 (이미지와 글을 한 묶음으로 세로 가운데)
+    if landscape:
+        image_box = (left, top, left + (right - left) * 0.48, bottom)
+        text_left = image_box[2] + padding
+    else:
+        image_box = (left, top, right, top + (bottom - top) * 0.45)
+        text_left = left
+    fitted = photo.copy()
+    fitted.thumbnail((round(image_box[2] - image_box[0]), round(image_box[3] - image_box[1])),
+                     Image.Resampling.LANCZOS)
+
+    # 글: 코드 / 이름 / 키워드, 맨 아래 구분선과 PEIT 문구
+    text_width = right - text_left
+    center_x = (text_left + right) / 2
+    spacing = round(unit * 0.012)
+    name_lines = _wrap(draw, name, name_font, text_width, 3)
+    keyword_lines = _wrap(draw, ' '.join(f'#{keyword}' for keyword in keywords), keyword_font, text_width, 2)
+    footer_top = bottom - footer_font.size
+    divider_y = footer_top - round(unit * 0.03)
+    block_height = (code_font.size + spacing * 2 + len(name_lines) * (name_font.size + spacing)
+                    + (spacing * 2 + len(keyword_lines) * (keyword_font.size + spacing) if keyword_lines else 0))
+
+    if landscape:
+        image_top = (image_box[1] + image_box[3] - fitted.height) / 2
+        y = top + max(0, (divider_y - top - block_height) / 2)
+    else:
+        gap = spacing * 3
+        image_top = top + max(0, (divider_y - top - fitted.height - gap - block_height) / 2)
+        y = image_top + fitted.height + gap
+    canvas.paste(fitted, (round((image_box[0] + image_box[2] - fitted.width) / 2), round(image_top)))
+
+    y = _draw_lines(draw, [code], code_font, ACCENT, center_x, y, spacing * 2)
+    y = _draw_lines(draw, name_lines, name_font, TEXT, center_x, y, spacing)
+    if keyword_lines:
+        _draw_lines(draw, keyword_lines, keyword_font, MUTED, center_x, y + spacing * 2, spacing)
+    draw.line((text_left, divider_y, right, divider_y), fill=DIVIDER, width=max(1, round(unit * 0.002)))
+    draw.text((center_x, footer_top), FOOTER, font=footer_font, fill=MUTED, anchor='mt')
+    return canvas
+
+
+def render_cards(unit):
+    """(유형 코드, 이름, 키워드, 이미지 경로, 글꼴, 출력 디렉터리, 다이제스트) → 캐시 항목 (작업 프로세스에서 실행)"""
+    from PIL import Image, ImageOps
+
+    code, name, keywords, image_path, fonts, out_dir, unit_digest = unit
+    with Image.open(image_path) as image:
+        photo = ImageOps.exif_transpose(image).convert('RGB')
+    os.makedirs(out_dir, exist_ok=True)
+    files = []
+    for size_name, size in SIZES.items():
+        card = draw_card(size, code, name, keywords, photo, fonts)
+        for extension, pillow_format, options in FORMATS:
+            path = os.path.join(out_dir, f'{code}-{size_name}.{unit_digest[:8]}.{extension}')
+            card.save(path, pillow_format, **options)
+            files.append(path)
+    return {'files': files}
+
+
+def card_inputs(results_doc, image_dir='public/images'):
+    """결과 Document → (유형 코드, 이름, 키워드, 이미지 경로) 들"""
+    for code in results_doc:
+        data = results_doc.data(code)
+        yield code, data.get('name', code), data.get('keywords') or [], type_image(code, data.get('category'), image_dir)
+
+
+def build_cards(results_doc, out_dir=CARD_DIR, font_dir=FONT_DIR, cache_path=CARD_CACHE, jobs=1, full=False):
+    """바뀐 유형만 카드를 그리고 → ([(유형 코드, {크기: {형식: URL}})], 다시 그린 유형 수)"""
+    fonts = find_fonts(font_dir)
+    font_digests = {role: file_digest(path) for role, path in fonts.items()}
+    # 렌더러 코드도 다이제스트에 넣어 레이아웃이 바뀌면 URL이 바뀌고 이전 카드는 삭제됨
+    renderer = file_digest(__file__)
+    cache = DigestCache(cache_path, CACHE_VERSION, (out_dir,))
+
+    entries = {}
+    units = []
+    for code, name, keywords, image_path in card_inputs(results_doc):
+        unit_digest = digest(json.dumps([code, name, keywords, file_digest(image_path), font_digests, renderer,
+                                         SIZES, FORMATS], ensure_ascii=False, sort_keys=True))
+        if not full and cache.fresh(code, unit_digest):
+            entries[code] = cache.entries[code]
+            continue
+        units.append((code, name, keywords, image_path, fonts, out_dir, unit_digest))
+        entries[code] = {'digest': unit_digest}
+
+    for unit, entry in zip(units, map_units(render_cards, units, jobs)):
+        entries[unit[0]]['entry'] = entry
+
+    cache.replace(entries)
+    return [(code, card_urls(entries[code], out_dir, code)) for code in results_doc], len(units)
+
+
+def card_urls(cached, out_dir, code):
+    """캐시 항목 → {크기: {형식: URL}}"""
+    digest = cached['digest'][:8]
+    return {
+        size_name: {extension: public_url(os.path.join(out_dir, f'{code}-{size_name}.{digest}.{extension}'))
+                    for extension, _, _ in FORMATS}
+        for size_name in SIZES
+    }
+
+
+def iter_cards_module(items):
+    """(유형 코드, {크기: {형식: URL}}) 들 → 모듈 텍스트"""
+    from peit_content.tsliteral import iter_module
+
+    sizes = ', '.join(f'{name} {w}×{h}' for name, (w, h) in SIZES.items())
+    yield (
+        '// 자동 생성 파일 - 직접 수정하지 마세요 (peit-content cards 로 생성)\n'
+        f'// 유형 코드 → 크기 ({sizes}) → 형식 → 미리 그린 공유 카드 URL\n'
+        '\n'
+    )
+    yield from iter_module('cards', items, 'Readonly<Record<string, Record<string, Record<string, string>>>>')
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+정리 단계 실행기
+- 대상 파일(lib/political_details.ts, lib/results_base.ts)을 파싱해 유형별 작업 단위로 분할
+- 매니페스트로 바뀐 블록/필드만 골라 작업 단위에 담음
+- 작업 단위를 (병렬로) 정리한 뒤 파일별로 정해진 순서대로 재조립해 저장
+"""
+
+import os
+import time
+
+from peit_content.manifest import CACHE_DIR, POLITICAL_MANIFEST, Manifest
+from peit_content.parallel import map_units
+from peit_content.paths import DETAILS_PATH, RESULTS_BASE_NAME, RESULTS_BASE_PATH
+from peit_content.sections import clean_unit, profile_unit
+from peit_content.tsliteral import load_document, parse_document
+from peit_content.writer import write_if_changed
+
+RESULTS_PATH = RESULTS_BASE_PATH
+RESULTS_MANIFEST = os.path.join(CACHE_DIR, 'results.manifest')
+
+
+class Target:
+    """정리 대상 파일 - 경로, export 이름, 정리할 유형 분류, 매니페스트 경로"""
+
+    def __init__(self, path, name, categories, manifest_path):
+        self.path = path
+        self.name = name
+        self.categories = tuple(categories)
+        self.manifest_path = manifest_path
+
+
+POLITICAL_TARGET = Target(DETAILS_PATH, None, ['political'], POLITICAL_MANIFEST)
+ECONOMIC_TARGET = Target(RESULTS_PATH, RESULTS_BASE_NAME, ['economic'], RESULTS_MANIFEST)
+
+
+def collect_units(doc, target, fields, manifest=None):
+    """문서를 유형별 작업 단위 (kind, 유형 코드, {필드: 값}) 로 분할"""
+    units = []
+    for code in doc:
+        kind = doc.get(code, 'category', target.categories[0])
+        if kind not in target.categories:
+            continue
+        if manifest and manifest.block_unchanged(doc, code):
+            continue
+        dirty = {}
+        for name in fields.get(kind, ()):
+            if name not in doc.blocks[code]:
+                continue
+            if manifest and manifest.field_unchanged(doc, code, name):
+                continue
+            dirty[name] = doc.get(code, name)
+        if dirty:
+            units.append((kind, code, dirty))
+    return units
+
+
+def run_cleanup(stage, targets, fields, rules, jobs=1, full=False, profiler=None):
+    """정리 단계 하나를 실행
+
+    fields: 유형 분류 → 정리할 필드 목록
+    profiler: Profiler가 주어지면 파일/필드별 시간과 바이트, 마커 수를 기록
+    """
+    loaded = []
+    units = []
+    owners = []
+    for target in targets:
+        start = time.perf_counter()
+        doc = load_document(target.path, target.name)
+        manifest = Manifest(target.manifest_path, stage, rules)
+        for unit in collect_units(doc, target, fields, None if full else manifest):
+            print(f"정리 중: {unit[1]}")
+            units.append(unit)
+            owners.append(len(loaded))
+        if profiler is not None:
+            profiler.add('load', field=target.path, seconds=time.perf_counter() - start,
+                         bytes_in=len(doc.source.encode('utf-8')))
+        loaded.append((target, doc, manifest))
+
+    worker = clean_unit if profiler is None else profile_unit
+    for owner, (code, cleaned, *stats) in zip(owners, map_units(worker, units, jobs)):
+        doc = loaded[owner][1]
+        for name, value in cleaned.items():
+            doc.set(code, name, value)
+        if stats:
+            profiler.add_unit_stats('clean', code, stats[0])
+
+    print("모든 필드 정리 완료")
+
+    for target, doc, manifest in loaded:
+        # 파일 저장 (수정된 필드만 다시 직렬화, 바뀐 것이 없으면 쓰지 않음)
+        start = time.perf_counter()
+        output = doc.render()
+        written = write_if_changed(target.path, output)
+        if profiler is not None:
+            profiler.add('write', field=target.path, seconds=time.perf_counter() - start,
+                         bytes_in=len(doc.source.encode('utf-8')), bytes_out=len(output.encode('utf-8')))
+        if written:
+            print(f"파일 저장 완료: {target.path}")
+        else:
+            print(f"변경 사항 없음: {target.path}")
+
+        manifest.record(parse_document(output, target.name))
+        manifest.save()
@@ -0,0 +1,692 @@
+# -*- coding: utf-8 -*-
+"""
+peit-content 명령줄 도구 (python -m peit_content <명령>)
+- ingest: 소스 .txt → 추출 결과 JSON Lines (정리 전) + 섹션 바이트 색인 갱신
+- section: 색인으로 소스의 섹션 하나만 꺼내 보기 (전체를 다시 파싱하지 않음)
+- clean: lib/political_details.ts, lib/results_base.ts 필드 정리 (증분, --jobs)
+- format: 값 보정 후 표준 형식으로 다시 직렬화
+- dedupe: 유형 블록 안에서 여러 필드에 반복된 문장 찾기/제거
+- near-dups: 다른 유형 사이의 유사 문단 쌍 보고 (MinHash/LSH, 바뀐 블록만 다시 해시)
+- score: 응답 JSON Lines를 lib/mapping.ts로 한 번에 채점 (NumPy, calculateResult와 같은 결과)
+- answers: 응답을 비트 압축 열 저장소에 덧붙이고(append), 저장소 전체를 청크 단위로 다시 채점(score)
+- percentiles: mapping.ts로 축 점수의 정확한 분포를 계산해 (축, 점수) → 백분위/강도 표 생성
+- early-stop: 표시 순서에서 축 쌍의 글자가 확정되는 시점 판정표 생성, --simulate로 줄어드는 문항 수 보고
+- images: public/images 원본 → 너비 구간별 AVIF/WebP/JPEG 변형과 srcset 매니페스트 (Pillow, 바뀐 원본만, --jobs)
+- fonts: lib/app/components의 글자만 남긴 Pretendard WOFF2 서브셋과 unicode-range @font-face (fontTools, 글자 집합이 바뀔 때만)
+- cards: 24개 유형의 공유 카드를 SNS 크기별 PNG/WebP로 미리 그림 (Pillow, fonts/의 Pretendard, 바뀐 유형만, --jobs)
+- check: 파싱/검증과 생성 파일 최신 여부만 확인 (파일을 쓰지 않음)
+- emit: .txt → lib/political_details.ts 생성 (+ 유형별 분할, 병합 결과)
+- watch: 소스 변경을 감시하며 바뀐 유형 블록만 다시 처리해 emit 결과를 갱신
+- 무거운 모듈(섹션 분할기 컴파일 등)은 각 명령 안에서 import하므로 --help는 바로 뜸
+"""
+
+import argparse
+import sys
+
+from peit_content.options import add_profile_arguments
+from peit_content.paths import (CARDS_OUTPUT_PATH, DETAILS_PATH, EARLY_STOP_OUTPUT_PATH, FONTS_CSS_OUTPUT_PATH,
+                                HTML_COMPONENT_PATHS, IMAGES_OUTPUT_PATH, MAPPING_PATH, ORDER_PATH,
+                                PERCENTILES_OUTPUT_PATH, QUESTIONS_PATH, RECOMMENDED_OUTPUT_PATH, RESULT_CARD_PATH,
+                                RESULT_DETAILS_DIR, RESULTS_BASE_PATH, RESULTS_OUTPUT_PATH, SIMPLE_RESULT_CARD_PATH,
+                                SOURCE_PATH)
+
+
+def _profiler(args, stage):
+    if args.profile is None:
+        return None
+    from peit_content.profiling import Profiler
+    return Profiler.from_args(args, stage)
+
+
+def cmd_ingest(args):
+    import json
+
+    from peit_content.ingest import extract_details, read_blocks
+    from peit_content.manifest import file_digest
+    from peit_content.section_index import write_index
+
+    out = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    sections = {}
+    try:
+        # 같은 스캔에서 섹션 바이트 구간도 기록
+        for block in read_blocks(args.source, offsets=True):
+            sections[block.code] = {name: list(span) for name, span in block.section_spans().items()}
+            out.write(json.dumps({'code': block.code, 'data': extract_details(block)}, ensure_ascii=False))
+            out.write('\n')
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    write_index(args.source, sections, file_digest(args.source))
+    return 0
+
+
+def cmd_section(args):
+    from peit_content.section_index import SectionIndex, resolve_section
+
+    with SectionIndex(args.source) as index:
+        if args.code not in index:
+            print(f"유형 없음: {args.code}", file=sys.stderr)
+            return 1
+        if args.name is None:
+            for name, (start, end) in index.sections[args.code].items():
+                print(f"{name:<26} {start:>8} {end:>8}")
+            return 0
+        try:
+            start, end = index.span(args.code, args.name)
+        except KeyError:
+            print(f"섹션 없음: {args.code} {resolve_section(args.name)}", file=sys.stderr)
+            return 1
+        if args.offsets:
+            print(start, end)
+        else:
+            print(index.get(args.code, args.name))
+    return 0
+
+
+def cmd_clean(args):
+    from peit_content import api, cleanup, sections, segmenter
+    from peit_content.cleanup import ECONOMIC_TARGET, POLITICAL_TARGET, run_cleanup
+    from peit_content.manifest import rules_digest
+
+    profiler = _profiler(args, 'clean')
+    rules = rules_digest(api.__file__, sections.__file__, segmenter.__file__, cleanup.__file__)
+    run_cleanup('clean', [POLITICAL_TARGET, ECONOMIC_TARGET], api.CLEAN_FIELDS, rules,
+                jobs=args.jobs, full=args.full, profiler=profiler)
+    if profiler is not None:
+        profiler.finish(args.profile)
+    return 0
+
+
+def cmd_format(args):
+    import time
+
+    from peit_content import api
+    from peit_content.writer import write_if_changed
+
+    profiler = _profiler(args, 'format')
+    doc = api.load(args.path)
+
+    # 필드 값 보정
+    start = time.perf_counter()
+    doc = api.fix(doc)
+    output = api.emit(doc)
+    written = write_if_changed(args.path, output)
+    if profiler is not None:
+        profiler.add('format', field=args.path, seconds=time.perf_counter() - start,
+                     bytes_in=len(doc.source.encode('utf-8')), bytes_out=len(output.encode('utf-8')))
+
+    if written:
+        print("포맷 수정 완료")
+    else:
+        print("변경 사항 없음")
+    if profiler is not None:
+        profiler.finish(args.profile)
+    return 0
+
+
+def cmd_dedupe(args):
+    from peit_content import api
+    from peit_content.writer import write_if_changed
+
+    doc = api.load(args.path, args.name)
+    result, report = api.dedupe(doc, args.fields)
+    for code, name, first, sentence in report:
+        print(f"{code}.{name} ← {first}: {sentence}")
+    if not report:
+        print("중복 문장 없음")
+        return 0
+    if args.check:
+        print(f"중복 문장 {len(report)}개", file=sys.stderr)
+        return 1
+    # 바뀐 필드만 다시 써서 나머지 원본 바이트는 그대로
+    write_if_changed(args.path, api.emit(result, canonical=False))
+    print(f"중복 문장 {len(report)}개 제거: {args.path}")
+    return 0
+
+
+def cmd_near_dups(args):
+    import time
+
+    from peit_content.neardup import INDEX_PATH, NearDupIndex
+    from peit_content.tsliteral import load_document
+
+    start = time.perf_counter()
+    index = NearDupIndex(None if args.no_cache else INDEX_PATH)
+    for path in args.paths:
+        index.update(load_document(path), path)
+    pairs = index.pairs(args.threshold)
+    index.save()
+
+    for score, a, b in pairs[:args.limit or None]:
+        print(f"{score:.2f}  {a[1]}.{a[2]}[{a[3]}] ({a[0]})  ~  {b[1]}.{b[2]}[{b[3]}] ({b[0]})")
+    print(f"유사 문단 쌍 {len(pairs)}개 (유사도 ≥ {args.threshold}, 다시 해시한 문단 {index.hashed}개, "
+          f"{time.perf_counter() - start:.2f}s)")
+    return 0
+
+
+def cmd_score(args):
+    import json
+    from collections import Counter
+
+    from peit_content.scoring import Scorer, result_dict
+
+    scorer = Scorer.from_file(args.mapping)
+    src = _open_input(args.input)
+    try:
+        # 줄마다 {"q1": "A", ...} 또는 {"answers": {...}}
+        answer_sets = []
+        for line in src:
+            if line.strip():
+                record = json.loads(line)
+                answer_sets.append(record.get('answers', record))
+    finally:
+        if src is not sys.stdin:
+            src.close()
+
+    political, economic, tallies = scorer.score(answer_sets)
+    if args.summary:
+        for kind, codes in (('political', political), ('economic', economic)):
+            for code, count in sorted(Counter(codes.tolist()).items()):
+                print(f"{kind:<9} {code:<4} {count:>9}")
+        return 0
+    out = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    try:
+        for row in zip(political, economic, tallies):
+            out.write(json.dumps(result_dict(*row), ensure_ascii=False))
+            out.write('\n')
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+def _open_input(path):
+    return sys.stdin if path == '-' else open(path, 'r', encoding='utf-8')
+
+
+def cmd_answers_append(args):
+    import json
+    import time
+
+    from peit_content.answer_store import AnswerStore
+
+    def records(src):
+        # 줄마다 {"answers": {...}, "timestamp": ..., "testType": ...} 또는 {"q1": "A", ...}
+        for line in src:
+            if line.strip():
+                record = json.loads(line)
+                if 'answers' in record:
+                    yield (record['answers'], record.get('timestamp'),
+                           record.get('testType', record.get('test_type')))
+                else:
+                    yield record, None, None
+
+    start = time.perf_counter()
+    store = AnswerStore(args.store)
+    src = _open_input(args.input)
+    try:
+        added = store.append(records(src))
+    finally:
+        if src is not sys.stdin:
+            src.close()
+    print(f"{added}건 추가: {args.store} (전체 {store.count}건, {time.perf_counter() - start:.2f}s)")
+    return 0
+
+
+def cmd_answers_score(args):
+    import json
+    import time
+    from collections import Counter
+
+    from peit_content.answer_store import AnswerStore, iter_scores
+    from peit_content.scoring import Scorer, result_dict
+
+    start = time.perf_counter()
+    store = AnswerStore(args.store)
+    scorer = Scorer.from_file(args.mapping)
+    if args.summary:
+        counts = {'political': Counter(), 'economic': Counter()}
+        for _, political, economic, _ in iter_scores(store, scorer):
+            counts['political'].update(political.tolist())
+            counts['economic'].update(economic.tolist())
+        for kind, counter in counts.items():
+            for code, count in sorted(counter.items()):
+                print(f"{kind:<9} {code:<4} {count:>9}")
+        print(f"{store.count}건 채점 ({time.perf_counter() - start:.2f}s)", file=sys.stderr)
+        return 0
+    out = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    try:
+        for _, political, economic, tallies in iter_scores(store, scorer):
+            for row in zip(political, economic, tallies):
+                out.write(json.dumps(result_dict(*row), ensure_ascii=False))
+                out.write('\n')
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+def cmd_percentiles(args):
+    import os
+
+    from peit_content.distribution import (empirical_priors, iter_percentiles_module, percentile_tables,
+                                           uniform_priors)
+    from peit_content.scoring import load_mapping
+    from peit_content.writer import write_chunks_if_changed
+
+    mapping = load_mapping(args.mapping)
+    tables = {'uniform': percentile_tables(mapping, uniform_priors(mapping))}
+    if args.store:
+        from peit_content.answer_store import AnswerStore, answer_counts
+
+        store = AnswerStore(args.store)
+        if store.count:
+            tables['empirical'] = percentile_tables(mapping, empirical_priors(mapping, answer_counts(store)))
+        else:
+            print(f"응답 없음: {args.store} (균등 가정만 기록)", file=sys.stderr)
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    if write_chunks_if_changed(args.output, iter_percentiles_module(tables)):
+        print(f"파일 저장 완료: {args.output} ({', '.join(tables)})")
+    else:
+        print(f"변경 사항 없음: {args.output}")
+    return 0
+
+
+def cmd_early_stop(args):
+    from peit_content.early_stop import iter_early_stop_module, load_tables
+
+    mapping, orders, tables = load_tables(args.mapping, args.questions, args.order)
+
+    if args.simulate:
+        _report_early_stop(args, mapping, orders, tables)
+        return 0
+
+    import os
+
+    from peit_content.writer import write_chunks_if_changed
+
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    if write_chunks_if_changed(args.output, iter_early_stop_module(tables)):
+        print(f"파일 저장 완료: {args.output}")
+    else:
+        print(f"변경 사항 없음: {args.output}")
+    return 0
+
+
+def _report_early_stop(args, mapping, orders, tables):
+    from peit_content.early_stop import simulate
+
+    priors = None
+    store = None
+    if args.store:
+        from peit_content.answer_store import AnswerStore, answer_counts
+        from peit_content.distribution import empirical_priors
+
+        store = AnswerStore(args.store)
+        priors = empirical_priors(mapping, answer_counts(store)) if store.count else None
+
+    for test_type, rules in tables.items():
+        total = sum(len(rule['questions']) for rule in rules)
+        print(f"[{test_type}] 문항 {len(orders[test_type])}개 (판정에 쓰는 문항 {total}개)")
+        for name, asked in simulate(rules, priors).items():
+            print(f"  {name:<10} 평균 {asked:6.2f}개 질문, {total - asked:6.2f}개 절약 ({100 * (1 - asked / total):4.1f}%)")
+        if store is not None and store.count:
+            _replay_early_stop(store, rules, orders[test_type], test_type, total)
+
+
+def _replay_early_stop(store, rules, order, test_type, total):
+    import numpy as np
+
+    from peit_content.answer_store import TEST_TYPES, unpack_choices
+    from peit_content.early_stop import replay_asked
+
+    columns = {q: i for i, q in enumerate(order)}
+    counts = []
+    for _, answers, answered, _, types in store.iter_chunks():
+        choices = unpack_choices(answers, answered, order)
+        # 이 검사 종류로 모든 문항에 답한 응답만 재생
+        rows = (types == TEST_TYPES[test_type]) & (choices != 0).all(axis=1)
+        if rows.any():
+            counts.append(replay_asked(rules, choices[rows], columns))
+    if not counts:
+        print("  저장소     이 검사를 끝까지 마친 응답 없음")
+        return
+    asked = np.concatenate(counts)
+    print(f"  저장소     {len(asked)}명 재생: 평균 {asked.mean():6.2f}개 질문, {total - asked.mean():6.2f}개 절약 "
+          f"(중앙값 {np.median(asked):.0f}, 최대 {asked.max()})")
+
+
+def cmd_images(args):
+    import os
+    import time
+
+    from peit_content.images import build_images, iter_images_module
+    from peit_content.writer import write_chunks_if_changed
+
+    start = time.perf_counter()
+    items, rebuilt = build_images(args.source, args.variants, jobs=args.jobs, full=args.full)
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    written = write_chunks_if_changed(args.output, iter_images_module(items))
+    print(f"이미지 {len(items)}개 중 {rebuilt}개 변형 생성 ({time.perf_counter() - start:.2f}s)")
+    print(f"{'파일 저장 완료' if written else '변경 사항 없음'}: {args.output}")
+    return 0
+
+
+def cmd_fonts(args):
+    import os
+    import time
+
+    from peit_content.fonts import build_fonts, font_face_css, iter_corpus
+    from peit_content.writer import write_if_changed
+
+    start = time.perf_counter()
+    paths = list(iter_corpus(args.corpus, skip=[args.output]))
+    try:
+        items, codepoints, rebuilt = build_fonts(paths, args.font_dir, args.subsets, jobs=args.jobs, full=args.full)
+    except FileNotFoundError as e:
+        print(f"서브셋 생성 실패: {e}", file=sys.stderr)
+        return 1
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    written = write_if_changed(args.output, font_face_css(items, codepoints))
+    print(f"코퍼스 {len(paths)}개 파일, {len(codepoints)}자 → 굵기 {len(items)}개 중 {rebuilt}개 서브셋 생성 "
+          f"({time.perf_counter() - start:.2f}s)")
+    for weight, entry in items:
+        print(f"  {weight}  {entry['source_size'] / 1024:8.1f} KB → {entry['size'] / 1024:7.1f} KB  {entry['files'][0]}")
+    print(f"{'파일 저장 완료' if written else '변경 사항 없음'}: {args.output}")
+    return 0
+
+
+def cmd_cards(args):
+    import os
+    import time
+
+    from peit_content.cards import build_cards, iter_cards_module
+    from peit_content.tsliteral import load_document
+    from peit_content.writer import write_chunks_if_changed
+
+    start = time.perf_counter()
+    try:
+        items, rebuilt = build_cards(load_document(args.results, 'results'), args.cards, args.font_dir,
+                                     jobs=args.jobs, full=args.full)
+    except FileNotFoundError as e:
+        print(f"카드 생성 실패: {e}", file=sys.stderr)
+        return 1
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    written = write_chunks_if_changed(args.output, iter_cards_module(items))
+    print(f"유형 {len(items)}개 중 {rebuilt}개 카드 생성 ({time.perf_counter() - start:.2f}s)")
+    print(f"{'파일 저장 완료' if written else '변경 사항 없음'}: {args.output}")
+    return 0
+
+
+def cmd_check(args):
+    from peit_content import api
+
+    problems = []
+    details = api.load(args.details)
+    errors, warnings = api.check(details)
+    problems.extend(f'{args.details}: {error}' for error in errors)
+    if args.verbose:
+        for name, code in warnings:
+            print(f"경고: {args.details}: {code}.{name} 비어 있음")
+
+    from peit_content.markdown import RENDERED_FIELDS, component_fields, missing_html
+
+    from peit_content.results import SUMMARY_HTML_FIELDS
+
+    # 컴포넌트가 읽는 본문 필드는 모두 빌드 때 렌더링해야 함 (클라이언트 변환기 없음)
+    fields = []
+    for path in HTML_COMPONENT_PATHS:
+        used = component_fields(_read(path) or '')
+        problems.extend(f'{path}: {name} HTML을 빌드 때 만들지 않음 (markdown.RENDERED_FIELDS에 추가 필요)'
+                        for name in used if name not in RENDERED_FIELDS)
+        fields.extend(name for name in used if name not in fields)
+    # 카드는 요약 모듈만 보므로 html이 요약 쪽에 있어야 함
+    for path in (RESULT_CARD_PATH, SIMPLE_RESULT_CARD_PATH):
+        problems.extend(f'{path}: {name} HTML이 요약 모듈에 없음 (results.SUMMARY_HTML_FIELDS에 추가 필요)'
+                        for name in component_fields(_read(path) or '') if name not in SUMMARY_HTML_FIELDS)
+
+    if not args.no_generated:
+        import os
+
+        from peit_content.paths import RESULTS_BASE_NAME
+        from peit_content.results import render_outputs
+        from peit_content.split import INDEX_NAME, dump_json, render_index
+
+        # 생성 파일이 현재 원본과 일치하는지
+        base = api.load(args.base, RESULTS_BASE_NAME)
+        summaries, detail_items, names, recommended = render_outputs(base, dict(details.items()))
+        expected = {
+            RESULTS_OUTPUT_PATH: ''.join(summaries),
+            RECOMMENDED_OUTPUT_PATH: ''.join(recommended),
+            os.path.join(RESULT_DETAILS_DIR, INDEX_NAME): render_index(names, RESULTS_OUTPUT_PATH),
+        }
+        expected.update((os.path.join(RESULT_DETAILS_DIR, f'{code}.json'), dump_json(data))
+                        for code, data in detail_items)
+        for code, data in detail_items:
+            problems.extend(f'{RESULT_DETAILS_DIR}/{code}.json: {name} HTML 없음'
+                            for name in missing_html(data, fields))
+        for path, text in expected.items():
+            if _read(path) != text:
+                problems.append(f'{path}: 원본과 다름 (generate_results.py 실행 필요)')
+
+        from peit_content.early_stop import iter_early_stop_module, load_tables
+
+        # 판정표의 문항 순서가 lib/order.ts의 표시 순서와 같은지 (questions/order/mapping이 바뀌면 다시 생성)
+        _, _, tables = load_tables(MAPPING_PATH, QUESTIONS_PATH, ORDER_PATH)
+        if _read(EARLY_STOP_OUTPUT_PATH) != ''.join(iter_early_stop_module(tables)):
+            problems.append(f'{EARLY_STOP_OUTPUT_PATH}: 원본과 다름 (python -m peit_content early-stop 실행 필요)')
+
+    for problem in problems:
+        print(problem, file=sys.stderr)
+    if problems:
+        return 1
+    print("검사 통과")
+    return 0
+
+
+def _read(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def cmd_emit(args):
+    from peit_content.split import split_document
+    from peit_content.tsliteral import load_document
+
+    if args.split_only and not args.split:
+        print("--split-only에는 --split DIR이 필요합니다", file=sys.stderr)
+        return 1
+
+    if not args.split_only:
+        from peit_content.pipeline import ValidationError, build
+
+        profiler = _profiler(args, 'emit')
+        try:
+            codes, written = build(args.source, args.output, clean=not args.raw, profiler=profiler)
+        except ValidationError as e:
+            print("검증 실패 - 파일을 쓰지 않았습니다:", file=sys.stderr)
+            for error in e.errors:
+                print(f"  {error}", file=sys.stderr)
+            return 1
+        finally:
+            if profiler is not None:
+                profiler.finish(args.profile)
+
+        if written:
+            print(f"Wrote {len(codes)} political entries to {args.output}")
+        else:
+            print(f"No changes: {args.output} ({len(codes)} political entries)")
+
+    if args.split:
+        written = split_document(load_document(args.output), args.split, args.output)
+        print(f"Split {args.output} into {args.split} ({len(written)} files written)")
+
+    if args.results:
+        from peit_content.results import build_results
+
+        if build_results(details=args.output):
+            print(f"파일 저장 완료: {RESULTS_OUTPUT_PATH}, {RESULT_DETAILS_DIR}/")
+        else:
+            print(f"변경 사항 없음: {RESULTS_OUTPUT_PATH}, {RESULT_DETAILS_DIR}/")
+    return 0
+
+
+def cmd_watch(args):
+    from peit_content.watch import WatchSession, watch
+
+    session = WatchSession(
+        args.source, args.output, clean=not args.raw,
+        split_dir=args.split,
+        results_output=RESULTS_OUTPUT_PATH if args.results else None,
+        base_path=RESULTS_BASE_PATH)
+    watch(session, debounce=args.debounce, poll=args.poll, interval=args.interval)
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='peit-content', description='PEIT 콘텐츠 파이프라인')
+    commands = parser.add_subparsers(dest='command', required=True, metavar='<명령>')
+
+    p = commands.add_parser('ingest', help='소스 .txt → 추출 결과 JSON Lines')
+    p.add_argument('--source', default=SOURCE_PATH)
+    p.add_argument('--output', default='-', help='출력 파일 (기본 표준 출력)')
+    p.set_defaults(func=cmd_ingest)
+
+    p = commands.add_parser('section', help='소스 섹션 하나 보기 (바이트 색인 사용)')
+    p.add_argument('code', help='유형 코드 (예: IPAS)')
+    p.add_argument('name', nargs='?', help='필드 이름 또는 소제목 (예: worst_partner, "최악의 갈등 상대"), 없으면 목록')
+    p.add_argument('--source', default=SOURCE_PATH)
+    p.add_argument('--offsets', action='store_true', help='내용 대신 바이트 구간만 출력')
+    p.set_defaults(func=cmd_section)
+
+    p = commands.add_parser('clean', help='유형 상세 필드 정리')
+    p.add_argument('--full', action='store_true', help='매니페스트를 무시하고 모든 유형을 다시 정리')
+    p.add_argument('--jobs', type=int, default=1, metavar='N',
+                   help='유형 블록을 N개 프로세스로 나눠 정리 (0이면 CPU 개수)')
+    add_profile_arguments(p)
+    p.set_defaults(func=cmd_clean)
+
+    p = commands.add_parser('format', help='값 보정 후 표준 형식으로 직렬화')
+    p.add_argument('path', nargs='?', default=DETAILS_PATH)
+    add_profile_arguments(p)
+    p.set_defaults(func=cmd_format)
+
+    p = commands.add_parser('dedupe', help='필드 간 중복 문장 제거')
+    p.add_argument('path', nargs='?', default=DETAILS_PATH)
+    p.add_argument('--name', help='export const 이름 (기본 파일의 첫 번째 export)')
+    p.add_argument('--fields', nargs='+', metavar='FIELD',
+                   help='이 필드들만 이 순서로 비교 (기본 모든 텍스트 필드, 파일 순서)')
+    p.add_argument('--check', action='store_true', help='제거하지 않고 보고만 (중복이 있으면 종료 코드 1)')
+    p.set_defaults(func=cmd_dedupe)
+
+    p = commands.add_parser('near-dups', help='유형 간 유사 문단 보고')
+    p.add_argument('paths', nargs='*', default=[DETAILS_PATH, RESULTS_BASE_PATH])
+    p.add_argument('--threshold', type=float, default=0.6,
+                   help='보고할 추정 Jaccard 유사도 하한 (기본 0.6)')
+    p.add_argument('--limit', type=int, default=0, metavar='N', help='상위 N쌍만 출력 (기본 전부)')
+    p.add_argument('--no-cache', action='store_true', help='저장된 서명을 쓰지 않고 모두 다시 해시')
+    p.set_defaults(func=cmd_near_dups)
+
+    p = commands.add_parser('score', help='응답 JSON Lines 일괄 채점 (NumPy 필요)')
+    p.add_argument('input', nargs='?', default='-', help='응답 JSON Lines (기본 표준 입력)')
+    p.add_argument('--output', default='-', help='결과 JSON Lines (기본 표준 출력)')
+    p.add_argument('--mapping', default=MAPPING_PATH)
+    p.add_argument('--summary', action='store_true', help='결과 대신 유형별 인원수만 출력')
+    p.set_defaults(func=cmd_score)
+
+    p = commands.add_parser('answers', help='응답 비트 압축 저장소 (NumPy 필요)')
+    actions = p.add_subparsers(dest='action', required=True, metavar='<동작>')
+    q = actions.add_parser('append', help='응답 JSON Lines를 저장소 끝에 덧붙임')
+    q.add_argument('store', help='저장소 디렉터리 (없으면 만듦)')
+    q.add_argument('input', nargs='?', default='-', help='응답 JSON Lines (기본 표준 입력)')
+    q.set_defaults(func=cmd_answers_append)
+    q = actions.add_parser('score', help='저장소 전체 다시 채점')
+    q.add_argument('store', help='저장소 디렉터리')
+    q.add_argument('--output', default='-', help='결과 JSON Lines (기본 표준 출력)')
+    q.add_argument('--mapping', default=MAPPING_PATH)
+    q.add_argument('--summary', action='store_true', help='결과 대신 유형별 인원수만 출력')
+    q.set_defaults(func=cmd_answers_score)
+
+    p = commands.add_parser('percentiles', help='축 점수 백분위/강도 표 생성 (NumPy 필요)')
+    p.add_argument('--store', metavar='DIR', help='문항별 실제 A/B 비율을 셀 응답 저장소 (주면 empirical 표도 기록)')
+    p.add_argument('--mapping', default=MAPPING_PATH)
+    p.add_argument('--output', default=PERCENTILES_OUTPUT_PATH)
+    p.set_defaults(func=cmd_percentiles)
+
+    p = commands.add_parser('early-stop', help='조기 종료 판정표 생성 / 절약 문항 수 시뮬레이션')
+    p.add_argument('--mapping', default=MAPPING_PATH)
+    p.add_argument('--questions', default=QUESTIONS_PATH)
+    p.add_argument('--order', default=ORDER_PATH, help='표시 순서(buildOrderForCategory의 축 순서)를 읽을 파일')
+    p.add_argument('--output', default=EARLY_STOP_OUTPUT_PATH)
+    p.add_argument('--simulate', action='store_true', help='표를 쓰지 않고 답 분포별 기대 문항 수만 보고 (NumPy 필요)')
+    p.add_argument('--store', metavar='DIR', help='--simulate에 문항별 실제 비율과 실제 응답 재생 추가')
+    p.set_defaults(func=cmd_early_stop)
+
+    p = commands.add_parser('images', help='반응형 이미지 변형 + srcset 매니페스트 생성 (Pillow 필요)')
+    p.add_argument('--source', default='public/images', help='원본 디렉터리')
+    p.add_argument('--variants', default='public/images/generated', help='변형 출력 디렉터리 (원본 스캔에서 제외)')
+    p.add_argument('--output', default=IMAGES_OUTPUT_PATH, help='srcset 매니페스트 모듈')
+    p.add_argument('--full', action='store_true', help='캐시를 무시하고 모든 원본을 다시 처리')
+    p.add_argument('--jobs', type=int, default=1, metavar='N', help='원본을 N개 프로세스로 나눠 처리 (0이면 CPU 개수)')
+    p.set_defaults(func=cmd_images)
+
+    p = commands.add_parser('fonts', help='코퍼스 글자만 남긴 Pretendard WOFF2 서브셋 생성 (fontTools 필요)')
+    p.add_argument('--corpus', nargs='+', default=['lib', 'app', 'components'], metavar='DIR',
+                   help='글자와 굵기를 모을 디렉터리')
+    p.add_argument('--font-dir', default='fonts', help='Pretendard-<굵기> 원본 글꼴 파일 디렉터리')
+    p.add_argument('--subsets', default='public/fonts', help='서브셋 WOFF2 출력 디렉터리')
+    p.add_argument('--output', default=FONTS_CSS_OUTPUT_PATH, help='@font-face 규칙 CSS')
+    p.add_argument('--full', action='store_true', help='캐시를 무시하고 모든 굵기를 다시 서브셋')
+    p.add_argument('--jobs', type=int, default=1, metavar='N', help='굵기를 N개 프로세스로 나눠 처리 (0이면 CPU 개수)')
+    p.set_defaults(func=cmd_fonts)
+
+    p = commands.add_parser('cards', help='유형별 공유 카드 PNG/WebP 미리 렌더링 (Pillow 필요)')
+    p.add_argument('--results', default=RESULTS_OUTPUT_PATH, help='유형 이름/키워드를 읽을 결과 모듈')
+    p.add_argument('--cards', default='public/cards', help='카드 출력 디렉터리')
+    p.add_argument('--font-dir', default='fonts', help='Pretendard-Bold/Medium/Regular 글꼴 파일 디렉터리')
+    p.add_argument('--output', default=CARDS_OUTPUT_PATH, help='카드 URL 매니페스트 모듈')
+    p.add_argument('--full', action='store_true', help='캐시를 무시하고 모든 유형을 다시 그림')
+    p.add_argument('--jobs', type=int, default=1, metavar='N', help='유형을 N개 프로세스로 나눠 그림 (0이면 CPU 개수)')
+    p.set_defaults(func=cmd_cards)
+
+    p = commands.add_parser('check', help='검증과 생성 파일 최신 여부 확인 (쓰기 없음)')
+    p.add_argument('--details', default=DETAILS_PATH)
+    p.add_argument('--base', default=RESULTS_BASE_PATH)
+    p.add_argument('--no-generated', action='store_true', help='생성 파일 비교 생략')
+    p.add_argument('-v', '--verbose', action='store_true', help='빈 필드 경고도 출력')
+    p.set_defaults(func=cmd_check)
+
+    p = commands.add_parser('emit', help='.txt → political_details.ts 생성')
+    p.add_argument('--source', default=SOURCE_PATH)
+    p.add_argument('--output', default=DETAILS_PATH)
+    p.add_argument('--raw', action='store_true', help='정리 없이 추출 결과만 기록')
+    p.add_argument('--split', metavar='DIR', help='political_details.ts를 유형별 JSON으로도 분할할 디렉터리')
+    p.add_argument('--split-only', action='store_true',
+                   help='소스를 다시 생성하지 않고 기존 출력 파일만 분할 (--split DIR 필요)')
+    p.add_argument('--results', action='store_true',
+                   help=f'{RESULTS_OUTPUT_PATH}와 유형별 상세 {RESULT_DETAILS_DIR}/도 다시 병합')
+    add_profile_arguments(p)
+    p.set_defaults(func=cmd_emit)
+
+    p = commands.add_parser('watch', help='소스 변경 시 바뀐 유형만 다시 생성')
+    p.add_argument('--source', default=SOURCE_PATH)
+    p.add_argument('--output', default=DETAILS_PATH)
+    p.add_argument('--raw', action='store_true', help='정리 없이 추출 결과만 기록')
+    p.add_argument('--split', metavar='DIR', help='political_details.ts의 유형별 JSON 분할 출력도 갱신할 디렉터리')
+    p.add_argument('--results', action='store_true',
+                   help=f'{RESULTS_OUTPUT_PATH}와 {RESULT_DETAILS_DIR}/도 갱신 ({RESULTS_BASE_PATH} 변경도 감시)')
+    p.add_argument('--debounce', type=float, default=0.15, metavar='SEC',
+                   help='연속 저장을 한 번으로 묶는 대기 시간 (기본 0.15초)')
+    p.add_argument('--poll', action='store_true', help='inotify 대신 mtime 폴링 사용')
+    p.add_argument('--interval', type=float, default=0.25, metavar='SEC', help='폴링 간격')
+    p.set_defaults(func=cmd_watch)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+유형 블록 안의 필드 간 중복 문장 찾기/제거
+(이전 scripts/check_and_fix_duplicates.js, fix_duplicates.js, remove_duplicates.js 대체)
+- 필드 값을 문장 단위로 나누고 정규화한 문장을 해시 색인(dict)에 한 번씩만 넣음
+  → 문장 수에 선형, career_value/money_value뿐 아니라 모든 필드 쌍을 검사
+- 같은 문장이 여러 필드에 있으면 필드 순서상 처음 나온 곳만 남기고 이후 반복은 제거
+- 배열 필드(strengths 등)는 항목별로 검사하고, 문장이 모두 빠진 항목은 삭제
+"""
+
+import re
+import unicodedata
+
+from peit_content.editbuffer import EditBuffer
+
+# 20자 이하는 "~입니다." 같은 상투 문장이 우연히 겹칠 수 있어 제외 (JS 스크립트와 같은 기준)
+MIN_SENTENCE_LENGTH = 20
+
+# 비교하지 않는 필드 (이름/분류/해시태그/도서 목록)
+SKIP_FIELDS = {'name', 'category', 'keywords', 'recommended_books', 'html'}
+
+# 카드에 보이는 요약 - 상세 필드의 문장을 발췌한 것이라 겹치는 게 정상
+SUMMARY_FIELDS = {'summary', 'description'}
+
+# 문장부호 뒤에 공백/줄 끝이 와야 문장 끝 ("...문제야!\"라며", "3.5배" 는 이어지는 문장)
+_SENTENCE_RE = re.compile(r'(?:[^.!?。\n]|[.!?。]+(?=[^\s.!?。]))+[.!?。]*')
+_MARKUP_RE = re.compile(r'\*\*|__|[*_`]')
+_BULLET_RE = re.compile(r'^[\s\-•▪·>#\d.)]+')
+_SPACE_RE = re.compile(r'\s+')
+_TRAILING_RE = re.compile(r'[\s.!?。]+$')
+_BLANK_LINES_RE = re.compile(r'\n\n\n+')
+_LINE_SPACE_RE = re.compile(r'[ \t]+\n')
+
+
+def normalize_sentence(sentence):
+    """비교용 정규화 - 마크다운 강조/글머리표/공백/끝 문장부호 차이를 무시"""
+    text = unicodedata.normalize('NFC', sentence)
+    text = _MARKUP_RE.sub('', text)
+    text = _BULLET_RE.sub('', text)
+    text = _SPACE_RE.sub(' ', text)
+    return _TRAILING_RE.sub('', text).casefold()
+
+
+def iter_sentences(text):
+    """(시작, 끝, 정규화 문장) - 비교 기준 길이보다 짧은 문장은 건너뜀"""
+    for match in _SENTENCE_RE.finditer(text):
+        key = normalize_sentence(match.group())
+        if len(key) > MIN_SENTENCE_LENGTH:
+            yield match.start(), match.end(), key
+
+
+def _remove_spans(text, spans):
+    """문장 구간(과 앞의 공백)을 지운 뒤 JS 스크립트처럼 빈 줄/공백 정리"""
+    buffer = EditBuffer(text)
+    for start, end in spans:
+        while start > 0 and text[start - 1] in ' \t':
+            start -= 1
+        buffer.delete(start, end)
+    text = _LINE_SPACE_RE.sub('\n', buffer.render())
+    return _BLANK_LINES_RE.sub('\n\n', text).strip()
+
+
+def _texts(value):
+    """필드 값 → [(배열 위치 또는 None, 문자열)]"""
+    if isinstance(value, str):
+        return [(None, value)]
+    if isinstance(value, list):
+        return [(i, item) for i, item in enumerate(value) if isinstance(item, str)]
+    return []
+
+
+def dedupe_block(data, fields=None):
+    """유형 하나의 필드 간 중복 문장 제거
+
+    → (바뀐 필드 {필드: 새 값}, [(필드, 처음 나온 필드, 문장)])
+    """
+    seen = {}
+    changed = {}
+    repeats = []
+    for name in (fields or data):
+        if name in SKIP_FIELDS or name in SUMMARY_FIELDS or name not in data:
+            continue
+        value = data[name]
+        removed_items = []
+        new_items = {}
+        for index, text in _texts(value):
+            spans = []
+            for start, end, key in iter_sentences(text):
+                first = seen.get(key)
+                if first is None:
+                    seen[key] = name
+                elif first != name:
+                    spans.append((start, end))
+                    repeats.append((name, first, text[start:end].strip()))
+            if not spans:
+                continue
+            new_text = _remove_spans(text, spans)
+            if index is None:
+                changed[name] = new_text
+            elif new_text:
+                new_items[index] = new_text
+            else:
+                removed_items.append(index)
+        if isinstance(value, list) and (new_items or removed_items):
+            changed[name] = [new_items.get(i, item) for i, item in enumerate(value)
+                             if i not in removed_items]
+    return changed, repeats
+
+
+def find_duplicates(items, fields=None):
+    """(유형 코드, 데이터) 목록 → [(유형 코드, 필드, 처음 나온 필드, 문장)]"""
+    report = []
+    for code, data in items:
+        _, repeats = dedupe_block(data, fields)
+        report.extend((code,) + repeat for repeat in repeats)
+    return report
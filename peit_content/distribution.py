@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+축 점수의 정확한 분포와 백분위 표 (NumPy 필요)
+- lib/mapping.ts의 문항마다 A/B가 어느 축에 1점을 주는지 보고, 축 쌍 (I/C, P/T, ...)의
+  결합 분포를 문항 하나씩 2차원 합성곱으로 누적 (표본 추출 없이 정확한 값)
+- 답 확률 가정은 균등(A/B 반반)과, 응답 저장소에서 센 문항별 실제 A/B 비율 두 가지
+- 결과는 (축, 점수) → 백분위/강도 표로 lib/generated/score_percentiles.ts에 기록해
+  결과 페이지가 런타임 통계 없이 배열 인덱스 한 번으로 찾게 함
+
+    백분위: 전체 응답자 중 이 축 점수가 더 낮은 비율 + 같은 비율의 절반 (0~100)
+    강도: 이 축 글자를 받은 응답자(calculateResult의 `>` 비교, 동점은 뒤 축) 안에서의 같은 백분위,
+          이 점수로는 그 글자를 받을 수 없으면 null
+"""
+
+import numpy as np
+
+from peit_content.scoring import AXES, ECONOMIC_PAIRS, POLITICAL_PAIRS
+
+PAIRS = [(front, back) for front, back, _, _ in POLITICAL_PAIRS + ECONOMIC_PAIRS]
+
+
+def uniform_priors(mapping):
+    """문항 번호 → A를 고를 확률 0.5"""
+    return {q: 0.5 for q in mapping}
+
+
+def empirical_priors(mapping, counts):
+    """answer_store.answer_counts 결과 → 문항별 A 비율 (답한 사람이 없으면 0.5)"""
+    priors = {}
+    for q in mapping:
+        answered, chose_b = counts.get(q, (0, 0))
+        priors[q] = (answered - chose_b) / answered if answered else 0.5
+    return priors
+
+
+def pair_distribution(mapping, front, back, priors):
+    """축 쌍의 결합 분포 → pmf[앞 축 점수, 뒤 축 점수] (모든 문항에 답했다고 가정)"""
+    pmf = np.ones((1, 1))
+    for q, answers in sorted(mapping.items()):
+        p_a = priors.get(q, 0.5)
+        steps = [((answers.get('A') == front, answers.get('A') == back), p_a),
+                 ((answers.get('B') == front, answers.get('B') == back), 1 - p_a)]
+        if not any(dx or dy for (dx, dy), _ in steps):
+            continue
+        rows, cols = pmf.shape
+        grown = np.zeros((rows + 1, cols + 1))
+        for (dx, dy), p in steps:
+            grown[int(dx):rows + int(dx), int(dy):cols + int(dy)] += p * pmf
+        pmf = grown
+    return pmf
+
+
+def _midrank(pmf):
+    """점수별 확률 → 점수별 (아래 비율 + 같은 비율의 절반) 백분위"""
+    total = pmf.sum()
+    if total <= 0:
+        return [None] * len(pmf)
+    below = np.concatenate([[0.0], np.cumsum(pmf)[:-1]])
+    return [round(float(value), 1) for value in 100 * (below + pmf / 2) / total]
+
+
+def axis_tables(pmf):
+    """결합 분포 → (앞 축 표, 뒤 축 표), 표 = {'percentile', 'strength'} 점수 순 배열"""
+    x = np.arange(pmf.shape[0])[:, None]
+    y = np.arange(pmf.shape[1])[None, :]
+    front_wins = np.where(x > y, pmf, 0.0)
+    back_wins = pmf - front_wins
+    tables = []
+    for marginal, won in ((pmf.sum(axis=1), front_wins.sum(axis=1)),
+                          (pmf.sum(axis=0), back_wins.sum(axis=0))):
+        strength = _midrank(won)
+        tables.append({
+            'percentile': _midrank(marginal),
+            'strength': [value if p > 0 else None for value, p in zip(strength, won)],
+        })
+    return tables
+
+
+def percentile_tables(mapping, priors):
+    """축 → 표 (AXES 순서)"""
+    tables = {}
+    for front, back in PAIRS:
+        tables[front], tables[back] = axis_tables(pair_distribution(mapping, front, back, priors))
+    return {axis: tables[axis] for axis in AXES if axis in tables}
+
+
+def iter_percentiles_module(tables):
+    """{가정: {축: 표}} → 모듈 텍스트"""
+    from peit_content.tsliteral import iter_module
+
+    yield (
+        '// 자동 생성 파일 - 직접 수정하지 마세요 (peit-content percentiles 로 생성)\n'
+        '// scorePercentiles[가정][축].percentile[점수], .strength[점수] (강도가 null이면 그 글자를 받을 수 없는 점수)\n'
+        '\n'
+        'export interface AxisPercentiles {\n'
+        '  percentile: number[];\n'
+        '  strength: (number | null)[];\n'
+        '}\n'
+        '\n'
+    )
+    yield from iter_module('scorePercentiles', tables.items(),
+                           'Readonly<Record<string, Readonly<Record<string, AxisPercentiles>>>>')
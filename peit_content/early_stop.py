@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+"""
+검사 조기 종료 판정표와 시뮬레이터
+- calculateResult는 축 쌍마다 `앞 축 > 뒤 축`으로 글자를 정하므로, 남은 문항을 어떻게 답해도
+  비교 결과가 바뀌지 않는 순간 그 축 쌍의 나머지 문항은 물을 필요가 없음
+- lib/order.ts의 표시 순서(축을 섞은 고정 순서)를 그대로 따라(축 순서는 order.ts에서 직접 읽음), 축 쌍마다
+  "이 쌍의 문항 k개에 답한 뒤 margin(앞 축 점수 - 뒤 축 점수)이 얼마면 확정인가" 표를 만듦
+- 표는 lib/generated/early_stop.ts로 내보내 검사 페이지가 확정된 쌍의 문항을 건너뛰게 함
+  (questions.ts/order.ts/mapping.ts가 바뀌었는데 다시 만들지 않았으면 check가 실패)
+- 시뮬레이터는 답 분포(균등, 한쪽으로 기운 응답자, 응답 저장소의 문항별 비율)마다
+  물어보는 문항 수의 기댓값을 정확히 계산하고, 저장소의 실제 응답은 그대로 재생해 셈
+
+조기 종료로 건너뛴 문항은 점수에 들어가지 않으므로 calculateRelativeScores의 비율과
+score_percentiles 표(모든 문항에 답했다고 가정)는 글자와 달리 끝까지 답한 경우와 달라질 수 있음
+"""
+
+import re
+
+from peit_content.paths import MAPPING_PATH, ORDER_PATH, QUESTIONS_PATH
+from peit_content.scoring import ECONOMIC_PAIRS, POLITICAL_PAIRS
+
+# lib/order.ts buildOrderForCategory의 축 순서 선언 (`category === 'political' ? [...] : [...]`)
+_AXIS_ORDER_RE = re.compile(r"""category\s*===\s*(['"])political\1\s*\?\s*(\[[^\]]*\])\s*:\s*(\[[^\]]*\])""")
+TEST_TYPES = ['political', 'economic', 'both']
+
+# 한쪽으로 기운 응답자: 매 문항 앞 축 쪽 답을 고를 확률
+LEANS = [0.5, 0.6, 0.7, 0.8, 0.9]
+
+
+def load_axis_order(path=ORDER_PATH):
+    """lib/order.ts에서 검사 종류 → 축 순서를 읽음 (축 순서는 order.ts 한 곳에만 둠)"""
+    from peit_content.tsliteral import ParseError, parse_literal
+
+    with open(path, 'r', encoding='utf-8') as f:
+        source = f.read()
+    match = _AXIS_ORDER_RE.search(source)
+    if not match:
+        raise ParseError('buildOrderForCategory axisOrder not found', source, 0)
+    return {'political': parse_literal(match.group(2)), 'economic': parse_literal(match.group(3))}
+
+
+def display_order(questions, category, axis_order):
+    """lib/order.ts buildOrderForCategory 이식 - 축별 대기열을 한 문항씩 번갈아 꺼냄"""
+    by_axis = {}
+    for question in questions:
+        if question['category'] == category:
+            by_axis.setdefault(question['axis'], []).append(question['id'])
+    queues = [list(by_axis.get(axis, [])) for axis in axis_order[category]]
+    order = []
+    while any(queues):
+        for queue in queues:
+            if queue:
+                order.append(queue.pop(0))
+    return order
+
+
+def display_orders(questions, axis_order):
+    """검사 종류 → 표시 순서 (전체 검사는 정치 후 경제, DISPLAY_ORDER_BOTH)"""
+    political = display_order(questions, 'political', axis_order)
+    economic = display_order(questions, 'economic', axis_order)
+    return {'political': political, 'economic': economic, 'both': political + economic}
+
+
+def load_tables(mapping_path=MAPPING_PATH, questions_path=QUESTIONS_PATH, order_path=ORDER_PATH):
+    """원본 파일들 → (매핑, 검사 종류 → 표시 순서, 검사 종류 → 판정표 목록)"""
+    from peit_content.scoring import load_mapping
+    from peit_content.tsliteral import load_literal
+
+    mapping = load_mapping(mapping_path)
+    orders = display_orders(load_literal(questions_path, 'questions'), load_axis_order(order_path))
+    return mapping, orders, {test_type: decision_rules(mapping, orders[test_type]) for test_type in TEST_TYPES}
+
+
+def decision_rules(mapping, order):
+    """표시 순서 → 축 쌍별 판정표 목록
+
+    {'front', 'back', 'questions': [(문항, A의 margin 변화, B의 margin 변화)],
+     'front_above': [k → 이 값보다 margin이 크면 앞 글자 확정],
+     'back_at_most': [k → 이 값 이하이면 뒤 글자 확정]}
+    (k = 이 쌍의 문항 중 표시 순서대로 답한 개수, 0..문항 수)
+    """
+    rules = []
+    for front, back, _, _ in POLITICAL_PAIRS + ECONOMIC_PAIRS:
+        steps = []
+        for q in order:
+            answers = mapping.get(q)
+            if answers is None:
+                continue
+            delta_a = (answers.get('A') == front) - (answers.get('A') == back)
+            delta_b = (answers.get('B') == front) - (answers.get('B') == back)
+            if delta_a or delta_b:
+                steps.append((q, delta_a, delta_b))
+        if not steps:
+            continue
+        # 남은 문항이 margin을 가장 낮추는/높이는 경우의 합
+        lowest = [0] * (len(steps) + 1)
+        highest = [0] * (len(steps) + 1)
+        for k in range(len(steps) - 1, -1, -1):
+            _, delta_a, delta_b = steps[k]
+            lowest[k] = lowest[k + 1] + min(delta_a, delta_b)
+            highest[k] = highest[k + 1] + max(delta_a, delta_b)
+        rules.append({
+            'front': front,
+            'back': back,
+            'questions': steps,
+            'front_above': [-value for value in lowest],
+            'back_at_most': [-value for value in highest],
+        })
+    return rules
+
+
+def decided(rule, k, margin):
+    """k개 답한 뒤 margin으로 글자가 확정됐는지"""
+    return margin > rule['front_above'][k] or margin <= rule['back_at_most'][k]
+
+
+def decided_rows(rule, k, margin):
+    """decided()의 행 배열판"""
+    return (margin > rule['front_above'][k]) | (margin <= rule['back_at_most'][k])
+
+
+def expected_asked(rule, priors):
+    """문항별 A 확률 priors에서 이 축 쌍의 문항을 물어보는 개수의 기댓값 (margin 분포를 따라가며 정확히)"""
+    margins = {0: 1.0}
+    asked = 0.0
+    for k, (q, delta_a, delta_b) in enumerate(rule['questions']):
+        open_margins = {m: p for m, p in margins.items() if not decided(rule, k, m)}
+        if not open_margins:
+            break
+        asked += sum(open_margins.values())
+        p_a = priors.get(q, 0.5)
+        margins = {}
+        for m, p in open_margins.items():
+            margins[m + delta_a] = margins.get(m + delta_a, 0.0) + p * p_a
+            margins[m + delta_b] = margins.get(m + delta_b, 0.0) + p * (1 - p_a)
+    return asked
+
+
+def lean_priors(rule, lean):
+    """매 문항 앞 축 쪽 답을 확률 lean으로 고르는 응답자의 문항별 A 확률"""
+    return {q: lean if delta_a > delta_b else 1 - lean if delta_a < delta_b else 0.5
+            for q, delta_a, delta_b in rule['questions']}
+
+
+def replay_asked(rules, choices, columns):
+    """실제 응답 (행 × 문항, 0 무응답/1 A/2 B) → 행별 물어보는 문항 수
+
+    이 검사의 문항에 모두 답한 행만 의미가 있음 (무응답 문항은 margin을 바꾸지 않은 것으로 봄, NumPy 필요)
+    """
+    import numpy as np
+
+    asked = np.zeros(len(choices), dtype=np.int64)
+    for rule in rules:
+        margin = np.zeros(len(choices), dtype=np.int64)
+        open_rows = ~decided_rows(rule, 0, margin)
+        for k, (q, delta_a, delta_b) in enumerate(rule['questions']):
+            asked += open_rows
+            choice = choices[:, columns[q]]
+            margin += np.where(choice == 1, delta_a, np.where(choice == 2, delta_b, 0))
+            open_rows &= ~decided_rows(rule, k + 1, margin)
+    return asked
+
+
+def simulate(rules, priors=None):
+    """판정표 → 분포 이름 → 물어보는 문항 수 기댓값 (균등/기운 응답자, priors가 있으면 'empirical')"""
+    report = {}
+    for lean in LEANS:
+        name = 'uniform' if lean == 0.5 else f'lean {lean:.1f}'
+        report[name] = sum(expected_asked(rule, lean_priors(rule, lean)) for rule in rules)
+    if priors is not None:
+        report['empirical'] = sum(expected_asked(rule, priors) for rule in rules)
+    return report
+
+
+def iter_early_stop_module(tables):
+    """{검사 종류: 판정표 목록} → 모듈 텍스트"""
+    from peit_content.tsliteral import iter_module
+
+    def export(rule):
+        return {
+            'front': rule['front'],
+            'back': rule['back'],
+            'questions': [q for q, _, _ in rule['questions']],
+            'frontAbove': rule['front_above'],
+            'backAtMost': rule['back_at_most'],
+        }
+
+    yield (
+        '// 자동 생성 파일 - 직접 수정하지 마세요 (peit-content early-stop 으로 생성)\n'
+        '// earlyStop[검사 종류]: 축 쌍마다 questions(표시 순서)의 k개에 답한 뒤\n'
+        '// margin = scores[front] - scores[back] 이 frontAbove[k]보다 크거나 backAtMost[k] 이하이면\n'
+        '// 글자가 확정되어 그 쌍의 남은 문항을 건너뛰어도 calculateResult의 유형이 같음\n'
+        '\n'
+        'export interface PairDecision {\n'
+        '  front: string;\n'
+        '  back: string;\n'
+        '  questions: number[];\n'
+        '  frontAbove: number[];\n'
+        '  backAtMost: number[];\n'
+        '}\n'
+        '\n'
+    )
+    items = ((test_type, [export(rule) for rule in rules]) for test_type, rules in tables.items())
+    yield from iter_module('earlyStop', items, 'Readonly<Record<string, readonly PairDecision[]>>')
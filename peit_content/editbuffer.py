@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+원본 텍스트 위의 편집 버퍼 (piece table)
+- 정리 패스는 새 문자열을 만드는 대신 (구간, 대체 문자열) 편집만 기록
+- 겹치는 편집은 기록 시점에 거부 (두 패스가 같은 구간을 고치면 조용히 덮어쓰지 않음)
+- 최종 결과는 원본 조각과 대체 문자열을 순서대로 이어 붙여 한 번만 만들거나,
+  pieces()로 조각 단위로 흘려 보내 파일에 바로 씀
+"""
+
+from bisect import bisect_left
+
+
+class OverlapError(ValueError):
+    """이미 기록된 편집과 구간이 겹침"""
+
+    def __init__(self, start, end, other_start, other_end):
+        super().__init__(f'edit [{start}, {end}) overlaps [{other_start}, {other_end})')
+        self.span = (start, end)
+        self.other = (other_start, other_end)
+
+
+class EditBuffer:
+    """원본 텍스트 + 시작 위치 순으로 정렬된 편집 목록"""
+
+    def __init__(self, source):
+        self.source = source
+        self._starts = []
+        self._edits = []
+
+    def __len__(self):
+        return len(self._edits)
+
+    def __iter__(self):
+        """(시작, 끝, 대체 문자열) - 시작 위치 순"""
+        return iter(self._edits)
+
+    def replace(self, start, end, text):
+        """source[start:end]를 text로 바꾸는 편집 기록 (맞닿는 건 허용, 겹치면 OverlapError)"""
+        if not 0 <= start <= end <= len(self.source):
+            raise IndexError(f'edit [{start}, {end}) out of range 0..{len(self.source)}')
+        i = bisect_left(self._starts, start)
+        if i > 0:
+            prev_start, prev_end, _ = self._edits[i - 1]
+            if prev_end > start:
+                raise OverlapError(start, end, prev_start, prev_end)
+        if i < len(self._edits):
+            next_start, next_end, _ = self._edits[i]
+            # 같은 위치의 삽입 두 개는 순서가 모호하므로 겹침으로 취급
+            if next_start < end or next_start == start:
+                raise OverlapError(start, end, next_start, next_end)
+        self._starts.insert(i, start)
+        self._edits.insert(i, (start, end, text))
+
+    def insert(self, pos, text):
+        self.replace(pos, pos, text)
+
+    def delete(self, start, end):
+        self.replace(start, end, '')
+
+    def pieces(self):
+        """결과 텍스트를 이루는 조각들 (원본 구간 / 대체 문자열이 번갈아)"""
+        pos = 0
+        for start, end, text in self._edits:
+            if start > pos:
+                yield self.source[pos:start]
+            if text:
+                yield text
+            pos = end
+        if pos < len(self.source) or not self._edits:
+            yield self.source[pos:]
+
+    def render(self):
+        """결과 텍스트를 한 번에 조립 (편집이 없으면 원본 그대로)"""
+        if not self._edits:
+            return self.source
+        return ''.join(self.pieces())
+
+    def result_length(self):
+        """render() 없이 결과 길이 계산"""
+        return len(self.source) + sum(len(text) - (end - start) for start, end, text in self._edits)
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+필드 값 보정 규칙 (fix_format.py 규칙을 문자열 치환 대신 값 단위로 적용)
+- 소제목 뒤에 남은 ': ' / ':\n' 접두어 제거
+- 다음 소제목 앞에서 잘리고 남은 글머리표/따옴표만 있는 마지막 줄 제거
+- 글머리표나 따옴표만 남은 빈 필드를 빈 문자열로 정리
+- 앞뒤가 잘린 불완전한 소통의 벽 문단 제거
+"""
+
+import re
+
+# 다음 소제목의 글머리표(또는 여는 따옴표)만 남은 마지막 줄
+_TRAILING_BULLET_RE = re.compile(r'\n[\s•◦▪\'"]*\Z')
+
+# 필드 → 값이 이것뿐이면 비어 있는 것으로 봄
+_EMPTY_LEFTOVERS = {
+    'love_value': ('▪\t',),
+    'best_partner': ('▪\t',),
+    'worst_partner': ("'",),
+}
+
+
+def fix_field(name, value):
+    """필드 하나의 값을 보정"""
+    if not isinstance(value, str):
+        return value
+
+    # 섹션 분할기가 소제목 바로 뒤에서 자르면 ': '가 남음
+    if value.startswith(':'):
+        value = value[1:].lstrip()
+    value = _TRAILING_BULLET_RE.sub('', value)
+
+    # "을 만드는 것입니다." 같은 불완전한 텍스트 제거
+    if name == 'communication_barrier' and '"' not in value and value.endswith('을 만드는 것입니다.'):
+        value = ''
+
+    if value in _EMPTY_LEFTOVERS.get(name, ()):
+        value = ''
+
+    return value
+
+
+def fix_fields(data):
+    """유형 하나의 모든 필드를 보정 (바뀐 필드만 담은 dict 반환)"""
+    fixed = {}
+    for name, value in data.items():
+        new_value = fix_field(name, value)
+        if new_value != value:
+            fixed[name] = new_value
+    return fixed
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""
+Pretendard 웹 글꼴 서브셋 단계 (fontTools + brotli 필요)
+- app/globals.css는 jsDelivr의 Pretendard 9개 굵기 전체(굵기마다 수 MB의 한글 글리프)를 받지만
+  사이트에 실제로 나오는 글자는 lib/, app/, components/의 문자열이 전부
+- 이 파일들에서 코드 포인트 집합을 모으고, 클래스/CSS에서 실제로 쓰는 굵기만 골라
+  fonts/의 로컬 Pretendard 원본을 그 글자만 남긴 WOFF2로 public/fonts/에 기록
+- 같은 글자 범위의 @font-face 규칙(unicode-range 포함)은 app/generated/fonts.css로 기록
+- 코드 포인트 집합, 원본 다이제스트가 지난 실행(.peit-cache/fonts.json)과 같고 출력이 남아 있으면 건너뜀
+  (파일 이름에 다이제스트 앞부분을 넣어 글자 집합이 바뀌면 URL도 바뀜, 이전 서브셋은 삭제)
+- 굵기 하나가 작업 단위 하나 (--jobs N이면 프로세스 풀)
+"""
+
+import json
+import os
+import re
+
+from peit_content.images import public_url
+from peit_content.manifest import CACHE_DIR, DigestCache, digest, file_digest
+from peit_content.parallel import map_units
+
+FONT_DIR = 'fonts'
+FONT_FAMILY = 'Pretendard'
+FONT_EXTENSIONS = ['.otf', '.ttf', '.woff2', '.woff']
+SUBSET_DIR = 'public/fonts'
+FONT_CACHE = os.path.join(CACHE_DIR, 'fonts.json')
+CACHE_VERSION = 1
+
+CORPUS_DIRS = ['lib', 'app', 'components']
+CORPUS_EXTENSIONS = {'.ts', '.tsx', '.js', '.jsx', '.css'}
+
+# CSS 굵기 → Pretendard 파일 이름
+WEIGHT_NAMES = {
+    100: 'Thin',
+    200: 'ExtraLight',
+    300: 'Light',
+    400: 'Regular',
+    500: 'Medium',
+    600: 'SemiBold',
+    700: 'Bold',
+    800: 'ExtraBold',
+    900: 'Black',
+}
+# Tailwind font-* 클래스 → CSS 굵기
+TAILWIND_WEIGHTS = {
+    'thin': 100,
+    'extralight': 200,
+    'light': 300,
+    'normal': 400,
+    'medium': 500,
+    'semibold': 600,
+    'bold': 700,
+    'extrabold': 800,
+    'black': 900,
+}
+# 본문 기본 굵기
+DEFAULT_WEIGHT = 400
+
+# 코퍼스에 없어도 항상 넣는 글자 (출력 가능한 ASCII - 숫자, 점수, 영문 유형 코드 등)
+ALWAYS = set(range(0x20, 0x7F))
+
+_TAILWIND_RE = re.compile(r'(?<![\w-])(?:[\w-]+:)*font-(' + '|'.join(TAILWIND_WEIGHTS) + r')(?![\w-])')
+_CSS_WEIGHT_RE = re.compile(r'font-weight\s*:\s*([1-9]00)\b')
+_FONT_FACE_RE = re.compile(r'@font-face\s*{[^}]*}')
+
+
+def find_font(weight_name, font_dir=FONT_DIR):
+    """fonts/Pretendard-<굵기>.otf 등 → 경로 (없으면 FileNotFoundError)"""
+    candidates = [os.path.join(font_dir, f'{FONT_FAMILY}-{weight_name}{extension}') for extension in FONT_EXTENSIONS]
+    for path in candidates:
+        if os.path.exists(path):
+            return path
+    raise FileNotFoundError(f'글꼴 없음: {candidates[0]} ({", ".join(FONT_EXTENSIONS)})')
+
+
+def iter_corpus(directories=CORPUS_DIRS, skip=()):
+    """코퍼스 파일 경로 (숨김 디렉터리와 skip 경로 제외, 경로 순)"""
+    skip = {os.path.normpath(path) for path in skip}
+    for directory in directories:
+        for root, dirs, files in os.walk(directory):
+            dirs[:] = sorted(d for d in dirs
+                             if not d.startswith('.') and os.path.normpath(os.path.join(root, d)) not in skip)
+            for name in sorted(files):
+                path = os.path.join(root, name)
+                if os.path.splitext(name)[1] in CORPUS_EXTENSIONS and os.path.normpath(path) not in skip:
+                    yield path
+
+
+def scan_corpus(paths):
+    """파일들 → (코드 포인트 집합, 쓰는 CSS 굵기 집합)
+
+    @font-face 블록은 굵기 선언만 있고 실제로 그 굵기를 쓰는 곳이 아니라서 굵기 검색에서 뺌
+    """
+    codepoints = set(ALWAYS)
+    weights = {DEFAULT_WEIGHT}
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            text = f.read()
+        codepoints.update(ord(char) for char in text if char.isprintable())
+        weights.update(TAILWIND_WEIGHTS[name] for name in _TAILWIND_RE.findall(text))
+        weights.update(int(value) for value in _CSS_WEIGHT_RE.findall(_FONT_FACE_RE.sub('', text)))
+    return codepoints, weights
+
+
+def unicode_ranges(codepoints):
+    """코드 포인트 집합 → 'U+20-7E, U+AC00, ...' (연속 구간은 묶음)"""
+    ranges = []
+    for cp in sorted(codepoints):
+        if ranges and ranges[-1][1] == cp - 1:
+            ranges[-1][1] = cp
+        else:
+            ranges.append([cp, cp])
+    return ', '.join(f'U+{start:X}' if start == end else f'U+{start:X}-{end:X}' for start, end in ranges)
+
+
+def subset_font(unit):
+    """(원본 경로, 출력 경로, 코드 포인트 목록) → 캐시 항목 (작업 프로세스에서 실행)"""
+    from fontTools import subset
+
+    source, path, codepoints = unit
+    options = subset.Options()
+    options.flavor = 'woff2'
+    font = subset.load_font(source, options)
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=codepoints)
+    subsetter.subset(font)
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    subset.save_font(font, path, options)
+    return {
+        'files': [path],
+        'size': os.path.getsize(path),
+        'source_size': os.path.getsize(source),
+    }
+
+
+def build_fonts(paths, font_dir=FONT_DIR, out_dir=SUBSET_DIR, cache_path=FONT_CACHE, jobs=1, full=False):
+    """코퍼스 파일들 → ([(CSS 굵기, 캐시 항목)], 코드 포인트 집합, 다시 만든 굵기 수)"""
+    from fontTools import version as fonttools_version
+
+    codepoints, weights = scan_corpus(paths)
+    glyphs = sorted(codepoints)
+    glyph_digest = digest(json.dumps(glyphs))
+    cache = DigestCache(cache_path, CACHE_VERSION, (font_dir, out_dir))
+
+    entries = {}
+    units = []
+    keys = []
+    for weight in sorted(weights):
+        weight_name = WEIGHT_NAMES[weight]
+        source = find_font(weight_name, font_dir)
+        subset_digest = digest(json.dumps([glyph_digest, file_digest(source), fonttools_version]))
+        key = str(weight)
+        if not full and cache.fresh(key, subset_digest):
+            entries[key] = cache.entries[key]
+            continue
+        path = os.path.join(out_dir, f'{FONT_FAMILY}-{weight_name}.{subset_digest[:8]}.woff2')
+        units.append((source, path, glyphs))
+        keys.append(key)
+        entries[key] = {'digest': subset_digest}
+
+    for key, entry in zip(keys, map_units(subset_font, units, jobs)):
+        entries[key]['entry'] = entry
+
+    # 글자 집합이나 원본이 바뀌어 더 이상 쓰지 않는 서브셋은 삭제됨
+    cache.replace(entries)
+    return [(int(key), entries[key]['entry']) for key in sorted(entries, key=int)], codepoints, len(units)
+
+
+def font_face_css(items, codepoints):
+    """(CSS 굵기, 캐시 항목) 들 → @font-face 규칙 텍스트"""
+    ranges = unicode_ranges(codepoints)
+    rules = ['/* 자동 생성 파일 - 직접 수정하지 마세요 (peit-content fonts 로 생성) */\n'
+             f'/* {FONT_FAMILY} 서브셋: 코퍼스의 {len(codepoints)}자, 굵기 {", ".join(str(w) for w, _ in items)} */\n']
+    for weight, entry in items:
+        rules.append(
+            '@font-face {\n'
+            f"  font-family: '{FONT_FAMILY}';\n"
+            f"  src: url('{public_url(entry['files'][0])}') format('woff2');\n"
+            f'  font-weight: {weight};\n'
+            '  font-display: swap;\n'
+            f'  unicode-range: {ranges};\n'
+            '}\n'
+        )
+    return '\n'.join(rules)
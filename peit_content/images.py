@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""
+반응형 이미지 빌드 단계 (Pillow 필요)
+- GitHub Pages 정적 export는 images.unoptimized라 public/images 원본이 그대로 내려감
+- 원본마다 next.config.js deviceSizes 너비 구간(원본보다 큰 구간은 건너뜀)으로 줄인
+  AVIF / WebP / JPEG(알파가 있으면 PNG) 변형을 public/images/generated/에 만듦
+- 원본 하나가 작업 단위 하나이고 --jobs N이면 프로세스 풀로 나눠 처리
+- 원본 바이트 다이제스트와 설정이 지난 실행(.peit-cache/images.json)과 같고 출력이 남아 있으면 건너뜀
+- 변형 파일 이름에 원본 다이제스트 앞부분을 넣어 원본이 바뀌면 URL도 바뀜 (이전 변형은 삭제)
+- 컴포넌트용 srcset 매니페스트는 lib/generated/images.ts로 기록
+
+    images['/images/political/CPUS.jpg'].srcSet.avif
+      → '/images/generated/political/CPUS.1a2b3c4d-640.avif 640w, ...'
+"""
+
+import hashlib
+import json
+import os
+import re
+from urllib.parse import quote
+
+from peit_content.manifest import CACHE_DIR, DigestCache, file_digest
+from peit_content.parallel import map_units
+
+IMAGE_DIR = 'public/images'
+PUBLIC_DIR = 'public'
+VARIANT_DIR = 'public/images/generated'
+IMAGE_CACHE = os.path.join(CACHE_DIR, 'images.json')
+NEXT_CONFIG = 'next.config.js'
+
+SOURCE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.webp'}
+DEFAULT_DEVICE_SIZES = [640, 750, 828, 1080, 1200, 1920, 2048, 3840]
+
+# (확장자, Pillow 형식, 저장 옵션) - srcset에 넣는 순서 (브라우저가 앞의 것부터 고름)
+FORMATS = [
+    ('avif', 'AVIF', {'quality': 50, 'speed': 6}),
+    ('webp', 'WEBP', {'quality': 75, 'method': 6}),
+    ('jpg', 'JPEG', {'quality': 80, 'optimize': True, 'progressive': True}),
+]
+ALPHA_FALLBACK = ('png', 'PNG', {'optimize': True})
+
+_DEVICE_SIZES_RE = re.compile(r'deviceSizes\s*:\s*\[([^\]]*)\]')
+
+
+def device_sizes(config=NEXT_CONFIG):
+    """next.config.js의 images.deviceSizes (못 읽으면 Next.js 기본값)"""
+    try:
+        with open(config, 'r', encoding='utf-8') as f:
+            match = _DEVICE_SIZES_RE.search(f.read())
+    except FileNotFoundError:
+        match = None
+    if not match:
+        return list(DEFAULT_DEVICE_SIZES)
+    return sorted(int(value) for value in re.findall(r'\d+', match.group(1)))
+
+
+def variant_widths(width, sizes):
+    """원본보다 작은 구간 + 원본 너비 (가장 큰 구간보다 크면 그 구간까지만)"""
+    widths = [size for size in sizes if size < width]
+    if width <= sizes[-1]:
+        widths.append(width)
+    return widths
+
+
+def settings_digest(sizes):
+    """변형 결과를 바꾸는 설정 - 바뀌면 모든 원본을 다시 처리"""
+    from PIL import __version__ as pillow_version
+
+    text = json.dumps([sizes, FORMATS, ALPHA_FALLBACK, pillow_version], sort_keys=True)
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def iter_sources(directory=IMAGE_DIR, variant_dir=VARIANT_DIR):
+    """원본 이미지 경로 (변형 출력 디렉터리와 숨김 파일 제외, 경로 순)"""
+    skip = os.path.normpath(variant_dir)
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = sorted(d for d in dirs
+                         if not d.startswith('.') and os.path.normpath(os.path.join(root, d)) != skip)
+        for name in sorted(files):
+            if not name.startswith('.') and os.path.splitext(name)[1].lower() in SOURCE_EXTENSIONS:
+                yield os.path.join(root, name)
+
+
+def public_url(path):
+    """public/ 아래 파일 경로 → 사이트 URL (공백/한글은 srcset에서 깨지지 않게 인코딩)"""
+    return '/' + quote(os.path.relpath(path, PUBLIC_DIR).replace(os.sep, '/'))
+
+
+def render_variants(unit):
+    """(원본 경로, 다이제스트, 출력 디렉터리, 너비 구간) → 매니페스트 항목 (작업 프로세스에서 실행)"""
+    from PIL import Image, ImageOps
+
+    source, source_digest, out_dir, sizes = unit
+    with Image.open(source) as image:
+        image = ImageOps.exif_transpose(image)
+        has_alpha = image.mode in ('RGBA', 'LA', 'PA') or (image.mode == 'P' and 'transparency' in image.info)
+        image = image.convert('RGBA' if has_alpha else 'RGB')
+    width, height = image.size
+    formats = FORMATS[:-1] + [ALPHA_FALLBACK] if has_alpha else FORMATS
+    stem = os.path.splitext(os.path.basename(source))[0]
+
+    os.makedirs(out_dir, exist_ok=True)
+    files = []
+    variants = {extension: [] for extension, _, _ in formats}
+    for target in variant_widths(width, sizes):
+        resized = image if target == width else image.resize(
+            (target, max(1, round(height * target / width))), Image.Resampling.LANCZOS, reducing_gap=3.0)
+        for extension, pillow_format, options in formats:
+            path = os.path.join(out_dir, f'{stem}.{source_digest[:8]}-{target}.{extension}')
+            resized.save(path, pillow_format, **options)
+            files.append(path)
+            variants[extension].append([target, os.path.getsize(path)])
+    return {
+        'width': width,
+        'height': height,
+        'variants': variants,
+        'files': files,
+    }
+
+
+def srcset(entry, out_dir_url, stem, source_digest, extension):
+    return ', '.join(f'{out_dir_url}/{quote(stem)}.{source_digest[:8]}-{width}.{extension} {width}w'
+                     for width, _ in entry['variants'][extension])
+
+
+def build_images(directory=IMAGE_DIR, variant_dir=VARIANT_DIR, cache_path=IMAGE_CACHE, jobs=1, full=False):
+    """바뀐 원본만 변형을 만들고 → ([(원본 URL, 매니페스트 항목)], 다시 만든 원본 수)"""
+    sizes = device_sizes()
+    cache = DigestCache(cache_path, settings_digest(sizes), (directory, variant_dir))
+    entries = {}
+    units = []
+    keys = []
+    for source in iter_sources(directory, variant_dir):
+        key = os.path.relpath(source, directory).replace(os.sep, '/')
+        source_digest = file_digest(source)
+        if not full and cache.fresh(key, source_digest):
+            entries[key] = cache.entries[key]
+            continue
+        out_dir = os.path.join(variant_dir, os.path.dirname(key))
+        units.append((source, source_digest, out_dir, sizes))
+        keys.append(key)
+        entries[key] = {'digest': source_digest}
+
+    for key, entry in zip(keys, map_units(render_variants, units, jobs)):
+        entries[key]['entry'] = entry
+
+    # 원본이 바뀌거나 사라져 더 이상 쓰지 않는 변형은 삭제됨
+    cache.replace(entries)
+    return [manifest_entry(key, entries[key], directory, variant_dir) for key in sorted(entries)], len(units)
+
+
+def manifest_entry(key, cached, directory=IMAGE_DIR, variant_dir=VARIANT_DIR):
+    """캐시 항목 → (원본 URL, {width, height, src, srcSet: {확장자: srcset}})"""
+    entry = cached['entry']
+    out_dir_url = public_url(os.path.join(variant_dir, os.path.dirname(key))).rstrip('/')
+    stem = os.path.splitext(os.path.basename(key))[0]
+    source_digest = cached['digest']
+    extensions = list(entry['variants'])
+    fallback = extensions[-1]
+    largest = entry['variants'][fallback][-1][0]
+    return public_url(os.path.join(directory, key)), {
+        'width': entry['width'],
+        'height': entry['height'],
+        'src': f'{out_dir_url}/{quote(stem)}.{source_digest[:8]}-{largest}.{fallback}',
+        'srcSet': {extension: srcset(entry, out_dir_url, stem, source_digest, extension)
+                   for extension in extensions},
+    }
+
+
+def iter_images_module(items):
+    """(원본 URL, 항목) 들 → 모듈 텍스트"""
+    from peit_content.tsliteral import iter_module
+
+    yield (
+        '// 자동 생성 파일 - 직접 수정하지 마세요 (peit-content images 로 생성)\n'
+        '// 원본 URL → 너비 구간별 변형 srcset (<picture>의 <source type="image/avif" srcSet=...> 등)\n'
+        '\n'
+        'export interface ImageVariants {\n'
+        '  width: number;\n'
+        '  height: number;\n'
+        '  src: string;\n'
+        '  srcSet: Record<string, string>;\n'
+        '}\n'
+        '\n'
+    )
+    yield from iter_module('images', items, 'Readonly<Record<string, ImageVariants>>')
@@ -0,0 +1,295 @@
+# -*- coding: utf-8 -*-
+"""
+data/political_details.txt 스트리밍 읽기
+- 소스를 한 줄씩 읽다가 다음 `CODE → Name` 머리줄이 나오면 직전 유형 블록을 바로 내보냄
+- 메모리에는 항상 블록 하나만 유지
+- 블록 텍스트에서 각 필드를 추출 (이전 Node 생성기 generate_political_details.js 규칙 이식)
+  소제목 줄에 본문이 이어 붙은 경우(`💔 최악의 갈등 상대: CTUE (...)왜 갈등하는가? ...`)가 많아서
+  본문 필드는 소제목 줄을 건너뛰지 않고 소제목부터 잡음 (소제목은 정리 단계의 섹션 분할기가 잘라냄)
+- 필요하면 줄마다 원본 UTF-8 바이트 위치를 기록해 필드 구간을 바이트 오프셋으로 변환
+"""
+
+import re
+from bisect import bisect_right
+
+HEADER_RE = re.compile(r'^([A-Z]{4})\s*[→>\-]\s*(.+)$')
+
+_HASHTAGS_RE = re.compile(r'#[^\n]+')
+_SUMMARY_RE = re.compile(r'한 줄 요약\s*:\s*([^\n]+)')
+_SPECTRUM_RE = re.compile(r'종합 정치 스펙트럼\s*:\s*([^\n]+)')
+# '…란?' 줄 - 줄 시작에서만 시도 (`.+?`를 모든 위치에서 다시 시작하면 긴 줄에서 제곱 시간)
+_SPECTRUM_DETAIL_RE = re.compile(
+    r"^[^\n]+?란\?\s*\n([\s\S]*?)(\n\s*[\-•\t]|\n\s*당신은 이런 사람|\n\s*강점과 약점|\Z)", re.M)
+_DETAIL_RE = re.compile(r'당신은 이런 사람입니다[^(]*\([^)]*\)?[:：]?\s*([\s\S]*?)(\n\s*강점과 약점|\Z)')
+_STRENGTHS_RE = re.compile(r'강점\s*\(Strengths\)[\s\S]*?\n([\s\S]*?)\n\s*•?\s*⚠️\s*약점|약점 \(Weaknesses\)')
+_WEAKNESSES_RE = re.compile(r'약점\s*\(Weaknesses\)[\s\S]*?\n([\s\S]*?)(\n\S|\Z)')
+_LIST_NUMBER_RE = re.compile(r'^\s*\d+\s*')
+# 소제목 줄의 내용, 소제목만 있는 줄이면 다음 줄
+_GROWTH_TASK_RE = re.compile(r'핵심 성장 과제[^\S\n]*[:：]?[^\S\n]*(?:\n[\s•◦▪-]*)?([^\n]+)')
+_GROWTH_TASK_BULLET_RE = re.compile(r'^[-•\s]+')
+_BOOK_RE = re.compile(r'추천 도서[:：]?『?([^』\n]+)』?\s*\(([^)]+)\)')
+_RECOMMENDED_CONTENT_RE = re.compile(r'추천 영상[^\n:：]*[:：]?[^\S\n]*(?:\n[\s•◦▪-]*)?([^\n]+)')
+
+# (필드, 패턴) - 첫 번째 그룹(소제목 포함)을 정규화해서 사용
+_TEXT_FIELDS = [
+    ('speech_style', re.compile(
+        r'(당신의 화법[\s\S]*?)(\n\s*💔|\n\s*돈과 일|\n\s*역사와 현실|\n\s*개인적 성장|\Z)')),
+    ('stress_moment', re.compile(
+        r'(스트레스[^\n]*:[\s\S]*?)(\n\s*•|\n\s*돈과 일|\n\s*역사와 현실|\n\s*개인적 성장|\Z)')),
+    ('solution', re.compile(
+        r'(솔루션[\s\S]*?)(\n\s*•|\n\s*돈과 일|\n\s*역사와 현실|\n\s*개인적 성장|\Z)')),
+    ('love_value', re.compile(
+        r'(연애 가치관[\s\S]*?)(\n\s*💚|\n\s*최고의 연애 파트너|\n\s*💔|\n\s*최악의 갈등 상대|\Z)')),
+    ('best_partner', re.compile(
+        r'(최고의 연애 파트너[\s\S]*?)(\n\s*💔|\n\s*최악의 갈등 상대|\n\s*소통의 벽|\Z)')),
+    ('worst_partner', re.compile(
+        r'(최악의 갈등 상대[\s\S]*?)(\n\s*소통의 벽|\n\s*돈과 일|\Z)')),
+    ('communication_barrier', re.compile(
+        r"(?<!')(소통의 벽[\s\S]*?)(\n\s*돈과 일|\n\s*역사와 현실|\n\s*개인적 성장|\Z)")),
+    ('career_value', re.compile(
+        r'(직업적 가치관[\s\S]*?)(\n\s*•|\n\s*역사와 현실|\n\s*개인적 성장|\Z)')),
+    ('money_value', re.compile(
+        r'((?:재무 스타일|잠재적 재무 스타일|돈과 일에 대한 태도)[\s\S]*?)(\n\s*역사와 현실|\n\s*유사 유형 인물|\n\s*개인적 성장|\Z)')),
+]
+
+_TAIL_FIELDS = [
+    ('historical_avatar', re.compile(
+        r'(역사적 아바타[\s\S]*?)(\n\s*현실 속 아바타|\n\s*개인적 성장|\Z)')),
+    ('real_avatar', re.compile(
+        r'(현실 속 아바타[\s\S]*?)(\n\s*개인적 성장|\n\s*성장 방향성|\Z)')),
+    ('growth_direction', re.compile(
+        r'(성장 방향성[\s\S]*?)(\n\s*핵심 성장 과제|\n\s*\*\*|\Z)')),
+    ('final_goal', re.compile(r'(성장의 최종 목표[\s\S]*)')),
+]
+
+# 블록의 대제목 줄 - 한 번만 매칭하는 패턴은 대제목 사이 구간 안에서만 찾아서
+# 게으른 `[\s\S]*?` 스캔이 종료 표시가 없어도 다음 대제목을 넘지 않음 (구간 끝이 `\Z`)
+_GROUP_RE = re.compile(
+    r"^[^\S\n]*(?:강점과 약점|'당신의 화법'|'소통의 벽|돈과 일에 대한 태도|역사와 현실 속|유사 유형 인물|개인적 성장과 자기계발)",
+    re.M)
+
+# 한 번만 매칭하는 섹션 (필드, 패턴, 본문 그룹) - 섹션 색인의 구간 기준
+_SECTION_PATTERNS = [
+    ('keywords', _HASHTAGS_RE, 0),
+    ('summary', _SUMMARY_RE, 1),
+    ('political_spectrum', _SPECTRUM_RE, 1),
+    ('political_spectrum_detail', _SPECTRUM_DETAIL_RE, 1),
+    ('detailed_description', _DETAIL_RE, 1),
+    ('strengths', _STRENGTHS_RE, 1),
+    ('weaknesses', _WEAKNESSES_RE, 1),
+] + [(name, pattern, 1) for name, pattern in _TEXT_FIELDS] + [
+    ('growth_task', _GROWTH_TASK_RE, 1),
+    ('recommended_content', _RECOMMENDED_CONTENT_RE, 1),
+] + [(name, pattern, 1) for name, pattern in _TAIL_FIELDS]
+
+
+def _group_windows(text):
+    """대제목 줄 시작 위치로 나눈 (시작, 끝) 구간들 - 대제목 앞 줄바꿈은 어느 구간에도 넣지 않음
+
+    그래서 `\n\s*강점과 약점` 같은 종료 표시 대신 구간 끝의 `\Z`가 맞아도 잡히는 본문은 같음
+    """
+    windows = []
+    start = 0
+    for match in _GROUP_RE.finditer(text):
+        if match.start():
+            windows.append((start, match.start() - 1))
+            start = match.start()
+    windows.append((start, len(text)))
+    return windows
+
+
+def _search_windows(pattern, text, windows):
+    """구간마다 차례로 찾은 첫 매치 (없으면 None)"""
+    for start, end in windows:
+        match = pattern.search(text, start, end)
+        if match:
+            return match
+    return None
+
+
+class SourceBlock:
+    """소스의 유형 블록 하나 - 머리줄의 코드/이름과 본문 줄들
+
+    offsets: 본문 줄마다 원본 파일에서의 바이트 위치 (iter_blocks(..., offsets=True)일 때만)
+    start/end: 머리줄 시작 ~ 마지막 본문 줄 끝의 바이트 위치
+    """
+
+    __slots__ = ('code', 'name', 'lines', 'line_no', 'offsets', 'start', 'end')
+
+    def __init__(self, code, name, line_no, start=None):
+        self.code = code
+        self.name = name
+        self.lines = []
+        self.line_no = line_no
+        self.offsets = None if start is None else []
+        self.start = start
+        self.end = start
+
+    @property
+    def text(self):
+        return '\n'.join(self.lines)
+
+    def line_starts(self):
+        """text 안에서 각 본문 줄이 시작하는 문자 위치"""
+        starts = []
+        char = 0
+        for line in self.lines:
+            starts.append(char)
+            char += len(line) + 1
+        return starts
+
+    def byte_offset(self, pos, starts=None):
+        """text 안의 문자 위치 → 원본 파일 바이트 위치"""
+        if not self.lines:
+            return self.end
+        starts = starts or self.line_starts()
+        i = bisect_right(starts, pos) - 1
+        return self.offsets[i] + len(self.lines[i][:pos - starts[i]].encode('utf-8'))
+
+    def section_spans(self):
+        """필드 → 원본 파일의 (시작, 끝) 바이트 구간 (머리줄부터 블록 전체는 'block')
+
+        같은 코드의 머리줄이 본문 중간에 반복되면 그 줄도 구간 안에 포함됨 (원본 바이트 그대로)
+        """
+        text = self.text
+        starts = self.line_starts()
+        spans = {'block': (self.start, self.end)}
+        windows = _group_windows(text)
+        for name, pattern, group in _SECTION_PATTERNS:
+            match = _search_windows(pattern, text, windows)
+            # 소제목부터 추출 본문 끝까지
+            if match and match.group(group) is not None:
+                spans[name] = (self.byte_offset(match.start(), starts),
+                               self.byte_offset(match.end(group), starts))
+        books = list(_BOOK_RE.finditer(text))
+        if books:
+            spans['recommended_books'] = (self.byte_offset(books[0].start(), starts),
+                                          self.byte_offset(books[-1].end(), starts))
+        return spans
+
+
+def normalize(s):
+    return (s or '').replace('\r', '').replace('\u2028', '').replace('\u2029', '').strip()
+
+
+def iter_blocks(lines, offsets=False):
+    """줄 단위 입력에서 유형 블록을 하나씩 생성
+
+    같은 코드의 머리줄이 연달아 다시 나오면 (예: CTUS 블록 중간의 머리줄) 이어지는 본문으로 취급.
+    offsets가 참이면 lines는 바이너리 모드로 읽은 줄이고, 블록에 줄별 바이트 위치를 기록
+    """
+    current = None
+    pos = 0
+    for line_no, line in enumerate(lines, 1):
+        if offsets:
+            start = pos
+            pos += len(line)
+            line = line.decode('utf-8')
+        line = line.rstrip('\n')
+        match = HEADER_RE.match(line)
+        if match:
+            if current is not None and current.code == match.group(1):
+                continue
+            if current is not None:
+                yield current
+            current = SourceBlock(match.group(1), normalize(match.group(2)), line_no,
+                                  start if offsets else None)
+            if offsets:
+                current.end = pos
+            continue
+        if current is not None:
+            current.lines.append(line)
+            if offsets:
+                current.offsets.append(start)
+                current.end = pos
+    if current is not None:
+        yield current
+
+
+def read_blocks(path, offsets=False):
+    """소스 파일을 열어 유형 블록을 스트리밍으로 생성 (offsets: 줄별 바이트 위치 기록)"""
+    if offsets:
+        with open(path, 'rb') as f:
+            yield from iter_blocks(f, offsets=True)
+        return
+    with open(path, 'r', encoding='utf-8') as f:
+        yield from iter_blocks(f)
+
+
+def _list_items(body):
+    items = (_LIST_NUMBER_RE.sub('', line, count=1).strip() for line in (body or '').split('\n'))
+    return [item for item in items if item]
+
+
+def extract_details(block):
+    """블록 본문에서 정치 유형 상세 필드 추출"""
+    data = {'name': block.name, 'category': 'political'}
+    text = block.text
+    windows = _group_windows(text)
+
+    # hashtags line: contains many #tokens
+    match = _search_windows(_HASHTAGS_RE, text, windows)
+    if match:
+        tags = [w[1:] for w in match.group().split() if w.startswith('#')]
+        if tags:
+            data['keywords'] = tags
+
+    match = _search_windows(_SUMMARY_RE, text, windows)
+    if match:
+        data['summary'] = normalize(match.group(1))
+
+    match = _search_windows(_SPECTRUM_RE, text, windows)
+    if match:
+        data['political_spectrum'] = normalize(match.group(1))
+    match = _search_windows(_SPECTRUM_DETAIL_RE, text, windows)
+    if match:
+        data['political_spectrum_detail'] = normalize(match.group(1))
+
+    match = _search_windows(_DETAIL_RE, text, windows)
+    if match:
+        data['detailed_description'] = normalize(match.group(1))
+
+    match = _search_windows(_STRENGTHS_RE, text, windows)
+    if match:
+        items = _list_items(match.group(1))
+        if items:
+            data['strengths'] = items
+
+    match = _search_windows(_WEAKNESSES_RE, text, windows)
+    if match:
+        items = _list_items(match.group(1))
+        if items:
+            data['weaknesses'] = items
+
+    for name, pattern in _TEXT_FIELDS:
+        match = _search_windows(pattern, text, windows)
+        if match:
+            data[name] = normalize(match.group(1))
+
+    match = _search_windows(_GROWTH_TASK_RE, text, windows)
+    if match:
+        data['growth_task'] = normalize(_GROWTH_TASK_BULLET_RE.sub('', match.group(1), count=1))
+
+    books = [
+        {'title': normalize(m.group(1)), 'author': normalize(m.group(2))}
+        for m in _BOOK_RE.finditer(text)
+    ]
+    if books:
+        data['recommended_books'] = books
+
+    match = _search_windows(_RECOMMENDED_CONTENT_RE, text, windows)
+    if match:
+        data['recommended_content'] = normalize(match.group(1))
+
+    for name, pattern in _TAIL_FIELDS:
+        match = _search_windows(pattern, text, windows)
+        if match:
+            data[name] = normalize(match.group(1))
+
+    return data
+
+
+def ingest(path):
+    """소스 파일에서 (유형 코드, 상세 필드) 를 블록 단위로 생성"""
+    for block in read_blocks(path):
+        yield block.code, extract_details(block)
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+증분 처리용 다이제스트 기록 (.peit-cache/)
+- Manifest: 정리 단계(스크립트)별로 마지막 출력의 유형 블록/필드 다이제스트를 기록 (political.manifest)
+  다음 실행 때 다이제스트가 같은 블록/필드는 이미 정리된 것으로 보고 건너뜀,
+  정리 규칙(스크립트/스키마 소스)이 바뀌면 해당 단계의 기록 전체를 무효화
+- DigestCache: 파일을 만들어 내는 단계(images, fonts, cards)의 작업 단위별 입력 다이제스트와 출력 파일
+- .peit-cache/의 JSON 캐시는 모두 load_cache/save_cache로 읽고 씀
+  (임시 파일에 쓴 뒤 교체하므로 중단된 실행이 잘린 JSON을 남기지 않고, 깨진 파일은 빈 캐시로 취급)
+"""
+
+import hashlib
+import json
+import os
+
+from peit_content.writer import write_if_changed
+
+CACHE_DIR = '.peit-cache'
+POLITICAL_MANIFEST = os.path.join(CACHE_DIR, 'political.manifest')
+
+
+def digest(text):
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def rules_digest(*paths):
+    """정리 규칙을 정의하는 소스 파일들의 다이제스트"""
+    h = hashlib.blake2b(digest_size=16)
+    for path in paths:
+        with open(path, 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def bytes_digest(data):
+    """바이트열(mmap 포함)의 다이제스트 - 같은 내용이면 file_digest와 같은 값"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def file_digest(path):
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def load_cache(path):
+    """캐시 JSON 객체 (없거나 깨졌으면 None → 호출하는 쪽은 빈 캐시로 시작)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def save_cache(path, data, **options):
+    """캐시 JSON을 원자적으로 기록 (options는 json.dumps 인자) → 기록했으면 True"""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    return write_if_changed(path, json.dumps(data, ensure_ascii=False, **options))
+
+
+class Manifest:
+    """단계 하나에 대한 블록/필드 다이제스트 기록"""
+
+    def __init__(self, path, stage, rules):
+        self.path = path
+        self.stage = stage
+        self.rules = rules
+        self.blocks = {}
+        self.data = load_cache(path) or {}
+        entry = self.data.get(stage)
+        if entry and entry.get('rules') == rules:
+            self.blocks = entry.get('blocks', {})
+
+    def block_unchanged(self, doc, code):
+        """유형 블록 전체가 지난 출력과 같은지"""
+        block = doc.blocks[code]
+        recorded = self.blocks.get(code)
+        return bool(recorded) and recorded['digest'] == digest(doc.source[block.start:block.end])
+
+    def field_unchanged(self, doc, code, name):
+        """필드 값이 지난 출력과 같은지"""
+        field = doc.blocks[code].fields.get(name)
+        recorded = self.blocks.get(code)
+        if field is None or not recorded:
+            return False
+        return recorded['fields'].get(name) == digest(doc.source[field.start:field.end])
+
+    def record(self, doc):
+        """출력 문서의 다이제스트를 기록"""
+        source = doc.source
+        self.blocks = {
+            code: {
+                'digest': digest(source[block.start:block.end]),
+                'fields': {
+                    name: digest(source[field.start:field.end])
+                    for name, field in block.fields.items()
+                },
+            }
+            for code, block in doc.blocks.items()
+        }
+
+    def save(self):
+        data = dict(self.data)
+        data[self.stage] = {'rules': self.rules, 'blocks': self.blocks}
+        if data == self.data:
+            return
+        save_cache(self.path, data, indent=1, sort_keys=True)
+        self.data = data
+
+
+class DigestCache:
+    """작업 단위 키 → {'digest': 입력 다이제스트, 'entry': {'files': [출력 경로], ...}}
+
+    settings(모든 출력을 바꾸는 설정 다이제스트나 캐시 형식 버전)나 directories(입력/출력 디렉터리)가
+    지난 실행과 다르면 빈 캐시로 시작
+    """
+
+    def __init__(self, path, settings, directories):
+        self.path = path
+        self.settings = settings
+        self.directories = list(directories)
+        self.entries = {}
+        data = load_cache(path) if path else None
+        if data and data.get('settings') == settings and data.get('directories') == self.directories:
+            self.entries = data.get('entries', {})
+
+    def fresh(self, key, input_digest):
+        """입력 다이제스트가 지난 실행과 같고 출력 파일이 모두 남아 있는지"""
+        cached = self.entries.get(key)
+        return (cached is not None and cached['digest'] == input_digest
+                and all(os.path.exists(path) for path in cached['entry']['files']))
+
+    def replace(self, entries):
+        """이번 실행의 항목으로 교체 - 지난 실행의 출력 중 더 이상 쓰지 않는 파일은 삭제하고 저장"""
+        current = {path for cached in entries.values() for path in cached['entry']['files']}
+        for cached in self.entries.values():
+            for path in cached['entry']['files']:
+                if path not in current and os.path.exists(path):
+                    os.remove(path)
+        save_cache(self.path, {'settings': self.settings, 'directories': self.directories, 'entries': entries},
+                   separators=(',', ':'))
+        self.entries = entries
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+본문 필드의 빌드 시 HTML 렌더링
+- 예전 컴포넌트들(ResultDetailSections, ResultPageClient 등)의 renderMarkdownText와 같은 규칙, 같은 클래스 이름
+  (이모지 제거, **굵게**, '인용', ### 소제목, 줄 단위 <p>)
+- 원문에 허용된 태그(쿠팡 링크 <a>, <br>)만 통과시키고 나머지 꺾쇠는 이스케이프
+- 결과는 유형 항목의 html 필드에 원문과 함께 저장되어, 클라이언트는 HTML만 주입
+  (클라이언트 쪽 변환기는 없으므로 컴포넌트가 읽는 필드가 빠지면 check가 실패)
+"""
+
+import re
+
+# 컴포넌트(paths.HTML_COMPONENT_PATHS)가 렌더링하는 필드
+RENDERED_FIELDS = [
+    'description',
+    'summary',
+    'political_spectrum_detail',
+    'detailed_description',
+    'speech_style',
+    'stress_moment',
+    'solution',
+    'love_value',
+    'best_partner',
+    'worst_partner',
+    'communication_barrier',
+    'career_value',
+    'financial_style',
+    'historical_avatar',
+    'real_avatar',
+    'growth_direction',
+    'final_goal',
+    'recommended_content',
+    'spectrum_analysis',
+    'detailed_analysis',
+    'coaching',
+    'synergy_partner',
+    'risk_partner',
+    'success_formula',
+    'failure_formula',
+    'benchmarking',
+    'career_navigation',
+]
+
+_EMOJI_RE = re.compile('[\U0001F300-\U0001FAFF\u2600-\u27BF\uFE0F]')
+# JS의 `.` 은 줄 구분 문자를 모두 제외
+_BOLD_RE = re.compile('\\*\\*([^\n\r\u2028\u2029]*?)\\*\\*')
+_QUOTE_RE = re.compile("'([^']+)'")
+# String.prototype.trim()이 지우는 공백 문자
+_JS_WHITESPACE = '\t\n\v\f\r \u00a0\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000\ufeff'
+
+_FIELD_HTML_RE = re.compile(r"fieldHtml\([^,()]+,\s*'(\w+)'\s*\)")
+
+_TAG_RE = re.compile(r'<(/?)([A-Za-z][\w-]*)([^<>]*)>')
+_ATTR_RE = re.compile(r'([a-z-]+)="([^"<>]*)"')
+_LINK_ATTRS = ('href', 'target', 'rel', 'class')
+_SAFE_HREF_RE = re.compile(r'https?://')
+
+
+def _escape(text):
+    return text.replace('<', '&lt;').replace('>', '&gt;')
+
+
+def _allowed_tag(match):
+    closing, tag, attrs = match.groups()
+    tag = tag.lower()
+    if tag == 'br':
+        return not closing and attrs.strip() in ('', '/')
+    if tag != 'a':
+        return False
+    if closing:
+        return not attrs.strip()
+    parsed = dict(_ATTR_RE.findall(attrs))
+    if _ATTR_RE.sub('', attrs).strip() or set(parsed) - set(_LINK_ATTRS):
+        return False
+    return bool(_SAFE_HREF_RE.match(parsed.get('href', '')))
+
+
+def sanitize(text):
+    """허용된 링크/줄바꿈 태그만 남기고 나머지 꺾쇠는 이스케이프"""
+    out = []
+    pos = 0
+    open_links = 0
+    for match in _TAG_RE.finditer(text):
+        if not _allowed_tag(match):
+            continue
+        # 닫는 </a>는 허용된 <a>가 열려 있을 때만 통과
+        if match.group(2).lower() == 'a':
+            if match.group(1):
+                if not open_links:
+                    continue
+                open_links -= 1
+            else:
+                open_links += 1
+        out.append(_escape(text[pos:match.start()]))
+        out.append(match.group())
+        pos = match.end()
+    out.append(_escape(text[pos:]))
+    return ''.join(out)
+
+
+def strip_emojis(text):
+    return _EMOJI_RE.sub('', text)
+
+
+def render_markdown(text):
+    """renderMarkdownText와 같은 HTML 조각"""
+    html = sanitize(strip_emojis(text or ''))
+    html = _BOLD_RE.sub(r'<strong class="font-semibold text-gray-900">\1</strong>', html)
+    html = _QUOTE_RE.sub('<span class="text-accent font-medium">\'\\1\'</span>', html)
+    parts = []
+    for line in html.split('\n'):
+        trimmed = line.strip(_JS_WHITESPACE)
+        if not trimmed:
+            continue
+        # ### 제목 처리
+        if trimmed.startswith('### '):
+            title = trimmed[4:].strip(_JS_WHITESPACE)
+            parts.append(f'<h3 class="text-xl font-bold mb-3 mt-6 text-gray-900">{title}</h3>')
+        else:
+            parts.append(f'<p class="mb-4 last:mb-0">{line}</p>')
+    return ''.join(parts)
+
+
+def render_fields(entry, fields=RENDERED_FIELDS):
+    """유형 항목에서 내용이 있는 본문 필드만 렌더링 → {필드: HTML}"""
+    return {
+        name: render_markdown(entry[name])
+        for name in fields
+        if isinstance(entry.get(name), str) and entry[name]
+    }
+
+
+def component_fields(source):
+    """컴포넌트 소스에서 fieldHtml(data, '<필드>')로 읽는 필드 이름들 (처음 나온 순서)"""
+    return list(dict.fromkeys(_FIELD_HTML_RE.findall(source)))
+
+
+def missing_html(entry, fields):
+    """원문은 있는데 미리 렌더링된 HTML이 없는 필드 이름들"""
+    html = entry.get('html') or {}
+    return [name for name in fields if entry.get(name) and name not in html]
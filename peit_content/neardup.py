@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""
+유형 간 유사 문단 색인 (문자 n-gram 싱글 + MinHash/LSH)
+- 모든 파일/유형/필드의 문단마다 MinHash 서명을 만들고, 서명을 밴드로 나눠 버킷에 넣음
+  → 같은 버킷에 들어간 후보 쌍만 비교하므로 문단 수에 대해 제곱 시간이 아님
+- 복사 후 고쳐 쓴 문단(다른 유형 코드가 남은 파트너 설명 등)을 유사도와 함께 보고
+- 서명은 .peit-cache/neardup.json에 유형 블록 다이제스트와 함께 저장해,
+  다음 실행에서는 바뀐 블록의 문단만 다시 해시
+"""
+
+import hashlib
+import os
+import re
+import struct
+from itertools import combinations
+
+from peit_content.dedupe import SKIP_FIELDS, normalize_sentence
+from peit_content.manifest import CACHE_DIR, digest, load_cache, save_cache
+
+INDEX_PATH = os.path.join(CACHE_DIR, 'neardup.json')
+
+SHINGLE_SIZE = 5
+NUM_PERM = 64
+BANDS = 16
+MIN_PARAGRAPH_LENGTH = 40
+DEFAULT_THRESHOLD = 0.6
+
+# 싱글 하나를 SHAKE-128로 NUM_PERM × 4바이트 해시해 독립 해시 함수 NUM_PERM개로 사용
+_HASHES = struct.Struct(f'<{NUM_PERM}I')
+_PARAGRAPH_RE = re.compile(r'\n\s*\n')
+_TAG_RE = re.compile(r'<[^>]*>')
+
+# 추천 도서/영상 목록은 여러 유형에 같은 항목을 일부러 싣는 큐레이션이라 제외
+SKIP = SKIP_FIELDS | {'recommended_content'}
+
+# 매개변수가 바뀌면 저장된 서명은 비교할 수 없으므로 색인 전체를 다시 만듦
+PARAMS = f'{SHINGLE_SIZE}/{NUM_PERM}/{BANDS}/{MIN_PARAGRAPH_LENGTH}/shake128'
+
+
+def iter_paragraphs(data):
+    """(필드, 문단 번호, 문단) - 문자열은 빈 줄 기준, 배열은 항목 하나가 문단"""
+    for name, value in data.items():
+        if name in SKIP:
+            continue
+        if isinstance(value, str):
+            texts = _PARAGRAPH_RE.split(value)
+        elif isinstance(value, list):
+            texts = [item for item in value if isinstance(item, str)]
+        else:
+            continue
+        for index, text in enumerate(texts):
+            yield name, index, text
+
+
+def shingles(text):
+    """태그를 뺀 정규화 문단의 문자 n-gram 집합 (짧은 문단은 빈 집합)"""
+    text = normalize_sentence(_TAG_RE.sub(' ', text))
+    if len(text) < MIN_PARAGRAPH_LENGTH:
+        return set()
+    return {text[i:i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1)}
+
+
+def minhash(grams):
+    """싱글 집합 → 해시 함수별 최솟값 NUM_PERM개 서명"""
+    rows = [_HASHES.unpack(hashlib.shake_128(gram.encode('utf-8')).digest(_HASHES.size)) for gram in grams]
+    return list(map(min, zip(*rows)))
+
+
+def similarity(sig_a, sig_b):
+    """서명이 같은 자리 비율 = Jaccard 유사도 추정값"""
+    return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / NUM_PERM
+
+
+class NearDupIndex:
+    """(파일, 유형 코드) → 블록 다이제스트와 문단별 서명"""
+
+    def __init__(self, path=INDEX_PATH):
+        self.path = path
+        self.blocks = {}
+        self.loaded = {}
+        self.hashed = 0
+        data = load_cache(path) if path else None
+        if data and data.get('params') == PARAMS:
+            self.loaded = data.get('blocks', {})
+
+    def update(self, doc, label):
+        """문서의 블록 중 다이제스트가 바뀐 것만 다시 해시 → 다시 해시한 유형 코드들"""
+        rehashed = []
+        for code, block in doc.blocks.items():
+            key = f'{label}:{code}'
+            block_digest = digest(doc.source[block.start:block.end])
+            cached = self.loaded.get(key)
+            if cached is None or cached['digest'] != block_digest:
+                paragraphs = []
+                for name, index, text in iter_paragraphs(doc.data(code)):
+                    hashes = shingles(text)
+                    if hashes:
+                        paragraphs.append([name, index, minhash(hashes)])
+                        self.hashed += 1
+                cached = {'digest': block_digest, 'paragraphs': paragraphs}
+                rehashed.append(code)
+            self.blocks[key] = cached
+        return rehashed
+
+    def pairs(self, threshold=DEFAULT_THRESHOLD):
+        """LSH 후보 중 추정 유사도가 threshold 이상인, 유형 코드가 다른 문단 쌍
+
+        → [(유사도, (파일, 유형 코드, 필드, 문단 번호), (...))] 유사도 내림차순
+        """
+        rows = NUM_PERM // BANDS
+        entries = []
+        buckets = {}
+        for key, block in self.blocks.items():
+            label, code = key.rsplit(':', 1)
+            for name, index, sig in block['paragraphs']:
+                entry = len(entries)
+                entries.append(((label, code, name, index), sig))
+                for band in range(BANDS):
+                    buckets.setdefault((band, tuple(sig[band * rows:(band + 1) * rows])), []).append(entry)
+
+        candidates = set()
+        for members in buckets.values():
+            if len(members) > 1:
+                candidates.update(combinations(members, 2))
+
+        result = []
+        for i, j in candidates:
+            (where_a, sig_a), (where_b, sig_b) = entries[i], entries[j]
+            # 같은 유형 코드끼리는 (파일이 달라도) 덮어쓰기/병합 관계라 제외
+            if where_a[1] == where_b[1]:
+                continue
+            score = similarity(sig_a, sig_b)
+            if score >= threshold:
+                result.append((score, where_a, where_b))
+        result.sort(key=lambda item: (-item[0], item[1], item[2]))
+        return result
+
+    def save(self):
+        """이번 실행에서 본 블록만 저장 (사라진 유형은 정리)"""
+        if not self.path or self.blocks == self.loaded:
+            return
+        save_cache(self.path, {'params': PARAMS, 'blocks': self.blocks}, separators=(',', ':'))
+        self.loaded = self.blocks
@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+"""
+여러 명령/스크립트가 함께 쓰는 명령줄 옵션 정의
+- import가 없는 가벼운 모듈이라 CLI가 명령을 정의할 때(--help 포함) 바로 불러도 됨
+"""
+
+
+def add_profile_arguments(parser):
+    """공통 --profile / --cprofile 옵션 (peit_content.profiling.Profiler.from_args가 읽음)"""
+    parser.add_argument('--profile', nargs='?', const='', default=None, metavar='PATH',
+                        help='단계/유형/필드별 프로파일 기록 (기본 .peit-cache/profile-<단계>.json)')
+    parser.add_argument('--cprofile', action='store_true',
+                        help='--profile에 cProfile 함수/정규식별 시간 포함 (--jobs 1일 때만 정확)')
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+"""
+작업 단위 병렬 실행
+- 유형 블록 단위 작업을 ProcessPoolExecutor로 나눠 실행
+- 결과는 입력 순서 그대로 돌려주므로 재조립 결과가 항상 같음
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+
+def resolve_jobs(jobs):
+    """--jobs 값 해석 (0 이하는 CPU 개수)"""
+    if jobs is None:
+        return 1
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def map_units(func, units, jobs=1):
+    """func를 각 작업 단위에 적용 (jobs > 1이면 프로세스 풀 사용)"""
+    units = list(units)
+    jobs = min(resolve_jobs(jobs), len(units))
+    if jobs <= 1:
+        return [func(unit) for unit in units]
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(func, units))
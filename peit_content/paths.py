@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""
+콘텐츠 파일 기본 경로 (저장소 루트 기준)
+- 가벼운 모듈이라 CLI가 --help를 띄울 때도 바로 import 가능
+"""
+
+SOURCE_PATH = 'data/political_details.txt'
+DETAILS_PATH = 'lib/political_details.ts'
+RESULTS_BASE_PATH = 'lib/results_base.ts'
+RESULTS_BASE_NAME = 'baseResults'
+RESULTS_OUTPUT_PATH = 'lib/generated/results.ts'
+RESULT_DETAILS_DIR = 'lib/generated/details'
+RECOMMENDED_OUTPUT_PATH = 'lib/generated/recommended_content.ts'
+DETAIL_SECTIONS_PATH = 'components/ResultDetailSections.tsx'
+RESULT_CARD_PATH = 'components/ResultCard.tsx'
+SIMPLE_RESULT_CARD_PATH = 'components/SimpleResultCard.tsx'
+# 미리 렌더링된 html 맵을 fieldHtml로 읽는 컴포넌트
+HTML_COMPONENT_PATHS = [
+    DETAIL_SECTIONS_PATH,
+    'components/ResultPageClient.tsx',
+    'components/DetailModal.tsx',
+    RESULT_CARD_PATH,
+    SIMPLE_RESULT_CARD_PATH,
+]
+MAPPING_PATH = 'lib/mapping.ts'
+QUESTIONS_PATH = 'lib/questions.ts'
+ORDER_PATH = 'lib/order.ts'
+PERCENTILES_OUTPUT_PATH = 'lib/generated/score_percentiles.ts'
+EARLY_STOP_OUTPUT_PATH = 'lib/generated/early_stop.ts'
+IMAGES_OUTPUT_PATH = 'lib/generated/images.ts'
+CARDS_OUTPUT_PATH = 'lib/generated/cards.ts'
+FONTS_CSS_OUTPUT_PATH = 'app/generated/fonts.css'
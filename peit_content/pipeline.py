@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+political_details.txt → lib/political_details.ts 한 번에 만들기
+- 추출 → 정리(weaknesses, 섹션) → 값 보정 → 검증 → 직렬화를 메모리 안에서 블록 단위로 수행
+- 출력은 임시 파일에 이어 쓰고, 검증을 통과했고 내용이 바뀐 경우에만 마지막에 한 번 교체
+"""
+
+import os
+import re
+import time
+
+from peit_content.fixups import fix_fields
+from peit_content.ingest import ingest
+from peit_content.paths import DETAILS_PATH, SOURCE_PATH
+from peit_content.profiling import value_bytes
+from peit_content.sections import FIELDS_TO_CLEAN, clean_unit, profile_unit
+from peit_content.tsliteral import ParseError, iter_module, load_document
+from peit_content.writer import write_chunks_if_changed
+
+POLITICAL_CODES = [
+    a + b + c + d
+    for a in 'IC' for b in 'PT' for c in 'AU' for d in 'ES'
+]
+_CODE_RE = re.compile(r'^[IC][PT][AU][ES]$')
+
+REQUIRED_TEXT_FIELDS = ['name', 'summary', 'political_spectrum']
+LIST_FIELDS = ['keywords', 'strengths', 'weaknesses']
+
+
+class ValidationError(ValueError):
+    """생성된 데이터가 검증을 통과하지 못함"""
+
+    def __init__(self, errors):
+        super().__init__('\n'.join(errors))
+        self.errors = errors
+
+
+def process_block(code, data, clean=True, profiler=None):
+    """블록 하나를 정리하고 값을 보정"""
+    if clean:
+        fields = {name: data[name] for name in ['weaknesses'] + FIELDS_TO_CLEAN if name in data}
+        if profiler is None:
+            _, cleaned = clean_unit(('political', code, fields))
+        else:
+            _, cleaned, stats = profile_unit(('political', code, fields))
+            profiler.add_unit_stats('clean', code, stats)
+        data.update(cleaned)
+    if profiler is None:
+        data.update(fix_fields(data))
+    else:
+        with profiler.phase('fixups', code, bytes_in=value_bytes(data)) as record:
+            fixed = fix_fields(data)
+            record['bytes_out'] = value_bytes(fixed)
+        data.update(fixed)
+    return data
+
+
+def _is_empty(value):
+    if isinstance(value, str):
+        return not value.strip()
+    return value is None or value in ([], {})
+
+
+def load_existing(path):
+    """기존 출력 파일의 유형 코드 → 필드 (없거나 읽을 수 없으면 빈 dict)"""
+    if not os.path.exists(path):
+        return {}
+    try:
+        document = load_document(path, 'politicalDetails')
+    except (OSError, ParseError):
+        return {}
+    return {code: document.data(code) for code in document}
+
+
+def validate_block(code, data, existing=None):
+    """블록 하나 검증 → (errors, [(빈 필드, 유형 코드)])
+
+    existing은 기존 출력의 같은 유형 필드 - 거기서 값이 있던 필드가 비게 되면 추출 오류로 보고 오류 처리
+    """
+    errors = []
+    warnings = []
+    if not _CODE_RE.match(code):
+        errors.append(f'{code}: 알 수 없는 유형 코드')
+    for name in REQUIRED_TEXT_FIELDS:
+        value = data.get(name)
+        if not isinstance(value, str) or not value.strip():
+            errors.append(f'{code}.{name}: 필수 필드가 비어 있음')
+    for name in LIST_FIELDS:
+        value = data.get(name)
+        if value is None:
+            warnings.append((name, code))
+        elif not isinstance(value, list) or not all(isinstance(v, str) and v.strip() for v in value):
+            errors.append(f'{code}.{name}: 문자열 배열이 아님')
+    for book in data.get('recommended_books', []):
+        if not isinstance(book, dict) or not book.get('title') or not book.get('author'):
+            errors.append(f'{code}.recommended_books: 제목/저자 누락')
+    for name, value in data.items():
+        if isinstance(value, str) and not value.strip() and name not in REQUIRED_TEXT_FIELDS:
+            warnings.append((name, code))
+    for name, value in (existing or {}).items():
+        if name not in REQUIRED_TEXT_FIELDS and not _is_empty(value) and _is_empty(data.get(name)):
+            errors.append(f'{code}.{name}: 기존 출력에는 값이 있는데 비게 됨')
+    return errors, warnings
+
+
+def build(source=SOURCE_PATH, output=DETAILS_PATH, clean=True, log=print, profiler=None):
+    """소스를 읽어 출력 모듈을 한 번에 생성 → (유형 코드 목록, 기록 여부)
+
+    검증에 실패하면 ValidationError, 결과가 기존 파일과 같으면 쓰지 않음
+    """
+    existing = load_existing(output)
+    seen = []
+    errors = []
+    warnings = []
+
+    def blocks():
+        source_blocks = ingest(source)
+        if profiler is not None:
+            source_blocks = profiler.timed_iter('ingest', source_blocks)
+        for code, data in source_blocks:
+            if code in seen:
+                errors.append(f'{code}: 중복된 유형 블록')
+            seen.append(code)
+            data = process_block(code, data, clean, profiler)
+            if profiler is None:
+                block_errors, block_warnings = validate_block(code, data, existing.get(code))
+            else:
+                with profiler.phase('validate', code, bytes_in=value_bytes(data)):
+                    block_errors, block_warnings = validate_block(code, data, existing.get(code))
+            errors.extend(block_errors)
+            warnings.extend(block_warnings)
+            yield code, data
+
+        missing = [code for code in POLITICAL_CODES if code not in seen]
+        if missing:
+            errors.append('누락된 유형: ' + ', '.join(missing))
+        # 빈 필드는 소스에 해당 섹션이 없는 경우라 경고만 필드별로 모아서 출력
+        empty = {}
+        for name, code in warnings:
+            empty.setdefault(name, []).append(code)
+        for name, codes in empty.items():
+            log(f"경고: {name} 비어 있음 ({len(codes)}개): {', '.join(codes)}")
+        # 마지막 조각을 내보내기 전에 실패시켜 기존 출력 파일을 보존
+        if errors:
+            raise ValidationError(errors)
+
+    if profiler is None:
+        written = write_chunks_if_changed(output, iter_module('politicalDetails', blocks()))
+        return seen, written
+
+    # 직렬화/쓰기 시간 = 전체 구간에서 블록 단위로 기록된 시간을 뺀 나머지
+    recorded = profiler.recorded_seconds()
+    start = time.perf_counter()
+    try:
+        written = write_chunks_if_changed(output, iter_module('politicalDetails', blocks()))
+    finally:
+        nested = profiler.recorded_seconds() - recorded
+        size = os.path.getsize(output) if os.path.exists(output) else 0
+        profiler.add('emit', field=output, seconds=time.perf_counter() - start - nested, bytes_out=size)
+    return seen, written
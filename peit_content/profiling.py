@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""
+파이프라인 프로파일링 (--profile)
+- 단계 × 유형 × 필드마다 경과 시간, 입력/출력 바이트, 매칭된 마커 수를 기록
+- --cprofile이면 cProfile로 전체 실행을 감싸 정규식 호출 지점별 시간(백트래킹이 큰 패턴 추적용)도 포함
+- 결과는 JSON 파일과, 시간 순으로 정렬한 콘솔 표로 출력
+"""
+
+import cProfile
+import json
+import os
+import pstats
+import time
+from contextlib import contextmanager
+
+from peit_content.manifest import CACHE_DIR
+
+
+def value_bytes(value):
+    """필드 값의 UTF-8 바이트 수 (배열은 항목 합계)"""
+    if isinstance(value, str):
+        return len(value.encode('utf-8'))
+    if isinstance(value, (list, tuple)):
+        return sum(value_bytes(item) for item in value)
+    if isinstance(value, dict):
+        return sum(value_bytes(item) for item in value.values())
+    return 0
+
+
+def default_report_path(stage):
+    return os.path.join(CACHE_DIR, f'profile-{stage}.json')
+
+
+class Profiler:
+    """프로파일 기록 모음"""
+
+    def __init__(self, stage, use_cprofile=False):
+        self.stage = stage
+        self.records = []
+        self.started = time.perf_counter()
+        self.elapsed = None
+        self._cprofile = cProfile.Profile() if use_cprofile else None
+        if self._cprofile:
+            self._cprofile.enable()
+
+    @classmethod
+    def from_args(cls, args, stage):
+        """--profile이 없으면 None"""
+        if args.profile is None:
+            return None
+        return cls(stage, use_cprofile=args.cprofile)
+
+    def add(self, phase, code=None, field=None, seconds=0.0, bytes_in=0, bytes_out=0, markers=0):
+        self.records.append({
+            'stage': self.stage,
+            'phase': phase,
+            'type': code,
+            'field': field,
+            'seconds': seconds,
+            'bytes_in': bytes_in,
+            'bytes_out': bytes_out,
+            'markers': markers,
+        })
+
+    def add_unit_stats(self, phase, code, stats):
+        """정리 작업 단위의 필드별 통계 [(필드, 초, 입력 바이트, 출력 바이트, 마커 수)] 기록"""
+        for field, seconds, bytes_in, bytes_out, markers in stats:
+            self.add(phase, code, field, seconds, bytes_in, bytes_out, markers)
+
+    def timed_iter(self, phase, items):
+        """(유형 코드, 데이터) 생성기를 감싸 항목 하나를 만드는 데 걸린 시간을 기록"""
+        items = iter(items)
+        while True:
+            start = time.perf_counter()
+            try:
+                code, data = next(items)
+            except StopIteration:
+                return
+            self.add(phase, code, seconds=time.perf_counter() - start, bytes_out=value_bytes(data))
+            yield code, data
+
+    def recorded_seconds(self):
+        return sum(record['seconds'] for record in self.records)
+
+    @contextmanager
+    def phase(self, phase, code=None, field=None, bytes_in=0):
+        """구간 측정 - yield된 dict에 bytes_out/markers를 채우면 함께 기록"""
+        record = {'bytes_out': 0, 'markers': 0}
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            self.add(phase, code, field, time.perf_counter() - start, bytes_in,
+                     record['bytes_out'], record['markers'])
+
+    def stop(self):
+        if self.elapsed is None:
+            self.elapsed = time.perf_counter() - self.started
+            if self._cprofile:
+                self._cprofile.disable()
+
+    def totals(self):
+        """phase별 합계"""
+        totals = {}
+        for record in self.records:
+            total = totals.setdefault(record['phase'], {
+                'seconds': 0.0, 'bytes_in': 0, 'bytes_out': 0, 'markers': 0, 'count': 0})
+            for key in ('seconds', 'bytes_in', 'bytes_out', 'markers'):
+                total[key] += record[key]
+            total['count'] += 1
+        for total in totals.values():
+            # 입력 크기를 모르는 단계(ingest, emit)는 출력 크기 기준
+            size = total['bytes_in'] or total['bytes_out']
+            total['mb_per_s'] = round(size / 1e6 / total['seconds'], 2) if total['seconds'] else None
+        return totals
+
+    def hotspots(self, limit=20):
+        """cProfile 결과 - 자체 시간 상위 함수와, 정규식 메서드의 호출 지점별 시간"""
+        if not self._cprofile:
+            return None
+        stats = pstats.Stats(self._cprofile).stats
+        functions = []
+        regex = []
+        for (filename, line, name), (_, calls, tottime, cumtime, callers) in stats.items():
+            label = f'{os.path.basename(filename)}:{line}({name})' if line else name
+            functions.append({'function': label, 'calls': calls,
+                              'tottime': round(tottime, 6), 'cumtime': round(cumtime, 6)})
+            if "re.Pattern" in name:
+                for (cfile, cline, cname), caller_stats in callers.items():
+                    regex.append({'pattern_method': name,
+                                  'caller': f'{os.path.basename(cfile)}:{cline}({cname})',
+                                  'calls': caller_stats[1], 'tottime': round(caller_stats[2], 6)})
+        functions.sort(key=lambda item: item['tottime'], reverse=True)
+        regex.sort(key=lambda item: item['tottime'], reverse=True)
+        return {'functions': functions[:limit], 'regex': regex[:limit]}
+
+    def report(self):
+        self.stop()
+        return {
+            'stage': self.stage,
+            'elapsed': round(self.elapsed, 6),
+            'phases': self.totals(),
+            'records': self.records,
+            'cprofile': self.hotspots(),
+        }
+
+    def write(self, path=None):
+        """JSON 보고서 저장 → 경로"""
+        path = path or default_report_path(self.stage)
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, ensure_ascii=False, indent=1)
+            f.write('\n')
+        return path
+
+    def print_table(self, limit=20):
+        """시간이 오래 걸린 순으로 정렬한 콘솔 표"""
+        report = self.report()
+        print(f"\n[profile] {self.stage}: {report['elapsed']:.3f}s")
+        print(f"{'phase':<10} {'type':<6} {'field':<26} {'ms':>9} {'in B':>9} {'out B':>9} {'markers':>7}")
+        for record in sorted(self.records, key=lambda r: r['seconds'], reverse=True)[:limit]:
+            print(f"{record['phase']:<10} {record['type'] or '-':<6} {record['field'] or '-':<26} "
+                  f"{record['seconds'] * 1000:>9.2f} {record['bytes_in']:>9} {record['bytes_out']:>9} "
+                  f"{record['markers']:>7}")
+        print(f"\n{'phase':<10} {'count':>6} {'ms':>9} {'MB/s':>8}")
+        for phase, total in sorted(report['phases'].items(), key=lambda item: item[1]['seconds'], reverse=True):
+            print(f"{phase:<10} {total['count']:>6} {total['seconds'] * 1000:>9.2f} {total['mb_per_s'] or 0:>8.2f}")
+        if report['cprofile']:
+            print(f"\n{'regex method':<40} {'caller':<40} {'calls':>7} {'ms':>9}")
+            for item in report['cprofile']['regex'][:10]:
+                print(f"{item['pattern_method'][:40]:<40} {item['caller'][:40]:<40} "
+                      f"{item['calls']:>7} {item['tottime'] * 1000:>9.2f}")
+
+    def finish(self, path=None):
+        """표 출력 후 JSON 저장"""
+        self.print_table()
+        path = self.write(path or None)
+        print(f"\n프로파일 저장: {path}")
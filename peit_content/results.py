@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+결과 데이터 빌드 시 병합
+- lib/results_base.ts(직접 작성한 24개 유형)에 lib/political_details.ts의 정치 유형 상세를 덮어씀
+- 예전에 lib/results.ts 모듈 로드 때마다 돌던 병합 루프(필드 삭제, Object.assign,
+  money_value → financial_style 별칭, growth_task 정리)를 그대로 옮김
+- 본문 필드는 미리 HTML로 렌더링해 각 항목의 html 필드에 함께 저장
+- 결과 목록/카드/메타데이터가 쓰는 요약 필드만 lib/generated/results.ts 로 기록 (모든 결과 페이지가 import)
+  카드가 바로 표시하는 설명 필드는 html도 요약 쪽에 함께 둠
+- 나머지 상세 필드와 html은 lib/generated/details/<유형 코드>.json 으로 나눠 기록하고,
+  상세를 보여 주는 화면만 index.ts의 loadTypeDetails로 자기 유형 파일을 불러옴
+- 도서 목록(lib/books.ts)이 쓰는 recommended_content는 lib/generated/recommended_content.ts 로 따로 기록
+"""
+
+import os
+
+from peit_content.markdown import render_fields
+from peit_content.paths import (DETAILS_PATH, RECOMMENDED_OUTPUT_PATH, RESULT_DETAILS_DIR, RESULTS_BASE_NAME,
+                                RESULTS_BASE_PATH, RESULTS_OUTPUT_PATH)
+from peit_content.split import emit_split
+from peit_content.tsliteral import iter_module, load_document
+from peit_content.writer import write_chunks_if_changed
+
+# results_base.ts에서 제거해야 할 하드코딩된 상세 필드들 (political_details.ts의 것으로 대체됨)
+POLITICAL_OVERRIDES = [
+    'speech_style',
+    'stress_moment',
+    'solution',
+    'love_value',
+    'best_partner',
+    'worst_partner',
+    'communication_barrier',
+    'career_value',
+    'financial_style',  # political_details.ts의 money_value로 대체됨
+    'historical_avatar',
+    'real_avatar',
+    'growth_direction',
+    'final_goal',
+    'recommended_books',
+    'recommended_content',
+    'growth_task',
+    'detailed_description',
+    'political_spectrum_detail',
+    'summary',
+    'political_spectrum',
+    'strengths',
+    'weaknesses',
+    'keywords',
+]
+
+# lib/generated/results.ts에 남기는 요약 필드 (유형 목록, ResultCard/SimpleResultCard, 결과 페이지 메타데이터, 공유 카드)
+SUMMARY_FIELDS = [
+    'name',
+    'category',
+    'code',
+    'nickname',
+    'scores',
+    'description',
+    'keywords',
+    'strengths',
+    'weaknesses',
+    'spectrum_analysis',
+]
+
+# 요약 모듈에도 html을 함께 두는 필드 (ResultCard/SimpleResultCard가 상세 모듈을 기다리지 않고 표시)
+SUMMARY_HTML_FIELDS = ['description', 'spectrum_analysis']
+
+
+def merge_entry(entry, details):
+    """기본 유형 항목 하나에 정치 유형 상세를 덮어쓴 새 dict (필드 순서는 예전 런타임 병합과 같음)"""
+    merged = {name: value for name, value in entry.items() if name not in POLITICAL_OVERRIDES}
+    merged.update(details)
+
+    # money_value를 financial_style로 alias (컴포넌트 호환성을 위해)
+    if merged.get('money_value'):
+        merged['financial_style'] = merged['money_value']
+
+    # 잘못 파싱된 growth_task ('추천 도서' 라인) 제거
+    growth_task = merged.get('growth_task')
+    if isinstance(growth_task, str) and '추천 도서' in growth_task:
+        del merged['growth_task']
+
+    return merged
+
+
+def merge_results(base, details):
+    """기본 결과 Document와 정치 유형 상세 {유형 코드: 데이터} → (유형 코드, 병합된 항목) 들"""
+    for code in base:
+        entry = base.data(code)
+        if code in details and entry.get('category') == 'political':
+            entry = merge_entry(entry, details[code])
+        entry['html'] = render_fields(entry)
+        yield code, entry
+
+
+def split_entry(entry):
+    """병합된 항목 → (요약 필드 dict, 상세 필드 dict)"""
+    summary = {name: value for name, value in entry.items() if name in SUMMARY_FIELDS}
+    details = {name: value for name, value in entry.items() if name not in SUMMARY_FIELDS}
+    html = {name: value for name, value in entry.get('html', {}).items() if name in SUMMARY_HTML_FIELDS}
+    if html:
+        summary['html'] = html
+    return summary, details
+
+
+def iter_results_module(items):
+    """병합된 결과 모듈 텍스트를 조금씩 생성"""
+    yield (
+        '// 자동 생성 파일 - 직접 수정하지 마세요 (generate_results.py 로 생성)\n'
+        "import { ResultData } from '../types';\n"
+        '\n'
+    )
+    yield from iter_module('results', items, 'Readonly<Record<string, Readonly<ResultData>>>')
+
+
+def recommended_content(entries, details):
+    """(유형 코드, 병합된 항목) 들 → 추천 콘텐츠가 있는 (유형 코드, 텍스트) 들
+
+    예전 getAllBooks 순서 그대로 정치 유형(political_details.ts 순서) 다음 경제 유형
+    """
+    order = [code for code in details if code in entries]
+    order.extend(code for code in entries if code not in details)
+    for code in order:
+        content = entries[code].get('recommended_content')
+        if content:
+            yield code, content
+
+
+def iter_recommended_module(items):
+    """추천 콘텐츠 모듈 텍스트를 조금씩 생성"""
+    yield (
+        '// 자동 생성 파일 - 직접 수정하지 마세요 (generate_results.py 로 생성)\n'
+        '// 유형 코드 → recommended_content 원문 (lib/books.ts가 도서 목록을 뽑음)\n'
+        '\n'
+    )
+    yield from iter_module('recommendedContent', items, 'Readonly<Record<string, string>>')
+
+
+def render_outputs(base_doc, details):
+    """기본 결과 Document와 정치 유형 상세 → (요약 모듈 청크, [(유형 코드, 상세)], 유형 이름, 추천 콘텐츠 모듈 청크)"""
+    entries = dict(merge_results(base_doc, details))
+    parts = {code: split_entry(entry) for code, entry in entries.items()}
+    return (iter_results_module((code, summary) for code, (summary, _) in parts.items()),
+            [(code, detail) for code, (_, detail) in parts.items()],
+            {code: entry.get('name', '') for code, entry in entries.items()},
+            iter_recommended_module(recommended_content(entries, details)))
+
+
+def build_results(base=RESULTS_BASE_PATH, details=DETAILS_PATH, output=RESULTS_OUTPUT_PATH,
+                  details_dir=RESULT_DETAILS_DIR, recommended=RECOMMENDED_OUTPUT_PATH):
+    """기본 결과 + 정치 유형 상세 → 요약 모듈, 유형별 상세, 추천 콘텐츠 모듈 기록 → 하나라도 기록했으면 True"""
+    base_doc = load_document(base, RESULTS_BASE_NAME)
+    details_doc = load_document(details)
+    return write_results(output, base_doc, dict(details_doc.items()), details_dir, recommended)
+
+
+def write_results(output, base_doc, details, details_dir=RESULT_DETAILS_DIR, recommended=RECOMMENDED_OUTPUT_PATH):
+    """요약 모듈, 유형별 상세, 추천 콘텐츠 모듈 기록 (내용이 같은 파일은 쓰지 않음) → 하나라도 기록했으면 True"""
+    summaries, detail_items, names, recommended_chunks = render_outputs(base_doc, details)
+    written = False
+    for path, chunks in ((output, summaries), (recommended, recommended_chunks)):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        written = write_chunks_if_changed(path, chunks) or written
+    return bool(emit_split(details_dir, detail_items, output, names)) or written
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+응답 대량 채점 (lib/calculate.ts의 calculateResult와 같은 결과, NumPy 필요)
+- lib/mapping.ts를 읽어 (문항, 답) → 축 가중치 행렬을 만듦
+- 응답 묶음을 (응답자 × [문항별 A | 문항별 B]) 0/1 행렬로 묶고, 행렬 곱 한 번으로 14개 축 점수 계산
+- 유형 코드는 축 쌍 비교(`>`, 동점이면 C/T/U/S, S/A/W)로 벡터 연산
+"""
+
+import re
+
+import numpy as np
+
+from peit_content.paths import MAPPING_PATH
+
+# calculate.ts Scores의 키 순서
+AXES = ['I', 'C', 'P', 'T', 'A', 'U', 'E', 'S', 'G', 'S2', 'V', 'A2', 'E2', 'W']
+AXIS_INDEX = {axis: i for i, axis in enumerate(AXES)}
+
+# (앞 축, 뒤 축, 앞 축이 더 클 때 글자, 아니면 글자)
+POLITICAL_PAIRS = [('I', 'C', 'I', 'C'), ('P', 'T', 'P', 'T'), ('A', 'U', 'A', 'U'), ('E', 'S', 'E', 'S')]
+ECONOMIC_PAIRS = [('G', 'S2', 'G', 'S'), ('V', 'A2', 'V', 'A'), ('E2', 'W', 'E', 'W')]
+
+# parseInt(questionId.replace('q', '')) - 첫 'q' 하나만 지우고 앞쪽 정수 부분만 읽음
+_INT_PREFIX_RE = re.compile(r'\s*([+-]?\d+)')
+
+
+def question_number(key):
+    """'q12' → 12 (calculate.ts와 같이 해석할 수 없으면 None)"""
+    match = _INT_PREFIX_RE.match(key.replace('q', '', 1))
+    return int(match.group(1)) if match else None
+
+
+def load_mapping(path=MAPPING_PATH):
+    """mapping.ts → {문항 번호: {'A': 축, 'B': 축}}"""
+    from peit_content.tsliteral import load_document
+
+    doc = load_document(path, 'mapping')
+    return {int(key): doc.data(key) for key in doc}
+
+
+def _code_table(pairs):
+    """비교 결과 비트 (앞 축부터 상위 비트) → 유형 코드 문자열 배열"""
+    size = len(pairs)
+    codes = []
+    for index in range(1 << size):
+        letters = []
+        for k, (_, _, win, lose) in enumerate(pairs):
+            letters.append(win if index >> (size - 1 - k) & 1 else lose)
+        codes.append(''.join(letters))
+    return np.array(codes)
+
+
+class Scorer:
+    """mapping 하나에 대한 가중치 행렬과 유형 코드 표"""
+
+    def __init__(self, mapping):
+        self.questions = sorted(mapping)
+        self.column = {q: i for i, q in enumerate(self.questions)}
+        self._columns = {}
+        count = len(self.questions)
+        # 행: [문항별 A 답 | 문항별 B 답], 열: 축 (Scores에 없는 축 이름은 calculate.ts처럼 무시)
+        self.weights = np.zeros((2 * count, len(AXES)), dtype=np.int32)
+        for q, i in self.column.items():
+            for offset, answer in ((0, 'A'), (count, 'B')):
+                axis = AXIS_INDEX.get(mapping[q].get(answer))
+                if axis is not None:
+                    self.weights[offset + i, axis] = 1
+        self._political = (_code_table(POLITICAL_PAIRS), self._pair_columns(POLITICAL_PAIRS))
+        self._economic = (_code_table(ECONOMIC_PAIRS), self._pair_columns(ECONOMIC_PAIRS))
+
+    @classmethod
+    def from_file(cls, path=MAPPING_PATH):
+        return cls(load_mapping(path))
+
+    @staticmethod
+    def _pair_columns(pairs):
+        return (np.array([AXIS_INDEX[a] for a, _, _, _ in pairs]),
+                np.array([AXIS_INDEX[b] for _, b, _, _ in pairs]))
+
+    def _answer_column(self, key, answer):
+        """(문항 키, 답) → 답 행렬의 열 (채점하지 않는 키/답이면 -1)"""
+        i = self.column.get(question_number(key))
+        if i is None or answer not in ('A', 'B'):
+            return -1
+        return i if answer == 'A' else len(self.questions) + i
+
+    def pack(self, answer_sets):
+        """{'q1': 'A', ...} 목록 → (응답자 × 2·문항) int32 행렬
+
+        같은 문항으로 해석되는 키가 여러 개면 calculate.ts처럼 모두 더함 (256개 넘게 겹쳐도 넘치지 않게 int32)
+        """
+        width = 2 * len(self.questions)
+        cache = self._columns
+        flat = []
+        rows = 0
+        for answers in answer_sets:
+            base = rows * width
+            for item in answers.items():
+                if not isinstance(item[1], str):
+                    continue
+                column = cache.get(item)
+                if column is None:
+                    column = cache[item] = self._answer_column(*item)
+                if column >= 0:
+                    flat.append(base + column)
+            rows += 1
+        counts = np.bincount(np.array(flat, dtype=np.int64), minlength=rows * width)
+        return counts.astype(np.int32).reshape(rows, width)
+
+    def pack_choices(self, choices):
+        """(응답자 × 문항) 배열 (0 무응답, 1 A, 2 B, 열 순서는 self.questions) → pack()과 같은 행렬"""
+        choices = np.asarray(choices)
+        return np.concatenate([choices == 1, choices == 2], axis=1).astype(np.uint8)
+
+    def tallies(self, matrix):
+        """답 행렬 → (응답자 × 14축) 점수 (행렬 곱 한 번)"""
+        return matrix.astype(np.int32, copy=False) @ self.weights
+
+    @staticmethod
+    def _codes(tallies, table_columns):
+        table, (left, right) = table_columns
+        bits = tallies[:, left] > tallies[:, right]
+        weights = 1 << np.arange(bits.shape[1] - 1, -1, -1)
+        return table[bits.astype(np.int64) @ weights]
+
+    def codes(self, tallies):
+        """점수 → (정치 4글자 코드 배열, 경제 3글자 코드 배열)"""
+        return self._codes(tallies, self._political), self._codes(tallies, self._economic)
+
+    def score(self, answer_sets):
+        """응답 목록 → (정치 코드, 경제 코드, 점수) 배열"""
+        tallies = self.tallies(self.pack(answer_sets))
+        political, economic = self.codes(tallies)
+        return political, economic, tallies
+
+
+def result_dict(political, economic, tallies):
+    """한 명의 결과를 calculateResult 반환 형태로"""
+    scores = {axis: int(value) for axis, value in zip(AXES, tallies)}
+    return {
+        'political': str(political),
+        'economic': str(economic),
+        'scores': scores,
+        'politicalScores': {axis: scores[axis] for axis in AXES[:8]},
+        'economicScores': {
+            'G': scores['G'], 'S': scores['S2'],
+            'V': scores['V'], 'A': scores['A2'],
+            'E': scores['E2'], 'W': scores['W'],
+        },
+    }
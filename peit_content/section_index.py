@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+data/political_details.txt 섹션 색인 (.peit-cache/sections.json)
+- (유형 코드, 섹션) → 원본 UTF-8 파일의 (시작, 끝) 바이트 구간
+- 소스 파일 다이제스트가 기록과 다르면 다시 만듦 (ingest 명령이 실행될 때마다 갱신)
+- 섹션 내용은 mmap 슬라이스로 바로 꺼내므로 소스 전체를 다시 읽거나 정규식을 돌리지 않음
+
+    with SectionIndex() as index:
+        text = index.get('IPAS', '최악의 갈등 상대')
+"""
+
+import mmap
+import os
+
+from peit_content.ingest import read_blocks
+from peit_content.manifest import CACHE_DIR, bytes_digest, load_cache, save_cache
+from peit_content.paths import SOURCE_PATH
+
+INDEX_PATH = os.path.join(CACHE_DIR, 'sections.json')
+
+# 소제목 → 섹션 id (sections.POLITICAL_SECTIONS의 제목 외에 추출 단계에만 있는 섹션)
+SECTION_TITLES = {
+    '해시태그': 'keywords',
+    '한 줄 요약': 'summary',
+    '종합 정치 스펙트럼': 'political_spectrum',
+    '당신은 이런 사람입니다': 'detailed_description',
+    '강점': 'strengths',
+    '약점': 'weaknesses',
+    '핵심 성장 과제': 'growth_task',
+    '추천 도서': 'recommended_books',
+}
+
+
+def build_sections(blocks):
+    """오프셋을 기록한 유형 블록들 → {유형 코드: {섹션: [시작, 끝]}}"""
+    return {
+        block.code: {name: list(span) for name, span in block.section_spans().items()}
+        for block in blocks
+    }
+
+
+def write_index(source, sections, digest, path=INDEX_PATH):
+    save_cache(path, {'source': source, 'digest': digest, 'sections': sections}, separators=(',', ':'))
+
+
+def resolve_section(name):
+    """필드 이름 또는 소제목('최악의 갈등 상대') → 섹션 id"""
+    if name in SECTION_TITLES:
+        return SECTION_TITLES[name]
+    from peit_content.sections import POLITICAL_SECTIONS
+    for field, section in POLITICAL_SECTIONS.items():
+        if name in (section.title, section.title and section.title.rstrip(':')):
+            return field
+    return name
+
+
+class SectionIndex:
+    """소스 파일을 mmap으로 열고 색인을 불러옴 (다이제스트가 다르면 다시 만들어 저장)"""
+
+    def __init__(self, source=SOURCE_PATH, path=INDEX_PATH):
+        self.source = source
+        self.path = path
+        self.rebuilt = False
+        self._file = open(source, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        self._buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        self.digest = bytes_digest(self._buffer)
+        self.sections = self._load()
+        if self.sections is None:
+            self.sections = build_sections(read_blocks(source, offsets=True))
+            write_index(source, self.sections, self.digest, path)
+            self.rebuilt = True
+
+    def _load(self):
+        """저장된 색인 (없거나 깨졌거나 소스가 다르면 None → 다시 만듦)"""
+        data = load_cache(self.path)
+        if not data or data.get('source') != self.source or data.get('digest') != self.digest:
+            return None
+        return data.get('sections')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        self._file.close()
+
+    def __contains__(self, code):
+        return code in self.sections
+
+    def __iter__(self):
+        return iter(self.sections)
+
+    def span(self, code, name):
+        """(시작, 끝) 바이트 구간 - 없는 섹션이면 KeyError"""
+        start, end = self.sections[code][resolve_section(name)]
+        return start, end
+
+    def get_bytes(self, code, name):
+        start, end = self.span(code, name)
+        return self._buffer[start:end]
+
+    def get(self, code, name):
+        return self.get_bytes(code, name).decode('utf-8')
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""
+정치/경제 유형 상세 필드의 섹션 스키마
+- 각 필드가 어떤 소제목(또는 이모지)에서 시작해서 어떤 소제목 앞에서 끝나는지 선언
+- 분할기는 모듈 로드 시 한 번만 컴파일
+- weaknesses 배열 정리와 병렬 작업 단위 정리 함수
+"""
+
+import time
+
+from peit_content.profiling import value_bytes
+from peit_content.segmenter import Section, Segmenter
+
+POLITICAL_SECTIONS = {
+    # 화법만 (스트레스, 솔루션, 연애, 파트너, 소통의 벽 제거)
+    'speech_style': Section(
+        '당신의 화법:', '🗣️', stop_at_repeat=True,
+        ends=['스트레스 받는 순간', '💔', '솔루션', '💡', '연애 가치관', '❤️',
+              '최고의 연애 파트너', '💚', '최악의 갈등 상대', '소통의 벽',
+              '돈과 일', '역사와 현실', '개인적 성장']),
+    # 스트레스 받는 순간만
+    'stress_moment': Section(
+        '스트레스 받는 순간', '💔',
+        ends=['솔루션', '💡', '연애 가치관', '❤️', '최고의 연애 파트너', '💚',
+              '최악의 갈등 상대', '소통의 벽', '돈과 일']),
+    # 솔루션만
+    'solution': Section(
+        '솔루션', '💡',
+        ends=['연애 가치관', '❤️', '최고의 연애 파트너', '💚', '최악의 갈등 상대',
+              '소통의 벽', '돈과 일']),
+    # 연애 가치관만
+    'love_value': Section(
+        '연애 가치관', '❤️',
+        ends=['최고의 연애 파트너', '💚', '최악의 갈등 상대', '💔', '소통의 벽',
+              '돈과 일', '역사와 현실', '개인적 성장', '추천 도서', '📚']),
+    # 최고의 파트너만
+    'best_partner': Section(
+        '최고의 연애 파트너', '💚',
+        ends=['최악의 갈등 상대', '💔', '소통의 벽', '돈과 일', '역사와 현실']),
+    # 최악의 상대만 (💔는 스트레스 섹션과 겹치므로 '최악'이 있을 때만)
+    'worst_partner': Section(
+        '최악의 갈등 상대', '💔', emoji_requires='최악',
+        ends=['소통의 벽', '돈과 일', '역사와 현실']),
+    # 소통의 벽만 (첫 번째 '소통의 벽' 이후부터)
+    'communication_barrier': Section(
+        '소통의 벽',
+        ends=['돈과 일', '역사와 현실', '개인적 성장']),
+    # 직업적 가치관만
+    'career_value': Section(
+        '직업적 가치관', '💼',
+        ends=['잠재적 재무 스타일', '💰', '역사와 현실', '개인적 성장']),
+    # 재무 스타일만
+    'money_value': Section(
+        '잠재적 재무 스타일', '💰',
+        ends=['역사와 현실', '개인적 성장', '추천 도서']),
+    # 성장 방향성만 (추천 도서, 최종 목표 제거)
+    'growth_direction': Section(
+        '성장 방향성', '🌱',
+        ends=['핵심 성장 과제', '🎯', '추천 도서', '📚', '추천 영상', '🎬',
+              '성장의 최종 목표', '🏆']),
+    # 성장의 최종 목표만
+    'final_goal': Section('성장의 최종 목표', '🏆'),
+    # 역사적 아바타만
+    'historical_avatar': Section(
+        '역사적 아바타',
+        ends=['현실 속 아바타', '개인적 성장', '성장 방향성']),
+    # 현실 속 아바타만
+    'real_avatar': Section(
+        '현실 속 아바타',
+        ends=['개인적 성장', '성장 방향성', '핵심 성장 과제', '추천 도서']),
+    # 추천 영상/강의만
+    'recommended_content': Section(
+        '추천 영상', '🎬',
+        ends=['성장의 최종 목표', '🏆']),
+}
+
+# 경제 유형은 소제목을 본문에 그대로 두므로, 뒤 섹션이 섞여 들어온 경우만 잘라냄
+_ECONOMIC_HEADINGS = [
+    ('synergy_partner', '**🤝 시너지 파트너'),
+    ('risk_partner', '**🔥 리스크 파트너'),
+    ('success_formula', '**💰 성공 공식'),
+    ('failure_formula', '**💸 실패 공식'),
+    ('benchmarking', '### **성공 DNA 벤치마킹'),
+    ('career_navigation', '**커리어 네비게이션'),
+    ('recommended_content', '**📚 추천 도서'),
+]
+
+ECONOMIC_SECTIONS = {
+    name: Section(ends=[heading for _, heading in _ECONOMIC_HEADINGS[i + 1:]])
+    for i, (name, _) in enumerate(_ECONOMIC_HEADINGS)
+}
+
+FIELDS_TO_CLEAN = list(POLITICAL_SECTIONS)
+ECONOMIC_FIELDS_TO_CLEAN = list(ECONOMIC_SECTIONS)
+
+SEGMENTERS = {
+    'political': Segmenter(POLITICAL_SECTIONS),
+    'economic': Segmenter(ECONOMIC_SECTIONS),
+}
+POLITICAL_SEGMENTER = SEGMENTERS['political']
+
+# weaknesses 배열에 섞여 들어온 다른 섹션의 키워드
+WEAKNESS_LEAK_KEYWORDS = ['당신의 화법', '스트레스 받는 순간', '솔루션', '연애 가치관', '최고의 연애 파트너', '최악의 갈등 상대']
+
+
+def clean_field_content(field_value, field_name, kind='political'):
+    """각 필드의 내용을 정리 - 해당 소제목에만 해당하는 내용만 남김"""
+    if not field_value or not isinstance(field_value, str):
+        return field_value
+    segmenter = SEGMENTERS[kind]
+    if field_name not in segmenter.sections:
+        return field_value
+    return segmenter.scan(field_value).section(field_name)
+
+
+def clean_weaknesses(items, leak_keywords=None):
+    """weaknesses 배열에서 화법 관련 내용 제거
+
+    •, ◦, ▪로 시작하는 항목(화법, 스트레스, 솔루션, 연애 관련)을 제거하고 일반적인 약점만 유지.
+    leak_keywords가 주어지면 그 키워드가 들어 있는 항목만 제거
+    """
+    cleaned = []
+    for item in items:
+        stripped = item.strip()
+        if not stripped:
+            continue
+        if item.startswith(('•', '◦', '▪')):
+            if leak_keywords is None or any(keyword in stripped for keyword in leak_keywords):
+                continue
+        cleaned.append(item)
+    return cleaned
+
+
+def clean_unit(unit):
+    """작업 단위 (kind, 유형 코드, {필드: 값}) 정리 → (유형 코드, {필드: 정리된 값})
+
+    프로세스 풀에서 실행되므로 모듈 최상위 함수로 둠
+    """
+    kind, code, fields = unit
+    cleaned = {}
+    for name, value in fields.items():
+        if name == 'weaknesses':
+            if isinstance(value, list):
+                cleaned[name] = clean_weaknesses(value)
+        elif isinstance(value, str):
+            cleaned[name] = clean_field_content(value, name, kind)
+    return code, cleaned
+
+
+def profile_unit(unit):
+    """clean_unit과 같지만 필드별 통계도 반환 → (유형 코드, {필드: 정리된 값}, 통계)
+
+    통계: [(필드, 초, 입력 바이트, 출력 바이트, 매칭된 마커 수)]
+    """
+    kind, code, fields = unit
+    segmenter = SEGMENTERS[kind]
+    cleaned = {}
+    stats = []
+    for name, value in fields.items():
+        start = time.perf_counter()
+        markers = 0
+        if name == 'weaknesses':
+            if not isinstance(value, list):
+                continue
+            new_value = clean_weaknesses(value)
+        elif isinstance(value, str):
+            if value and name in segmenter.sections:
+                segmentation = segmenter.scan(value)
+                markers = segmentation.match_count()
+                new_value = segmentation.section(name)
+            else:
+                new_value = value
+        else:
+            continue
+        cleaned[name] = new_value
+        stats.append((name, time.perf_counter() - start, value_bytes(value), value_bytes(new_value), markers))
+    return code, cleaned, stats
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""
+섹션 분할기
+- 선언적 섹션 스키마(시작 마커, 이모지 별칭, 종료 마커)로부터 한 번만 생성
+- 모든 마커를 하나의 Aho-Corasick 오토마톤으로 컴파일하여 텍스트를 한 번만 스캔
+- 스캔 결과(마커별 등장 위치)로 각 섹션의 시작/끝을 이분 탐색으로 결정
+"""
+
+import re
+from bisect import bisect_left
+from collections import deque
+
+
+class Section:
+    """섹션 하나의 선언
+
+    - title: 섹션 제목 마커 (있으면 우선 사용)
+    - emoji: 제목이 없을 때 사용하는 이모지 별칭
+    - ends: 섹션을 끝내는 다음 섹션 마커들
+    - emoji_requires: 이모지 별칭을 쓰기 위해 텍스트 어딘가에 있어야 하는 마커
+    - stop_at_repeat: 같은 시작 마커가 다시 나오면 거기서 끝냄
+    """
+
+    __slots__ = ('title', 'emoji', 'ends', 'emoji_requires', 'stop_at_repeat')
+
+    def __init__(self, title=None, emoji=None, ends=(), emoji_requires=None, stop_at_repeat=False):
+        self.title = title
+        self.emoji = emoji
+        self.ends = tuple(ends)
+        self.emoji_requires = emoji_requires
+        self.stop_at_repeat = stop_at_repeat
+
+    def markers(self):
+        for marker in (self.title, self.emoji, self.emoji_requires):
+            if marker:
+                yield marker
+        yield from self.ends
+
+
+class Automaton:
+    """여러 마커를 동시에 찾는 Aho-Corasick 오토마톤 (겹치는 등장도 모두 보고)"""
+
+    def __init__(self, patterns):
+        self.patterns = list(dict.fromkeys(p for p in patterns if p))
+        goto = [{}]
+        outputs = [[]]
+        for index, pattern in enumerate(self.patterns):
+            state = 0
+            for char in pattern:
+                nxt = goto[state].get(char)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][char] = nxt
+                    goto.append({})
+                    outputs.append([])
+                state = nxt
+            outputs[state].append(index)
+
+        # 실패 링크를 따라 전이를 미리 채워 완전한 DFA로 만든다
+        fail = [0] * len(goto)
+        delta = [dict(goto[0])]
+        delta.extend({} for _ in range(len(goto) - 1))
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            outputs[state] = outputs[state] + outputs[fail[state]]
+            transitions = dict(delta[fail[state]])
+            transitions.update(goto[state])
+            delta[state] = transitions
+            for char, nxt in goto[state].items():
+                fail[nxt] = delta[fail[state]].get(char, 0)
+                queue.append(nxt)
+
+        self._delta = delta
+        self._outputs = [tuple(out) for out in outputs]
+        self._lengths = [len(p) for p in self.patterns]
+        first_chars = ''.join(sorted({p[0] for p in self.patterns}))
+        self._first_re = re.compile('[' + re.escape(first_chars) + ']') if first_chars else None
+
+    def scan(self, text):
+        """텍스트를 한 번 훑어 마커 인덱스별 시작 위치 목록을 반환"""
+        hits = [[] for _ in self.patterns]
+        if self._first_re is None:
+            return hits
+        delta = self._delta
+        outputs = self._outputs
+        lengths = self._lengths
+        search = self._first_re.search
+        state = 0
+        pos = 0
+        size = len(text)
+        while pos < size:
+            if state == 0:
+                # 루트 상태에서는 마커 첫 글자가 나올 때까지 건너뛴다
+                match = search(text, pos)
+                if match is None:
+                    break
+                pos = match.start()
+            state = delta[state].get(text[pos], 0)
+            pos += 1
+            for index in outputs[state]:
+                hits[index].append(pos - lengths[index])
+        return hits
+
+
+class Segmentation:
+    """텍스트 하나에 대한 스캔 결과 - 섹션 경계를 계산"""
+
+    def __init__(self, segmenter, text, hits):
+        self.segmenter = segmenter
+        self.text = text
+        self._hits = hits
+
+    def positions(self, marker):
+        index = self.segmenter.marker_index.get(marker)
+        return self._hits[index] if index is not None else []
+
+    def match_count(self):
+        """스캔에서 찾은 마커 등장 횟수 합계"""
+        return sum(len(positions) for positions in self._hits)
+
+    def first(self, marker, start=0):
+        positions = self.positions(marker)
+        i = bisect_left(positions, start)
+        return positions[i] if i < len(positions) else -1
+
+    def span(self, name):
+        """섹션의 (시작, 끝) 위치, 없으면 None"""
+        section = self.segmenter.sections[name]
+        marker = None
+        if section.title and self.positions(section.title):
+            marker = section.title
+        elif section.emoji and self.positions(section.emoji):
+            if not section.emoji_requires or self.positions(section.emoji_requires):
+                marker = section.emoji
+        if marker is None:
+            return None
+
+        start = self.first(marker) + len(marker)
+        end = len(self.text)
+        ends = section.ends + (marker,) if section.stop_at_repeat else section.ends
+        for terminator in ends:
+            pos = self.first(terminator, start)
+            if pos != -1 and pos < end:
+                end = pos
+        return start, end
+
+    def section(self, name):
+        """섹션 본문 (시작 마커가 없으면 텍스트 전체에서 종료 마커 이전까지)"""
+        span = self.span(name)
+        if span is None:
+            section = self.segmenter.sections[name]
+            end = len(self.text)
+            for terminator in section.ends:
+                pos = self.first(terminator)
+                if pos != -1 and pos < end:
+                    end = pos
+            span = (0, end)
+        return self.text[span[0]:span[1]].strip()
+
+    def sections(self):
+        """스키마의 모든 섹션을 한 번에 잘라낸 결과 (시작 마커가 있는 것만)"""
+        result = {}
+        for name in self.segmenter.sections:
+            span = self.span(name)
+            if span is not None:
+                result[name] = self.text[span[0]:span[1]].strip()
+        return result
+
+
+class Segmenter:
+    """섹션 스키마 → 컴파일된 분할기"""
+
+    def __init__(self, sections):
+        self.sections = dict(sections)
+        markers = [m for section in self.sections.values() for m in section.markers()]
+        self.automaton = Automaton(markers)
+        self.marker_index = {m: i for i, m in enumerate(self.automaton.patterns)}
+
+    def scan(self, text):
+        return Segmentation(self, text, self.automaton.scan(text))
+
+    def segment(self, text):
+        return self.scan(text).sections()
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+유형별 분할 출력 (lib/generated/details/IPAS.json ...)
+- 유형 코드마다 JSON 파일 하나와, 코드/이름 목록과 동적 import 로더만 담은 작은 index.ts 생성
+- 결과 페이지는 자기 유형 파일만 불러오면 됨 (results.write_results가 병합 결과의 상세 필드로 생성,
+  emit/watch --split DIR은 political_details.ts를 그대로 나눠 보는 용도)
+- 바뀐 파일만 쓰고, 더 이상 없는 유형의 파일은 삭제
+"""
+
+import json
+import os
+
+from peit_content.writer import write_if_changed
+
+INDEX_NAME = 'index.ts'
+
+
+def dump_json(data):
+    """유형 하나의 JSON 텍스트 (JSON.stringify(data, null, 2) 와 같은 모양)"""
+    return json.dumps(data, ensure_ascii=False, indent=2) + '\n'
+
+
+def render_index(names, source):
+    """분할 디렉터리의 index.ts - 코드/이름 목록과 유형별 로더"""
+    codes = list(names)
+    lines = [
+        f'// 자동 생성 파일 - 직접 수정하지 마세요 ({source} 에서 분할)',
+        '',
+        'export const typeCodes = [' + ', '.join(f"'{code}'" for code in codes) + '] as const;',
+        '',
+        'export const typeNames: Record<string, string> = {',
+    ]
+    lines.extend(f'  {code}: {json.dumps(name, ensure_ascii=False)},' for code, name in names.items())
+    lines.extend([
+        '};',
+        '',
+        'const loaders: Record<string, () => Promise<{ default: Record<string, any> }>> = {',
+    ])
+    lines.extend(f"  {code}: () => import('./{code}.json')," for code in codes)
+    lines.extend([
+        '};',
+        '',
+        '/**',
+        ' * 유형 하나의 상세 데이터만 불러옵니다. 없는 코드면 null을 반환합니다.',
+        ' */',
+        'export async function loadTypeDetails(code: string): Promise<Record<string, any> | null> {',
+        '  const loader = loaders[code];',
+        '  return loader ? (await loader()).default : null;',
+        '}',
+        '',
+    ])
+    return '\n'.join(lines)
+
+
+def emit_split(directory, items, source, type_names=None):
+    """(유형 코드, 데이터) 들을 유형별 JSON과 index.ts로 분할 저장 → 기록한 파일 경로 목록
+
+    type_names: 유형 코드 → 이름 (데이터에 name 필드가 없을 때)
+    """
+    os.makedirs(directory, exist_ok=True)
+    written = []
+    names = {}
+    for code, data in items:
+        names[code] = data.get('name', '') if type_names is None else type_names[code]
+        path = os.path.join(directory, f'{code}.json')
+        if write_if_changed(path, dump_json(data)):
+            written.append(path)
+
+    index_path = os.path.join(directory, INDEX_NAME)
+    if write_if_changed(index_path, render_index(names, source)):
+        written.append(index_path)
+
+    # 더 이상 없는 유형의 파일 정리
+    for filename in sorted(os.listdir(directory)):
+        code, ext = os.path.splitext(filename)
+        if ext == '.json' and code not in names:
+            path = os.path.join(directory, filename)
+            os.remove(path)
+            written.append(path)
+    return written
+
+
+def split_document(doc, directory, source):
+    """파싱된 Document를 유형별로 분할 저장"""
+    return emit_split(directory, ((code, doc.data(code)) for code in doc), source)
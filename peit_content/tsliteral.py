@@ -0,0 +1,459 @@
+# -*- coding: utf-8 -*-
+"""
+lib/*.ts 데이터 리터럴 파서
+- `export const politicalDetails = {...}` 형태의 객체 리터럴을 한 번의 선형 스캔으로 파싱
+- 유형 코드 → 필드 모델을 만들고, 각 필드 값의 원본 위치(span)를 기록
+- 수정된 필드만 원본 텍스트에 다시 써 넣어 나머지 바이트는 그대로 보존
+"""
+
+import re
+
+from peit_content.editbuffer import EditBuffer
+
+_EXPORT_RE = re.compile(r'export\s+const\s+([A-Za-z_$][\w$]*)[^=]*=\s*')
+_SKIP_RE = re.compile(r'(?:\s+|//[^\n]*|/\*.*?\*/)*', re.DOTALL)
+_IDENT_RE = re.compile(r'[A-Za-z_$][\w$]*')
+_NUMBER_RE = re.compile(r'-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?')
+_STRING_CHUNK_RE = {
+    '"': re.compile(r'[^"\\\n]+'),
+    "'": re.compile(r"[^'\\\n]+"),
+    '`': re.compile(r'[^`\\$]+'),
+}
+_HEX4_RE = re.compile(r'[0-9a-fA-F]{4}')
+_HEX2_RE = re.compile(r'[0-9a-fA-F]{2}')
+_SIMPLE_ESCAPES = {
+    'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0',
+}
+_LITERALS = {'true': True, 'false': False, 'null': None, 'undefined': None}
+
+
+class ParseError(ValueError):
+    """리터럴 파싱 실패 (줄/칸 위치 포함)"""
+
+    def __init__(self, message, source, pos):
+        line = source.count('\n', 0, pos) + 1
+        col = pos - (source.rfind('\n', 0, pos) + 1) + 1
+        super().__init__(f'{message} (line {line}, col {col})')
+        self.pos = pos
+        self.line = line
+        self.col = col
+
+
+class Field:
+    """유형 블록 안의 필드 하나 - 값과 원본 위치"""
+
+    __slots__ = ('name', 'value', 'key_start', 'start', 'end', 'quote')
+
+    def __init__(self, name, value, key_start, start, end, quote):
+        self.name = name
+        self.value = value
+        self.key_start = key_start
+        self.start = start
+        self.end = end
+        self.quote = quote
+
+
+class Block:
+    """유형 코드 하나에 해당하는 객체 블록"""
+
+    def __init__(self, code, key_start, start, end, fields):
+        self.code = code
+        self.key_start = key_start
+        self.start = start
+        self.end = end
+        self.fields = fields
+
+    def __contains__(self, name):
+        return name in self.fields
+
+    def __iter__(self):
+        return iter(self.fields)
+
+    def get(self, name, default=None):
+        field = self.fields.get(name)
+        return field.value if field is not None else default
+
+
+class Document:
+    """파싱된 TS 모듈 - 유형 코드 → 필드 모델과 수정 내역"""
+
+    def __init__(self, source, name, start, end, blocks, quote, bare_keys):
+        self.source = source
+        self.name = name
+        self.start = start
+        self.end = end
+        self.blocks = blocks
+        self.quote = quote
+        self.bare_keys = bare_keys
+        self.edits = {}
+
+    def __contains__(self, code):
+        return code in self.blocks
+
+    def __iter__(self):
+        return iter(self.blocks)
+
+    def get(self, code, name, default=None):
+        """수정 내역을 반영한 필드 값"""
+        key = (code, name)
+        if key in self.edits:
+            return self.edits[key]
+        block = self.blocks.get(code)
+        if block is None:
+            return default
+        return block.get(name, default)
+
+    def set(self, code, name, value):
+        """필드 값 수정 (기존 필드만, 값이 같으면 기록하지 않음)"""
+        field = self.blocks[code].fields[name]
+        if value == field.value:
+            self.edits.pop((code, name), None)
+        else:
+            self.edits[(code, name)] = value
+
+    def copy(self):
+        """수정 내역만 복사한 새 Document (파싱 결과는 읽기 전용으로 공유)"""
+        doc = Document(self.source, self.name, self.start, self.end, self.blocks,
+                       self.quote, self.bare_keys)
+        doc.edits = dict(self.edits)
+        return doc
+
+    @property
+    def changed(self):
+        return bool(self.edits)
+
+    def edit_buffer(self):
+        """수정된 필드를 원본 값 구간의 편집으로 기록한 EditBuffer"""
+        buffer = EditBuffer(self.source)
+        for (code, name), value in self.edits.items():
+            field = self.blocks[code].fields[name]
+            buffer.replace(field.start, field.end, self._dump_field(field, value))
+        return buffer
+
+    def pieces(self):
+        """render() 결과를 이루는 조각들 - 전체 문자열을 만들지 않고 파일에 바로 쓸 때"""
+        return self.edit_buffer().pieces()
+
+    def render(self):
+        """수정된 필드만 다시 직렬화하여 전체 텍스트를 한 번에 조립"""
+        if not self.edits:
+            return self.source
+        return self.edit_buffer().render()
+
+    def data(self, code):
+        """수정 내역을 반영한 유형 블록 하나의 {필드: 값}"""
+        return {name: self.get(code, name) for name in self.blocks[code].fields}
+
+    def items(self):
+        """(유형 코드, {필드: 값}) 들 - 수정 내역 반영"""
+        for code in self.blocks:
+            yield code, self.data(code)
+
+    def format(self):
+        """구조화된 모델에서 리터럴 전체를 표준 형식(JSON.stringify(data, null, 2))으로 다시 생성
+
+        리터럴 앞뒤의 텍스트(타입 주석, import 등)는 그대로 둠
+        """
+        data = {code: self.data(code) for code in self.blocks}
+        literal = dump_value(data, '', self.quote, self.bare_keys)
+        return self.source[:self.start] + literal + self.source[self.end:]
+
+    def _dump_field(self, field, value):
+        line_start = self.source.rfind('\n', 0, field.key_start) + 1
+        indent = self.source[line_start:field.key_start]
+        if indent.strip():
+            indent = ''
+        return dump_value(value, indent, field.quote or self.quote, self.bare_keys)
+
+
+class _Parser:
+    def __init__(self, source):
+        self.source = source
+        self.pos = 0
+
+    def error(self, message, pos=None):
+        return ParseError(message, self.source, self.pos if pos is None else pos)
+
+    def skip(self):
+        self.pos = _SKIP_RE.match(self.source, self.pos).end()
+
+    def peek(self):
+        if self.pos >= len(self.source):
+            raise self.error('unexpected end of input')
+        return self.source[self.pos]
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise self.error(f'expected {char!r}, found {self.source[self.pos]!r}')
+        self.pos += 1
+
+    def parse_value(self):
+        char = self.peek()
+        if char == '{':
+            return {member[0]: member[2] for member in self.parse_members(self.parse_value)}
+        if char == '[':
+            return self.parse_array()
+        if char in _STRING_CHUNK_RE:
+            return self.parse_string()
+        match = _NUMBER_RE.match(self.source, self.pos)
+        if match:
+            self.pos = match.end()
+            text = match.group()
+            return float(text) if any(c in text for c in '.eE') else int(text)
+        match = _IDENT_RE.match(self.source, self.pos)
+        if match and match.group() in _LITERALS:
+            self.pos = match.end()
+            return _LITERALS[match.group()]
+        raise self.error(f'unexpected character {char!r}')
+
+    def parse_members(self, parse_member_value):
+        """객체 멤버를 (key, key_start, value, start, end) 목록으로 파싱"""
+        self.expect('{')
+        members = []
+        while True:
+            self.skip()
+            if self.peek() == '}':
+                self.pos += 1
+                return members
+            key_start = self.pos
+            key = self.parse_key()
+            self.skip()
+            self.expect(':')
+            self.skip()
+            start = self.pos
+            value = parse_member_value()
+            members.append((key, key_start, value, start, self.pos))
+            self.skip()
+            char = self.peek()
+            if char == ',':
+                self.pos += 1
+            elif char != '}':
+                raise self.error(f"expected ',' or '}}', found {char!r}")
+
+    def parse_key(self):
+        if self.peek() in '"\'':
+            return self.parse_string()
+        match = _IDENT_RE.match(self.source, self.pos) or _NUMBER_RE.match(self.source, self.pos)
+        if not match:
+            raise self.error('expected property name')
+        self.pos = match.end()
+        return match.group()
+
+    def parse_array(self):
+        self.expect('[')
+        items = []
+        while True:
+            self.skip()
+            if self.peek() == ']':
+                self.pos += 1
+                return items
+            items.append(self.parse_value())
+            self.skip()
+            char = self.peek()
+            if char == ',':
+                self.pos += 1
+            elif char != ']':
+                raise self.error(f"expected ',' or ']', found {char!r}")
+
+    def parse_string(self):
+        """이스케이프를 인식하며 문자열을 한 번만 스캔"""
+        source = self.source
+        quote = source[self.pos]
+        chunk_re = _STRING_CHUNK_RE[quote]
+        start = self.pos
+        pos = self.pos + 1
+        parts = []
+        while True:
+            match = chunk_re.match(source, pos)
+            if match:
+                parts.append(match.group())
+                pos = match.end()
+            if pos >= len(source):
+                raise self.error('unterminated string', start)
+            char = source[pos]
+            if char == quote:
+                self.pos = pos + 1
+                return ''.join(parts)
+            if char == '\n':
+                raise self.error('unterminated string', start)
+            if char == '$':
+                if source.startswith('${', pos):
+                    raise self.error('template substitutions are not supported', pos)
+                parts.append(char)
+                pos += 1
+                continue
+            pos = self._parse_escape(pos + 1, parts)
+
+    def _parse_escape(self, pos, parts):
+        source = self.source
+        if pos >= len(source):
+            raise self.error('unterminated escape', pos)
+        char = source[pos]
+        if char in _SIMPLE_ESCAPES:
+            parts.append(_SIMPLE_ESCAPES[char])
+            return pos + 1
+        if char == 'u':
+            if source.startswith('{', pos + 1):
+                close = source.find('}', pos + 2)
+                if close == -1:
+                    raise self.error('bad unicode escape', pos)
+                parts.append(chr(int(source[pos + 2:close], 16)))
+                return close + 1
+            match = _HEX4_RE.match(source, pos + 1)
+            if not match:
+                raise self.error('bad unicode escape', pos)
+            parts.append(chr(int(match.group(), 16)))
+            return match.end()
+        if char == 'x':
+            match = _HEX2_RE.match(source, pos + 1)
+            if not match:
+                raise self.error('bad hex escape', pos)
+            parts.append(chr(int(match.group(), 16)))
+            return match.end()
+        if char == '\r' and source.startswith('\n', pos + 1):
+            return pos + 2
+        if char in '\n\u2028\u2029':
+            return pos + 1
+        parts.append(char)
+        return pos + 1
+
+
+def parse_literal(source):
+    """객체/배열/문자열 리터럴 하나를 파이썬 값으로 변환"""
+    parser = _Parser(source)
+    parser.skip()
+    value = parser.parse_value()
+    parser.skip()
+    if parser.pos != len(source):
+        raise parser.error('trailing characters after literal')
+    return value
+
+
+def parse_document(source, name=None):
+    """`export const <name> = {...}` 리터럴을 유형 코드 → 필드 모델로 파싱"""
+    for match in _EXPORT_RE.finditer(source):
+        if name is None or match.group(1) == name:
+            break
+    else:
+        raise ParseError(f'export const {name or "<object>"} not found', source, 0)
+
+    parser = _Parser(source)
+    parser.pos = match.end()
+    if parser.peek() != '{':
+        raise parser.error('expected object literal')
+    start = parser.pos
+    state = {'quote': None, 'bare_keys': None}
+
+    def parse_field_value():
+        if state['quote'] is None and parser.peek() in '"\'`':
+            state['quote'] = parser.peek()
+        quote = parser.peek() if parser.peek() in '"\'`' else None
+        return parser.parse_value(), quote
+
+    def parse_block():
+        if parser.peek() != '{':
+            raise parser.error('expected object literal for type block')
+        fields = {}
+        for key, key_start, (value, quote), field_start, field_end in parser.parse_members(parse_field_value):
+            fields[key] = Field(key, value, key_start, field_start, field_end, quote)
+        return fields
+
+    blocks = {}
+    for key, key_start, fields, block_start, block_end in parser.parse_members(parse_block):
+        if state['bare_keys'] is None:
+            state['bare_keys'] = source[key_start] not in '"\''
+        blocks[key] = Block(key, key_start, block_start, block_end, fields)
+
+    return Document(source, match.group(1), start, parser.pos, blocks,
+                    state['quote'] or '"', bool(state['bare_keys']))
+
+
+def load_document(path, name=None):
+    """파일을 읽어 Document로 파싱"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return parse_document(f.read(), name)
+
+
+def load_literal(path, name):
+    """파일에서 `export const <name> = <리터럴>` 의 값만 파이썬 값으로 읽음 (배열 export 등, 필드 모델 없음)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        source = f.read()
+    for match in _EXPORT_RE.finditer(source):
+        if match.group(1) == name:
+            parser = _Parser(source)
+            parser.pos = match.end()
+            return parser.parse_value()
+    raise ParseError(f'export const {name} not found', source, 0)
+
+
+def encode_string(value, quote='"'):
+    """JSON.stringify와 같은 규칙으로 문자열 리터럴 생성"""
+    out = [quote]
+    for char in value:
+        if char == quote or char == '\\':
+            out.append('\\' + char)
+        elif char == '\n':
+            out.append('\\n')
+        elif char == '\t':
+            out.append('\\t')
+        elif char == '\r':
+            out.append('\\r')
+        elif char == '\b':
+            out.append('\\b')
+        elif char == '\f':
+            out.append('\\f')
+        elif char < ' ':
+            out.append(f'\\u{ord(char):04x}')
+        else:
+            out.append(char)
+    out.append(quote)
+    return ''.join(out)
+
+
+def encode_key(key, quote='"', bare=False):
+    if bare and _IDENT_RE.fullmatch(key):
+        return key
+    return encode_string(key, quote)
+
+
+def dump_value(value, indent='', quote='"', bare_keys=False):
+    """JSON.stringify(value, null, 2) 형식으로 값 직렬화 (indent는 현재 줄의 들여쓰기)"""
+    if isinstance(value, str):
+        return encode_string(value, quote)
+    if value is True:
+        return 'true'
+    if value is False:
+        return 'false'
+    if value is None:
+        return 'null'
+    if isinstance(value, (int, float)):
+        return repr(value)
+    inner = indent + '  '
+    if isinstance(value, (list, tuple)):
+        if not value:
+            return '[]'
+        items = [inner + dump_value(item, inner, quote, bare_keys) for item in value]
+        return '[\n' + ',\n'.join(items) + '\n' + indent + ']'
+    if isinstance(value, dict):
+        if not value:
+            return '{}'
+        items = [
+            inner + encode_key(str(key), quote, bare_keys) + ': ' + dump_value(item, inner, quote, bare_keys)
+            for key, item in value.items()
+        ]
+        return '{\n' + ',\n'.join(items) + '\n' + indent + '}'
+    raise TypeError(f'cannot serialize {type(value).__name__}')
+
+
+def iter_module(name, items, annotation='Record<string, any>', quote='"', bare_keys=False):
+    """`export const <name> = {...};` 모듈 텍스트를 (키, 값) 단위로 조금씩 생성
+
+    JSON.stringify(data, null, 2) 와 같은 모양이며, 항목을 하나씩 받아 바로 내보내므로
+    전체 데이터를 메모리에 모으지 않아도 됨
+    """
+    head = f'export const {name}: {annotation} = ' if annotation else f'export const {name} = '
+    first = True
+    for key, value in items:
+        yield (head + '{\n' if first else ',\n') + '  ' + encode_key(key, quote, bare_keys) + ': ' + dump_value(value, '  ', quote, bare_keys)
+        first = False
+    yield head + '{};\n' if first else '\n};\n'
@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+"""
+watch 모드 - 소스가 바뀔 때마다 바뀐 유형 블록만 다시 처리
+- 섹션 분할기와 블록별 처리 결과를 메모리에 유지
+- Linux inotify(ctypes)로 저장을 감지하고, 사용할 수 없으면 mtime 폴링으로 대체
+- 연달아 들어오는 저장 이벤트는 debounce 후 한 번에 처리
+- 출력은 내용이 바뀐 경우에만 임시 파일 + os.replace로 교체
+"""
+
+import ctypes
+import ctypes.util
+import hashlib
+import os
+import select
+import struct
+import time
+
+from peit_content.ingest import extract_details, read_blocks
+from peit_content.pipeline import POLITICAL_CODES, ValidationError, load_existing, process_block, validate_block
+from peit_content.tsliteral import iter_module
+from peit_content.writer import write_chunks_if_changed
+
+# <sys/inotify.h>
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_EVENT = struct.Struct('iIII')
+
+
+class InotifyWatcher:
+    """디렉터리 단위 inotify - 편집기가 임시 파일을 rename으로 저장해도 감지"""
+
+    def __init__(self, paths):
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self._targets = {}
+        self._dirs = {}
+        mask = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+        for path in paths:
+            directory, name = os.path.split(os.path.abspath(path))
+            if directory not in self._dirs.values():
+                wd = libc.inotify_add_watch(self._fd, directory.encode(), mask)
+                if wd < 0:
+                    os.close(self._fd)
+                    raise OSError(ctypes.get_errno(), f'inotify_add_watch failed: {directory}')
+                self._dirs[wd] = directory
+            self._targets[os.path.join(directory, name)] = path
+
+    def wait(self, timeout=None):
+        """감시 중인 파일이 바뀔 때까지 대기 → 바뀐 경로 집합 (timeout이면 빈 집합)"""
+        changed = set()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not changed:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            ready, _, _ = select.select([self._fd], [], [], remaining)
+            if not ready:
+                break
+            data = os.read(self._fd, 64 * 1024)
+            pos = 0
+            while pos < len(data):
+                wd, _, _, length = _IN_EVENT.unpack_from(data, pos)
+                pos += _IN_EVENT.size
+                name = data[pos:pos + length].rstrip(b'\0').decode('utf-8', 'replace')
+                pos += length
+                path = self._targets.get(os.path.join(self._dirs.get(wd, ''), name))
+                if path is not None:
+                    changed.add(path)
+        return changed
+
+    def close(self):
+        os.close(self._fd)
+
+
+class PollingWatcher:
+    """파일의 (mtime, 크기)를 주기적으로 비교"""
+
+    def __init__(self, paths, interval=0.25):
+        self.interval = interval
+        self._stats = {path: self._stat(path) for path in paths}
+
+    @staticmethod
+    def _stat(path):
+        try:
+            st = os.stat(path)
+            return st.st_mtime_ns, st.st_size
+        except FileNotFoundError:
+            return None
+
+    def wait(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            changed = set()
+            for path, old in self._stats.items():
+                new = self._stat(path)
+                if new != old:
+                    self._stats[path] = new
+                    changed.add(path)
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return changed
+            time.sleep(self.interval if deadline is None else min(self.interval, max(0.0, deadline - time.monotonic())))
+
+    def close(self):
+        pass
+
+
+def make_watcher(paths, poll=False, interval=0.25):
+    """inotify를 쓸 수 없으면 폴링으로 대체"""
+    if not poll:
+        try:
+            return InotifyWatcher(paths)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(paths, interval)
+
+
+def _block_digest(block):
+    h = hashlib.blake2b(digest_size=16)
+    h.update(block.name.encode('utf-8'))
+    h.update(b'\0')
+    h.update(block.text.encode('utf-8'))
+    return h.hexdigest()
+
+
+class WatchSession:
+    """소스 블록 다이제스트 → 처리 결과 캐시를 유지하며 출력을 갱신"""
+
+    def __init__(self, source, output, clean=True, split_dir=None, results_output=None,
+                 base_path=None, log=print):
+        self.source = source
+        self.output = output
+        self.clean = clean
+        self.split_dir = split_dir
+        self.results_output = results_output
+        self.base_path = base_path
+        self.log = log
+        self.blocks = {}
+        self.base_doc = None
+        # 마지막으로 기록된 출력 - 값이 있던 필드가 비게 되는 변경은 쓰지 않음
+        self.existing = None
+
+    def paths(self):
+        paths = [self.source]
+        if self.results_output and self.base_path:
+            paths.append(self.base_path)
+        return paths
+
+    def _process(self):
+        """소스를 다시 읽어 바뀐 블록만 처리 → (유형 코드 순서, 다시 처리한 코드들, 오류)"""
+        order = []
+        changed = []
+        errors = []
+        blocks = {}
+        if self.existing is None:
+            self.existing = load_existing(self.output)
+        for block in read_blocks(self.source):
+            if block.code in blocks:
+                errors.append(f'{block.code}: 중복된 유형 블록')
+                continue
+            digest = _block_digest(block)
+            cached = self.blocks.get(block.code)
+            if cached is None or cached[0] != digest:
+                data = process_block(block.code, extract_details(block), self.clean)
+                block_errors, _ = validate_block(block.code, data, self.existing.get(block.code))
+                cached = (digest, data, block_errors)
+                changed.append(block.code)
+            blocks[block.code] = cached
+            order.append(block.code)
+            errors.extend(cached[2])
+        missing = [code for code in POLITICAL_CODES if code not in blocks]
+        if missing:
+            errors.append('누락된 유형: ' + ', '.join(missing))
+        removed = [code for code in self.blocks if code not in blocks]
+        self.blocks = blocks
+        return order, changed + removed, errors
+
+    def update(self, changed_paths=None):
+        """변경 하나를 처리 → 검증 통과 여부"""
+        start = time.perf_counter()
+        order, changed, errors = self._process()
+        if errors:
+            self.log("검증 실패 - 파일을 쓰지 않았습니다:")
+            for error in errors:
+                self.log(f"  {error}")
+            return False
+
+        details = {code: self.blocks[code][1] for code in order}
+        written = []
+        if changed or not os.path.exists(self.output):
+            if write_chunks_if_changed(self.output, iter_module('politicalDetails', details.items())):
+                written.append(self.output)
+        self.existing = details
+
+        if self.split_dir:
+            from peit_content.split import emit_split
+            written.extend(emit_split(self.split_dir, details.items(), self.output))
+
+        if self.results_output:
+            from peit_content.paths import RESULTS_BASE_NAME
+            from peit_content.results import write_results
+            from peit_content.tsliteral import load_document
+            if self.base_doc is None or (changed_paths and self.base_path in changed_paths):
+                self.base_doc = load_document(self.base_path, RESULTS_BASE_NAME)
+            if write_results(self.results_output, self.base_doc, details):
+                written.append(self.results_output)
+
+        elapsed = (time.perf_counter() - start) * 1000
+        reprocessed = ', '.join(changed) if changed else '없음'
+        self.log(f"[{time.strftime('%H:%M:%S')}] 다시 처리: {reprocessed} / "
+                 f"기록: {', '.join(written) if written else '없음'} ({elapsed:.0f} ms)")
+        return True
+
+
+def watch(session, debounce=0.15, poll=False, interval=0.25, log=print):
+    """Ctrl+C까지 소스 변경을 감시하며 session.update 실행"""
+    try:
+        session.update()
+    except (OSError, ValidationError) as e:
+        log(f"초기 처리 실패: {e}")
+    watcher = make_watcher(session.paths(), poll, interval)
+    log(f"감시 중 ({type(watcher).__name__}): {', '.join(session.paths())}")
+    try:
+        while True:
+            changed = watcher.wait()
+            # 연달아 오는 저장 이벤트는 조용해질 때까지 모음
+            while True:
+                more = watcher.wait(debounce)
+                if not more:
+                    break
+                changed |= more
+            try:
+                session.update(changed)
+            except OSError as e:
+                log(f"처리 실패: {e}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+출력 파일 쓰기
+- 새 내용이 기존 바이트와 같으면 쓰지 않음 (dev 서버 HMR / next build 재컴파일 방지)
+- 다르면 같은 디렉터리의 임시 파일에 쓴 뒤 os.replace로 원자적으로 교체
+  (임시 파일 이름은 mkstemp로 매번 달라 watch와 수동 emit이 동시에 써도 서로 덮지 않음,
+   기존 파일의 권한 비트는 유지하고 새 파일은 umask 기본 권한)
+"""
+
+import filecmp
+import os
+import shutil
+import stat
+import tempfile
+
+
+def _same_bytes(path, data):
+    try:
+        if os.path.getsize(path) != len(data):
+            return False
+        with open(path, 'rb') as f:
+            return f.read() == data
+    except FileNotFoundError:
+        return False
+
+
+def _temp_file(path):
+    """path와 같은 디렉터리의 새 임시 파일 → (fd, 임시 경로)"""
+    directory, name = os.path.split(path)
+    return tempfile.mkstemp(prefix=f'.{name}.', suffix='.tmp', dir=directory or '.')
+
+
+def _replace(tmp_path, path):
+    """권한 비트를 맞춘 뒤 임시 파일로 path를 교체 (mkstemp는 0600으로 만듦)"""
+    try:
+        shutil.copymode(path, tmp_path)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_path, (stat.S_IRUSR | stat.S_IWUSR | stat.S_IRGRP | stat.S_IWGRP
+                            | stat.S_IROTH | stat.S_IWOTH) & ~umask)
+    os.replace(tmp_path, path)
+
+
+def write_if_changed(path, text):
+    """텍스트 전체를 비교 후 필요할 때만 기록 → 기록했으면 True"""
+    data = text.encode('utf-8')
+    if _same_bytes(path, data):
+        return False
+    fd, tmp_path = _temp_file(path)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        _replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return True
+
+
+def write_chunks_if_changed(path, chunks):
+    """조각 단위로 생성되는 텍스트를 임시 파일에 이어 쓴 뒤 비교 후 교체 → 기록했으면 True
+
+    chunks 생성 중에 예외가 나면 기존 파일은 건드리지 않음
+    """
+    fd, tmp_path = _temp_file(path)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            for chunk in chunks:
+                f.write(chunk)
+        if os.path.exists(path) and filecmp.cmp(tmp_path, path, shallow=False):
+            return False
+        _replace(tmp_path, path)
+        return True
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
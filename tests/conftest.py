@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+# 테스트용 글꼴에 넣는 글자 (카드/서브셋 테스트에서 쓰는 것만)
+FONT_TEXT = ''.join(chr(cp) for cp in range(0x20, 0x7F)) + '급진적자유주의자진보당신의정치경제좌표·'
+
+
+def make_font(path, text=FONT_TEXT):
+    """글자마다 사각형 글리프 하나씩 있는 작은 TrueType 글꼴"""
+    from fontTools.fontBuilder import FontBuilder
+    from fontTools.pens.ttGlyphPen import TTGlyphPen
+
+    chars = sorted(set(text))
+    names = ['.notdef'] + [f'uni{ord(char):04X}' for char in chars]
+    builder = FontBuilder(1000, isTTF=True)
+    builder.setupGlyphOrder(names)
+    builder.setupCharacterMap({ord(char): name for char, name in zip(chars, names[1:])})
+    glyphs = {}
+    for name in names:
+        pen = TTGlyphPen(None)
+        pen.moveTo((100, 0))
+        pen.lineTo((100, 700))
+        pen.lineTo((500, 700))
+        pen.lineTo((500, 0))
+        pen.closePath()
+        glyphs[name] = pen.glyph()
+    builder.setupGlyf(glyphs)
+    builder.setupHorizontalMetrics({name: (600, 100) for name in names})
+    builder.setupHorizontalHeader(ascent=800, descent=-200)
+    builder.setupNameTable({'familyName': 'Pretendard', 'styleName': 'Regular'})
+    builder.setupOS2()
+    builder.setupPost()
+    builder.save(str(path))
+
+
+@pytest.fixture
+def font_dir(tmp_path):
+    """Pretendard 9개 굵기 자리에 테스트용 글꼴을 둔 디렉터리"""
+    pytest.importorskip('fontTools')
+    from peit_content.fonts import FONT_FAMILY, WEIGHT_NAMES
+
+    directory = tmp_path / 'fonts'
+    directory.mkdir()
+    for weight_name in WEIGHT_NAMES.values():
+        make_font(directory / f'{FONT_FAMILY}-{weight_name}.ttf')
+    return str(directory)
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+import os
+import random
+
+import numpy as np
+import pytest
+
+from peit_content.answer_store import (WORDS, AnswerStore, answer_counts, iter_scores, parse_timestamp,
+                                       unpack_choices)
+from peit_content.scoring import Scorer
+
+QUESTIONS = [q for word in WORDS for q in word]
+
+
+def random_records(count, seed=1):
+    rng = random.Random(seed)
+    records = []
+    for i in range(count):
+        answers = {f'q{q}': rng.choice('AB') for q in QUESTIONS if rng.random() < 0.9}
+        records.append((answers, 1700000000 + i, rng.choice(['both', 'political', 'economic', None])))
+    return records
+
+
+def choice_row(answers):
+    return [{'A': 1, 'B': 2}.get(answers.get(f'q{q}'), 0) for q in QUESTIONS]
+
+
+def test_round_trip_through_chunks(tmp_path):
+    records = random_records(50)
+    store = AnswerStore(str(tmp_path))
+    assert store.append(records[:30]) == 30
+    # 다시 열어 이어서 덧붙임
+    store = AnswerStore(str(tmp_path))
+    assert store.append(records[30:]) == 20
+
+    store = AnswerStore(str(tmp_path))
+    assert store.count == 50
+    chunks = list(store.iter_chunks(rows=16))
+    assert [chunk[0] for chunk in chunks] == [0, 16, 32, 48]
+    choices = np.concatenate([unpack_choices(answers, answered, QUESTIONS) for _, answers, answered, _, _ in chunks])
+    assert choices.tolist() == [choice_row(answers) for answers, _, _ in records]
+    assert store.column('timestamp').tolist() == [parse_timestamp(t) for _, t, _ in records]
+    assert store.column('test_type').tolist() == [{'political': 1, 'economic': 2}.get(t, 0) for _, _, t in records]
+    # meta.json은 고유 임시 파일을 거쳐 교체되고 남는 파일이 없음
+    assert sorted(os.listdir(str(tmp_path))) == ['answered.u64', 'answers.u64', 'meta.json', 'test_type.u8', 'timestamp.i64']
+
+
+def test_iter_scores_matches_scorer(tmp_path):
+    records = random_records(40, seed=2)
+    store = AnswerStore(str(tmp_path))
+    store.append(records)
+    scorer = Scorer.from_file()
+    political, economic, tallies = scorer.score([answers for answers, _, _ in records])
+    chunks = list(iter_scores(store, scorer, rows=7))
+    assert np.array_equal(np.concatenate([chunk[3] for chunk in chunks]), tallies)
+    assert list(np.concatenate([chunk[1] for chunk in chunks])) == list(political)
+    assert list(np.concatenate([chunk[2] for chunk in chunks])) == list(economic)
+
+
+def test_last_answer_wins_and_unknown_keys_are_dropped(tmp_path):
+    store = AnswerStore(str(tmp_path))
+    store.append([({'q1': 'A', 'q01': 'B', 'q70': 'A', 'foo': 'B', 'q2': 'C', 'q69': 'B'}, None, 'both')])
+    _, answers, answered, _, _ = next(store.iter_chunks())
+    row = unpack_choices(answers, answered, [1, 2, 69, 70])[0]
+    assert row.tolist() == [2, 0, 2, 0]
+    counts = answer_counts(store)
+    assert counts[1] == (1, 1) and counts[2] == (0, 0)
+
+
+def test_uncommitted_tail_is_ignored_and_truncated(tmp_path):
+    store = AnswerStore(str(tmp_path))
+    store.append(random_records(3))
+    # meta.json을 갱신하기 전에 중단된 append 흉내
+    with open(os.path.join(str(tmp_path), 'answers.u64'), 'ab') as f:
+        f.write(b'\xff' * 11)
+    store = AnswerStore(str(tmp_path))
+    assert store.column('answers').shape == (3, len(WORDS))
+    store.append(random_records(2, seed=3))
+    assert os.path.getsize(os.path.join(str(tmp_path), 'answers.u64')) == 5 * 8 * len(WORDS)
+    assert AnswerStore(str(tmp_path)).count == 5
+
+
+@pytest.mark.parametrize('value, ms', [
+    (None, 0), ('', 0), (1700000000, 1700000000000), (1700000000123, 1700000000123),
+    ('2023-11-14T22:13:20Z', 1700000000000),
+])
+def test_parse_timestamp(value, ms):
+    assert parse_timestamp(value) == ms
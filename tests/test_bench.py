@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+import os
+
+from peit_content.bench import compare, corpus_key, lengthen_line, write_corpus
+from peit_content.ingest import ingest
+
+
+def test_compare_ignores_jitter_below_min_delta():
+    baseline = {'1': {'fixups': {'seconds': 0.0001}}, '16': {'ingest': {'seconds': 0.3}}}
+    report = {'1': {'fixups': {'seconds': 0.0009}}, '16': {'ingest': {'seconds': 0.6}}}
+    assert compare(report, baseline) == [('16', 'ingest', 0.3, 0.6)]
+    assert compare(report, baseline, min_delta=0) == [('1', 'fixups', 0.0001, 0.0009), ('16', 'ingest', 0.3, 0.6)]
+
+
+def test_lengthen_line_keeps_short_lines_and_markers():
+    assert lengthen_line('\t•\t강점 (Strengths)', 8) == '\t•\t강점 (Strengths)'
+    line = '한 줄 요약: ' + '아주 긴 본문 문장이 이어지며 내용을 설명합니다. ' * 3
+    longer = lengthen_line(line, 4)
+    assert longer.startswith(line)
+    assert longer.count('한 줄 요약:') == 1
+    assert 3 * len(line) <= len(longer) <= 5 * len(line)
+
+
+def test_fields_corpus_keeps_types_and_sections(tmp_path):
+    types = str(tmp_path / 'types.txt')
+    fields = str(tmp_path / 'fields.txt')
+    write_corpus(types, 1)
+    write_corpus(fields, 4, mode='fields')
+    original = dict(ingest(types))
+    scaled = dict(ingest(fields))
+    assert list(original) == list(scaled)
+    for code, data in original.items():
+        assert set(scaled[code]) == set(data)
+    assert os.path.getsize(fields) > 2 * os.path.getsize(types)
+    assert corpus_key(4, 'fields') == 'fields-4' and corpus_key(4) == '4'
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+
+import pytest
+
+from peit_content.cards import SIZES, build_cards, find_fonts, iter_cards_module
+from peit_content.paths import RESULTS_OUTPUT_PATH
+from peit_content.tsliteral import load_document, parse_document
+
+Image = pytest.importorskip('PIL.Image')
+
+CODES = ['IPAS', 'GVE']
+
+
+def results_doc(**changes):
+    """실제 결과 모듈에서 유형 두 개만 뽑은 문서 (changes: 유형 코드 → 바꿀 필드)"""
+    source = load_document(RESULTS_OUTPUT_PATH, 'results')
+    items = []
+    for code in CODES:
+        data = source.data(code)
+        data = {name: data[name] for name in ('name', 'category', 'keywords')}
+        data.update(changes.get(code, {}))
+        items.append(f'  {json.dumps(code)}: {json.dumps(data, ensure_ascii=False)}')
+    return parse_document('export const results = {\n' + ',\n'.join(items) + '\n};\n', 'results')
+
+
+def test_cards_are_rendered_and_reused(tmp_path, font_dir):
+    out_dir = str(tmp_path / 'public' / 'cards')
+    cache_path = str(tmp_path / 'cards.json')
+    items, rebuilt = build_cards(results_doc(), out_dir, font_dir, cache_path)
+    assert rebuilt == 2
+    assert [code for code, _ in items] == CODES
+    files = sorted(os.listdir(out_dir))
+    assert len(files) == len(CODES) * len(SIZES) * 2
+    for name in files:
+        code, size_name = name.split('.')[0].split('-')
+        with Image.open(os.path.join(out_dir, name)) as image:
+            assert image.size == SIZES[size_name]
+    urls = dict(items)['IPAS']
+    assert set(urls) == set(SIZES) and set(urls['og']) == {'png', 'webp'}
+    assert os.path.basename(urls['square']['png']) in files
+
+    # 입력이 같으면 다시 그리지 않음
+    assert build_cards(results_doc(), out_dir, font_dir, cache_path) == (items, 0)
+
+    # 바뀐 유형만 다시 그리고 이전 카드는 삭제
+    changed, rebuilt = build_cards(results_doc(IPAS={'keywords': ['자유']}), out_dir, font_dir, cache_path)
+    assert rebuilt == 1
+    assert dict(changed)['GVE'] == dict(items)['GVE']
+    assert dict(changed)['IPAS'] != urls
+    assert len(os.listdir(out_dir)) == len(files)
+    assert 'export const cards' in ''.join(iter_cards_module(changed))
+
+
+def test_missing_font(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        find_fonts(str(tmp_path))
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+import shutil
+
+from peit_content import api
+from peit_content.cleanup import Target, run_cleanup
+from peit_content.paths import RESULTS_BASE_NAME, RESULTS_BASE_PATH, SOURCE_PATH
+from peit_content.pipeline import build
+
+
+def clean_copies(tmp_path, jobs):
+    """정리 전 상세 파일과 경제 유형 파일 사본을 jobs개 프로세스로 정리 → 결과 바이트"""
+    directory = tmp_path / f'jobs{jobs}'
+    directory.mkdir()
+    details = directory / 'political_details.ts'
+    results = directory / 'results_base.ts'
+    shutil.copy(str(tmp_path / 'raw.ts'), str(details))
+    shutil.copy(RESULTS_BASE_PATH, str(results))
+    targets = [
+        Target(str(details), None, ['political'], str(directory / 'political.manifest')),
+        Target(str(results), RESULTS_BASE_NAME, ['economic'], str(directory / 'results.manifest')),
+    ]
+    run_cleanup('clean', targets, api.CLEAN_FIELDS, 'rules', jobs=jobs, full=True)
+    return details.read_bytes(), results.read_bytes()
+
+
+def test_jobs_produce_identical_output(tmp_path):
+    raw = tmp_path / 'raw.ts'
+    build(SOURCE_PATH, str(raw), clean=False, log=lambda *args: None)
+    serial = clean_copies(tmp_path, 1)
+    assert serial[0] != raw.read_bytes()
+    assert clean_copies(tmp_path, 4) == serial
+
+
+def test_clean_api_jobs(tmp_path):
+    raw = tmp_path / 'raw.ts'
+    build(SOURCE_PATH, str(raw), clean=False, log=lambda *args: None)
+    doc = api.load(str(raw))
+    assert api.emit(api.clean(doc, jobs=4)) == api.emit(api.clean(doc))
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+from peit_content import api
+from peit_content.dedupe import dedupe_block, find_duplicates, iter_sentences, normalize_sentence
+
+REPEAT = '당신은 안정적인 조직보다 변화를 만드는 자리에서 빛납니다.'
+OTHER = '투자에서도 공격적인 성향이 드러나는 편입니다.'
+
+
+def test_first_occurrence_is_kept():
+    data = {
+        'name': '급진적 자유주의자',
+        'summary': REPEAT,
+        'career_value': f'{REPEAT} 그래서 창업이 잘 맞습니다, 그렇지 않나요?',
+        'money_value': f'**{REPEAT[:-1]}**!\n\n{OTHER}',
+        'strengths': [f'- {REPEAT}', '결단력: 빠른 결정을 내리는 능력이 있습니다.'],
+    }
+    changed, repeats = dedupe_block(data)
+    # 요약 필드는 비교하지 않고, 처음 나온 career_value에만 남김
+    assert 'career_value' not in changed
+    assert changed['money_value'] == OTHER
+    # 문장이 모두 빠진 배열 항목은 삭제
+    assert changed['strengths'] == ['결단력: 빠른 결정을 내리는 능력이 있습니다.']
+    assert [(name, first) for name, first, _ in repeats] == [
+        ('money_value', 'career_value'), ('strengths', 'career_value')]
+
+
+def test_field_order_decides_the_first_occurrence():
+    data = {'career_value': REPEAT, 'money_value': REPEAT}
+    assert dedupe_block(data)[0] == {'money_value': ''}
+    assert dedupe_block(data, ['money_value', 'career_value'])[0] == {'career_value': ''}
+
+
+def test_repeats_within_a_field_and_short_sentences_are_kept():
+    data = {'career_value': f'{REPEAT} {REPEAT}', 'money_value': '좋은 게 좋은 거지. 끝.'}
+    data['love_value'] = data['money_value']
+    assert dedupe_block(data) == ({}, [])
+
+
+def test_sentence_split_and_normalize():
+    text = '"이건 문제야!"라며 회의 중에 화를 내곤 합니다. 짧은 문장. 수익률이 3.5배 올랐다고 자랑하는 편입니다!'
+    assert [key for _, _, key in iter_sentences(text)] == [
+        '"이건 문제야!"라며 회의 중에 화를 내곤 합니다', '수익률이 3.5배 올랐다고 자랑하는 편입니다']
+    assert normalize_sentence('  • **Bold**  text.. ') == 'bold text'
+
+
+def test_document_dedupe_reports_codes():
+    doc = api.parse('export const politicalDetails = {\n'
+                    f'  "IPAS": {{"career_value": "{REPEAT}", "money_value": "{REPEAT} {OTHER}"}},\n'
+                    f'  "IPAE": {{"career_value": "{REPEAT}"}}\n'
+                    '};\n')
+    result, report = api.dedupe(doc)
+    assert result.get('IPAS', 'money_value') == OTHER
+    assert doc.get('IPAS', 'money_value') == f'{REPEAT} {OTHER}'
+    assert report == [('IPAS', 'money_value', 'career_value', REPEAT)]
+    assert find_duplicates([(code, result.data(code)) for code in result]) == []
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+from itertools import product
+
+import numpy as np
+import pytest
+
+from peit_content.distribution import (PAIRS, axis_tables, empirical_priors, iter_percentiles_module,
+                                       pair_distribution, percentile_tables, uniform_priors)
+from peit_content.paths import PERCENTILES_OUTPUT_PATH
+from peit_content.scoring import load_mapping
+
+MAPPING = {
+    1: {'A': 'I', 'B': 'C'},
+    2: {'A': 'C', 'B': 'I'},
+    3: {'A': 'I', 'B': 'P'},
+    4: {'A': 'P', 'B': 'T'},
+}
+
+
+def brute_force(mapping, front, back, priors):
+    """모든 응답 조합을 나열한 결합 분포"""
+    counts = {}
+    questions = sorted(mapping)
+    for answers in product('AB', repeat=len(questions)):
+        p = 1.0
+        x = y = 0
+        for q, answer in zip(questions, answers):
+            p *= priors[q] if answer == 'A' else 1 - priors[q]
+            x += mapping[q][answer] == front
+            y += mapping[q][answer] == back
+        counts[x, y] = counts.get((x, y), 0.0) + p
+    return counts
+
+
+@pytest.mark.parametrize('priors', [uniform_priors(MAPPING), {1: 0.9, 2: 0.3, 3: 0.75, 4: 0.1}])
+def test_pair_distribution_is_exact(priors):
+    pmf = pair_distribution(MAPPING, 'I', 'C', priors)
+    expected = brute_force(MAPPING, 'I', 'C', priors)
+    # 4번 문항은 I/C 어느 쪽에도 점수를 주지 않아 건너뜀
+    assert pmf.shape == (4, 4)
+    for (x, y), p in np.ndenumerate(pmf):
+        assert p == pytest.approx(expected.get((x, y), 0.0))
+
+
+@pytest.mark.parametrize('skewed', [False, True])
+def test_tables_sum_to_one(skewed):
+    mapping = load_mapping()
+    priors = uniform_priors(mapping)
+    if skewed:
+        priors = empirical_priors(mapping, {q: (10, q % 10) for q in mapping})
+    for front, back in PAIRS:
+        pmf = pair_distribution(mapping, front, back, priors)
+        assert pmf.sum() == pytest.approx(1.0)
+        front_table, back_table = axis_tables(pmf)
+        for table, marginal in ((front_table, pmf.sum(axis=1)), (back_table, pmf.sum(axis=0))):
+            assert marginal.sum() == pytest.approx(1.0)
+            # 백분위 = 아래 비율 + 같은 비율의 절반 → 마지막 점수에서 나머지 절반을 더하면 100
+            below = np.concatenate([[0.0], np.cumsum(marginal)[:-1]])
+            assert table['percentile'] == pytest.approx(list(100 * (below + marginal / 2)), abs=0.05)
+            assert table['percentile'][-1] + 50 * marginal[-1] == pytest.approx(100, abs=0.05)
+            assert table['percentile'] == sorted(table['percentile'])
+
+
+def test_strength_is_null_when_letter_cannot_win():
+    front_table, back_table = axis_tables(pair_distribution(MAPPING, 'I', 'C', uniform_priors(MAPPING)))
+    # I 0점이면 C는 2점 - I는 이길 수 없음
+    assert front_table['strength'][0] is None
+    # C 0점이면 I는 2점 이상, C 2점이면 I는 1점 이하 (동점은 뒤 축 C가 가져감)
+    assert back_table['strength'][0] is None
+    assert back_table['strength'][2] is not None
+
+
+def test_generated_percentiles_are_current():
+    mapping = load_mapping()
+    tables = {'uniform': percentile_tables(mapping, uniform_priors(mapping))}
+    with open(PERCENTILES_OUTPUT_PATH, encoding='utf-8') as f:
+        assert f.read() == ''.join(iter_percentiles_module(tables))
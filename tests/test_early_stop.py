@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from peit_content.early_stop import display_orders, iter_early_stop_module, load_axis_order, load_tables
+from peit_content.paths import EARLY_STOP_OUTPUT_PATH, ORDER_PATH
+from peit_content.tsliteral import ParseError
+
+QUESTIONS = [
+    {'id': 1, 'category': 'political', 'axis': 'I/C'},
+    {'id': 2, 'category': 'political', 'axis': 'I/C'},
+    {'id': 3, 'category': 'political', 'axis': 'P/T'},
+    {'id': 4, 'category': 'economic', 'axis': 'V/A'},
+    {'id': 5, 'category': 'economic', 'axis': 'G/S'},
+    {'id': 6, 'category': 'economic', 'axis': 'G/S'},
+]
+
+
+def test_axis_order_is_read_from_order_ts():
+    assert load_axis_order(ORDER_PATH) == {
+        'political': ['I/C', 'P/T', 'A/U', 'E/S'],
+        'economic': ['G/S', 'V/A', 'E/W'],
+    }
+
+
+def test_display_orders_follow_axis_order(tmp_path):
+    with open(ORDER_PATH, encoding='utf-8') as f:
+        source = f.read()
+    path = tmp_path / 'order.ts'
+    path.write_text(source.replace("['G/S', 'V/A', 'E/W']", "['V/A', 'G/S', 'E/W']"), encoding='utf-8')
+    assert display_orders(QUESTIONS, load_axis_order(ORDER_PATH)) == {
+        'political': [1, 3, 2], 'economic': [5, 4, 6], 'both': [1, 3, 2, 5, 4, 6]}
+    assert display_orders(QUESTIONS, load_axis_order(str(path)))['economic'] == [4, 5, 6]
+
+
+def test_missing_axis_order(tmp_path):
+    path = tmp_path / 'order.ts'
+    path.write_text('export const DISPLAY_ORDER = {};\n', encoding='utf-8')
+    with pytest.raises(ParseError):
+        load_axis_order(str(path))
+
+
+def test_generated_tables_are_current():
+    _, orders, tables = load_tables()
+    for test_type, rules in tables.items():
+        asked = [q for rule in rules for q, _, _ in rule['questions']]
+        assert sorted(asked) == sorted(orders[test_type])
+    with open(EARLY_STOP_OUTPUT_PATH, encoding='utf-8') as f:
+        assert f.read() == ''.join(iter_early_stop_module(tables))
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from peit_content.editbuffer import EditBuffer, OverlapError
+
+
+def test_edits_apply_in_position_order():
+    buffer = EditBuffer('0123456789')
+    buffer.replace(6, 8, 'xy')
+    buffer.delete(0, 2)
+    buffer.insert(4, '-')
+    assert list(buffer) == [(0, 2, ''), (4, 4, '-'), (6, 8, 'xy')]
+    assert buffer.render() == '23-45xy89'
+    assert buffer.result_length() == len(buffer.render())
+    assert ''.join(buffer.pieces()) == buffer.render()
+
+
+def test_adjacent_edits_are_allowed():
+    buffer = EditBuffer('abcdef')
+    buffer.replace(2, 4, 'X')
+    buffer.replace(0, 2, 'Y')
+    buffer.replace(4, 6, 'Z')
+    # 바뀐 구간의 바로 뒤 삽입도 맞닿는 편집
+    buffer.insert(6, '!')
+    assert buffer.render() == 'YXZ!'
+
+
+@pytest.mark.parametrize('first, second', [
+    ((2, 5), (4, 6)),
+    ((2, 5), (0, 3)),
+    ((2, 5), (3, 4)),
+    ((3, 4), (2, 5)),
+    ((2, 5), (2, 5)),
+    ((3, 3), (3, 3)),
+    ((3, 6), (3, 3)),
+    ((4, 4), (3, 6)),
+])
+def test_overlapping_edits_are_rejected(first, second):
+    buffer = EditBuffer('0123456789')
+    buffer.replace(*first, 'a')
+    with pytest.raises(OverlapError) as info:
+        buffer.replace(*second, 'b')
+    assert info.value.span == second and info.value.other == first
+    # 거부된 편집은 기록되지 않음
+    assert list(buffer) == [first + ('a',)]
+
+
+def test_out_of_range_edits():
+    buffer = EditBuffer('abc')
+    for start, end in [(-1, 1), (2, 1), (0, 4)]:
+        with pytest.raises(IndexError):
+            buffer.replace(start, end, '')
+    assert buffer.render() is buffer.source
+    assert list(buffer.pieces()) == ['abc']
+
+
+def test_empty_source_and_full_delete():
+    buffer = EditBuffer('abc')
+    buffer.delete(0, 3)
+    assert buffer.render() == '' and list(buffer.pieces()) == []
+    empty = EditBuffer('')
+    empty.insert(0, 'x')
+    assert empty.render() == 'x'
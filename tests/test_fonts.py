@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+import os
+
+import pytest
+
+from peit_content.fonts import ALWAYS, build_fonts, find_font, font_face_css, iter_corpus, scan_corpus, unicode_ranges
+
+
+def write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    return path
+
+
+def test_scan_corpus(tmp_path):
+    page = write(str(tmp_path / 'app' / 'page.tsx'),
+                 '<p className="md:font-bold text-sm">급진적</p>\n<i className="font-fancy">x</i>\n')
+    css = write(str(tmp_path / 'app' / 'globals.css'),
+                "@font-face { font-family: 'Pretendard'; font-weight: 900; }\nh1 { font-weight: 600; }\n")
+    codepoints, weights = scan_corpus([page, css])
+    # @font-face 선언의 굵기와 없는 클래스는 세지 않음
+    assert weights == {400, 600, 700}
+    assert {ord(char) for char in '급진적'} <= codepoints and ALWAYS <= codepoints
+    assert ord('\n') not in codepoints
+
+
+def test_iter_corpus_skips_hidden_and_generated(tmp_path):
+    root = tmp_path / 'lib'
+    write(str(root / 'a.ts'), '')
+    write(str(root / 'b.json'), '')
+    write(str(root / '.cache' / 'c.ts'), '')
+    write(str(root / 'generated' / 'd.ts'), '')
+    write(str(root / 'sub' / 'e.tsx'), '')
+    paths = list(iter_corpus([str(root)], skip=[str(root / 'generated')]))
+    assert paths == [str(root / 'a.ts'), str(root / 'sub' / 'e.tsx')]
+
+
+def test_unicode_ranges():
+    assert unicode_ranges({0x41, 0x42, 0x43, 0xAC00, 0xAC02}) == 'U+41-43, U+AC00, U+AC02'
+
+
+def test_subsets_keep_only_corpus_glyphs(tmp_path, font_dir):
+    from fontTools.ttLib import TTFont
+
+    out_dir = str(tmp_path / 'public' / 'fonts')
+    cache_path = str(tmp_path / 'fonts.json')
+    page = write(str(tmp_path / 'app' / 'page.tsx'), '<b className="font-bold">진보</b>\n')
+    items, codepoints, rebuilt = build_fonts([page], font_dir, out_dir, cache_path)
+    assert rebuilt == 2 and [weight for weight, _ in items] == [400, 700]
+    for _, entry in items:
+        path, = entry['files']
+        assert path.endswith('.woff2') and entry['size'] < entry['source_size']
+        cmap = TTFont(path).getBestCmap()
+        assert {ord('진'), ord('보'), ord('A')} <= set(cmap)
+        assert ord('급') not in cmap
+    css = font_face_css(items, codepoints)
+    assert css.count('@font-face') == 2 and "font-weight: 700;" in css
+
+    # 글자 집합이 같으면 다시 만들지 않음
+    assert build_fonts([page], font_dir, out_dir, cache_path) == (items, codepoints, 0)
+
+    # 글자가 늘면 다시 만들고 이전 서브셋은 삭제
+    write(page, '<b className="font-bold">급진</b>\n')
+    changed, _, rebuilt = build_fonts([page], font_dir, out_dir, cache_path)
+    assert rebuilt == 2
+    assert sorted(os.listdir(out_dir)) == sorted(os.path.basename(entry['files'][0]) for _, entry in changed)
+
+
+def test_missing_weight(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        find_font('Regular', str(tmp_path))
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+import io
+
+from peit_content.ingest import extract_details, ingest, iter_blocks
+
+SOURCE = '''IPAS → 급진적 자유주의자 (Radical Liberal)
+\t•\t#마이웨이 #급진적개혁
+\t•\t한 줄 요약: 판을 흔드는 사람
+\t•\t종합 정치 스펙트럼: 중도 (급진적)
+\t◦\t'중도(급진적)'란?
+\t•\t제3의 길을 추구하는 성향입니다.
+\t•\t당신은 이런 사람입니다 (상세 설명):미지근한 것을 견디지 못합니다.
+강점과 약점
+\t•\t✅ 강점 (Strengths)
+\t1\t추진력: 해결하려는 의지
+\t2\t결단력: 빠른 결정
+\t•\t⚠️ 약점 (Weaknesses)
+\t1\t독단성: 의견을 무시함
+\t•\t'당신의 화법'
+\t▪\t💔 최악의 갈등 상대: CTUE (중도 보수주의자)왜 갈등하는가? 속도가 다릅니다.
+돈과 일에 대한 태도
+\t•\t💼 직업적 가치관:변화 없는 조직은 무덤입니다.
+\t•\t💰 잠재적 재무 스타일:공격적인 투자
+개인적 성장과 자기계발
+\t•\t🌱 성장 방향성당신의 추진력은 강합니다.
+\t•\t🎯 핵심 성장 과제: '과정'의 가치를 존중하기
+\t•\t🏆 성장의 최종 목표모두를 설득하는 개혁가
+
+IPAE → 진보적 자유주의자
+한 줄 요약: 점진적인 변화
+IPAE → 진보적 자유주의자
+종합 정치 스펙트럼: 진보 (좌파) 성향
+'''
+
+
+def test_blocks_split_at_headers():
+    blocks = list(iter_blocks(io.StringIO(SOURCE)))
+    assert [(b.code, b.name, b.line_no) for b in blocks] == [
+        ('IPAS', '급진적 자유주의자 (Radical Liberal)', 1),
+        ('IPAE', '진보적 자유주의자', 24),
+    ]
+    # 같은 코드의 머리줄이 다시 나오면 이어지는 본문
+    assert blocks[1].lines == ['한 줄 요약: 점진적인 변화', '종합 정치 스펙트럼: 진보 (좌파) 성향']
+
+
+def test_extract_details():
+    data = extract_details(next(iter_blocks(io.StringIO(SOURCE))))
+    assert data['keywords'] == ['마이웨이', '급진적개혁']
+    assert data['summary'] == '판을 흔드는 사람'
+    assert data['political_spectrum'] == '중도 (급진적)'
+    assert data['political_spectrum_detail'] == '•\t제3의 길을 추구하는 성향입니다.'
+    assert data['detailed_description'] == '미지근한 것을 견디지 못합니다.'
+    assert data['strengths'] == ['추진력: 해결하려는 의지', '결단력: 빠른 결정']
+    assert data['weaknesses'][0] == '독단성: 의견을 무시함'
+    assert data['growth_task'] == "'과정'의 가치를 존중하기"
+    assert data['final_goal'] == '성장의 최종 목표모두를 설득하는 개혁가'
+
+
+def test_inline_heading_keeps_content():
+    data = extract_details(next(iter_blocks(io.StringIO(SOURCE))))
+    # 소제목 줄에 본문이 이어 붙어 있어도 그 줄부터 잡음
+    assert data['worst_partner'] == '최악의 갈등 상대: CTUE (중도 보수주의자)왜 갈등하는가? 속도가 다릅니다.'
+    assert data['career_value'] == '직업적 가치관:변화 없는 조직은 무덤입니다.'
+
+
+def test_ingest_reads_file_and_offsets(tmp_path):
+    path = tmp_path / 'details.txt'
+    path.write_text(SOURCE, encoding='utf-8')
+    assert [code for code, _ in ingest(str(path))] == ['IPAS', 'IPAE']
+    raw = SOURCE.encode('utf-8')
+    text_blocks = list(iter_blocks(io.StringIO(SOURCE)))
+    byte_blocks = list(iter_blocks(io.BytesIO(raw), offsets=True))
+    assert [b.text for b in byte_blocks] == [b.text for b in text_blocks]
+    for block in byte_blocks:
+        for line, offset in zip(block.lines, block.offsets):
+            assert raw[offset:].decode('utf-8').startswith(line)
+    assert byte_blocks[-1].end == len(raw)
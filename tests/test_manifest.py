@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+import os
+
+from peit_content.manifest import DigestCache, Manifest, bytes_digest, file_digest, load_cache, save_cache
+
+
+def test_truncated_cache_reads_as_empty(tmp_path):
+    path = str(tmp_path / 'cache.json')
+    save_cache(path, {'entries': {'a': 1}})
+    assert load_cache(path) == {'entries': {'a': 1}}
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{"entries": {"a"')
+    assert load_cache(path) is None
+    assert load_cache(str(tmp_path / 'missing.json')) is None
+
+
+def test_manifest_recovers_from_truncated_file(tmp_path):
+    path = str(tmp_path / 'political.manifest')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{"clean": {"rules": ')
+    manifest = Manifest(path, 'clean', 'r1')
+    assert manifest.blocks == {}
+    manifest.blocks = {'IPAS': {'digest': 'd', 'fields': {}}}
+    manifest.save()
+    assert Manifest(path, 'clean', 'r1').blocks == manifest.blocks
+    assert Manifest(path, 'clean', 'r2').blocks == {}
+
+
+def test_digest_cache_reuses_fresh_entries_and_removes_stale_files(tmp_path):
+    path = str(tmp_path / 'cache.json')
+    old_file = tmp_path / 'a.1111.txt'
+    old_file.write_text('old')
+    cache = DigestCache(path, 1, ['src', 'out'])
+    cache.replace({'a': {'digest': '1111', 'entry': {'files': [str(old_file)]}}})
+
+    cache = DigestCache(path, 1, ['src', 'out'])
+    assert cache.fresh('a', '1111')
+    assert not cache.fresh('a', '2222')
+    new_file = tmp_path / 'a.2222.txt'
+    new_file.write_text('new')
+    cache.replace({'a': {'digest': '2222', 'entry': {'files': [str(new_file)]}}})
+    assert not old_file.exists() and new_file.exists()
+
+    assert DigestCache(path, 1, ['src', 'out']).fresh('a', '2222')
+    assert DigestCache(path, 2, ['src', 'out']).entries == {}
+    assert DigestCache(path, 1, ['other', 'out']).entries == {}
+    os.remove(new_file)
+    assert not DigestCache(path, 1, ['src', 'out']).fresh('a', '2222')
+
+
+def test_bytes_digest_matches_file_digest(tmp_path):
+    path = tmp_path / 'source.txt'
+    data = '섹션 색인\n'.encode('utf-8') * 300000
+    path.write_bytes(data)
+    assert bytes_digest(data) == file_digest(str(path))
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from peit_content.markdown import RENDERED_FIELDS, component_fields, missing_html, render_markdown
+from peit_content.paths import HTML_COMPONENT_PATHS, RESULT_CARD_PATH
+
+
+def test_render_markdown_escapes_unknown_tags():
+    html = render_markdown('**굵게** <script>x</script> <a href="javascript:y">z</a>')
+    assert '<strong class="font-semibold text-gray-900">굵게</strong>' in html
+    assert '<script>' not in html and '&lt;script&gt;' in html
+    assert '<a href="javascript' not in html
+
+
+def test_render_markdown_keeps_http_links():
+    link = '<a href="https://link.coupang.com/a/x" target="_blank" rel="noopener">구매</a>'
+    assert link in render_markdown(link)
+
+
+@pytest.mark.parametrize('path', HTML_COMPONENT_PATHS)
+def test_components_only_read_prerendered_fields(path):
+    with open(path, encoding='utf-8') as f:
+        source = f.read()
+    assert 'renderMarkdownText' not in source
+    assert set(component_fields(source)) <= set(RENDERED_FIELDS)
+
+
+def test_component_fields():
+    source = "fieldHtml(data, 'summary') + fieldHtml(results[type], 'description') + fieldHtml(data, field)"
+    assert component_fields(source) == ['summary', 'description']
+    with open(RESULT_CARD_PATH, encoding='utf-8') as f:
+        assert component_fields(f.read()) == ['spectrum_analysis', 'description']
+
+
+def test_missing_html():
+    entry = {'summary': '요약', 'solution': '', 'html': {'final_goal': '<p>x</p>'}}
+    assert missing_html(entry, ['summary', 'solution', 'final_goal']) == ['summary']
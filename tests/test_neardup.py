@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+from peit_content import api
+from peit_content.neardup import NearDupIndex, iter_paragraphs, minhash, shingles, similarity
+from peit_content.paths import DETAILS_PATH
+
+
+def plant(doc):
+    """IPAS의 갈등 상대 설명을 조금 고쳐 IPAE에 복사한 문서"""
+    text = doc.get('IPAS', 'worst_partner')
+    edited = (text.replace('3개월짜리', '6개월짜리').replace('폭탄일 뿐입니다', '시한폭탄처럼 보일 뿐입니다')
+              .replace('CTUE', 'CPAE'))
+    assert edited.count('\n\n') == 1 and edited != text
+    planted = doc.copy()
+    planted.set('IPAE', 'worst_partner', edited)
+    return api.parse(planted.render())
+
+
+def index_pairs(doc, path=None):
+    index = NearDupIndex(path)
+    index.update(doc, 'details')
+    return index, [(a, b) for _, a, b in index.pairs()]
+
+
+def test_planted_near_duplicate_is_found():
+    doc = api.load(DETAILS_PATH)
+    _, before = index_pairs(doc)
+    index, after = index_pairs(plant(doc))
+    found = [pair for pair in after if pair not in before]
+    assert found == [(('details', 'IPAS', 'worst_partner', 1), ('details', 'IPAE', 'worst_partner', 1))]
+    score = next(score for score, a, b in index.pairs() if (a, b) == found[0])
+    assert 0.6 <= score < 1.0
+
+
+def test_similarity_estimates_jaccard():
+    a = '당신은 빙빙 돌려 말하는 것을 시간 낭비라고 생각하며, 문제의 핵심을 바로 짚는 대화를 선호합니다.'
+    b = a.replace('시간 낭비', '에너지 낭비')
+    grams_a, grams_b = shingles(a), shingles(b)
+    jaccard = len(grams_a & grams_b) / len(grams_a | grams_b)
+    assert abs(similarity(minhash(grams_a), minhash(grams_b)) - jaccard) < 0.2
+    assert similarity(minhash(grams_a), minhash(grams_a)) == 1.0
+    # 짧은 문단과 제외 필드는 색인하지 않음
+    assert shingles('짧은 문단') == set()
+    data = {'name': a, 'recommended_content': a, 'summary': f'{a}\n\n{b}', 'strengths': [a, 1]}
+    assert [(name, index) for name, index, _ in iter_paragraphs(data)] == [
+        ('summary', 0), ('summary', 1), ('strengths', 0)]
+
+
+def test_cached_signatures_are_reused(tmp_path):
+    path = str(tmp_path / 'neardup.json')
+    doc = api.load(DETAILS_PATH)
+    index, pairs = index_pairs(doc, path)
+    index.save()
+    cached = NearDupIndex(path)
+    assert cached.update(doc, 'details') == [] and cached.hashed == 0
+    assert [(a, b) for _, a, b in cached.pairs()] == pairs
+    # 바뀐 블록만 다시 해시
+    assert NearDupIndex(path).update(plant(doc), 'details') == ['IPAE']
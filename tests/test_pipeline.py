@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from peit_content.ingest import ingest
+from peit_content.pipeline import ValidationError, build, load_existing, process_block, validate_block
+
+SOURCE = '''IPAS → 급진적 자유주의자
+#마이웨이 #급진적개혁
+한 줄 요약: 판을 흔드는 사람
+종합 정치 스펙트럼: 중도 (급진적)
+강점과 약점
+✅ 강점 (Strengths)
+1 추진력: 해결하려는 의지
+⚠️ 약점 (Weaknesses)
+1 독단성: 의견을 무시함
+'당신의 화법'
+\t▪\t💔 최악의 갈등 상대: CTUE (중도 보수주의자)왜 갈등하는가? 속도가 다릅니다.
+'소통의 벽: 당신이 갈등을 겪는 이유'
+소통의 벽: 대화가 답답한 이유
+점진적인 사람과는 속도가 맞지 않습니다.
+'''
+
+DATA = {'name': '급진적 자유주의자', 'summary': '요약', 'political_spectrum': '중도',
+        'keywords': ['a'], 'strengths': ['b'], 'weaknesses': ['c']}
+
+
+def test_inline_heading_survives_cleanup(tmp_path):
+    path = tmp_path / 'details.txt'
+    path.write_text(SOURCE, encoding='utf-8')
+    code, data = next(ingest(str(path)))
+    data = process_block(code, data)
+    # 소제목은 정리 단계에서 잘리고 같은 줄의 본문은 남음
+    assert data['worst_partner'] == 'CTUE (중도 보수주의자)왜 갈등하는가? 속도가 다릅니다.'
+    assert validate_block(code, data, {'worst_partner': '이전 값'})[0] == []
+
+
+def test_field_emptied_against_existing_output():
+    data = dict(DATA, worst_partner='', love_value='')
+    errors, warnings = validate_block('IPAS', data, {'worst_partner': '이전 값', 'love_value': ''})
+    assert errors == ['IPAS.worst_partner: 기존 출력에는 값이 있는데 비게 됨']
+    assert ('love_value', 'IPAS') in warnings
+    # 기존 출력에 없던 필드가 비는 것은 경고만
+    assert validate_block('IPAS', data)[0] == []
+
+
+def test_load_existing(tmp_path):
+    path = tmp_path / 'details.ts'
+    assert load_existing(str(path)) == {}
+    path.write_text('export const politicalDetails = {\n  "IPAS": {"name": "x"}\n};\n', encoding='utf-8')
+    assert load_existing(str(path)) == {'IPAS': {'name': 'x'}}
+    path.write_text('export const politicalDetails = {', encoding='utf-8')
+    assert load_existing(str(path)) == {}
+
+
+def test_failed_build_keeps_existing_output(tmp_path):
+    source = tmp_path / 'details.txt'
+    source.write_text(SOURCE, encoding='utf-8')
+    output = tmp_path / 'details.ts'
+    output.write_text('기존 출력', encoding='utf-8')
+    with pytest.raises(ValidationError) as info:
+        build(str(source), str(output), log=lambda *args: None)
+    assert any(error.startswith('누락된 유형: ') for error in info.value.errors)
+    assert output.read_text(encoding='utf-8') == '기존 출력'
+    # 임시 출력 파일도 남지 않음
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['details.ts', 'details.txt']
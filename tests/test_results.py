@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+
+from peit_content.results import SUMMARY_FIELDS, SUMMARY_HTML_FIELDS, write_results
+from peit_content.tsliteral import load_literal, parse_document
+
+BASE = '''export const baseResults = {
+  "IPAS": {
+    "name": "기본 이름",
+    "category": "political",
+    "scores": {"I": 1},
+    "description": "설명",
+    "strengths": ["예전 강점"],
+    "weaknesses": [],
+    "speech_style": "예전 화법"
+  },
+  "GVE": {
+    "name": "경제 유형",
+    "category": "economic",
+    "scores": {"G": 1},
+    "description": "설명",
+    "strengths": [],
+    "weaknesses": [],
+    "spectrum_analysis": "**분석**",
+    "recommended_content": "경제 추천"
+  }
+};
+'''
+
+DETAILS = {
+    'IPAS': {
+        'name': '상세 이름',
+        'category': 'political',
+        'strengths': ['강점'],
+        'speech_style': "'화법'",
+        'money_value': '돈',
+        'recommended_content': '정치 추천',
+    },
+}
+
+
+def test_write_results_splits_summary_and_details(tmp_path):
+    output = str(tmp_path / 'results.ts')
+    details_dir = str(tmp_path / 'details')
+    recommended = str(tmp_path / 'recommended_content.ts')
+    assert write_results(output, parse_document(BASE), DETAILS, details_dir, recommended)
+    assert not write_results(output, parse_document(BASE), DETAILS, details_dir, recommended)
+
+    summaries = load_literal(output, 'results')
+    assert all(set(entry) - {'html'} <= set(SUMMARY_FIELDS) for entry in summaries.values())
+    assert all(set(entry['html']) <= set(SUMMARY_HTML_FIELDS) for entry in summaries.values())
+    assert set(summaries['GVE']['html']) == {'description', 'spectrum_analysis'}
+    assert summaries['IPAS']['name'] == '상세 이름'
+    assert summaries['GVE']['spectrum_analysis'] == '**분석**'
+
+    with open(os.path.join(details_dir, 'IPAS.json'), encoding='utf-8') as f:
+        ipas = json.load(f)
+    assert ipas['financial_style'] == '돈'
+    assert set(ipas['html']) == {'description', 'speech_style', 'financial_style', 'recommended_content'}
+    with open(os.path.join(details_dir, 'GVE.json'), encoding='utf-8') as f:
+        assert 'spectrum_analysis' in json.load(f)['html']
+    with open(os.path.join(details_dir, 'index.ts'), encoding='utf-8') as f:
+        assert 'IPAS: "상세 이름"' in f.read()
+
+    assert list(load_literal(recommended, 'recommendedContent').items()) == [
+        ('IPAS', '정치 추천'), ('GVE', '경제 추천')]
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+
+from peit_content.scoring import AXES, Scorer, question_number, result_dict
+
+MAPPING = {
+    1: {'A': 'I', 'B': 'C'},
+    2: {'A': 'P', 'B': 'T'},
+    3: {'A': 'A', 'B': 'U'},
+    4: {'A': 'E', 'B': 'S'},
+    5: {'A': 'G', 'B': 'S2'},
+    6: {'A': 'V', 'B': 'A2'},
+    7: {'A': 'E2', 'B': 'W'},
+}
+
+
+def score_one(answers):
+    political, economic, tallies = Scorer(MAPPING).score([answers])
+    return result_dict(political[0], economic[0], tallies[0])
+
+
+@pytest.mark.parametrize('key, number', [
+    ('q1', 1), ('q01', 1), ('q1x', 1), ('q 12', 12), ('qq1', None), ('x', None), ('q', None),
+])
+def test_question_number_follows_parse_int(key, number):
+    assert question_number(key) == number
+
+
+def test_tie_rows_take_the_second_letter():
+    # 아무것도 답하지 않으면 모든 축 쌍이 0:0 동점
+    result = score_one({})
+    assert (result['political'], result['economic']) == ('CTUS', 'SAW')
+    # 앞 축이 더 클 때만 앞 글자
+    result = score_one({'q1': 'A', 'q2': 'B', 'q5': 'A'})
+    assert (result['political'], result['economic']) == ('ITUS', 'GAW')
+
+
+def test_duplicate_and_odd_keys_are_all_counted():
+    result = score_one({'q1': 'B', 'q01': 'A', 'q1x': 'A'})
+    assert result['scores']['I'] == 2 and result['scores']['C'] == 1
+    assert result['political'][0] == 'I'
+
+
+def test_unknown_answers_and_questions_are_ignored():
+    result = score_one({'q1': 'C', 'q2': None, 'q99': 'A', 'foo': 'A', 'q3': 'A'})
+    assert sum(result['scores'].values()) == 1
+    assert result['scores']['A'] == 1
+
+
+def test_pack_does_not_wrap_above_255_duplicates():
+    scorer = Scorer(MAPPING)
+    answers = {f'q1{"x" * n}': 'A' for n in range(300)}
+    matrix = scorer.pack([answers])
+    assert matrix.dtype == np.int32
+    tallies = scorer.tallies(matrix)
+    assert tallies[0, AXES.index('I')] == 300
+
+
+def test_pack_choices_matches_pack():
+    scorer = Scorer(MAPPING)
+    answers = {'q1': 'A', 'q2': 'B', 'q7': 'B'}
+    choices = np.zeros((1, len(scorer.questions)), dtype=np.uint8)
+    choices[0, scorer.column[1]] = 1
+    choices[0, scorer.column[2]] = 2
+    choices[0, scorer.column[7]] = 2
+    assert np.array_equal(scorer.tallies(scorer.pack([answers])), scorer.tallies(scorer.pack_choices(choices)))
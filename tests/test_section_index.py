@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+import shutil
+
+from peit_content.ingest import HEADER_RE, extract_details, read_blocks
+from peit_content.paths import SOURCE_PATH
+from peit_content.section_index import SectionIndex, resolve_section
+
+
+def copy_source(tmp_path):
+    source = tmp_path / 'political_details.txt'
+    shutil.copy(SOURCE_PATH, str(source))
+    return str(source), str(tmp_path / 'sections.json')
+
+
+def test_spans_match_iter_blocks(tmp_path):
+    source, path = copy_source(tmp_path)
+    with SectionIndex(source, path) as index:
+        blocks = list(read_blocks(source))
+        assert list(index) == [block.code for block in blocks]
+        for block in blocks:
+            lines = index.get(block.code, 'block').split('\n')
+            assert HEADER_RE.match(lines[0]).group(1) == block.code
+            # 블록 중간에 반복된 같은 코드의 머리줄만 빼면 본문 줄과 같음
+            assert [line for line in lines[1:-1] if not line.startswith(f'{block.code} ')] == block.lines
+            for name, value in extract_details(block).items():
+                if isinstance(value, str) and name not in ('name', 'category'):
+                    # 추출한 본문은 섹션 구간 안에 있음
+                    assert value in index.get(block.code, name), (block.code, name)
+            for item in extract_details(block).get('strengths', []):
+                assert item in index.get(block.code, 'strengths')
+
+
+def test_index_is_reused_until_source_changes(tmp_path):
+    source, path = copy_source(tmp_path)
+    with SectionIndex(source, path) as index:
+        assert index.rebuilt
+        worst = index.get('IPAS', '최악의 갈등 상대')
+    with SectionIndex(source, path) as index:
+        assert not index.rebuilt
+        assert index.get('IPAS', 'worst_partner') == worst
+    with open(source, 'ab') as f:
+        f.write('\n추가된 줄'.encode('utf-8'))
+    with SectionIndex(source, path) as index:
+        assert index.rebuilt
+    # 잘린 색인 파일은 다시 만듦
+    with open(path, 'r+b') as f:
+        f.truncate(10)
+    with SectionIndex(source, path) as index:
+        assert index.rebuilt and index.get('IPAS', 'worst_partner') == worst
+
+
+def test_resolve_section():
+    assert resolve_section('최악의 갈등 상대') == 'worst_partner'
+    assert resolve_section('한 줄 요약') == 'summary'
+    assert resolve_section('money_value') == 'money_value'
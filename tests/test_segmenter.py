@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+import re
+
+import pytest
+
+from peit_content.segmenter import Automaton, Section, Segmenter
+
+
+def naive_hits(patterns, text):
+    return [[m.start() for m in re.finditer(f'(?={re.escape(p)})', text)] for p in patterns]
+
+
+@pytest.mark.parametrize('patterns, text', [
+    (['he', 'she', 'his', 'hers'], 'ushershishe'),
+    (['a', 'aa', 'aaa'], 'aaaa'),
+    (['강점', '강점 분석', '점'], '강점 분석의 강점과 약점'),
+    (['\U0001f4a1', '\U0001f4a1 팁'], '\U0001f4a1 팁 \U0001f4a1'),
+    (['xyz'], 'abc'),
+])
+def test_automaton_reports_every_overlapping_match(patterns, text):
+    assert Automaton(patterns).scan(text) == naive_hits(patterns, text)
+
+
+def test_automaton_without_patterns():
+    assert Automaton(['', None]).scan('abc') == []
+
+
+SECTIONS = {
+    'summary': Section(title='요약', emoji='\U0001f4cc', ends=('강점', '약점')),
+    'strengths': Section(title='강점', ends=('약점',)),
+    'weaknesses': Section(title='약점', emoji='\u26a0\ufe0f', emoji_requires='강점', stop_at_repeat=True),
+}
+
+
+def test_segment_cuts_at_first_end_marker():
+    text = '요약 한 줄 요약\n강점 잘함\n약점 못함'
+    assert Segmenter(SECTIONS).segment(text) == {
+        'summary': '한 줄 요약',
+        'strengths': '잘함',
+        'weaknesses': '못함',
+    }
+
+
+def test_emoji_alias_and_requirement():
+    segmenter = Segmenter(SECTIONS)
+    assert segmenter.segment('\U0001f4cc 이모지 설명\n강점 x') == {'summary': '이모지 설명', 'strengths': 'x'}
+    # 약점의 이모지 별칭은 강점 마커가 있을 때만 씀
+    assert 'weaknesses' not in segmenter.segment('\u26a0\ufe0f 주의')
+    assert segmenter.segment('강점 a \u26a0\ufe0f 주의')['weaknesses'] == '주의'
+
+
+def test_stop_at_repeat_and_section_fallback():
+    scan = Segmenter(SECTIONS).scan('머리말\n약점 하나\n약점 둘')
+    assert scan.sections() == {'weaknesses': '하나'}
+    # 시작 마커가 없으면 텍스트 처음부터 종료 마커 앞까지
+    assert scan.section('summary') == '머리말'
+    assert scan.span('strengths') is None
+    assert scan.match_count() == 2
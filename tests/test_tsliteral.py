@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+import json
+
+import pytest
+
+from peit_content.tsliteral import ParseError, dump_value, encode_string, parse_document, parse_literal
+
+SOURCE = '''import type { X } from './x';
+
+// 유형별 상세
+export const politicalDetails: Record<string, X> = {
+  IPAS: {
+    name: '이름', // 주석
+    /* 블록 주석 */ list: ['a', "b",],
+    score: -1.5e2,
+    flag: true,
+  },
+  'CTUS': {
+    name: `템플릿 $ 문자열`,
+    empty: null,
+  }
+};
+export const other = {};
+'''
+
+
+def test_parse_document_reads_ts_literal():
+    doc = parse_document(SOURCE, 'politicalDetails')
+    assert list(doc) == ['IPAS', 'CTUS']
+    assert doc.data('IPAS') == {'name': '이름', 'list': ['a', 'b'], 'score': -150.0, 'flag': True}
+    assert doc.data('CTUS') == {'name': '템플릿 $ 문자열', 'empty': None}
+    assert doc.quote == "'" and doc.bare_keys
+
+
+def test_render_rewrites_only_edited_fields():
+    doc = parse_document(SOURCE, 'politicalDetails')
+    assert doc.render() is doc.source
+    doc.set('IPAS', 'name', "새 '이름'")
+    doc.set('CTUS', 'empty', None)
+    rendered = doc.render()
+    assert rendered == SOURCE.replace("name: '이름',", "name: '새 \\'이름\\'',")
+    assert parse_document(rendered, 'politicalDetails').data('IPAS')['name'] == "새 '이름'"
+
+
+def test_format_matches_json_stringify():
+    source = 'export const d = {"A": {"x": "1", "y": [1, 2], "z": {}}};\n'
+    doc = parse_document(source)
+    data = {'A': {'x': '1', 'y': [1, 2], 'z': {}}}
+    assert doc.format() == 'export const d = ' + json.dumps(data, indent=2) + ';\n'
+
+
+@pytest.mark.parametrize('value', ['', 'a"b', "a'b", 'back\\slash', '줄\n바꿈\t탭', '\x01\x1f', '  이모지 \U0001f600'])
+def test_encode_string_round_trips(value):
+    for quote in '"\'':
+        assert parse_literal(encode_string(value, quote)) == value
+    assert encode_string(value) == json.dumps(value, ensure_ascii=False).replace(' ', ' ')
+
+
+def test_parse_literal_escapes():
+    assert parse_literal(r"'é\x41\u{1F600}\0\'' ") == 'éA\U0001f600\0\''
+    assert parse_literal('[1, "a\\\nb"]') == [1, 'ab']
+
+
+def test_dump_value_nested_indent():
+    assert dump_value({'a': [1, {'b': None}]}, '  ') == '{\n    "a": [\n      1,\n      {\n        "b": null\n      }\n    ]\n  }'
+
+
+@pytest.mark.parametrize('source, message', [
+    ('"abc', 'unterminated string'),
+    ('"a\nb"', 'unterminated string'),
+    ('`a${b}`', 'template substitutions'),
+    ('{a: 1 b: 2}', "expected ','"),
+    ('[1, 2', 'unexpected end of input'),
+    ('{a: 1} x', 'trailing characters'),
+    ('"\\u12"', 'bad unicode escape'),
+])
+def test_parse_errors(source, message):
+    with pytest.raises(ParseError, match=message):
+        parse_literal(source)
+
+
+def test_parse_error_position_and_missing_export():
+    with pytest.raises(ParseError) as info:
+        parse_literal('{\n  a: 1,\n  b: ?\n}')
+    assert (info.value.line, info.value.col) == (3, 6)
+    with pytest.raises(ParseError, match='export const missing not found'):
+        parse_document(SOURCE, 'missing')
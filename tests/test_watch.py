@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+import re
+import shutil
+
+from peit_content.paths import SOURCE_PATH
+from peit_content.pipeline import build
+from peit_content.watch import PollingWatcher, WatchSession
+
+OLD_SUMMARY = '한 줄 요약: 개인의 자유(I)를 최우선으로 삼되,'
+NEW_SUMMARY = '한 줄 요약: 바뀐 요약입니다. 개인의 자유(I)를 최우선으로 삼되,'
+
+
+def make_session(tmp_path):
+    source = tmp_path / 'political_details.txt'
+    shutil.copy(SOURCE_PATH, str(source))
+    logs = []
+    session = WatchSession(str(source), str(tmp_path / 'political_details.ts'), log=logs.append)
+    return session, source, logs
+
+
+def test_incremental_rebuild(tmp_path):
+    session, source, logs = make_session(tmp_path)
+    output = tmp_path / 'political_details.ts'
+    assert session.update()
+    expected = tmp_path / 'expected.ts'
+    build(str(source), str(expected), log=lambda *args: None)
+    assert output.read_bytes() == expected.read_bytes()
+    cached = dict(session.blocks)
+
+    text = source.read_text(encoding='utf-8')
+    assert text.count(OLD_SUMMARY) == 1
+    source.write_text(text.replace(OLD_SUMMARY, NEW_SUMMARY), encoding='utf-8')
+    assert session.update({str(source)})
+    # 바뀐 블록만 다시 처리하고 나머지는 캐시를 그대로 씀
+    assert [code for code in session.blocks if session.blocks[code] is not cached[code]] == ['IPAE']
+    assert '다시 처리: IPAE /' in logs[-1]
+    build(str(source), str(expected), log=lambda *args: None)
+    assert output.read_bytes() == expected.read_bytes()
+
+    # 내용이 같으면 다시 처리도, 기록도 하지 않음
+    assert session.update({str(source)})
+    assert '다시 처리: 없음 / 기록: 없음' in logs[-1]
+
+
+def test_failed_update_keeps_output(tmp_path):
+    session, source, logs = make_session(tmp_path)
+    output = tmp_path / 'political_details.ts'
+    assert session.update()
+    before = output.read_bytes()
+    text = source.read_text(encoding='utf-8')
+    source.write_text(re.sub(re.escape(OLD_SUMMARY) + '.*\n', '', text), encoding='utf-8')
+    assert not session.update({str(source)})
+    assert logs[-1] == '  IPAE.summary: 필수 필드가 비어 있음'
+    assert logs[-2] == '검증 실패 - 파일을 쓰지 않았습니다:'
+    assert output.read_bytes() == before
+
+
+def test_polling_watcher_reports_changed_path(tmp_path):
+    path = tmp_path / 'a.txt'
+    path.write_text('a', encoding='utf-8')
+    watcher = PollingWatcher([str(path)], interval=0.01)
+    assert watcher.wait(0.02) == set()
+    path.write_text('bb', encoding='utf-8')
+    assert watcher.wait(1) == {str(path)}
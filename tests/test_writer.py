@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+import os
+import stat
+
+from peit_content.writer import write_chunks_if_changed, write_if_changed
+
+
+def test_skips_identical_bytes(tmp_path):
+    path = str(tmp_path / 'out.ts')
+    assert write_if_changed(path, 'a')
+    assert not write_if_changed(path, 'a')
+    assert not write_chunks_if_changed(path, ['', 'a'])
+    assert write_chunks_if_changed(path, ['a', 'b'])
+    with open(path, encoding='utf-8') as f:
+        assert f.read() == 'ab'
+
+
+def test_keeps_mode_and_leaves_no_temp_files(tmp_path):
+    path = str(tmp_path / 'out.ts')
+    write_if_changed(path, 'a')
+    os.chmod(path, 0o640)
+    write_if_changed(path, 'b')
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o640
+    write_chunks_if_changed(path, ['c'])
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o640
+    assert os.listdir(tmp_path) == ['out.ts']
+
+
+def test_failed_chunks_keep_existing_file(tmp_path):
+    path = str(tmp_path / 'out.ts')
+    write_if_changed(path, 'old')
+
+    def chunks():
+        yield 'new'
+        raise ValueError
+
+    try:
+        write_chunks_if_changed(path, chunks())
+    except ValueError:
+        pass
+    with open(path, encoding='utf-8') as f:
+        assert f.read() == 'old'
+    assert os.listdir(tmp_path) == ['out.ts']